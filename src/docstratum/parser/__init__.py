@@ -10,11 +10,14 @@ Modules:
     io          File I/O, encoding detection, and line ending normalization (v0.2.0a).
     tokens      Token type enum and Token model (v0.2.0b).
     tokenizer   Line-by-line Markdown tokenizer (v0.2.0b).
+    token_table Columnar (array-backed) tokenizer output.
     populator   Token-to-model populator (v0.2.0c).
+    lazy        Section-indexed lazy population for oversized files (v0.9.2b).
     classifier           Document type classifier (v0.2.1a/b).
     section_matcher      Canonical section name matching (v0.2.1c).
     metadata             YAML frontmatter extraction (v0.2.1d).
     validator_adapter    SingleFileValidator adapter (v0.2.2d).
+    cache                Persistent content-hash parse cache.
 
 Implementation Status:
     - [x] File I/O & Encoding Detection (v0.2.0a)
@@ -32,32 +35,85 @@ Related:
     - docs/design/03-parser/: Design specifications for this package
 """
 
+from docstratum.parser.cache import CacheStats, ParseCache
 from docstratum.parser.classifier import (
+    ClassifiableDocument,
     assign_size_tier,
     classify_document,
     classify_document_type,
 )
-from docstratum.parser.io import FileMetadata, read_bytes, read_file, read_string
+from docstratum.parser.io import (
+    FileMetadata,
+    LineStream,
+    MappedFile,
+    SourceText,
+    preprocess,
+    read_bytes,
+    read_bytes_source,
+    read_file,
+    read_file_mapped,
+    read_string,
+    read_string_source,
+)
+from docstratum.parser.lazy import (
+    LAZY_THRESHOLD_TOKENS,
+    LazyDocument,
+    SectionSpan,
+    populate_lazy,
+)
 from docstratum.parser.metadata import extract_metadata
 from docstratum.parser.populator import populate
-from docstratum.parser.section_matcher import match_canonical_sections
-from docstratum.parser.tokenizer import tokenize
+from docstratum.parser.section_matcher import (
+    MIN_FUZZY_CONFIDENCE,
+    SECTION_NAME_INDEX,
+    FuzzyMatch,
+    FuzzySectionMatcher,
+    canonical_section,
+    match_canonical_sections,
+    normalize_section_name,
+)
+from docstratum.parser.token_table import TokenTable
+from docstratum.parser.tokenizer import iter_tokens, tokenize, tokenize_table
 from docstratum.parser.tokens import Token, TokenType
-from docstratum.parser.validator_adapter import ParserAdapter
+from docstratum.parser.validator_adapter import ParserAdapter, ParseSession
 
 __all__ = [
+    "LAZY_THRESHOLD_TOKENS",
+    "MIN_FUZZY_CONFIDENCE",
+    "SECTION_NAME_INDEX",
+    "CacheStats",
+    "ClassifiableDocument",
     "FileMetadata",
+    "FuzzyMatch",
+    "FuzzySectionMatcher",
+    "LazyDocument",
+    "LineStream",
+    "MappedFile",
+    "ParseCache",
+    "ParseSession",
     "ParserAdapter",
+    "SectionSpan",
+    "SourceText",
     "Token",
+    "TokenTable",
     "TokenType",
     "assign_size_tier",
+    "canonical_section",
     "classify_document",
     "classify_document_type",
     "extract_metadata",
+    "iter_tokens",
     "match_canonical_sections",
+    "normalize_section_name",
     "populate",
+    "populate_lazy",
+    "preprocess",
     "read_bytes",
+    "read_bytes_source",
     "read_file",
+    "read_file_mapped",
     "read_string",
+    "read_string_source",
     "tokenize",
+    "tokenize_table",
 ]
@@ -0,0 +1,377 @@
+"""Persistent content-hash parse cache for the DocStratum parser.
+
+CI runs re-validate the same unchanged ``llms.txt`` and content pages many
+times a day. ``ParseCache`` stores the expensive per-file results — the
+``ParsedLlmsTxt``, its ``FileMetadata`` and frontmatter ``Metadata``, and
+the ``DocumentClassification`` — in a single SQLite file, so a
+``ParserAdapter`` constructed with a cache turns ``parse()`` and
+``classify()`` into lookups for content it has seen before.
+
+Keys:
+    A SHA-256 over the docstratum version, the cache format version, the
+    caller-supplied parser configuration, the filename, and the content.
+    Upgrading docstratum or changing the configuration therefore never
+    returns a stale entry; old entries simply age out.
+
+Storage:
+    One row per key holding zlib-compressed JSON blobs. The total stored
+    size is bounded by ``max_bytes``; when a write exceeds it, the least
+    recently used rows are evicted, a batch at a time, until the cache fits
+    again. The total is summed once when the database is opened and then
+    kept up to date by each write, so a write costs O(log N) rather than a
+    scan of the table. Writes made by other processes sharing the file are
+    not seen until the next open; each process bounds its own view of the
+    size.
+
+Concurrency:
+    Each process opens a database file at most once, on first use, and
+    every ``ParseCache`` for that file in the process shares the one
+    connection, guarded by a lock, so instances can be shared across
+    threads. Pickling (process-pool workers) carries only the path and
+    settings: unpickling costs no I/O, and each worker connects when it
+    first reads or writes. SQLite's WAL mode lets the processes read and
+    write concurrently. Hit/miss/eviction counters are per instance and so
+    per process; a worker's counters are not sent back to the parent.
+
+Classes:
+    ParseCache: SQLite-backed, size-bounded LRU cache of parse results.
+    CacheStats: Hit/miss/eviction counters and current size.
+
+Example:
+    >>> from docstratum.parser.cache import ParseCache
+    >>> from docstratum.parser.validator_adapter import ParserAdapter
+    >>> adapter = ParserAdapter(cache=ParseCache(".docstratum-cache/parse.db"))
+    >>> doc = adapter.parse("# Title\\n", "llms.txt")  # miss: parsed, stored
+    >>> doc = adapter.parse("# Title\\n", "llms.txt")  # hit: loaded
+    >>> adapter.cache.stats().hits
+    1
+
+Related:
+    - src/docstratum/parser/validator_adapter.py: Consults the cache
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import zlib
+from collections.abc import Mapping
+from typing import NamedTuple
+
+from docstratum import __version__
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 1
+"""Bumped whenever the stored blob layout changes."""
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+"""Default bound on the total compressed size of cached entries."""
+
+_EVICT_BATCH = 64
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    session BLOB NOT NULL,
+    classification BLOB,
+    size INTEGER NOT NULL,
+    last_used INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used);
+"""
+
+
+class CacheStats(NamedTuple):
+    """Counters for one ``ParseCache`` instance.
+
+    Hits, misses, and evictions count this instance's operations since it
+    was created, in this process only (process-pool workers count on their
+    own copies); ``entries`` and ``size_bytes`` describe the database.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+
+
+# ── Connections ──────────────────────────────────────────────────────
+
+
+class _Database:
+    """This process's connection to one cache file.
+
+    Shared by every ``ParseCache`` for the file; ``size`` is the running
+    total of the ``size`` column, summed once at connect and then adjusted
+    by each write.
+    """
+
+    __slots__ = ("conn", "lock", "size")
+
+    def __init__(self, path: str) -> None:
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        self.conn = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+        (size,) = self.conn.execute(
+            "SELECT coalesce(sum(size), 0) FROM entries"
+        ).fetchone()
+        self.size = int(size)
+        self.lock = threading.Lock()
+
+
+# Keyed by (pid, absolute path): a forked child must not reuse the
+# connections it inherited from its parent.
+_databases: dict[tuple[int, str], _Database] = {}
+_databases_lock = threading.Lock()
+
+
+def _database_key(path: str) -> tuple[int, str]:
+    return (os.getpid(), os.path.abspath(path))
+
+
+# ── Cache ────────────────────────────────────────────────────────────
+
+
+class ParseCache:
+    """SQLite-backed, size-bounded LRU cache of parse results.
+
+    Values are opaque JSON strings (the adapter serializes its models);
+    the cache only compresses, stores, bounds, and counts them.
+
+    Attributes:
+        path: Location of the SQLite database file.
+        max_bytes: Upper bound on the total compressed size of entries.
+        config: Parser configuration folded into every key.
+
+    Example:
+        >>> cache = ParseCache("parse.db", max_bytes=64 * 1024 * 1024)
+        >>> key = cache.key("# Title\\n", "llms.txt")
+        >>> cache.get_session(key) is None
+        True
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        config: Mapping[str, object] | None = None,
+    ) -> None:
+        """Open (creating if needed) the cache database at ``path``.
+
+        Args:
+            path: SQLite file location; parent directories are created.
+            max_bytes: Bound on the total compressed size of entries.
+            config: Parser configuration that affects results. Any change
+                produces different keys. Must be JSON-serializable.
+
+        Raises:
+            ValueError: If ``max_bytes`` is less than 1.
+        """
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be >= 1, got {max_bytes}")
+        self._open(os.fspath(path), max_bytes, dict(config or {}))
+
+    def _open(self, path: str, max_bytes: int, config: dict[str, object]) -> None:
+        """Set up the instance state; the database is connected on first use."""
+        self.path = path
+        self.max_bytes = max_bytes
+        self.config = config
+        self._key_prefix = json.dumps(
+            [__version__, CACHE_FORMAT_VERSION, self.config],
+            sort_keys=True,
+            default=str,
+        ).encode("utf-8")
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _database(self) -> _Database:
+        """This process's connection to the cache file, opened on first use."""
+        key = _database_key(self.path)
+        with _databases_lock:
+            database = _databases.get(key)
+            if database is None:
+                database = _databases[key] = _Database(self.path)
+            return database
+
+    def __getstate__(self) -> dict:
+        """Pickle settings only; the receiving process connects on first use."""
+        return {"path": self.path, "max_bytes": self.max_bytes, "config": self.config}
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore the settings in the receiving process."""
+        self._open(state["path"], state["max_bytes"], state["config"])
+
+    def close(self) -> None:
+        """Close this process's connection to the database.
+
+        Every ``ParseCache`` for the file in this process shares that
+        connection; using any of them afterwards connects again.
+        """
+        with _databases_lock:
+            database = _databases.pop(_database_key(self.path), None)
+        if database is not None:
+            with database.lock:
+                database.conn.close()
+
+    # ── Keys ─────────────────────────────────────────────────────────
+
+    def key(self, content: str, filename: str, variant: str = "") -> str:
+        """Return the cache key for ``content`` parsed as ``filename``.
+
+        Args:
+            content: Raw file content, exactly as given to the parser.
+            filename: The name recorded on the parsed document.
+            variant: Adapter options that change results (e.g. fuzzy
+                section matching); empty for the default parse.
+
+        Returns:
+            Hex SHA-256 digest.
+        """
+        digest = hashlib.sha256(self._key_prefix)
+        digest.update(b"\x00")
+        digest.update(filename.encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(content.encode("utf-8", "surrogatepass"))
+        if variant:
+            digest.update(b"\x00")
+            digest.update(variant.encode("utf-8"))
+        return digest.hexdigest()
+
+    # ── Lookups ──────────────────────────────────────────────────────
+
+    def get_session(self, key: str) -> str | None:
+        """Return the stored session JSON for ``key``, counting hit/miss."""
+        return self._get("session", key)
+
+    def get_classification(self, key: str) -> str | None:
+        """Return the stored classification JSON for ``key``, counting hit/miss."""
+        return self._get("classification", key)
+
+    def _get(self, column: str, key: str) -> str | None:
+        database = self._database()
+        with database.lock:
+            row = database.conn.execute(
+                f"SELECT {column} FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[0] is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            database.conn.execute(
+                "UPDATE entries SET last_used = ? WHERE key = ?",
+                (_next_tick(database), key),
+            )
+        return zlib.decompress(row[0]).decode("utf-8")
+
+    # ── Stores ───────────────────────────────────────────────────────
+
+    def put_session(self, key: str, session_json: str) -> None:
+        """Store the session JSON for ``key`` (drops any classification)."""
+        blob = zlib.compress(session_json.encode("utf-8"))
+        database = self._database()
+        with database.lock:
+            replaced = _stored_size(database, key)
+            database.conn.execute(
+                "INSERT OR REPLACE INTO entries"
+                " (key, session, classification, size, last_used)"
+                " VALUES (?, ?, NULL, ?, ?)",
+                (key, blob, len(blob), _next_tick(database)),
+            )
+            database.size += len(blob) - replaced
+            self._evict(database)
+
+    def put_classification(self, key: str, classification_json: str) -> None:
+        """Attach the classification JSON to an existing entry for ``key``.
+
+        Does nothing if the session for ``key`` is not cached (for example,
+        because it was evicted in the meantime).
+        """
+        blob = zlib.compress(classification_json.encode("utf-8"))
+        database = self._database()
+        with database.lock:
+            before = _stored_size(database, key)
+            database.conn.execute(
+                "UPDATE entries SET classification = ?,"
+                " size = length(session) + ?, last_used = ? WHERE key = ?",
+                (blob, len(blob), _next_tick(database), key),
+            )
+            database.size += _stored_size(database, key) - before
+            self._evict(database)
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        database = self._database()
+        with database.lock:
+            database.conn.execute("DELETE FROM entries")
+            database.size = 0
+            self._hits = self._misses = self._evictions = 0
+
+    # ── Bookkeeping ──────────────────────────────────────────────────
+
+    def stats(self) -> CacheStats:
+        """Return this instance's counters and the database size."""
+        database = self._database()
+        with database.lock:
+            entries, size = database.conn.execute(
+                "SELECT count(*), coalesce(sum(size), 0) FROM entries"
+            ).fetchone()
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=entries,
+                size_bytes=size,
+            )
+
+    def _evict(self, database: _Database) -> None:
+        """Drop least recently used entries until the size bound holds."""
+        evicted = 0
+        while database.size > self.max_bytes:
+            rows = database.conn.execute(
+                "SELECT key, size FROM entries ORDER BY last_used LIMIT ?",
+                (_EVICT_BATCH,),
+            ).fetchall()
+            if not rows:
+                # The table is empty; another process cleared it.
+                database.size = 0
+                break
+            doomed = []
+            for key, size in rows:
+                if database.size <= self.max_bytes:
+                    break
+                doomed.append((key,))
+                database.size -= size
+            database.conn.executemany("DELETE FROM entries WHERE key = ?", doomed)
+            evicted += len(doomed)
+        if evicted:
+            self._evictions += evicted
+            logger.debug("Evicted %d parse cache entries", evicted)
+
+
+def _next_tick(database: _Database) -> int:
+    """Next LRU timestamp; a counter, so order survives clock skew."""
+    (tick,) = database.conn.execute(
+        "SELECT coalesce(max(last_used), 0) + 1 FROM entries"
+    ).fetchone()
+    return int(tick)
+
+
+def _stored_size(database: _Database, key: str) -> int:
+    """Stored size of the entry for ``key``; 0 if there is none."""
+    row = database.conn.execute(
+        "SELECT size FROM entries WHERE key = ?", (key,)
+    ).fetchone()
+    return int(row[0]) if row else 0
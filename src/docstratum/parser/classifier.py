@@ -16,6 +16,9 @@ findings from 11 real-world specimens (v0.0.1a section 6):
     5. H1 heading count (>1 implies Type 2 Full)
     6. Link density (fallback heuristic)
 
+Classes:
+    ClassifiableDocument: What the classifier reads from a document.
+
 Functions:
     classify_document_type: Classify a parsed document into a DocumentType.
     assign_size_tier: Assign a SizeTier from estimated token count.
@@ -35,6 +38,9 @@ from __future__ import annotations
 
 import logging
 import os
+import re
+from collections.abc import Sequence
+from typing import Protocol
 
 from docstratum.parser.io import FileMetadata
 from docstratum.schema.classification import (
@@ -42,10 +48,46 @@ from docstratum.schema.classification import (
     DocumentType,
     SizeTier,
 )
-from docstratum.schema.parsed import ParsedLlmsTxt
+from docstratum.schema.parsed import ParsedSection
 
 logger = logging.getLogger(__name__)
 
+# Line starts that matter for H1 counting: "# " headings and ``` fences.
+# A line start is the beginning of the text or any position after one of
+# the separators ``str.splitlines()`` recognizes, so results match a
+# line-by-line scan without materializing the list of lines. LF-normalized
+# text almost never contains the other separators, so the cheaper
+# ``re.MULTILINE`` form is used when none are present.
+_H1_OR_FENCE_LF_RE = re.compile(r"^(# |```)", re.MULTILINE)
+_H1_OR_FENCE_ANY_RE = re.compile(
+    r"(?:\A|(?<=[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]))(# |```)"
+)
+_NON_LF_BREAK_RE = re.compile(r"[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+class ClassifiableDocument(Protocol):
+    """The read-only surface of a parsed document the classifier uses.
+
+    Satisfied by ``ParsedLlmsTxt`` and by the lazily parsed
+    ``LazyDocument`` (``lazy.py``), whose sections are built only when
+    read.
+    """
+
+    @property
+    def title(self) -> str | None: ...
+
+    @property
+    def sections(self) -> Sequence[ParsedSection]: ...
+
+    @property
+    def raw_content(self) -> str: ...
+
+    @property
+    def source_filename(self) -> str: ...
+
+    @property
+    def estimated_tokens(self) -> int: ...
+
 
 def _count_h1_headings(raw_content: str) -> int:
     """Count H1 headings in raw content.
@@ -54,6 +96,9 @@ def _count_h1_headings(raw_content: str) -> int:
     Lines starting with '## ' or '### ' are NOT counted.
     Lines inside code fences are NOT counted.
 
+    Only the lines that begin with ``# `` or a code fence are visited
+    (regex scan), instead of splitting the whole document into lines.
+
     Args:
         raw_content: The complete raw file text.
 
@@ -62,11 +107,14 @@ def _count_h1_headings(raw_content: str) -> int:
     """
     count = 0
     in_code_block = False
-    for line in raw_content.splitlines():
-        if line.startswith("```"):
+    if _NON_LF_BREAK_RE.search(raw_content) is None:
+        pattern = _H1_OR_FENCE_LF_RE
+    else:
+        pattern = _H1_OR_FENCE_ANY_RE
+    for match in pattern.finditer(raw_content):
+        if match.group(1) == "```":
             in_code_block = not in_code_block
-            continue
-        if not in_code_block and line.startswith("# ") and not line.startswith("## "):
+        elif not in_code_block:
             count += 1
     return count
 
@@ -96,7 +144,7 @@ def _classify_by_filename(filename: str) -> DocumentType | None:
 
 
 def classify_document_type(
-    doc: ParsedLlmsTxt,
+    doc: ClassifiableDocument,
     file_meta: FileMetadata,
 ) -> DocumentType:
     """Classify a parsed document into a DocumentType.
@@ -108,7 +156,7 @@ def classify_document_type(
     - Filename conventions
     - Content patterns
 
-    The classifier does NOT modify the ParsedLlmsTxt instance.
+    The classifier does NOT modify the document.
 
     Args:
         doc: Parsed document from v0.2.0.
@@ -132,7 +180,7 @@ def classify_document_type(
         return DocumentType.UNKNOWN
 
     # Step 2: Empty/unparseable detection
-    if doc.title is None and doc.sections == []:
+    if doc.title is None and not doc.sections:
         logger.info("Classified as UNKNOWN: no title and no sections")
         return DocumentType.UNKNOWN
 
@@ -224,7 +272,7 @@ def assign_size_tier(estimated_tokens: int) -> SizeTier:
 
 
 def classify_document(
-    doc: ParsedLlmsTxt,
+    doc: ClassifiableDocument,
     file_meta: FileMetadata,
 ) -> DocumentClassification:
     """Classify and tier a parsed document.
@@ -8,13 +8,26 @@ phases (tokenizer, model population) and the validator (v0.3.x) can inspect.
 This is the first stage of the parser pipeline. It converts raw I/O into
 clean, LF-normalized text that the tokenizer (v0.2.0b) can consume.
 
+Preprocessing (line-ending detection, normalization, line counting) is
+done once by ``preprocess()``, which returns a ``SourceText``: the
+normalized text together with its line-ending counts, line count, and a
+lazily built line-offset index. Later phases reuse it instead of
+re-scanning the document.
+
 Classes:
     FileMetadata: Pydantic model capturing file-level encoding metadata.
+    SourceText: Normalized text plus counts and a line-offset index.
+    LineStream: Chunked, bounded-memory line reader over a file object.
+    MappedFile: Memory-mapped, zero-copy scanner for large files.
 
 Functions:
+    preprocess: One-pass line-ending detection and normalization.
     read_file: Read a file from disk and return decoded content with metadata.
+    read_file_mapped: Like read_file, via a memory map (no bytes copy).
     read_string: Wrap a raw string with metadata for pipeline compatibility.
+    read_string_source: Like read_string, returning the SourceText.
     read_bytes: Decode raw bytes with full encoding detection.
+    read_bytes_source: Like read_bytes, returning the SourceText.
 
 Related:
     - src/docstratum/schema/parsed.py: ParsedLlmsTxt model (populated downstream)
@@ -27,8 +40,14 @@ Research basis:
 
 from __future__ import annotations
 
+import codecs
 import logging
-import re
+import mmap
+import os
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterator
+from typing import IO, cast
 
 from pydantic import BaseModel, Field
 
@@ -99,6 +118,36 @@ class FileMetadata(BaseModel):
 _UTF8_BOM = b"\xef\xbb\xbf"
 
 
+def _line_ending_style(crlf: int, cr: int, lf: int) -> str:
+    """Map line-ending counts to the dominant style name.
+
+    Args:
+        crlf: Number of ``\\r\\n`` sequences.
+        cr: Number of ``\\r`` not followed by ``\\n``.
+        lf: Number of ``\\n`` not preceded by ``\\r``.
+
+    Returns:
+        One of ``'lf'``, ``'crlf'``, ``'cr'``, or ``'mixed'``.
+        Returns ``'lf'`` when there are no line endings at all
+        (the default per spec §4.2).
+    """
+    types_present = []
+    if crlf > 0:
+        types_present.append("crlf")
+    if lf > 0:
+        types_present.append("lf")
+    if cr > 0:
+        types_present.append("cr")
+
+    if len(types_present) == 0:
+        # No line endings at all → single-line file, default to 'lf'
+        return "lf"
+    if len(types_present) == 1:
+        return types_present[0]
+    # Multiple types present → mixed
+    return "mixed"
+
+
 def _detect_line_endings(text: str) -> str:
     """Detect the dominant line ending style in decoded text.
 
@@ -123,29 +172,7 @@ def _detect_line_endings(text: str) -> str:
         >>> _detect_line_endings("line1\\nline2\\n")
         'lf'
     """
-    # Count CRLF first, then account for lone CR and lone LF.
-    # Using regex to avoid double-counting \r\n as both \r and \n.
-    crlf_count = len(re.findall(r"\r\n", text))
-    # CR-only: \r NOT followed by \n
-    cr_count = len(re.findall(r"\r(?!\n)", text))
-    # LF-only: \n NOT preceded by \r
-    lf_count = len(re.findall(r"(?<!\r)\n", text))
-
-    types_present = []
-    if crlf_count > 0:
-        types_present.append("crlf")
-    if lf_count > 0:
-        types_present.append("lf")
-    if cr_count > 0:
-        types_present.append("cr")
-
-    if len(types_present) == 0:
-        # No line endings at all → single-line file, default to 'lf'
-        return "lf"
-    if len(types_present) == 1:
-        return types_present[0]
-    # Multiple types present → mixed
-    return "mixed"
+    return preprocess(text).line_ending_style
 
 
 def _normalize_line_endings(text: str) -> str:
@@ -161,18 +188,175 @@ def _normalize_line_endings(text: str) -> str:
     Returns:
         String with all line endings replaced by ``\\n``.
     """
+    if "\r" not in text:
+        return text
     return text.replace("\r\n", "\n").replace("\r", "\n")
 
 
-def read_file(path: str) -> tuple[str, FileMetadata]:
+# ── One-pass preprocessing ───────────────────────────────────────────
+
+
+class SourceText:
+    """LF-normalized text plus everything learned while normalizing it.
+
+    Produced by ``preprocess()``. Carries the original line-ending counts
+    (so ``line_ending_style`` needs no re-scan), the line count, and a
+    line-offset index that is built on first use and then shared by every
+    later phase that needs to map between offsets and lines.
+
+    Attributes:
+        text: The LF-normalized text.
+        crlf_count: ``\\r\\n`` sequences in the original text.
+        cr_count: Lone ``\\r`` in the original text.
+        lf_count: Lone ``\\n`` in the original text.
+
+    Example:
+        >>> src = preprocess("# T\\r\\n> D\\r\\n")
+        >>> src.text
+        '# T\\n> D\\n'
+        >>> src.line_ending_style, src.line_count
+        ('crlf', 3)
+        >>> list(src.line_starts)
+        [0, 4, 8]
+        >>> src.line_number(5)
+        2
+    """
+
+    __slots__ = ("_line_starts", "cr_count", "crlf_count", "lf_count", "text")
+
+    def __init__(
+        self, text: str, crlf_count: int = 0, cr_count: int = 0, lf_count: int = 0
+    ) -> None:
+        """Wrap already-normalized text and its original line-ending counts."""
+        self.text = text
+        self.crlf_count = crlf_count
+        self.cr_count = cr_count
+        self.lf_count = lf_count
+        self._line_starts: array | None = None
+
+    def __repr__(self) -> str:
+        """Short summary without the (possibly huge) text."""
+        return (
+            f"SourceText(chars={len(self.text)}, lines={self.line_count}, "
+            f"line_endings={self.line_ending_style!r})"
+        )
+
+    @property
+    def line_ending_style(self) -> str:
+        """Dominant original line ending: 'lf', 'crlf', 'cr', or 'mixed'."""
+        return _line_ending_style(self.crlf_count, self.cr_count, self.lf_count)
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines, counted as ``text.count("\\n") + 1`` (0 if empty)."""
+        if not self.text:
+            return 0
+        return self.crlf_count + self.cr_count + self.lf_count + 1
+
+    @property
+    def line_starts(self) -> array:
+        """Offset of the first character of every line (``array('q')``).
+
+        Built on first access and cached. ``line_starts[n - 1]`` is the
+        start of 1-indexed line ``n``.
+        """
+        if self._line_starts is None:
+            starts = array("q", [0])
+            if self.text:
+                find = self.text.find
+                append = starts.append
+                pos = find("\n")
+                while pos != -1:
+                    append(pos + 1)
+                    pos = find("\n", pos + 1)
+            self._line_starts = starts
+        return self._line_starts
+
+    def line(self, line_number: int) -> str:
+        """Return the text of 1-indexed line ``line_number`` (no newline).
+
+        Raises:
+            IndexError: If ``line_number`` is out of range.
+        """
+        if not 1 <= line_number <= self.line_count:
+            raise IndexError(f"line {line_number} out of range")
+        starts = self.line_starts
+        start = starts[line_number - 1]
+        end = starts[line_number] - 1 if line_number < len(starts) else len(self.text)
+        return self.text[start:end]
+
+    def line_number(self, offset: int) -> int:
+        """Return the 1-indexed line containing character ``offset``.
+
+        A bisect over ``line_starts``, so mapping many offsets costs
+        O(log lines) each instead of rescanning the text before every one.
+        The newline ending a line belongs to that line, and
+        ``len(text)`` maps to the last line.
+
+        Raises:
+            IndexError: If ``offset`` is outside ``0..len(text)``.
+        """
+        if not 0 <= offset <= len(self.text):
+            raise IndexError(f"offset {offset} out of range")
+        return bisect_right(self.line_starts, offset)
+
+
+def preprocess(text: str) -> SourceText:
+    """Detect line endings and normalize to LF in one logical pass.
+
+    Replaces the separate detect → normalize → count phases: the counts
+    come from C-level ``str.count`` (no match lists), the line count is
+    derived from those counts, and the text is only copied when it
+    actually contains a CR — LF files, the spec-required format, are
+    passed through untouched.
+
+    Args:
+        text: Decoded string with original line endings.
+
+    Returns:
+        A SourceText with the normalized text and its counts.
+    """
+    cr_total = text.count("\r")
+    lf_total = text.count("\n")
+    if cr_total:
+        crlf = text.count("\r\n")
+        normalized = text.replace("\r\n", "\n") if crlf else text
+        if cr_total > crlf:
+            normalized = normalized.replace("\r", "\n")
+    else:
+        crlf = 0
+        normalized = text
+    return SourceText(
+        normalized,
+        crlf_count=crlf,
+        cr_count=cr_total - crlf,
+        lf_count=lf_total - crlf,
+    )
+
+
+def _utf8_length(text: str) -> int:
+    """Length of ``text`` encoded as UTF-8, without encoding ASCII text."""
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
+def read_file(
+    path: str, *, mmap_threshold: int | None = None
+) -> tuple[str, FileMetadata]:
     """Read a file from disk and return decoded content with metadata.
 
     The file is read as raw bytes, then decoded to a Python string.
     Encoding detection, BOM handling, and line ending normalization
     happen during this step.
 
+    Files of at least ``mmap_threshold`` bytes (default
+    ``MMAP_THRESHOLD_BYTES``) are read through ``read_file_mapped()``
+    instead, which never materializes the raw bytes; the result is
+    identical.
+
     Args:
         path: Absolute or relative path to the file.
+        mmap_threshold: Size in bytes from which the memory-mapped path
+            is used. Defaults to ``MMAP_THRESHOLD_BYTES``.
 
     Returns:
         A tuple of:
@@ -196,6 +380,10 @@ def read_file(path: str) -> tuple[str, FileMetadata]:
     """
     logger.info("Loading file from %s", path)
 
+    threshold = MMAP_THRESHOLD_BYTES if mmap_threshold is None else mmap_threshold
+    if os.path.getsize(path) >= threshold:
+        return read_file_mapped(path)
+
     # Let FileNotFoundError and PermissionError propagate naturally
     with open(path, "rb") as f:
         raw_bytes = f.read()
@@ -227,28 +415,31 @@ def read_string(content: str) -> tuple[str, FileMetadata]:
         >>> meta.line_ending_style
         'crlf'
     """
-    # Compute byte count from UTF-8 encoding of the original string
-    byte_count = len(content.encode("utf-8"))
+    source, metadata = read_string_source(content)
+    return source.text, metadata
 
-    # Detect line endings before normalization
-    line_ending_style = _detect_line_endings(content)
 
-    # Normalize line endings to LF
-    normalized = _normalize_line_endings(content)
+def read_string_source(content: str) -> tuple[SourceText, FileMetadata]:
+    """Like ``read_string()``, but return the full ``SourceText``.
 
-    # Compute line count from normalized content
-    line_count = normalized.count("\n") + 1 if normalized else 0
+    Args:
+        content: Raw Markdown content.
+
+    Returns:
+        A tuple of (SourceText, FileMetadata).
+    """
+    source = preprocess(content)
 
     metadata = FileMetadata(
-        byte_count=byte_count,
+        byte_count=_utf8_length(content),
         encoding="utf-8",
         has_bom=False,
         has_null_bytes=False,
-        line_ending_style=line_ending_style,
-        line_count=line_count,
+        line_ending_style=source.line_ending_style,
+        line_count=source.line_count,
     )
 
-    return normalized, metadata
+    return source, metadata
 
 
 def read_bytes(data: bytes) -> tuple[str, FileMetadata]:
@@ -278,12 +469,26 @@ def read_bytes(data: bytes) -> tuple[str, FileMetadata]:
         >>> meta.line_count
         3
     """
+    source, metadata = read_bytes_source(data)
+    return source.text, metadata
+
+
+def read_bytes_source(data: bytes) -> tuple[SourceText, FileMetadata]:
+    """Like ``read_bytes()``, but return the full ``SourceText``.
+
+    Args:
+        data: Raw file bytes.
+
+    Returns:
+        A tuple of (SourceText, FileMetadata).
+    """
     byte_count = len(data)
 
     # -- Handle empty input --
     if byte_count == 0:
         logger.debug("Empty input (0 bytes)")
-        return "", FileMetadata(byte_count=0, encoding="utf-8", line_count=0)
+        empty_meta = FileMetadata(byte_count=0, encoding="utf-8", line_count=0)
+        return SourceText(""), empty_meta
 
     has_bom = False
     has_null_bytes = False
@@ -291,49 +496,485 @@ def read_bytes(data: bytes) -> tuple[str, FileMetadata]:
     decoding_error: str | None = None
 
     # -- Step 1: Check for UTF-8 BOM (0xEF 0xBB 0xBF) --
+    # The BOM is skipped with a zero-copy memoryview instead of slicing.
+    start = 0
     if data.startswith(_UTF8_BOM):
         has_bom = True
         encoding = "utf-8-bom"
-        data = data[3:]  # Strip the 3-byte BOM prefix
+        start = len(_UTF8_BOM)
         logger.debug("UTF-8 BOM detected and stripped")
 
     # -- Step 2: Scan for null bytes (0x00) --
-    if b"\x00" in data:
+    if data.find(b"\x00", start) != -1:
         has_null_bytes = True
         logger.debug("Null bytes detected (likely binary file)")
 
     # -- Step 3: Attempt UTF-8 decode, fallback to Latin-1 --
-    try:
-        text = data.decode("utf-8")
-        logger.debug("Detected encoding %s", encoding)
-    except UnicodeDecodeError as e:
-        # Latin-1 always succeeds (maps all 256 byte values)
-        # per v0.0.1a edge case D2
-        decoding_error = str(e)
-        text = data.decode("latin-1")
-        encoding = "latin-1"
-        logger.debug("UTF-8 decode failed, fell back to Latin-1: %s", decoding_error)
+    with memoryview(data) as view:
+        body = view[start:]
+        try:
+            text = str(body, "utf-8")
+            logger.debug("Detected encoding %s", encoding)
+        except UnicodeDecodeError as e:
+            # Latin-1 always succeeds (maps all 256 byte values)
+            # per v0.0.1a edge case D2
+            decoding_error = str(e)
+            text = str(body, "latin-1")
+            encoding = "latin-1"
+            logger.debug(
+                "UTF-8 decode failed, fell back to Latin-1: %s", decoding_error
+            )
+        body.release()
 
     logger.debug("Detected encoding %s", encoding)
 
-    # -- Step 4: Detect line endings (before normalization) --
-    line_ending_style = _detect_line_endings(text)
-    logger.debug("Detected line endings %s", line_ending_style)
-
-    # -- Step 5: Normalize line endings to LF --
-    normalized = _normalize_line_endings(text)
-
-    # -- Step 6: Compute line count --
-    line_count = normalized.count("\n") + 1 if normalized else 0
+    # -- Steps 4-6: Detect line endings, normalize to LF, count lines --
+    # (one pass; see preprocess())
+    source = preprocess(text)
+    logger.debug("Detected line endings %s", source.line_ending_style)
 
     metadata = FileMetadata(
         byte_count=byte_count,
         encoding=encoding,
         has_bom=has_bom,
         has_null_bytes=has_null_bytes,
-        line_ending_style=line_ending_style,
-        line_count=line_count,
+        line_ending_style=source.line_ending_style,
+        line_count=source.line_count,
         decoding_error=decoding_error,
     )
 
-    return normalized, metadata
+    return source, metadata
+
+
+# ── Streaming reader ─────────────────────────────────────────────────
+# Reads a file object in fixed-size chunks so a huge aggregate file never
+# has to be held in memory as one string. Memory is bounded by the chunk
+# size plus the longest single line.
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+"""Default number of bytes (or characters, for text streams) per read."""
+
+
+class LineStream:
+    """Iterate the LF-normalized lines of a file object, one chunk at a time.
+
+    Applies the same rules as ``read_bytes()`` (binary streams) or
+    ``read_string()`` (text streams) incrementally:
+
+    - a UTF-8 BOM at the very start of a binary stream is detected and
+      stripped, even if the first read returns fewer than 3 bytes;
+    - CRLF / CR are normalized to LF, including a CRLF split across two
+      chunks (a trailing CR is held back until the next chunk arrives);
+    - multi-byte UTF-8 sequences split across chunks are decoded correctly
+      (incremental decoder);
+    - null bytes, line ending style, byte count, and line count are
+      accumulated into ``metadata``.
+
+    Lines are yielded without their terminating newline. As with
+    ``tokenize()``, a final newline does not produce an extra empty line.
+
+    Latin-1 fallback:
+        ``read_bytes()`` decodes the *whole* file as Latin-1 when any byte
+        is invalid UTF-8. A stream cannot revisit lines it already yielded,
+        so ``LineStream`` switches to Latin-1 from the chunk containing the
+        first invalid byte onward. Output is identical whenever the text
+        before that chunk is ASCII (the common case for mis-encoded files);
+        otherwise earlier lines keep their UTF-8 decoding. ``encoding`` and
+        ``decoding_error`` are set exactly as ``read_bytes()`` would, though
+        the error message reports a chunk-relative position.
+
+    ``metadata`` is complete once iteration has finished.
+
+    Example:
+        >>> import io
+        >>> lines = LineStream(io.BytesIO(b"\\xef\\xbb\\xbf# T\\r\\n> D\\r\\n"))
+        >>> list(lines)
+        ['# T', '> D']
+        >>> lines.metadata.has_bom, lines.metadata.line_ending_style
+        (True, 'crlf')
+    """
+
+    def __init__(
+        self, stream: IO[bytes] | IO[str], chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> None:
+        """Wrap a binary or text file object.
+
+        Args:
+            stream: Any object with ``read(n)`` returning ``bytes`` or ``str``.
+            chunk_size: Maximum units requested per ``read()`` call.
+
+        Raises:
+            ValueError: If ``chunk_size`` is less than 1.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+        self._stream: IO[bytes] | IO[str] = stream
+        self._chunk_size = chunk_size
+        self._byte_count = 0
+        self._has_bom = False
+        self._has_null_bytes = False
+        self._encoding = "utf-8"
+        self._decoding_error: str | None = None
+        self._crlf = 0
+        self._cr = 0
+        self._lf = 0
+        self._newlines = 0
+        self._any_text = False
+        self._finished = False
+
+    @property
+    def finished(self) -> bool:
+        """Whether the stream has been read to the end."""
+        return self._finished
+
+    @property
+    def metadata(self) -> FileMetadata:
+        """FileMetadata for everything read so far (final once finished)."""
+        return FileMetadata(
+            byte_count=self._byte_count,
+            encoding=self._encoding,
+            has_bom=self._has_bom,
+            has_null_bytes=self._has_null_bytes,
+            line_ending_style=_line_ending_style(self._crlf, self._cr, self._lf),
+            line_count=self._newlines + 1 if self._any_text else 0,
+            decoding_error=self._decoding_error,
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield normalized lines; see the class docstring for semantics."""
+        tail = ""
+        held_cr = ""
+        for text in self._decoded_chunks():
+            # A CR at the end of a chunk may be the first half of a CRLF.
+            text = held_cr + text
+            if text.endswith("\r"):
+                held_cr = "\r"
+                text = text[:-1]
+            else:
+                held_cr = ""
+            if not text:
+                continue
+            self._count_line_endings(text)
+            text = _normalize_line_endings(text)
+            parts = (tail + text).split("\n")
+            tail = parts.pop()
+            yield from parts
+
+        if held_cr:
+            # A lone CR at end of file is a CR-only line ending.
+            self._count_line_endings(held_cr)
+            yield tail
+            tail = ""
+        if tail:
+            yield tail
+        self._finished = True
+        logger.debug(
+            "Streamed %d bytes, %d lines", self._byte_count, self.metadata.line_count
+        )
+
+    def _count_line_endings(self, text: str) -> None:
+        """Accumulate line-ending counts for a chunk that does not end in CR."""
+        self._any_text = True
+        crlf = text.count("\r\n")
+        cr = text.count("\r") - crlf
+        lf = text.count("\n") - crlf
+        self._crlf += crlf
+        self._cr += cr
+        self._lf += lf
+        self._newlines += crlf + cr + lf
+
+    def _decoded_chunks(self) -> Iterator[str]:
+        """Read the stream and yield decoded text chunks."""
+        size = self._chunk_size
+        first = self._stream.read(size)
+        if isinstance(first, str):
+            # Text stream: already decoded, mirrors read_string().
+            read_text = cast(IO[str], self._stream).read
+            piece = first
+            while piece:
+                self._byte_count += _utf8_length(piece)
+                yield piece
+                piece = read_text(size)
+            return
+
+        # -- Binary stream: BOM detection needs the first 3 bytes --
+        read = cast(IO[bytes], self._stream).read
+        head = first
+        while head and len(head) < len(_UTF8_BOM):
+            more = read(size)
+            if not more:
+                break
+            head += more
+        self._byte_count = len(head)
+        if head.startswith(_UTF8_BOM):
+            self._has_bom = True
+            self._encoding = "utf-8-bom"
+            head = head[len(_UTF8_BOM) :]
+            logger.debug("UTF-8 BOM detected and stripped")
+
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        latin1 = False
+        chunk = head
+        while True:
+            if chunk:
+                if not self._has_null_bytes and b"\x00" in chunk:
+                    self._has_null_bytes = True
+                    logger.debug("Null bytes detected (likely binary file)")
+                if latin1:
+                    yield chunk.decode("latin-1")
+                else:
+                    pending = decoder.getstate()[0]
+                    try:
+                        text = decoder.decode(chunk)
+                    except UnicodeDecodeError as e:
+                        # Switch to Latin-1 for the rest of the stream
+                        # (per v0.0.1a edge case D2; see class docstring).
+                        self._decoding_error = str(e)
+                        self._encoding = "latin-1"
+                        latin1 = True
+                        text = (pending + chunk).decode("latin-1")
+                        logger.debug(
+                            "UTF-8 decode failed mid-stream, Latin-1 from here: %s",
+                            e,
+                        )
+                    if text:
+                        yield text
+            chunk = read(size)
+            if not chunk:
+                break
+            self._byte_count += len(chunk)
+
+        if not latin1:
+            pending = decoder.getstate()[0]
+            try:
+                text = decoder.decode(b"", final=True)
+            except UnicodeDecodeError as e:
+                # Truncated multi-byte sequence at end of file.
+                self._decoding_error = str(e)
+                self._encoding = "latin-1"
+                text = pending.decode("latin-1")
+            if text:
+                yield text
+
+
+# ── Memory-mapped reader ─────────────────────────────────────────────
+# ``read_file()`` holds the raw bytes and the decoded text at the same
+# time (plus normalization copies). For multi-hundred-MB aggregate files
+# the raw bytes are pure overhead: a read-only memory map lets the OS page
+# the file in on demand, all scanning happens on the mapped buffer, and
+# the text is decoded straight from a memoryview only when requested.
+
+MMAP_THRESHOLD_BYTES = 32 * 1024 * 1024
+"""File size from which ``read_file()`` switches to the memory-mapped path."""
+
+DEFAULT_SCAN_WINDOW = 1024 * 1024
+"""Bytes examined per window when scanning a mapped file."""
+
+
+def _format_decode_error(data_start: int, data_end: int, byte: int, reason: str) -> str:
+    """Render a UTF-8 decode error exactly as ``str(UnicodeDecodeError)`` does.
+
+    Used when the error was raised on a window, so positions are rebased to
+    the whole (post-BOM) content and the message matches ``read_bytes()``.
+    """
+    if data_end == data_start + 1:
+        return (
+            f"'utf-8' codec can't decode byte 0x{byte:02x} "
+            f"in position {data_start}: {reason}"
+        )
+    return (
+        f"'utf-8' codec can't decode bytes in position "
+        f"{data_start}-{data_end - 1}: {reason}"
+    )
+
+
+class MappedFile:
+    """Read-only memory map of a file with zero-copy scanning.
+
+    ``scan()`` computes the same ``FileMetadata`` as ``read_bytes()`` —
+    BOM, null bytes, UTF-8 validity (with an identical ``decoding_error``),
+    line-ending counts, and line count — by examining the mapped buffer in
+    ``window``-sized pieces, so scanning allocates O(window) memory no
+    matter how large the file is. ``read_text()`` decodes directly from a
+    memoryview over the map; the raw bytes are never copied into a
+    ``bytes`` object.
+
+    Peak Python-heap memory for ``read_text()`` is the decoded string plus
+    one window for LF files (CR-containing files add one normalization
+    copy), versus roughly 2-3x the file size for ``read_file()``.
+
+    Use as a context manager; the map is closed on exit.
+
+    Example:
+        >>> with MappedFile("llms-full.txt") as mapped:
+        ...     meta = mapped.scan()
+        ...     text = mapped.read_text()
+        >>> meta.byte_count == len(text.encode())
+        True
+    """
+
+    def __init__(self, path: str, window: int = DEFAULT_SCAN_WINDOW) -> None:
+        """Open and map ``path`` read-only.
+
+        Args:
+            path: File to map.
+            window: Bytes examined per scanning step.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            PermissionError: If the file cannot be read.
+            ValueError: If ``window`` is less than 1.
+        """
+        if window < 1:
+            raise ValueError(f"window must be >= 1, got {window}")
+        self.path = path
+        self._window = window
+        self._metadata: FileMetadata | None = None
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            # Zero-length files cannot be mapped.
+            self._mm = (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+            )
+        self._start = (
+            len(_UTF8_BOM)
+            if self._mm is not None and self._mm[: len(_UTF8_BOM)] == _UTF8_BOM
+            else 0
+        )
+
+    def __enter__(self) -> MappedFile:
+        """Return self; the map is already open."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the map."""
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the file. Safe to call more than once."""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+    @property
+    def byte_count(self) -> int:
+        """Raw file size in bytes (including any BOM)."""
+        return len(self._mm) if self._mm is not None else 0
+
+    @property
+    def has_bom(self) -> bool:
+        """Whether the file starts with a UTF-8 BOM."""
+        return self._start > 0
+
+    def scan(self) -> FileMetadata:
+        """Compute FileMetadata from the mapped buffer (cached).
+
+        Returns:
+            FileMetadata identical to ``read_bytes()`` on the same bytes.
+        """
+        if self._metadata is not None:
+            return self._metadata
+
+        mm = self._mm
+        if mm is None:
+            self._metadata = FileMetadata(byte_count=0, encoding="utf-8", line_count=0)
+            return self._metadata
+
+        start = self._start
+        size = len(mm)
+        has_null_bytes = mm.find(b"\x00", start) != -1
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        decoding_error: str | None = None
+        crlf = cr_total = lf_total = 0
+        prev_cr = False
+
+        with memoryview(mm) as view:
+            for pos in range(start, size, self._window):
+                end = min(pos + self._window, size)
+                window = view[pos:end]
+                chunk = window.tobytes()  # one bounded window, not the file
+
+                # -- Line endings: counts per window, CRLF across edges --
+                cr_total += chunk.count(b"\r")
+                lf_total += chunk.count(b"\n")
+                crlf += chunk.count(b"\r\n")
+                if prev_cr and chunk.startswith(b"\n"):
+                    crlf += 1
+                prev_cr = chunk.endswith(b"\r")
+
+                # -- UTF-8 validity: decode and discard --
+                if decoding_error is None:
+                    pending = decoder.getstate()[0]
+                    try:
+                        decoder.decode(chunk, final=end == size)
+                    except UnicodeDecodeError as e:
+                        base = pos - start - len(pending)
+                        bad = (pending + chunk)[e.start]
+                        decoding_error = _format_decode_error(
+                            base + e.start, base + e.end, bad, e.reason
+                        )
+                window.release()
+
+        encoding = "utf-8-bom" if self.has_bom else "utf-8"
+        if decoding_error is not None:
+            encoding = "latin-1"
+
+        # \r and \n are single bytes in both UTF-8 and Latin-1, so byte
+        # counts equal the character counts read_bytes() would see.
+        counts = SourceText(
+            "x" if size > start else "",
+            crlf_count=crlf,
+            cr_count=cr_total - crlf,
+            lf_count=lf_total - crlf,
+        )
+        self._metadata = FileMetadata(
+            byte_count=size,
+            encoding=encoding,
+            has_bom=self.has_bom,
+            has_null_bytes=has_null_bytes,
+            line_ending_style=counts.line_ending_style,
+            line_count=counts.line_count,
+            decoding_error=decoding_error,
+        )
+        return self._metadata
+
+    def read_source(self) -> SourceText:
+        """Decode and normalize the content, straight from the map.
+
+        Returns:
+            The preprocessed text (see ``preprocess()``).
+        """
+        mm = self._mm
+        if mm is None:
+            return SourceText("")
+        meta = self.scan()
+        encoding = "latin-1" if meta.encoding == "latin-1" else "utf-8"
+        with memoryview(mm) as view:
+            body = view[self._start :]
+            text = str(body, encoding)
+            body.release()
+        return preprocess(text)
+
+    def read_text(self) -> str:
+        """Decode and normalize the content; see ``read_source()``."""
+        return self.read_source().text
+
+
+def read_file_mapped(path: str) -> tuple[str, FileMetadata]:
+    """Read a file via a memory map; same result as ``read_file()``.
+
+    Args:
+        path: Absolute or relative path to the file.
+
+    Returns:
+        A tuple of (decoded LF-normalized string, FileMetadata).
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        PermissionError: If the file cannot be read.
+    """
+    with MappedFile(path) as mapped:
+        metadata = mapped.scan()
+        content = mapped.read_text()
+    logger.info("Loaded %d bytes from %s (memory-mapped)", metadata.byte_count, path)
+    return content, metadata
@@ -0,0 +1,417 @@
+"""Lazy, section-indexed parsing for oversized documents (v0.9.2b).
+
+``populate()`` builds every ``ParsedSection`` up front: it classifies every
+line, concatenates each section's ``raw_content``, and parses every link.
+For a multi-megabyte ``llms-full.txt`` most of that work is wasted when
+the caller only needs the title, the section names, or a token estimate.
+
+``populate_lazy()`` instead makes one regex pass that visits only the
+lines starting with a code fence or ``## `` and records a section offset
+table — one ``SectionSpan`` per H2, code-fence aware with the tokenizer's
+rules. Title and blockquote come from tokenizing the short preamble. The
+resulting ``LazyDocument`` answers from the table:
+
+    title / title_line / blockquote   From the preamble
+    section_names / section_count     From the spans
+    estimated_tokens / section_tokens Span lengths (chars / 4)
+
+and builds a section's ``raw_content`` and links only when
+``document.sections[i]`` is read (each section at most once). Callers
+that iterate ``sections`` with an early exit — the classifier's
+"any section with links?" test — materialize only what they touch.
+``materialize()`` produces the ``ParsedLlmsTxt`` that ``populate()``
+would have produced from the same text.
+
+Files at or above ``LAZY_THRESHOLD_TOKENS`` are the intended audience;
+``ParserAdapter.parse_lazy()`` is the entry point from raw content, and
+``ParserAdapter.parse_for_reading()`` picks it for such files.
+
+Classes:
+    SectionSpan: Offsets and line numbers of one H2 section.
+    LazySections: Read-only sequence that materializes sections on access.
+    LazyDocument: Section-indexed view of a parsed document.
+
+Functions:
+    populate_lazy: Scan a document into a LazyDocument.
+
+Related:
+    - src/docstratum/parser/populator.py: Eager population (the reference)
+    - src/docstratum/parser/tokenizer.py: Line classification rules
+    - src/docstratum/parser/classifier.py: Reads titles, sections, raw content
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections.abc import Iterator, Sequence
+from datetime import datetime
+from typing import NamedTuple, overload
+
+from docstratum.parser.io import FileMetadata
+from docstratum.parser.populator import _parse_link_line, populate
+from docstratum.parser.tokenizer import _BLANK_RE, tokenize_table
+from docstratum.schema.parsed import (
+    ParsedBlockquote,
+    ParsedLink,
+    ParsedLlmsTxt,
+    ParsedSection,
+)
+from docstratum.schema.trusted import trusted_constructor
+
+logger = logging.getLogger(__name__)
+
+LAZY_THRESHOLD_TOKENS = 50_000
+"""Estimated token count at which lazy parsing pays off (SizeTier.OVERSIZED)."""
+
+# Line starts that change section structure: code fences and H2 headings.
+_STRUCTURE_RE = re.compile(r"^(?:```|## )", re.MULTILINE)
+
+# Line starts that matter inside a section: code fences and link entries.
+_LINK_OR_FENCE_RE = re.compile(r"^(?:```|- \[)", re.MULTILINE)
+
+
+class SectionSpan(NamedTuple):
+    """Where one H2 section lives in the scanned text.
+
+    ``text[start:end]`` is the section's ``raw_content``: the lines after
+    the heading up to the next heading, without leading empty lines and
+    without the final newline (exactly what ``populate()`` builds).
+
+    Attributes:
+        name: Heading text without ``## ``.
+        line_number: 1-indexed line of the heading.
+        start: Offset of the first content character.
+        end: Offset one past the last content character.
+        content_line: 1-indexed line number of ``start``.
+    """
+
+    name: str
+    line_number: int
+    start: int
+    end: int
+    content_line: int
+
+    @property
+    def estimated_tokens(self) -> int:
+        """Token estimate of the section content (chars / 4)."""
+        return (self.end - self.start) // 4
+
+
+def _preamble_end(body: str, limit: int) -> int:
+    """Offset after the leading lines that can hold the title or blockquote.
+
+    Phases 1 and 2 of ``populate()`` only look at leading blank, H1, and
+    blockquote lines, so the preamble stops at the first line that starts
+    with neither ``#`` nor ``>`` and is not blank (or at ``limit``, the
+    first H2). Blank means what it means to the tokenizer: whitespace
+    only, Unicode whitespace such as NBSP included.
+    """
+    pos = 0
+    while pos < limit:
+        end = body.find("\n", pos, limit)
+        line_end = limit if end == -1 else end
+        first = body[pos]
+        if first not in "#>" and not (
+            first.isspace() and _BLANK_RE.fullmatch(body, pos, line_end)
+        ):
+            return pos
+        if end == -1:
+            return limit
+        pos = end + 1
+    return limit
+
+
+def _scan_sections(body: str) -> tuple[list[SectionSpan], int]:
+    """Find every H2 outside code fences and compute its content span.
+
+    Returns:
+        The spans, and the offset of the first H2 (``len(body)`` if none).
+    """
+    headings: list[tuple[int, int, int]] = []  # (heading start, heading end, line)
+    in_code_block = False
+    line = 1
+    last = 0
+    count = body.count
+    find = body.find
+    for match in _STRUCTURE_RE.finditer(body):
+        pos = match.start()
+        if body.startswith("```", pos):
+            in_code_block = not in_code_block
+            continue
+        if in_code_block:
+            continue
+        line += count("\n", last, pos)
+        last = pos
+        end = find("\n", pos)
+        headings.append((pos, len(body) if end == -1 else end, line))
+
+    # A trailing "\n" does not start a new line (tokenizer rule).
+    body_end = len(body) - 1 if body.endswith("\n") else len(body)
+    spans: list[SectionSpan] = []
+    for i, (pos, heading_end, line) in enumerate(headings):
+        end = headings[i + 1][0] - 1 if i + 1 < len(headings) else body_end
+        start = heading_end + 1
+        # populate() drops the empty lines a section starts with.
+        skipped = 0
+        while start < end and body[start] == "\n":
+            start += 1
+            skipped += 1
+        end = max(start, end)
+        spans.append(
+            SectionSpan(
+                name=body[pos:heading_end].removeprefix("## ").strip(),
+                line_number=line,
+                start=start,
+                end=end,
+                content_line=line + 1 + skipped,
+            )
+        )
+    return spans, headings[0][0] if headings else len(body)
+
+
+def _section_links(body: str, span: SectionSpan) -> list[ParsedLink]:
+    """Parse the link entries of one section, skipping fenced code."""
+    links: list[ParsedLink] = []
+    new_link = trusted_constructor(ParsedLink)
+    in_code_block = False
+    line = span.content_line
+    last = span.start
+    for match in _LINK_OR_FENCE_RE.finditer(body, span.start, span.end):
+        pos = match.start()
+        if body.startswith("```", pos):
+            in_code_block = not in_code_block
+            continue
+        if in_code_block:
+            continue
+        line += body.count("\n", last, pos)
+        last = pos
+        end = body.find("\n", pos, span.end)
+        link = _parse_link_line(
+            body[pos : span.end if end == -1 else end], line, new_link
+        )
+        if link is not None:
+            links.append(link)
+    return links
+
+
+class LazySections(Sequence[ParsedSection]):
+    """The sections of a ``LazyDocument``, built on first access.
+
+    Behaves like the read-only ``list[ParsedSection]`` of a parsed
+    document: indexing, slicing, iteration, ``len()``, and comparison
+    with a list. Each section is materialized once and then reused.
+    """
+
+    __slots__ = ("_body", "_built", "_spans")
+
+    def __init__(self, body: str, spans: list[SectionSpan]) -> None:
+        self._body = body
+        self._spans = spans
+        self._built: list[ParsedSection | None] = [None] * len(spans)
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    @overload
+    def __getitem__(self, index: int) -> ParsedSection: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[ParsedSection]: ...
+
+    def __getitem__(self, index: int | slice) -> ParsedSection | list[ParsedSection]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        section = self._built[index]
+        if section is None:
+            span = self._spans[index]
+            section = trusted_constructor(ParsedSection)(
+                {
+                    "name": span.name,
+                    "line_number": span.line_number,
+                    "raw_content": self._body[span.start : span.end],
+                    "links": _section_links(self._body, span),
+                    "estimated_tokens": span.estimated_tokens,
+                }
+            )
+            self._built[index] = section
+        return section
+
+    def __iter__(self) -> Iterator[ParsedSection]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazySections):
+            other = list(other)
+        if isinstance(other, list):
+            return len(other) == len(self) and list(self) == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def materialized(self) -> int:
+        """How many sections have been built so far."""
+        return sum(1 for s in self._built if s is not None)
+
+    def __repr__(self) -> str:
+        return f"LazySections({len(self)} sections, {self.materialized} built)"
+
+
+class LazyDocument:
+    """Section-indexed view of a document, materialized on demand.
+
+    Exposes the read-only surface of ``ParsedLlmsTxt`` that the
+    classifier and reports use, so it can be passed where a parsed
+    document is only read.
+
+    Attributes:
+        title: H1 title text, or None.
+        title_line: Line number of the H1 title.
+        blockquote: The blockquote description, or None.
+        spans: Section offset table, in document order.
+        sections: The sections, built on first access.
+        raw_content: Complete raw file content.
+        source_filename: Original filename.
+        parsed_at: When the scan completed.
+        file_meta: I/O metadata when produced by
+            ``ParserAdapter.parse_lazy()``, else None.
+
+    Example:
+        >>> doc = populate_lazy(text, raw_content=text, source_filename="llms-full.txt")
+        >>> doc.section_names[:2]
+        ['Getting Started', 'API Reference']
+        >>> doc.sections.materialized
+        0
+    """
+
+    __slots__ = (
+        "blockquote",
+        "file_meta",
+        "parsed_at",
+        "raw_content",
+        "sections",
+        "source_filename",
+        "spans",
+        "title",
+        "title_line",
+    )
+
+    def __init__(
+        self,
+        body: str,
+        spans: list[SectionSpan],
+        *,
+        title: str | None = None,
+        title_line: int | None = None,
+        blockquote: ParsedBlockquote | None = None,
+        raw_content: str = "",
+        source_filename: str = "llms.txt",
+        file_meta: FileMetadata | None = None,
+    ) -> None:
+        """Wrap a scanned body; use ``populate_lazy()`` to build one."""
+        self.title = title
+        self.title_line = title_line
+        self.blockquote = blockquote
+        self.spans = spans
+        self.sections = LazySections(body, spans)
+        self.raw_content = raw_content
+        self.source_filename = source_filename
+        self.parsed_at = datetime.now()
+        self.file_meta = file_meta
+
+    # ── ParsedLlmsTxt-compatible properties ──────────────────────────
+
+    @property
+    def section_count(self) -> int:
+        """Total number of H2 sections."""
+        return len(self.spans)
+
+    @property
+    def section_names(self) -> list[str]:
+        """Section names in document order (no materialization)."""
+        return [span.name for span in self.spans]
+
+    @property
+    def total_links(self) -> int:
+        """Total number of links (materializes every section)."""
+        return sum(s.link_count for s in self.sections)
+
+    @property
+    def estimated_tokens(self) -> int:
+        """Approximate total token count (heuristic: chars / 4)."""
+        return len(self.raw_content) // 4
+
+    @property
+    def has_blockquote(self) -> bool:
+        """Whether a blockquote description is present."""
+        return self.blockquote is not None
+
+    # ── Lazy-specific API ────────────────────────────────────────────
+
+    def section_tokens(self, index: int) -> int:
+        """Token estimate of section ``index`` (no materialization)."""
+        return self.spans[index].estimated_tokens
+
+    def materialize(self) -> ParsedLlmsTxt:
+        """Build the full ``ParsedLlmsTxt`` (as ``populate()`` would)."""
+        return ParsedLlmsTxt(
+            title=self.title,
+            title_line=self.title_line,
+            blockquote=self.blockquote,
+            sections=list(self.sections),
+            raw_content=self.raw_content,
+            source_filename=self.source_filename,
+            parsed_at=self.parsed_at,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"LazyDocument({self.source_filename!r}, sections={self.section_count}, "
+            f"built={self.sections.materialized})"
+        )
+
+
+def populate_lazy(
+    body: str,
+    *,
+    raw_content: str = "",
+    source_filename: str = "llms.txt",
+) -> LazyDocument:
+    """Scan a document into a ``LazyDocument``.
+
+    Takes the same text ``tokenize_table()`` would (decoded,
+    LF-normalized, frontmatter stripped) and the same keyword arguments
+    as ``populate()``.
+
+    Args:
+        body: The Markdown body to index.
+        raw_content: Complete original file text.
+        source_filename: Value for ``source_filename``.
+
+    Returns:
+        A LazyDocument; no section has been materialized yet.
+
+    Example:
+        >>> doc = populate_lazy("# App\\n## API\\n- [A](https://a.dev)\\n")
+        >>> doc.section_names, doc.section_count
+        (['API'], 1)
+    """
+    spans, first_heading = _scan_sections(body)
+    head = populate(tokenize_table(body[: _preamble_end(body, first_heading)]))
+
+    logger.info(
+        "Indexed %s lazily: %s sections",
+        source_filename,
+        len(spans),
+    )
+    return LazyDocument(
+        body,
+        spans,
+        title=head.title,
+        title_line=head.title_line,
+        blockquote=head.blockquote,
+        raw_content=raw_content,
+        source_filename=source_filename,
+    )
@@ -20,6 +20,8 @@ Research basis:
 from __future__ import annotations
 
 import logging
+import re
+from collections.abc import Iterator
 
 import yaml
 
@@ -27,6 +29,9 @@ from docstratum.schema.enrichment import Metadata
 
 logger = logging.getLogger(__name__)
 
+# The line boundaries recognized by ``str.splitlines()``.
+_LINE_BREAK_RE = re.compile(r"\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
 
 def extract_metadata(raw_content: str) -> Metadata | None:
     """Extract YAML frontmatter metadata from raw file content.
@@ -68,6 +73,27 @@ def extract_metadata(raw_content: str) -> Metadata | None:
     return _map_to_metadata(raw_dict)
 
 
+def _iter_lines_keepends(content: str) -> Iterator[str]:
+    """Lazily yield ``content.splitlines(keepends=True)``.
+
+    Frontmatter lives at the top of the file, so the caller usually stops
+    after a handful of lines; the rest of the document is never split.
+
+    Args:
+        content: Text to split.
+
+    Yields:
+        Each line including its line break, exactly as ``splitlines``.
+    """
+    pos = 0
+    for match in _LINE_BREAK_RE.finditer(content):
+        end = match.end()
+        yield content[pos:end]
+        pos = end
+    if pos < len(content):
+        yield content[pos:]
+
+
 def _extract_frontmatter_text(content: str) -> str | None:
     """Extract the text between opening and closing --- delimiters.
 
@@ -81,31 +107,26 @@ def _extract_frontmatter_text(content: str) -> str | None:
         The text between delimiters, or None if no valid
         frontmatter block is found.
     """
-    lines = content.splitlines(keepends=True)
-
-    # Skip leading blank lines
-    start_idx = 0
-    while start_idx < len(lines) and lines[start_idx].strip() == "":
-        start_idx += 1
-
-    # Check for opening delimiter
-    if start_idx >= len(lines) or lines[start_idx].strip() != "---":
-        return None
+    lines = _iter_lines_keepends(content)
 
-    # Find closing delimiter
-    body_start = start_idx + 1
-    close_idx = None
-    for i in range(body_start, len(lines)):
-        if lines[i].strip() == "---":
-            close_idx = i
+    # Skip leading blank lines, then check for the opening delimiter
+    for line in lines:
+        if line.strip() != "":
             break
+    else:
+        return None
+    if line.strip() != "---":
+        return None
 
-    if close_idx is None:
-        return None  # No closing delimiter
+    # Collect lines until the closing delimiter
+    frontmatter_lines: list[str] = []
+    for line in lines:
+        if line.strip() == "---":
+            # Extract frontmatter text
+            return "".join(frontmatter_lines)
+        frontmatter_lines.append(line)
 
-    # Extract frontmatter text
-    frontmatter_lines = lines[body_start:close_idx]
-    return "".join(frontmatter_lines)
+    return None  # No closing delimiter
 
 
 def _parse_yaml(text: str) -> dict | None:
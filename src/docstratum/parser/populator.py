@@ -14,6 +14,10 @@ The populator follows the reference parser design in v0.0.1a and uses
 a cursor-based sequential walk -- each phase advances through the
 token list from where the previous phase left off.
 
+The walk runs over a columnar ``TokenTable`` (type codes + line spans),
+so no per-line ``Token`` model is needed. A ``list[Token]`` is still
+accepted and is converted to a table first.
+
 Functions:
     populate: Walk tokens and build a ParsedLlmsTxt instance.
 
@@ -32,9 +36,12 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Callable
 from datetime import datetime
+from typing import Any
 from urllib.parse import urlparse
 
+from docstratum.parser.token_table import TOKEN_CODES, TokenTable
 from docstratum.parser.tokens import Token, TokenType
 from docstratum.schema.parsed import (
     ParsedBlockquote,
@@ -42,6 +49,7 @@ from docstratum.schema.parsed import (
     ParsedLlmsTxt,
     ParsedSection,
 )
+from docstratum.schema.trusted import revalidate, trusted_constructor
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +57,18 @@ logger = logging.getLogger(__name__)
 # Groups: (1) title, (2) URL, (3) optional description after ": "
 LINK_PATTERN = re.compile(r"^- \[([^\]]*)\]\(([^)]*)\)(?::\s*(.*))?$")
 
+# Type codes for the columnar walk.
+_H1 = TOKEN_CODES[TokenType.H1]
+_H2 = TOKEN_CODES[TokenType.H2]
+_BLANK = TOKEN_CODES[TokenType.BLANK]
+_BLOCKQUOTE = TOKEN_CODES[TokenType.BLOCKQUOTE]
+_LINK_ENTRY = TOKEN_CODES[TokenType.LINK_ENTRY]
+_CODE_FENCE = TOKEN_CODES[TokenType.CODE_FENCE]
+
+# Characters that make urlsplit() strip, reject, or re-check the netloc;
+# URLs containing them skip the http(s) fast path below.
+_URL_SLOW_PATH_CHARS = frozenset("\t\r\n[]")
+
 
 def _is_syntactically_valid_url(url: str) -> bool:
     """Check if a URL is syntactically valid (not reachable).
@@ -82,6 +102,17 @@ def _is_syntactically_valid_url(url: str) -> bool:
     if url.startswith(("/", "./", "../")):
         return True
 
+    # Fast path for plain http(s) URLs (almost every link): the netloc is
+    # what follows "//" up to the first "/", "?", or "#", exactly as
+    # urlparse() would split it.
+    if (
+        url.startswith(("https://", "http://"))
+        and url.isascii()
+        and _URL_SLOW_PATH_CHARS.isdisjoint(url)
+    ):
+        rest = url[8:] if url[4] == "s" else url[7:]
+        return bool(rest) and rest[0] not in "/?#"
+
     parsed = urlparse(url)
     return bool(parsed.scheme and parsed.netloc)
 
@@ -99,20 +130,39 @@ def _parse_link_entry(token: Token) -> ParsedLink | None:
     Returns:
         ParsedLink if the regex matches, None if the line is
         malformed (starts with ``- [`` but doesn't complete the pattern).
+    """
+    return _parse_link_line(token.raw_text, token.line_number)
+
+
+def _parse_link_line(
+    raw_text: str,
+    line_number: int,
+    new_link: Callable[[dict[str, Any]], ParsedLink] | None = None,
+) -> ParsedLink | None:
+    """Parse the text of a LINK_ENTRY line into a ParsedLink.
+
+    Args:
+        raw_text: The complete line text.
+        line_number: 1-indexed line number of the line.
+        new_link: Trusted ParsedLink constructor; callers parsing many
+            lines fetch it once. Defaults to ``trusted_constructor()``.
+
+    Returns:
+        ParsedLink if the regex matches, None if the line is malformed.
 
     Regex groups:
         group(1) = link title (content within ``[]``)
         group(2) = URL (content within ``()``)
         group(3) = description (content after ``:``) or None
     """
-    match = LINK_PATTERN.match(token.raw_text)
+    match = LINK_PATTERN.match(raw_text)
     if not match:
         # Malformed link entry -- tokenizer flagged it as LINK_ENTRY
         # based on prefix, but full pattern doesn't match.
         logger.debug(
             "Malformed link entry at line %s: %s",
-            token.line_number,
-            token.raw_text,
+            line_number,
+            raw_text,
         )
         return None
 
@@ -120,12 +170,16 @@ def _parse_link_entry(token: Token) -> ParsedLink | None:
     url = match.group(2).strip()
     description = match.group(3).strip() if match.group(3) else None
 
-    return ParsedLink(
-        title=title,
-        url=url,
-        description=description,
-        line_number=token.line_number,
-        is_valid_url=_is_syntactically_valid_url(url),
+    if new_link is None:
+        new_link = trusted_constructor(ParsedLink)
+    return new_link(
+        {
+            "title": title,
+            "url": url,
+            "description": description,
+            "line_number": line_number,
+            "is_valid_url": _is_syntactically_valid_url(url),
+        }
     )
 
 
@@ -143,7 +197,7 @@ def _estimate_section_tokens(doc: ParsedLlmsTxt) -> None:
 
 
 def populate(
-    tokens: list[Token],
+    tokens: list[Token] | TokenTable,
     *,
     raw_content: str = "",
     source_filename: str = "llms.txt",
@@ -155,8 +209,15 @@ def populate(
     assembly. Produces a fully populated model with safe defaults
     for any missing elements.
 
+    Section ``raw_content`` is sliced from the table's source once per
+    section, so population is linear in the number of lines however
+    large a single section is. This relies on the rows being
+    consecutive lines of ``table.source``, which holds for
+    ``tokenize_table()`` and ``TokenTable.from_tokens()``.
+
     Args:
-        tokens: Ordered list of Token instances from tokenize().
+        tokens: A TokenTable from tokenize_table(), or an ordered list
+            of Token instances from tokenize().
         raw_content: Complete original file text (set as-is on
             ParsedLlmsTxt.raw_content).
         source_filename: Value for ParsedLlmsTxt.source_filename.
@@ -165,122 +226,135 @@ def populate(
         A ParsedLlmsTxt instance. Always non-None.
 
     Example:
-        >>> from docstratum.parser.tokenizer import tokenize
-        >>> tokens = tokenize("# My App\\n> A tool\\n## API\\n- [Auth](https://api.com/auth): Auth docs\\n")
-        >>> doc = populate(tokens, raw_content="...", source_filename="llms.txt")
+        >>> from docstratum.parser.tokenizer import tokenize_table
+        >>> table = tokenize_table("# My App\\n> A tool\\n## API\\n- [Auth](https://api.com/auth): Auth docs\\n")
+        >>> doc = populate(table, raw_content="...", source_filename="llms.txt")
         >>> doc.title
         'My App'
         >>> doc.sections[0].name
         'API'
     """
-    logger.info("Populating model from %s tokens", len(tokens))
+    table = tokens if isinstance(tokens, TokenTable) else TokenTable.from_tokens(tokens)
+
+    logger.info("Populating model from %s tokens", len(table))
+
+    # Column locals: the walk below only touches ints until it needs text.
+    types = table.types
+    starts = table.starts
+    ends = table.ends
+    line_numbers = table.line_numbers
+    source = table.source
+
+    # Internal values: trusted construction (see schema/trusted.py).
+    new_link = trusted_constructor(ParsedLink)
+    new_section = trusted_constructor(ParsedSection)
 
     doc = ParsedLlmsTxt()
     pos = 0
-    total = len(tokens)
+    total = len(table)
 
     # ── Phase 1: H1 Title Extraction ─────────────────────────────────
     # Advance past leading BLANK tokens, then look for the first H1.
-    while pos < total and tokens[pos].token_type == TokenType.BLANK:
+    while pos < total and types[pos] == _BLANK:
         pos += 1
 
-    if pos < total and tokens[pos].token_type == TokenType.H1:
-        doc.title = tokens[pos].raw_text.removeprefix("# ").strip()
-        doc.title_line = tokens[pos].line_number
+    if pos < total and types[pos] == _H1:
+        doc.title = source[starts[pos] : ends[pos]].removeprefix("# ").strip()
+        doc.title_line = line_numbers[pos]
         pos += 1
 
     # ── Phase 2: Blockquote Extraction ───────────────────────────────
     # Skip BLANK tokens after H1, then collect consecutive BLOCKQUOTE tokens.
-    while pos < total and tokens[pos].token_type == TokenType.BLANK:
+    while pos < total and types[pos] == _BLANK:
         pos += 1
 
-    bq_tokens: list[Token] = []
-    while pos < total and tokens[pos].token_type == TokenType.BLOCKQUOTE:
-        bq_tokens.append(tokens[pos])
+    bq_first = pos
+    while pos < total and types[pos] == _BLOCKQUOTE:
         pos += 1
 
-    if bq_tokens:
+    if pos > bq_first:
+        bq_lines = [source[starts[i] : ends[i]] for i in range(bq_first, pos)]
         text_lines: list[str] = []
-        for bq_token in bq_tokens:
-            if bq_token.raw_text == ">":
+        for bq_text in bq_lines:
+            if bq_text == ">":
                 text_lines.append("")
-            elif bq_token.raw_text.startswith("> "):
-                text_lines.append(bq_token.raw_text[2:])
+            elif bq_text.startswith("> "):
+                text_lines.append(bq_text[2:])
             else:
-                text_lines.append(bq_token.raw_text[1:])
-
-        doc.blockquote = ParsedBlockquote(
-            text="\n".join(text_lines),
-            line_number=bq_tokens[0].line_number,
-            raw="\n".join(t.raw_text for t in bq_tokens),
+                text_lines.append(bq_text[1:])
+
+        doc.blockquote = trusted_constructor(ParsedBlockquote)(
+            {
+                "text": "\n".join(text_lines),
+                "line_number": line_numbers[bq_first],
+                "raw": "\n".join(bq_lines),
+            }
         )
 
     # ── Phase 3: Body Content Consumption ────────────────────────────
     # Consume all tokens that are NOT H2 -- body content between
     # blockquote and first section. Not stored separately.
-    while pos < total and tokens[pos].token_type != TokenType.H2:
+    while pos < total and types[pos] != _H2:
         # H1 tokens in the body are treated as text (spec A4)
-        if tokens[pos].token_type == TokenType.H1:
+        if types[pos] == _H1:
             logger.debug(
                 "Additional H1 at line %s treated as text",
-                tokens[pos].line_number,
+                line_numbers[pos],
             )
         pos += 1
 
     # ── Phase 4: Section & Link Building ─────────────────────────────
+    # Every section line (fences, links, text) belongs to raw_content,
+    # except the empty lines a section starts with. Rows are consecutive
+    # lines of ``source``, so each section's raw_content is one slice from
+    # its first non-empty row to its last row, taken when it closes.
     current_section: ParsedSection | None = None
     in_code_block = False
+    content_first = -1  # first non-empty row of the current section
 
     while pos < total:
-        token = tokens[pos]
-        pos += 1
+        code = types[pos]
 
-        if token.token_type == TokenType.H2:
+        if code == _H2:
+            if current_section is not None and content_first >= 0:
+                current_section.raw_content = source[
+                    starts[content_first] : ends[pos - 1]
+                ]
             # Close any open code block from previous section
             in_code_block = False
-            current_section = ParsedSection(
-                name=token.raw_text.removeprefix("## ").strip(),
-                line_number=token.line_number,
+            content_first = -1
+            current_section = new_section(
+                {
+                    "name": source[starts[pos] : ends[pos]].removeprefix("## ").strip(),
+                    "line_number": line_numbers[pos],
+                }
             )
             doc.sections.append(current_section)
+            pos += 1
             continue
 
         if current_section is None:
             # Tokens before first H2 in Phase 4 -- should not happen
             # since Phase 3 consumed them, but guard defensively.
+            pos += 1
             continue
 
-        if token.token_type == TokenType.CODE_FENCE:
-            in_code_block = not in_code_block
-            # Append raw text to section content
-            if current_section.raw_content:
-                current_section.raw_content += "\n" + token.raw_text
-            else:
-                current_section.raw_content = token.raw_text
-            continue
+        if content_first < 0 and ends[pos] > starts[pos]:
+            content_first = pos
 
-        if token.token_type == TokenType.LINK_ENTRY and not in_code_block:
-            link = _parse_link_entry(token)
+        if code == _CODE_FENCE:
+            in_code_block = not in_code_block
+        elif code == _LINK_ENTRY and not in_code_block:
+            link = _parse_link_line(
+                source[starts[pos] : ends[pos]], line_numbers[pos], new_link
+            )
             if link is not None:
                 current_section.links.append(link)
-                # Also add to raw_content
-                if current_section.raw_content:
-                    current_section.raw_content += "\n" + token.raw_text
-                else:
-                    current_section.raw_content = token.raw_text
-            else:
-                # Malformed link -- treat as text content
-                if current_section.raw_content:
-                    current_section.raw_content += "\n" + token.raw_text
-                else:
-                    current_section.raw_content = token.raw_text
-            continue
+            # Malformed links are kept as text content.
+        pos += 1
 
-        # Any other token: append to section raw_content
-        if current_section.raw_content:
-            current_section.raw_content += "\n" + token.raw_text
-        else:
-            current_section.raw_content = token.raw_text
+    if current_section is not None and content_first >= 0:
+        current_section.raw_content = source[starts[content_first] : ends[total - 1]]
 
     # ── Phase 5: Final Assembly ──────────────────────────────────────
     doc.raw_content = raw_content
@@ -298,4 +372,7 @@ def populate(
     # ── Phase 6: Token Estimation (v0.2.0d) ──────────────────────────
     _estimate_section_tokens(doc)
 
+    # Debug switch only: re-check fields assigned after construction.
+    revalidate(doc)
+
     return doc
@@ -5,12 +5,44 @@ match the section's ``name`` against the 11 canonical section names and
 their 32 aliases.  Populates ``ParsedSection.canonical_name`` in-place.
 
 The matching algorithm:
-    1. Normalize the section name (strip + lowercase)
+    1. Normalize the section name (``normalize_section_name``: NFKC,
+       Unicode casefold, punctuation to spaces, whitespace collapsed)
     2. Exact match against CanonicalSectionName enum values
     3. Alias match against SECTION_NAME_ALIASES keys
-    4. If neither matches, canonical_name remains None
+    4. Optionally (``fuzzy=``), fuzzy match with a FuzzySectionMatcher
+    5. If nothing matches, canonical_name remains None
+
+Steps 2 and 3 are one lookup in ``SECTION_NAME_INDEX``, a read-only
+mapping built once at import from the normalized canonical names and
+aliases (canonical names win on a clash). ``canonical_section()``
+memoizes name → canonical, so a name seen in any file is normalized once
+per process. Stage 2 stores the result on ``ParsedSection.canonical_name``;
+later consumers (``EcosystemIndex.canonical_coverage``) read that field
+and only fall back to ``canonical_section()`` for sections built without
+the parser.
+
+Fuzzy matching is opt-in. ``FuzzySectionMatcher`` indexes the word
+trigrams of every ``SECTION_NAME_INDEX`` key in an inverted index, so a
+heading is compared only with the few keys it shares trigrams with (at
+most ``MAX_FUZZY_CANDIDATES``), never with every key. Each candidate is
+verified with a bounded edit distance — whole-string, and word by word
+against every run of the heading's words, so "Getting started guide" and
+"API Ref" reach "Getting Started" and "API Reference" — and the best
+confidence at or above ``min_confidence`` wins. Results are memoized per
+distinct heading, so corpus runs pay for each heading once.
+
+Constants:
+    SECTION_NAME_INDEX: Normalized name → CanonicalSectionName (read-only).
+    MIN_FUZZY_CONFIDENCE: Default confidence a fuzzy match must reach.
+
+Classes:
+    FuzzyMatch: A fuzzy match and its confidence.
+    FuzzySectionMatcher: Trigram-indexed, memoized fuzzy matcher.
 
 Functions:
+    normalize_section_name: Normalize a section name for matching.
+    canonical_section: Memoized name → CanonicalSectionName lookup.
+    coverage_of: Bitmask of the canonical categories a document covers.
     match_canonical_sections: Match section names and set canonical_name in-place.
 
 Related:
@@ -25,25 +57,346 @@ Research basis:
 from __future__ import annotations
 
 import logging
+import math
+import re
+import unicodedata
+from collections import Counter
+from functools import lru_cache
+from types import MappingProxyType
+from typing import NamedTuple
 
-from docstratum.schema.constants import SECTION_NAME_ALIASES, CanonicalSectionName
+from docstratum.schema.constants import (
+    SECTION_NAME_ALIASES,
+    CanonicalCoverage,
+    CanonicalSectionName,
+)
 from docstratum.schema.parsed import ParsedLlmsTxt
 
 logger = logging.getLogger(__name__)
 
+# Runs of anything but letters and digits (punctuation, "_", whitespace).
+_SEPARATOR_RE = re.compile(r"[\W_]+")
+
+# Bound on memoized distinct section names.
+_CANONICAL_CACHE_SIZE = 4096
+
+MIN_FUZZY_CONFIDENCE = 0.8
+"""Default confidence a fuzzy match must reach to be accepted."""
+
+MAX_FUZZY_CANDIDATES = 8
+"""Most index keys verified with edit distance per heading."""
+
+ABBREVIATION_SCORE = 0.9
+"""Word score when a heading word (3+ chars) is a prefix of the key word."""
+
+# Bound on memoized distinct headings per FuzzySectionMatcher.
+_FUZZY_CACHE_SIZE = 16_384
+
+
+def normalize_section_name(name: str) -> str:
+    """Normalize a section name for canonical matching.
+
+    Applies NFKC normalization and Unicode casefolding, turns runs of
+    punctuation and whitespace into single spaces, and trims the ends.
+
+    Args:
+        name: Section heading text.
+
+    Returns:
+        The matching key.
+
+    Example:
+        >>> normalize_section_name("  API-Reference: ")
+        'api reference'
+        >>> normalize_section_name("\\uff26\\uff21\\uff31")  # fullwidth FAQ
+        'faq'
+    """
+    folded = unicodedata.normalize("NFKC", name).casefold()
+    return _SEPARATOR_RE.sub(" ", folded).strip()
+
+
+def _build_index() -> MappingProxyType[str, CanonicalSectionName]:
+    """Normalized canonical names and aliases → canonical name."""
+    index = {
+        normalize_section_name(alias): c for alias, c in SECTION_NAME_ALIASES.items()
+    }
+    index.update({normalize_section_name(c.value): c for c in CanonicalSectionName})
+    return MappingProxyType(index)
+
+
+SECTION_NAME_INDEX = _build_index()
+"""Normalized canonical name or alias → CanonicalSectionName (read-only)."""
+
+
+@lru_cache(maxsize=_CANONICAL_CACHE_SIZE)
+def canonical_section(name: str) -> CanonicalSectionName | None:
+    """Return the canonical section a heading matches, if any.
+
+    Args:
+        name: Section heading text, as written.
+
+    Returns:
+        The matched CanonicalSectionName, or None.
+
+    Example:
+        >>> canonical_section("Quick-Start")
+        <CanonicalSectionName.GETTING_STARTED: 'Getting Started'>
+    """
+    return SECTION_NAME_INDEX.get(normalize_section_name(name))
+
+
+def coverage_of(doc: ParsedLlmsTxt) -> CanonicalCoverage:
+    """Bitmask of the canonical categories ``doc``'s sections cover.
+
+    Uses each section's ``canonical_name`` when set (by
+    ``match_canonical_sections()``, including fuzzy matches), else
+    ``canonical_section()`` on its name.
+
+    Args:
+        doc: A parsed document.
+
+    Returns:
+        The document's CanonicalCoverage (``NONE`` if nothing matches).
+    """
+    mask = CanonicalCoverage.NONE
+    for section in doc.sections:
+        matched = (
+            CanonicalSectionName(section.canonical_name)
+            if section.canonical_name is not None
+            else canonical_section(section.name)
+        )
+        if matched is not None:
+            mask |= CanonicalCoverage[matched.name]
+    return mask
+
+
+# ── Fuzzy Matching ──────────────────────────────────────────────────
+
+
+class FuzzyMatch(NamedTuple):
+    """A heading's fuzzy match.
 
-def match_canonical_sections(doc: ParsedLlmsTxt) -> None:
+    Attributes:
+        canonical: The matched canonical section.
+        key: The normalized canonical name or alias that matched.
+        confidence: 1.0 for an exact match, else in
+            [min_confidence, 1.0).
+    """
+
+    canonical: CanonicalSectionName
+    key: str
+    confidence: float
+
+
+def _trigrams(words: list[str]) -> set[str]:
+    """Trigrams of each word padded with one space on either side."""
+    grams: set[str] = set()
+    for word in words:
+        padded = f" {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def _bounded_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance of ``a`` and ``b``, or ``limit + 1`` if larger.
+
+    Stops as soon as a whole DP row exceeds ``limit``.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        row_min = i
+        for j, char_b in enumerate(b, 1):
+            cost = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b),
+            )
+            current.append(cost)
+            row_min = min(row_min, cost)
+        if row_min > limit:
+            return limit + 1
+        previous = current
+    return min(previous[-1], limit + 1)
+
+
+def _similarity(a: str, b: str, floor: float) -> float:
+    """``1 - distance / longer length``, or 0.0 if below ``floor``."""
+    longest = max(len(a), len(b))
+    if not longest:
+        return 1.0
+    limit = int((1.0 - floor) * longest)
+    distance = _bounded_distance(a, b, limit)
+    return 0.0 if distance > limit else 1.0 - distance / longest
+
+
+class FuzzySectionMatcher:
+    """Fuzzy canonical matching over a trigram inverted index.
+
+    Confidence of a heading against one index key is the larger of:
+
+    - whole-string similarity, ``1 - edit distance / longer length``;
+    - phrase similarity: for each run of heading words as long as the
+      key, the key-length-weighted mean of per-word scores (1.0 equal,
+      ``ABBREVIATION_SCORE`` for a prefix abbreviation, else word
+      similarity), times the square root of the share of the heading's
+      characters in the run — extra words lower the confidence.
+
+    Edit distances are bounded by what ``min_confidence`` allows, so a
+    hopeless candidate is abandoned after a few DP rows.
+
+    Attributes:
+        min_confidence: Lowest confidence returned as a match.
+        match: Memoized ``heading -> FuzzyMatch | None`` (an
+            ``lru_cache`` wrapper; ``match.cache_info()`` reports use).
+
+    Example:
+        >>> fuzzy = FuzzySectionMatcher()
+        >>> fuzzy.match("Getting started guide").canonical
+        <CanonicalSectionName.GETTING_STARTED: 'Getting Started'>
+        >>> round(fuzzy.match("API Ref").confidence, 3)
+        0.925
+        >>> fuzzy.match("Release Notes") is None
+        True
+    """
+
+    __slots__ = (
+        "_gram_counts",
+        "_key_words",
+        "_keys",
+        "_postings",
+        "match",
+        "max_entries",
+        "min_confidence",
+    )
+
+    def __init__(
+        self,
+        min_confidence: float = MIN_FUZZY_CONFIDENCE,
+        max_entries: int = _FUZZY_CACHE_SIZE,
+    ) -> None:
+        """Index every ``SECTION_NAME_INDEX`` key.
+
+        Args:
+            min_confidence: Lowest confidence accepted, in (0, 1].
+            max_entries: Most distinct headings memoized.
+
+        Raises:
+            ValueError: If ``min_confidence`` is outside (0, 1].
+        """
+        if not 0.0 < min_confidence <= 1.0:
+            raise ValueError(f"min_confidence must be in (0, 1], got {min_confidence}")
+        self._setup(min_confidence, max_entries)
+
+    def _setup(self, min_confidence: float, max_entries: int) -> None:
+        """Build the trigram index and the memoized ``match()``."""
+        self.min_confidence = min_confidence
+        self.max_entries = max_entries
+        self._keys = tuple(SECTION_NAME_INDEX)
+        self._key_words = [key.split() for key in self._keys]
+        postings: dict[str, list[int]] = {}
+        self._gram_counts: list[int] = []
+        for key_id, words in enumerate(self._key_words):
+            grams = _trigrams(words)
+            self._gram_counts.append(len(grams))
+            for gram in grams:
+                postings.setdefault(gram, []).append(key_id)
+        self._postings = {gram: tuple(ids) for gram, ids in postings.items()}
+        self.match = lru_cache(maxsize=max_entries)(self._match)
+
+    def __getstate__(self) -> dict:
+        """Pickle settings only; the index is rebuilt on unpickling."""
+        return {
+            "min_confidence": self.min_confidence,
+            "max_entries": self.max_entries,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        """Rebuild the index in the receiving process."""
+        self._setup(state["min_confidence"], state["max_entries"])
+
+    @property
+    def cache_token(self) -> str:
+        """Identifies this configuration in parse-cache keys."""
+        return f"fuzzy-sections:{self.min_confidence}"
+
+    def _match(self, name: str) -> FuzzyMatch | None:
+        """Uncached ``match()``."""
+        query = normalize_section_name(name)
+        if not query:
+            return None
+        exact = SECTION_NAME_INDEX.get(query)
+        if exact is not None:
+            return FuzzyMatch(exact, query, 1.0)
+
+        words = query.split()
+        shared: Counter[int] = Counter()
+        for gram in _trigrams(words):
+            shared.update(self._postings.get(gram, ()))
+        candidates = sorted(
+            (key_id for key_id, count in shared.items() if count >= 2),
+            key=lambda key_id: (-shared[key_id] / self._gram_counts[key_id], key_id),
+        )[:MAX_FUZZY_CANDIDATES]
+
+        best: FuzzyMatch | None = None
+        for key_id in candidates:
+            key = self._keys[key_id]
+            confidence = max(
+                _similarity(query, key, self.min_confidence),
+                self._phrase_similarity(words, self._key_words[key_id]),
+            )
+            if confidence >= self.min_confidence and (
+                best is None or confidence > best.confidence
+            ):
+                best = FuzzyMatch(SECTION_NAME_INDEX[key], key, confidence)
+        return best
+
+    def _phrase_similarity(self, words: list[str], key_words: list[str]) -> float:
+        """Best score of any run of ``len(key_words)`` heading words."""
+        span = len(key_words)
+        if span > len(words):
+            return 0.0
+        key_chars = sum(len(word) for word in key_words)
+        heading_chars = sum(len(word) for word in words)
+        best = 0.0
+        for start in range(len(words) - span + 1):
+            run = words[start : start + span]
+            coverage = math.sqrt(sum(len(word) for word in run) / heading_chars)
+            if coverage < self.min_confidence:
+                continue
+            score = 0.0
+            for word, key_word in zip(run, key_words, strict=True):
+                if word == key_word:
+                    word_score = 1.0
+                elif len(word) >= 3 and key_word.startswith(word):
+                    word_score = ABBREVIATION_SCORE
+                else:
+                    word_score = _similarity(word, key_word, self.min_confidence)
+                score += word_score * len(key_word)
+            best = max(best, score / key_chars * coverage)
+        return best
+
+
+# ── Document Enrichment ─────────────────────────────────────────────
+
+
+def match_canonical_sections(
+    doc: ParsedLlmsTxt, fuzzy: FuzzySectionMatcher | None = None
+) -> None:
     """Match section names to canonical names and set canonical_name in-place.
 
-    For each section in doc.sections, performs case-insensitive matching:
-    1. Exact match against CanonicalSectionName enum values
-    2. Alias match against SECTION_NAME_ALIASES keys
-    3. If neither matches, canonical_name remains None
+    For each section in doc.sections, looks up the normalized name in
+    ``SECTION_NAME_INDEX`` (canonical names, then aliases) through the
+    memoized ``canonical_section()``. With ``fuzzy``, sections without an
+    exact match are fuzzy matched; otherwise unmatched sections get None.
 
     This function mutates doc.sections in place. It does not return a value.
 
     Args:
         doc: ParsedLlmsTxt with populated sections.
+        fuzzy: Optional fuzzy matcher for headings without an exact match.
 
     Example:
         >>> doc.sections[0].name = "Getting Started"
@@ -57,37 +410,15 @@ def match_canonical_sections(doc: ParsedLlmsTxt) -> None:
         >>> doc.sections[2].canonical_name is None
         True
     """
-    # Pre-compute lowercase canonical names for O(1) lookup
-    canonical_lookup: dict[str, str] = {
-        name.value.lower(): name.value for name in CanonicalSectionName
-    }
-
     for section in doc.sections:
-        key = section.name.strip().lower()
-
-        # Priority 1: exact canonical match
-        if key in canonical_lookup:
-            section.canonical_name = canonical_lookup[key]
-            logger.debug(
-                "Section '%s' matched canonical name '%s'",
-                section.name,
-                section.canonical_name,
-            )
-            continue
-
-        # Priority 2: alias match
-        if key in SECTION_NAME_ALIASES:
-            section.canonical_name = SECTION_NAME_ALIASES[key].value
-            logger.debug(
-                "Section '%s' matched alias -> '%s'",
-                section.name,
-                section.canonical_name,
-            )
-            continue
-
-        # No match
-        section.canonical_name = None
+        matched = canonical_section(section.name)
+        if matched is None and fuzzy is not None:
+            fuzzy_match = fuzzy.match(section.name)
+            if fuzzy_match is not None:
+                matched = fuzzy_match.canonical
+        section.canonical_name = matched.value if matched is not None else None
         logger.debug(
-            "Section '%s' did not match any canonical name or alias",
+            "Section '%s' matched canonical name %s",
             section.name,
+            section.canonical_name,
         )
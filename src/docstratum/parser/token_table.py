@@ -0,0 +1,174 @@
+"""Columnar token table for the DocStratum parser.
+
+An array-backed alternative to ``list[Token]``. Instead of one validated
+Pydantic ``Token`` per line, a ``TokenTable`` keeps four parallel columns
+over the original source string:
+
+    types         ``array('B')``  uint8 type code (index into TOKEN_TYPES)
+    starts        ``array('q')``  offset of the first character of the line
+    ends          ``array('q')``  offset one past the last character (no LF)
+    line_numbers  ``array('I')``  1-indexed line number
+
+Line text is never copied at tokenize time; ``raw_text(i)`` slices it from
+the source on demand. For a 100k-line ``llms-full.txt`` this replaces 100k
+model instances (and their line strings) with four compact buffers, which
+cuts both memory and GC pressure.
+
+``populate()`` consumes a ``TokenTable`` directly. ``to_tokens()`` is the
+compatibility view for code that expects ``list[Token]``, and
+``TokenTable.from_tokens()`` goes the other way.
+
+Classes:
+    TokenTable: Parallel-column token storage.
+
+Constants:
+    TOKEN_TYPES: TokenType values in type-code order.
+    TOKEN_CODES: Mapping of TokenType → uint8 type code.
+
+Related:
+    - src/docstratum/parser/tokens.py: TokenType enum and Token model
+    - src/docstratum/parser/tokenizer.py: ``tokenize_table()`` builds tables
+    - src/docstratum/parser/populator.py: Consumes tables
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator, Sequence
+
+from docstratum.parser.tokens import Token, TokenType
+from docstratum.schema.trusted import trusted_constructor
+
+# ── Type codes ───────────────────────────────────────────────────────
+# The code for a TokenType is its position in the enum. Stored as a
+# uint8, so the enum must stay below 256 members (it has 8).
+TOKEN_TYPES: tuple[TokenType, ...] = tuple(TokenType)
+TOKEN_CODES: dict[TokenType, int] = {t: i for i, t in enumerate(TOKEN_TYPES)}
+
+
+class TokenTable:
+    """Tokenizer output stored as parallel typed arrays over the source.
+
+    Row ``i`` describes one line: its type code, its ``[start, end)`` span
+    in ``source``, and its 1-indexed line number.
+
+    Attributes:
+        source: The string the offsets index into.
+        types: uint8 type codes (``TOKEN_TYPES[code]`` is the TokenType).
+        starts: Start offset of each line in ``source``.
+        ends: End offset (exclusive, excluding the newline) of each line.
+        line_numbers: 1-indexed line number of each row.
+
+    Example:
+        >>> from docstratum.parser.tokenizer import tokenize_table
+        >>> table = tokenize_table("# Title\\n> Desc\\n")
+        >>> len(table)
+        2
+        >>> table.token_type(0)
+        <TokenType.H1: 'h1'>
+        >>> table.raw_text(1)
+        '> Desc'
+    """
+
+    __slots__ = ("ends", "line_numbers", "source", "starts", "types")
+
+    def __init__(
+        self,
+        source: str = "",
+        types: array | None = None,
+        starts: array | None = None,
+        ends: array | None = None,
+        line_numbers: array | None = None,
+    ) -> None:
+        """Create a table over ``source``; columns default to empty.
+
+        Args:
+            source: The string the offsets index into.
+            types: ``array('B')`` of type codes.
+            starts: ``array('q')`` of start offsets.
+            ends: ``array('q')`` of end offsets.
+            line_numbers: ``array('I')`` of 1-indexed line numbers.
+
+        Raises:
+            ValueError: If the columns have different lengths.
+        """
+        self.source = source
+        self.types = types if types is not None else array("B")
+        self.starts = starts if starts is not None else array("q")
+        self.ends = ends if ends is not None else array("q")
+        self.line_numbers = line_numbers if line_numbers is not None else array("I")
+        n = len(self.types)
+        if not (len(self.starts) == len(self.ends) == len(self.line_numbers) == n):
+            raise ValueError("TokenTable columns must all have the same length")
+
+    def __len__(self) -> int:
+        """Number of tokens (rows) in the table."""
+        return len(self.types)
+
+    def __iter__(self) -> Iterator[Token]:
+        """Iterate over rows as ``Token`` models (compatibility view)."""
+        new_token = trusted_constructor(Token)
+        source = self.source
+        for code, start, end, line_number in zip(
+            self.types, self.starts, self.ends, self.line_numbers, strict=True
+        ):
+            yield new_token(
+                {
+                    "token_type": TOKEN_TYPES[code],
+                    "line_number": line_number,
+                    "raw_text": source[start:end],
+                }
+            )
+
+    def __repr__(self) -> str:
+        """Short summary; the columns themselves can be large."""
+        return f"TokenTable(tokens={len(self)}, source_chars={len(self.source)})"
+
+    def token_type(self, index: int) -> TokenType:
+        """Return the TokenType of row ``index``."""
+        return TOKEN_TYPES[self.types[index]]
+
+    def raw_text(self, index: int) -> str:
+        """Return the original line text of row ``index``."""
+        return self.source[self.starts[index] : self.ends[index]]
+
+    def token(self, index: int) -> Token:
+        """Materialize row ``index`` as a ``Token`` model."""
+        return trusted_constructor(Token)(
+            {
+                "token_type": TOKEN_TYPES[self.types[index]],
+                "line_number": self.line_numbers[index],
+                "raw_text": self.source[self.starts[index] : self.ends[index]],
+            }
+        )
+
+    def to_tokens(self) -> list[Token]:
+        """Return the whole table as ``list[Token]`` (compatibility view)."""
+        return list(self)
+
+    @classmethod
+    def from_tokens(cls, tokens: Sequence[Token]) -> TokenTable:
+        """Build a table from an existing ``list[Token]``.
+
+        The token texts are joined with ``"\\n"`` into a fresh source string,
+        so this works for any token list, not only tokenizer output.
+
+        Args:
+            tokens: Tokens to convert, in order.
+
+        Returns:
+            A TokenTable with the same types, texts, and line numbers.
+        """
+        codes = TOKEN_CODES
+        types = array("B", [codes[t.token_type] for t in tokens])
+        line_numbers = array("I", [t.line_number for t in tokens])
+        starts = array("q")
+        ends = array("q")
+        offset = 0
+        for t in tokens:
+            starts.append(offset)
+            offset += len(t.raw_text)
+            ends.append(offset)
+            offset += 1  # the joining "\n"
+        source = "\n".join(t.raw_text for t in tokens)
+        return cls(source, types, starts, ends, line_numbers)
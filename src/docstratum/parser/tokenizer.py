@@ -9,11 +9,27 @@ the ``llms.txt`` format is a constrained Markdown subset that does not
 require a full CommonMark parser. See v0.0.1a §ABNF Grammar for the
 exact productions matched.
 
+Two output forms are available:
+
+    ``tokenize_table()`` returns a columnar ``TokenTable`` (uint8 type codes
+    plus line offsets into the source). No per-line objects are created,
+    which is what the parser pipeline uses.
+
+    ``tokenize()`` returns ``list[Token]``. It is the compatibility view of
+    the same scan, for callers and tests that work with Token models.
+
+    ``iter_tokens()`` is the streaming form: it reads a file object in
+    chunks (via ``io.LineStream``) and yields Token instances one at a
+    time, so a huge aggregate file is tokenized in bounded memory.
+
 Functions:
+    tokenize_table: Classify each line into a columnar TokenTable.
     tokenize: Classify each line of an llms.txt string into Token instances.
+    iter_tokens: Lazily tokenize a binary or text file object.
 
 Related:
     - src/docstratum/parser/tokens.py: TokenType enum and Token model
+    - src/docstratum/parser/token_table.py: Columnar TokenTable
     - src/docstratum/parser/io.py: Produces the decoded string this module consumes
     - docs/design/03-parser/RR-SPEC-v0.2.0b-markdown-tokenization.md: Design spec
 
@@ -25,11 +41,73 @@ Research basis:
 from __future__ import annotations
 
 import logging
+import re
+from array import array
+from collections.abc import Iterator
+from typing import IO
 
+from docstratum.parser.io import DEFAULT_CHUNK_SIZE, LineStream
+from docstratum.parser.token_table import TOKEN_CODES, TOKEN_TYPES, TokenTable
 from docstratum.parser.tokens import Token, TokenType
+from docstratum.schema.trusted import trusted_constructor
 
 logger = logging.getLogger(__name__)
 
+# ── Type codes used by the span classifier ───────────────────────────
+_H1 = TOKEN_CODES[TokenType.H1]
+_H2 = TOKEN_CODES[TokenType.H2]
+_H3_PLUS = TOKEN_CODES[TokenType.H3_PLUS]
+_BLOCKQUOTE = TOKEN_CODES[TokenType.BLOCKQUOTE]
+_LINK_ENTRY = TOKEN_CODES[TokenType.LINK_ENTRY]
+_CODE_FENCE = TOKEN_CODES[TokenType.CODE_FENCE]
+_BLANK = TOKEN_CODES[TokenType.BLANK]
+_TEXT = TOKEN_CODES[TokenType.TEXT]
+
+# Whitespace-only span. ``\s`` and ``str.strip()`` share the same notion of
+# whitespace, so this matches exactly the lines where ``line.strip() == ""``.
+_BLANK_RE = re.compile(r"\s*")
+
+
+def _classify_span(content: str, start: int, end: int) -> int:
+    """Classify ``content[start:end]`` without slicing it out.
+
+    Same priority order as ``_classify_line``; returns a uint8 type code.
+    Dispatches on the first character so most TEXT lines cost a single
+    comparison.
+
+    Args:
+        content: The full source string.
+        start: Offset of the first character of the line.
+        end: Offset one past the last character of the line.
+
+    Returns:
+        The type code (index into ``TOKEN_TYPES``) for the line.
+    """
+    if start == end:
+        return _BLANK
+
+    first = content[start]
+    if first == "#":
+        # (v0.2.0b §4.2: ### → ## → # order is critical)
+        if content.startswith(("### ", "####"), start, end):
+            return _H3_PLUS
+        if content.startswith("## ", start, end):
+            return _H2
+        if content.startswith("# ", start, end):
+            return _H1
+        return _TEXT
+    if first == ">":
+        if end - start == 1 or content.startswith("> ", start, end):
+            return _BLOCKQUOTE
+        return _TEXT
+    if first == "-":
+        if content.startswith("- [", start, end):
+            return _LINK_ENTRY
+        return _TEXT
+    if first.isspace() and _BLANK_RE.fullmatch(content, start, end):
+        return _BLANK
+    return _TEXT
+
 
 def _classify_line(line: str) -> TokenType:
     """Classify a single line by its prefix pattern.
@@ -48,29 +126,75 @@ def _classify_line(line: str) -> TokenType:
     Returns:
         The TokenType classification for this line.
     """
-    # -- Headings: check deepest first to avoid false matches --
-    # (v0.2.0b §4.2: ### → ## → # order is critical)
-    if line.startswith("### ") or line.startswith("####"):
-        return TokenType.H3_PLUS
-    if line.startswith("## "):
-        return TokenType.H2
-    if line.startswith("# "):
-        return TokenType.H1
+    # Delegates to the span classifier so both tokenizer forms share one
+    # set of rules.
+    return TOKEN_TYPES[_classify_span(line, 0, len(line))]
 
-    # -- Blockquote: "> " or bare ">" (edge case C2) --
-    if line.startswith("> ") or line == ">":
-        return TokenType.BLOCKQUOTE
 
-    # -- Link entry: prefix-only check, full parsing in v0.2.0c --
-    if line.startswith("- ["):
-        return TokenType.LINK_ENTRY
+def tokenize_table(content: str) -> TokenTable:
+    """Tokenize a decoded llms.txt string into a columnar TokenTable.
 
-    # -- Blank: empty or whitespace-only --
-    if line.strip() == "":
-        return TokenType.BLANK
+    Performs the same scan as ``tokenize()`` — identical types, texts,
+    and line numbers — but records each line as a type code and a
+    ``[start, end)`` span instead of a ``Token`` model.
 
-    # -- Everything else is plain text --
-    return TokenType.TEXT
+    Args:
+        content: Decoded, LF-normalized Markdown content (from v0.2.0a).
+
+    Returns:
+        A TokenTable over ``content``, one row per line. Empty content
+        returns an empty table.
+
+    Example:
+        >>> table = tokenize_table("# Title\\n> Desc\\n")
+        >>> [table.token_type(i) for i in range(len(table))]
+        [<TokenType.H1: 'h1'>, <TokenType.BLOCKQUOTE: 'blockquote'>]
+    """
+    types = array("B")
+    starts = array("q")
+    ends = array("q")
+
+    # -- Handle empty input --
+    if not content:
+        logger.debug("Empty content, returning empty token table")
+        return TokenTable(content)
+
+    add_type = types.append
+    add_start = starts.append
+    add_end = ends.append
+    find = content.find
+    startswith = content.startswith
+    classify = _classify_span
+    length = len(content)
+    in_code_block = False
+    pos = 0
+
+    # A trailing "\n" does not start a new line, matching tokenize()'s
+    # removal of the empty final element produced by split().
+    while pos < length:
+        end = find("\n", pos)
+        if end == -1:
+            end = length
+
+        # -- Code fence detection (priority 1-2 per §4) --
+        if startswith("```", pos, end):
+            code = _CODE_FENCE
+            in_code_block = not in_code_block
+        # -- Inside code block: everything is TEXT (priority 1) --
+        elif in_code_block:
+            code = _TEXT
+        # -- Normal classification (priorities 3-9) --
+        else:
+            code = classify(content, pos, end)
+
+        add_type(code)
+        add_start(pos)
+        add_end(end)
+        pos = end + 1
+
+    line_numbers = array("I", range(1, len(types) + 1))
+    logger.info("Tokenized %d lines into token table", len(types))
+    return TokenTable(content, types, starts, ends, line_numbers)
 
 
 def tokenize(content: str) -> list[Token]:
@@ -92,58 +216,63 @@ def tokenize(content: str) -> list[Token]:
         >>> [t.token_type for t in tokens]
         [<TokenType.H1: 'h1'>, <TokenType.BLOCKQUOTE: 'blockquote'>, <TokenType.H2: 'h2'>, <TokenType.LINK_ENTRY: 'link_entry'>]
     """
-    # -- Handle empty input --
-    if not content:
-        logger.debug("Empty content, returning empty token list")
-        return []
+    # Same scan as tokenize_table(); Token models are the compatibility view.
+    return tokenize_table(content).to_tokens()
+
+
+def iter_tokens(
+    source: IO[bytes] | IO[str] | LineStream,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Token]:
+    """Lazily tokenize a file object, yielding one Token per line.
 
-    lines = content.split("\n")
+    The stream is read ``chunk_size`` units at a time. BOM stripping,
+    decoding, and line-ending normalization follow ``io.read_bytes()``
+    (binary) or ``io.read_string()`` (text) — see ``LineStream`` for the
+    one documented divergence on mid-file Latin-1 fallback. Code-fence
+    state is carried across the whole stream, so the yielded tokens equal
+    ``tokenize(read_bytes(data)[0])``.
 
-    # Trailing newline produces an empty final element — remove it
-    # to avoid a spurious BLANK token. A file ending with "\n" has
-    # its last real line before the newline; the empty string after
-    # is an artifact of split(), not a real document line.
-    if lines and lines[-1] == "":
-        lines = lines[:-1]
+    To inspect ``FileMetadata`` afterwards, pass a ``LineStream`` and read
+    its ``metadata`` once the iterator is exhausted.
 
-    logger.info("Tokenizing %d lines", len(lines))
+    Args:
+        source: A binary or text file object, or a ``LineStream``.
+        chunk_size: Units per read when ``source`` is a file object.
+
+    Yields:
+        Token instances in document order.
 
-    tokens: list[Token] = []
+    Example:
+        >>> import io
+        >>> lines = LineStream(io.BytesIO(b"# Title\\r\\n```\\n# code\\n```\\n"))
+        >>> [t.token_type.value for t in iter_tokens(lines)]
+        ['h1', 'code_fence', 'text', 'code_fence']
+        >>> lines.metadata.line_ending_style
+        'mixed'
+    """
+    lines = source if isinstance(source, LineStream) else LineStream(source, chunk_size)
+    new_token = trusted_constructor(Token)
     in_code_block = False
+    line_number = 0
+
+    for line in lines:
+        line_number += 1
 
-    for line_number, line in enumerate(lines, start=1):
         # -- Code fence detection (priority 1-2 per §4) --
         if line.startswith("```"):
-            tokens.append(
-                Token(
-                    token_type=TokenType.CODE_FENCE,
-                    line_number=line_number,
-                    raw_text=line,
-                )
-            )
+            token_type = TokenType.CODE_FENCE
             in_code_block = not in_code_block
-            continue
-
         # -- Inside code block: everything is TEXT (priority 1) --
-        if in_code_block:
-            tokens.append(
-                Token(
-                    token_type=TokenType.TEXT,
-                    line_number=line_number,
-                    raw_text=line,
-                )
-            )
-            continue
-
+        elif in_code_block:
+            token_type = TokenType.TEXT
         # -- Normal classification (priorities 3-9) --
-        token_type = _classify_line(line)
-        tokens.append(
-            Token(
-                token_type=token_type,
-                line_number=line_number,
-                raw_text=line,
-            )
+        else:
+            token_type = _classify_line(line)
+
+        yield new_token(
+            {"token_type": token_type, "line_number": line_number, "raw_text": line}
         )
 
-    logger.info("Tokenized %d lines into %d tokens", len(lines), len(tokens))
-    return tokens
+    logger.info("Streamed %d lines into tokens", line_number)
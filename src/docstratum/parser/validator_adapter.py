@@ -10,6 +10,20 @@ engine (v0.3.x) and quality scorer (v0.4.x) are not yet implemented.
 
 Implements v0.2.2d.
 
+Concurrency:
+    Every ``parse()`` call produces a ``ParseSession`` that carries the
+    parsed document together with the ``FileMetadata`` and frontmatter
+    ``Metadata`` computed alongside it. ``classify()`` looks the session up
+    by document identity, so a single warm adapter can be shared by many
+    threads (or interleaved callers) without one file's metadata leaking
+    into another file's classification. Callers that want the extra data
+    directly use ``parse_session()`` / ``classify_session()``.
+
+Caching:
+    An adapter constructed with a ``ParseCache`` looks every file up by a
+    hash of its content before parsing, and classifications by the same
+    key, so unchanged files are never re-parsed across runs.
+
 Example:
     >>> from docstratum.parser.validator_adapter import ParserAdapter
     >>> from docstratum.pipeline.per_file import PerFileStage
@@ -29,14 +43,29 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
+import weakref
+
+from pydantic import BaseModel, ConfigDict, Field
 
+from docstratum.parser.cache import ParseCache
 from docstratum.parser.classifier import classify_document
-from docstratum.parser.io import FileMetadata, read_string
+from docstratum.parser.io import (
+    FileMetadata,
+    SourceText,
+    preprocess,
+    read_string_source,
+)
+from docstratum.parser.lazy import LAZY_THRESHOLD_TOKENS, LazyDocument, populate_lazy
 from docstratum.parser.metadata import extract_metadata
 from docstratum.parser.populator import populate
-from docstratum.parser.section_matcher import match_canonical_sections
-from docstratum.parser.tokenizer import tokenize
+from docstratum.parser.section_matcher import (
+    FuzzySectionMatcher,
+    match_canonical_sections,
+)
+from docstratum.parser.tokenizer import tokenize_table
 from docstratum.schema.classification import DocumentClassification
+from docstratum.schema.enrichment import Metadata
 from docstratum.schema.parsed import ParsedLlmsTxt
 from docstratum.schema.quality import (
     DimensionScore,
@@ -68,14 +97,65 @@ def _strip_frontmatter(content: str) -> str:
     return _FRONTMATTER_RE.sub("", content, count=1)
 
 
+class ParseSession(BaseModel):
+    """Everything produced by one ``ParserAdapter.parse_session()`` call.
+
+    Bundles the parsed document with the I/O-layer ``FileMetadata`` and the
+    frontmatter ``Metadata`` computed from the same content, so downstream
+    steps never have to rely on adapter-level "last call" state.
+
+    Attributes:
+        document: The fully enriched parsed document.
+        file_meta: File-level metadata from ``read_string()`` (byte count,
+            line endings, BOM).
+        metadata: Frontmatter metadata, or None if the file has none.
+        source: The preprocessed text (line-ending counts, line-offset
+            index) so later phases can reuse it instead of re-scanning.
+            None for sessions reconstructed around a foreign document.
+        cache_key: The ``ParseCache`` key of the content, when the adapter
+            has a cache; used to cache the classification too.
+
+    Example:
+        >>> session = ParserAdapter().parse_session("# Title\\n", "llms.txt")
+        >>> session.document.title
+        'Title'
+        >>> session.file_meta.byte_count
+        8
+    """
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    document: ParsedLlmsTxt = Field(description="The parsed document.")
+    file_meta: FileMetadata = Field(
+        description="I/O-layer metadata computed from the same content.",
+    )
+    metadata: Metadata | None = Field(
+        default=None,
+        description="Frontmatter metadata, or None if absent.",
+    )
+    source: SourceText | None = Field(
+        default=None,
+        description="Preprocessed source text shared with later phases.",
+    )
+    cache_key: str | None = Field(
+        default=None,
+        description="ParseCache key of the content, if caching is enabled.",
+    )
+
+    def to_cache_json(self) -> str:
+        """Serialize the cacheable part of the session (not the source text)."""
+        return self.model_dump_json(exclude={"source", "cache_key"})
+
+
 class ParserAdapter:
     """Adapter implementing SingleFileValidator using the v0.2.0-v0.2.1 parser.
 
     This adapter wires the parser and enrichment modules into the
     protocol contract that the ecosystem pipeline expects. It is
-    stateless across independent file-processing cycles, though it
-    caches intermediate results (``FileMetadata``, ``Metadata``) from
-    the most recent ``parse()`` call for use by ``classify()``.
+    reentrant and thread-safe: each ``parse()`` call records its
+    ``ParseSession`` keyed by the returned document, and ``classify()``
+    uses the session belonging to the document it is given. Sessions are
+    dropped automatically when their document is garbage-collected.
 
     Example:
         >>> adapter = ParserAdapter()
@@ -86,47 +166,109 @@ class ParserAdapter:
     Traces to: FR-080 (per-file validation within ecosystem)
     """
 
-    def __init__(self) -> None:
-        """Initialize the adapter with empty caches."""
-        self._last_file_meta: FileMetadata | None = None
-        self._last_metadata = None
+    def __init__(
+        self,
+        cache: ParseCache | None = None,
+        *,
+        fuzzy_sections: FuzzySectionMatcher | None = None,
+    ) -> None:
+        """Initialize the adapter with an empty session registry.
 
-    def parse(self, content: str, filename: str) -> ParsedLlmsTxt:
-        """Parse raw content into a fully enriched structured model.
+        Args:
+            cache: Optional persistent parse cache. When given, ``parse()``
+                and ``classify()`` return stored results for content seen
+                before instead of recomputing them.
+            fuzzy_sections: Optional fuzzy matcher for section headings
+                without an exact canonical match. Off by default; cached
+                results are keyed separately when set.
+        """
+        self._setup(cache, fuzzy_sections)
+
+    def _setup(
+        self, cache: ParseCache | None, fuzzy_sections: FuzzySectionMatcher | None
+    ) -> None:
+        """Set the options and start an empty session registry."""
+        self._cache = cache
+        self._fuzzy = fuzzy_sections
+        # id(document) -> (weak ref to document, session without document).
+        # The document is held weakly so the registry never keeps it alive.
+        self._sessions: dict[
+            int, tuple[weakref.ref[ParsedLlmsTxt], dict[str, object]]
+        ] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def cache(self) -> ParseCache | None:
+        """The persistent parse cache, or None if caching is disabled."""
+        return self._cache
+
+    def __getstate__(self) -> dict:
+        """Pickle without sessions or the lock (process-pool workers)."""
+        return {"cache": self._cache, "fuzzy_sections": self._fuzzy}
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore a fresh adapter in the receiving process."""
+        self._setup(state.get("cache"), state.get("fuzzy_sections"))
+
+    def parse_session(self, content: str, filename: str) -> ParseSession:
+        """Parse raw content and return the document with its metadata.
 
         Calls the full parser pipeline: read_string → strip frontmatter →
-        tokenize → populate. Then applies enrichment: canonical section
-        matching and metadata extraction.
+        tokenize_table → populate. Then applies enrichment: canonical section
+        matching and metadata extraction. Holds no adapter state, so it is
+        safe to call concurrently.
+
+        With a cache, a hit skips all of the above and only re-runs the
+        (cheap) line-ending preprocessing to rebuild ``source``.
 
         Args:
             content: Raw text content of the file.
             filename: The file's basename (e.g., "llms.txt").
 
         Returns:
-            A fully populated ParsedLlmsTxt instance with canonical
-            section names matched.
+            A ParseSession with the parsed document, its FileMetadata, and
+            its frontmatter Metadata.
         """
-        # Step 1: I/O layer — normalize line endings, compute FileMetadata
-        normalized, file_meta = read_string(content)
-        self._last_file_meta = file_meta
+        if self._cache is None:
+            return self._parse_uncached(content, filename)
+
+        variant = self._fuzzy.cache_token if self._fuzzy is not None else ""
+        key = self._cache.key(content, filename, variant)
+        cached = self._cache.get_session(key)
+        if cached is not None:
+            logger.info("Parse cache hit for %s", filename)
+            session = ParseSession.model_validate_json(cached)
+            return session.model_copy(
+                update={"source": preprocess(content), "cache_key": key}
+            )
+
+        session = self._parse_uncached(content, filename)
+        self._cache.put_session(key, session.to_cache_json())
+        return session.model_copy(update={"cache_key": key})
+
+    def _parse_uncached(self, content: str, filename: str) -> ParseSession:
+        """Run the parser pipeline; see ``parse_session()``."""
+        # Step 1: I/O layer — one-pass normalization, compute FileMetadata
+        source, file_meta = read_string_source(content)
+        normalized = source.text
 
         # Step 2: Strip YAML frontmatter (tokenizer cannot handle ``---``)
         body = _strip_frontmatter(normalized)
 
-        # Step 3: Tokenize
-        tokens = tokenize(body)
+        # Step 3: Tokenize (columnar table — no per-line Token models)
+        tokens = tokenize_table(body)
 
         # Step 4: Populate the model
         doc = populate(tokens, raw_content=normalized, source_filename=filename)
 
         # Step 5: Enrichment — canonical section matching (v0.2.1c)
-        match_canonical_sections(doc)
+        match_canonical_sections(doc, fuzzy=self._fuzzy)
 
         # Step 6: Enrichment — metadata extraction (v0.2.1d)
-        # ParsedLlmsTxt does not have a metadata field; the result is
-        # stashed for potential future use when the model is extended.
+        # ParsedLlmsTxt does not have a metadata field; the result travels
+        # on the session instead.
         # TODO (v0.3.x): Store metadata on ParsedLlmsTxt when field is added.
-        self._last_metadata = extract_metadata(normalized)
+        metadata = extract_metadata(normalized)
 
         logger.info(
             "Parsed %s: title=%s, sections=%d, links=%d",
@@ -136,43 +278,179 @@ class ParserAdapter:
             doc.total_links,
         )
 
+        return ParseSession(
+            document=doc, file_meta=file_meta, metadata=metadata, source=source
+        )
+
+    def parse_lazy(self, content: str, filename: str) -> LazyDocument:
+        """Index raw content for on-demand section access.
+
+        Runs the I/O layer and frontmatter stripping like ``parse()``, then
+        ``populate_lazy()`` instead of tokenizing and populating the whole
+        file. Intended for files of ``LAZY_THRESHOLD_TOKENS`` or more when
+        only titles, section names, or classification are needed. Not
+        cached and not enriched (no canonical section matching).
+
+        Args:
+            content: Raw text content of the file.
+            filename: The file's basename (e.g., "llms-full.txt").
+
+        Returns:
+            A LazyDocument carrying the content's FileMetadata.
+        """
+        source, file_meta = read_string_source(content)
+        normalized = source.text
+        doc = populate_lazy(
+            _strip_frontmatter(normalized),
+            raw_content=normalized,
+            source_filename=filename,
+        )
+        doc.file_meta = file_meta
         return doc
 
-    def classify(self, parsed: ParsedLlmsTxt) -> DocumentClassification:
-        """Classify a parsed document by type and size.
+    def parse_for_reading(
+        self, content: str, filename: str
+    ) -> ParsedLlmsTxt | LazyDocument:
+        """Parse for read-only use, lazily when the content is oversized.
 
-        Uses the ``FileMetadata`` cached from the most recent ``parse()``
-        call. If ``classify()`` is called independently (without a prior
-        ``parse()``), reconstructs a minimal ``FileMetadata`` from the
-        parsed document's ``raw_content``.
+        Content estimated at ``LAZY_THRESHOLD_TOKENS`` or more (chars / 4,
+        as ``estimated_tokens`` counts) goes through ``parse_lazy()``;
+        anything smaller through ``parse()``. Either result can be passed
+        to ``classify()``; only a ``ParsedLlmsTxt`` can be validated.
 
         Args:
-            parsed: The parsed representation from ``parse()``.
+            content: Raw text content of the file.
+            filename: The file's basename (e.g., "llms-full.txt").
 
         Returns:
-            DocumentClassification with document_type and size_tier.
+            A LazyDocument for oversized content, else a ParsedLlmsTxt.
         """
-        # Prefer cached FileMetadata from parse(); reconstruct if unavailable.
-        # Reconstruction loses line_ending_style and has_bom but provides
-        # accurate byte_count, which is what classify_document needs.
-        file_meta = self._last_file_meta
-        if file_meta is None:
-            file_meta = FileMetadata(
-                byte_count=len(parsed.raw_content.encode("utf-8")),
-                encoding="utf-8",
+        if len(content) // 4 >= LAZY_THRESHOLD_TOKENS:
+            return self.parse_lazy(content, filename)
+        return self.parse(content, filename)
+
+    def parse(self, content: str, filename: str) -> ParsedLlmsTxt:
+        """Parse raw content into a fully enriched structured model.
+
+        Delegates to ``parse_session()`` and remembers the session for the
+        returned document so a later ``classify(doc)`` can use its exact
+        ``FileMetadata``.
+
+        Args:
+            content: Raw text content of the file.
+            filename: The file's basename (e.g., "llms.txt").
+
+        Returns:
+            A fully populated ParsedLlmsTxt instance with canonical
+            section names matched.
+        """
+        session = self.parse_session(content, filename)
+        doc = session.document
+        key = id(doc)
+        with self._lock:
+            self._sessions[key] = (
+                weakref.ref(doc),
+                {
+                    "file_meta": session.file_meta,
+                    "metadata": session.metadata,
+                    "source": session.source,
+                    "cache_key": session.cache_key,
+                },
             )
+        # Forget the entry once the document is gone, so the id can be
+        # reused safely and the registry does not grow without bound.
+        weakref.finalize(doc, self._forget, key)
+        return doc
+
+    def session_for(self, parsed: ParsedLlmsTxt) -> ParseSession | None:
+        """Return the session recorded by ``parse()`` for a document.
+
+        Args:
+            parsed: A document previously returned by ``parse()``.
+
+        Returns:
+            The matching ParseSession, or None if the document was not
+            produced by this adapter's ``parse()``.
+        """
+        with self._lock:
+            entry = self._sessions.get(id(parsed))
+        if entry is None:
+            return None
+        doc_ref, fields = entry
+        if doc_ref() is not parsed:
+            return None
+        return ParseSession(document=parsed, **fields)
+
+    def classify_session(self, session: ParseSession) -> DocumentClassification:
+        """Classify a parsed document using its session's FileMetadata.
+
+        Args:
+            session: The result of ``parse_session()``.
 
-        classification = classify_document(parsed, file_meta)
+        Returns:
+            DocumentClassification with document_type and size_tier.
+        """
+        cache = self._cache
+        key = session.cache_key if cache is not None else None
+        if cache is not None and key is not None:
+            cached = cache.get_classification(key)
+            if cached is not None:
+                return DocumentClassification.model_validate_json(cached)
+
+        classification = classify_document(session.document, session.file_meta)
+        if cache is not None and key is not None:
+            cache.put_classification(key, classification.model_dump_json())
 
         logger.info(
             "Classified %s: type=%s, tier=%s",
-            parsed.source_filename,
+            session.document.source_filename,
             classification.document_type,
             classification.size_tier,
         )
 
         return classification
 
+    def classify(self, parsed: ParsedLlmsTxt | LazyDocument) -> DocumentClassification:
+        """Classify a parsed document by type and size.
+
+        Uses the ``FileMetadata`` recorded when ``parse()`` produced this
+        document. If the document did not come from this adapter's
+        ``parse()``, reconstructs a minimal ``FileMetadata`` from the
+        parsed document's ``raw_content``. A ``LazyDocument`` is classified
+        directly (with the metadata ``parse_lazy()`` attached), which only
+        materializes the sections the classifier inspects.
+
+        Args:
+            parsed: The parsed representation from ``parse()`` or
+                ``parse_lazy()``.
+
+        Returns:
+            DocumentClassification with document_type and size_tier.
+        """
+        if isinstance(parsed, LazyDocument):
+            file_meta = parsed.file_meta or FileMetadata(
+                byte_count=len(parsed.raw_content.encode("utf-8")),
+                encoding="utf-8",
+            )
+            return classify_document(parsed, file_meta)
+        session = self.session_for(parsed)
+        if session is None:
+            # Reconstruction loses line_ending_style and has_bom but provides
+            # accurate byte_count, which is what classify_document needs.
+            session = ParseSession(
+                document=parsed,
+                file_meta=FileMetadata(
+                    byte_count=len(parsed.raw_content.encode("utf-8")),
+                    encoding="utf-8",
+                ),
+            )
+        return self.classify_session(session)
+
+    def _forget(self, key: int) -> None:
+        """Drop a session whose document has been garbage-collected."""
+        with self._lock:
+            self._sessions.pop(key, None)
+
     def validate(
         self,
         parsed: ParsedLlmsTxt,
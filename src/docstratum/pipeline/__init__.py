@@ -12,15 +12,29 @@ analysis. The pipeline operates in five stages:
 
 Public API:
     EcosystemPipeline      — The main orchestrator (use this to run the pipeline)
+    AsyncEcosystemPipeline — asyncio runner of the same stages (non-blocking)
+    StageScheduler         — Barrier (stage by stage) or DAG scheduling
+    PipelineNode           — Unit of work for run_nodes() (DAG scheduler)
     PipelineContext         — The context object that flows through stages
     PipelineStageId        — Stage identifiers for stop_after control
     StageResult            — Per-stage execution outcome
     StageStatus            — Success/Failed/Skipped status enum
     SingleFileValidator    — Protocol for plugging in the L0–L4 pipeline
+    ExecutorBackend        — Thread/process pool choice for parallel Stage 2
+    IncrementalState       — Fingerprint snapshot for incremental re-runs
+    PipelineCheckpoint     — Context saved after a stage, for resume()
+    StageProfile           — Per-stage CPU/memory profile (run(profile=True))
+    ChromeTracer           — Execution timeline as Chrome trace-event JSON
+    EcosystemIndex         — One-pass lookups shared by Stage 4 and Stage 5
+    RelationshipGraph      — CSR adjacency with reachability/SCC queries
+    LinkResolver           — Memoizing link → file resolver used by Stage 3
+    SignatureCache         — Content-hash cache of W017 MinHash signatures
+    AggregateIndexCache    — Content-hash cache of W014 aggregate fingerprints
 
     Stage classes (for advanced/custom pipelines):
         DiscoveryStage
         PerFileStage
+        AsyncPerFileStage       (Stage 2 with bounded asyncio concurrency)
         RelationshipStage
         EcosystemValidationStage
         ScoringStage
@@ -32,6 +46,7 @@ Public API:
         classify_relationship      — Classify a link's relationship type
         calculate_completeness     — Score the Completeness dimension
         calculate_coverage         — Score the Coverage dimension
+        write_profiles             — Export a profiled run's stage profiles
 
 Example:
     >>> from docstratum.pipeline import EcosystemPipeline, PipelineStageId
@@ -57,7 +72,20 @@ Traces to:
 """
 
 # ── Core pipeline infrastructure ────────────────────────────────────
+from docstratum.pipeline.profiling import (
+    FileTimings,
+    StageProfile,
+    StageProfiler,
+    write_profiles,
+)
+from docstratum.pipeline.tracing import (
+    NULL_TRACER,
+    ChromeTracer,
+    NullTracer,
+    Tracer,
+)
 from docstratum.pipeline.stages import (
+    AsyncPipelineStage,
     PipelineContext,
     PipelineStage,
     PipelineStageId,
@@ -72,40 +100,108 @@ from docstratum.pipeline.discovery import (
     DiscoveryStage,
     classify_filename,
 )
-from docstratum.pipeline.per_file import PerFileStage
+from docstratum.pipeline.per_file import ExecutorBackend, PerFileStage
 from docstratum.pipeline.relationship import (
+    LinkResolver,
     RelationshipStage,
+    ResolverStats,
+    UrlInfo,
     classify_relationship,
     extract_links_from_content,
     is_external_url,
 )
-from docstratum.pipeline.ecosystem_validator import EcosystemValidationStage
+from docstratum.pipeline.ecosystem_validator import (
+    ECOSYSTEM_CHECKS,
+    CheckInput,
+    EcosystemValidationStage,
+)
+from docstratum.pipeline.ecosystem_index import EcosystemIndex
+from docstratum.pipeline.graph import RelationshipGraph
+from docstratum.pipeline.similarity import SignatureCache
+from docstratum.pipeline.containment import AggregateIndexCache
 from docstratum.pipeline.ecosystem_scorer import (
     ScoringStage,
     calculate_completeness,
     calculate_coverage,
 )
 
+# ── Incremental runs ────────────────────────────────────────────────
+from docstratum.pipeline.incremental import (
+    ChangeSet,
+    FileFingerprint,
+    IncrementalState,
+    PipelineSnapshot,
+    fingerprint_file,
+)
+
+# ── Checkpoints ─────────────────────────────────────────────────────
+from docstratum.pipeline.checkpoint import PipelineCheckpoint
+
 # ── Orchestrator ────────────────────────────────────────────────────
-from docstratum.pipeline.orchestrator import EcosystemPipeline
+from docstratum.pipeline.orchestrator import (
+    EcosystemPipeline,
+    NodeSpan,
+    PipelineNode,
+    StageScheduler,
+    run_nodes,
+)
+from docstratum.pipeline.async_pipeline import (
+    AsyncEcosystemPipeline,
+    AsyncPerFileStage,
+)
 
 __all__ = [
     # Infrastructure
     "PipelineContext",
     "PipelineStage",
+    "AsyncPipelineStage",
     "PipelineStageId",
     "SingleFileValidator",
     "StageResult",
     "StageStatus",
     "StageTimer",
+    # Profiling
+    "StageProfile",
+    "StageProfiler",
+    "FileTimings",
+    "write_profiles",
+    # Tracing
+    "Tracer",
+    "NullTracer",
+    "NULL_TRACER",
+    "ChromeTracer",
     # Stages
     "DiscoveryStage",
     "PerFileStage",
+    "AsyncPerFileStage",
+    "ExecutorBackend",
     "RelationshipStage",
+    "LinkResolver",
+    "ResolverStats",
+    "UrlInfo",
     "EcosystemValidationStage",
     "ScoringStage",
+    "ECOSYSTEM_CHECKS",
+    "CheckInput",
+    "EcosystemIndex",
+    "RelationshipGraph",
+    "SignatureCache",
+    "AggregateIndexCache",
+    # Incremental runs
+    "IncrementalState",
+    "PipelineSnapshot",
+    "FileFingerprint",
+    "ChangeSet",
+    "fingerprint_file",
+    # Checkpoints
+    "PipelineCheckpoint",
     # Orchestrator
     "EcosystemPipeline",
+    "StageScheduler",
+    "PipelineNode",
+    "NodeSpan",
+    "run_nodes",
+    "AsyncEcosystemPipeline",
     # Utility functions
     "classify_filename",
     "classify_relationship",
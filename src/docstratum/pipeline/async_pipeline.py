@@ -0,0 +1,258 @@
+"""asyncio-native ecosystem pipeline for embedding in async services.
+
+``EcosystemPipeline.run()`` blocks its caller: Discovery walks the tree
+with ``iterdir()``/``stat()``, Stage 2 reads every file with
+``read_text()`` and parses it, and Stages 3-5 are CPU work. Inside an
+event loop that stalls every other request. ``AsyncEcosystemPipeline``
+runs the same five stages without blocking the loop:
+
+    Stage 2        ``AsyncPerFileStage.execute_async()``: each file's read →
+                   parse → classify → validate → score runs in an executor,
+                   at most ``concurrency`` files at a time (an
+                   ``asyncio.Semaphore``), inside a ``TaskGroup``.
+    Other stages   Stages without ``execute_async()`` (``AsyncPipelineStage``)
+                   run their blocking ``execute()`` via
+                   ``asyncio.to_thread()``.
+
+Results are applied in discovery order, so a run produces the same
+context as ``EcosystemPipeline.run()``. Many pipelines can run on one
+loop; they share the executor's threads instead of holding one each.
+
+Cancellation: cancelling the task awaiting ``run()`` cancels Stage 2's
+queued files, stops the pipeline at the next stage boundary, and
+re-raises ``CancelledError`` to the caller. Work already running in a
+thread finishes in the background and its result is discarded. Use
+``asyncio.timeout()`` around ``run()`` for a deadline.
+
+Classes:
+    AsyncPerFileStage: Stage 2 with bounded asyncio concurrency.
+    AsyncEcosystemPipeline: Async runner for the five stages.
+
+Related:
+    - src/docstratum/pipeline/orchestrator.py: The synchronous runner
+    - src/docstratum/pipeline/per_file.py: ``run_file`` and outcome handling
+    - src/docstratum/pipeline/stages.py: PipelineStage / AsyncPipelineStage
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Sequence
+from concurrent.futures import Executor
+
+from docstratum.pipeline.discovery import DiscoveryStage
+from docstratum.pipeline.ecosystem_scorer import ScoringStage
+from docstratum.pipeline.ecosystem_validator import EcosystemValidationStage
+from docstratum.pipeline.per_file import FileOutcome, PerFileStage, run_file
+from docstratum.pipeline.relationship import RelationshipStage
+from docstratum.pipeline.stages import (
+    AsyncPipelineStage,
+    PipelineContext,
+    PipelineStage,
+    PipelineStageId,
+    SingleFileValidator,
+    StageResult,
+    StageTimer,
+    exception_result,
+    log_summary,
+    record_result,
+    skip_result,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 8
+"""Default number of files a pipeline processes at once in Stage 2."""
+
+
+class AsyncPerFileStage(PerFileStage):
+    """Stage 2 with each file processed off the event loop.
+
+    Behaves like ``PerFileStage`` (same outcomes, same order, same
+    ``file_contents``); ``execute()`` remains available for synchronous
+    use.
+
+    Attributes:
+        concurrency: Most files in flight at once.
+
+    Example:
+        >>> stage = AsyncPerFileStage(validator=ParserAdapter(), concurrency=16)
+        >>> result = await stage.execute_async(ctx)
+    """
+
+    def __init__(
+        self,
+        validator: SingleFileValidator | None = None,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        executor: Executor | None = None,
+    ) -> None:
+        """Initialize the stage.
+
+        Args:
+            validator: Optional SingleFileValidator (must be thread-safe, or
+                picklable for a process pool executor).
+            concurrency: Most files processed at once.
+            executor: Where per-file work runs; the loop's default thread
+                pool if None.
+
+        Raises:
+            ValueError: If ``concurrency`` is less than 1.
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+        super().__init__(validator)
+        self._concurrency = concurrency
+        self._executor = executor
+
+    @property
+    def concurrency(self) -> int:
+        """Most files processed at once."""
+        return self._concurrency
+
+    async def execute_async(self, context: PipelineContext) -> StageResult:
+        """Run per-file validation on all files without blocking the loop.
+
+        Args:
+            context: Pipeline context with ``files`` populated by Stage 1.
+
+        Returns:
+            StageResult as ``PerFileStage.execute()`` would return it.
+
+        Raises:
+            asyncio.CancelledError: If the run is cancelled; files not yet
+                started are never processed.
+        """
+        timer = StageTimer()
+        timer.start()
+        self.file_contents.clear()
+        self.file_timings.clear()
+        pending = self._pending_files(context.files)
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def run_one(path: str) -> FileOutcome:
+            async with semaphore:
+                return await loop.run_in_executor(
+                    self._executor, run_file, self._validator, path
+                )
+
+        logger.info(
+            "Async per-file stage starting: %d files (concurrency=%d)",
+            len(pending),
+            self._concurrency,
+        )
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(run_one(f.file_path)) for f in pending]
+
+        results = [
+            self._apply_outcome(eco_file, task.result())
+            for eco_file, task in zip(pending, tasks, strict=True)
+        ]
+        return self._finish(context, results, timer)
+
+
+class AsyncEcosystemPipeline:
+    """Runs the five ecosystem stages from a coroutine.
+
+    Attributes:
+        validator: The optional SingleFileValidator for Stage 2.
+        concurrency: Most files processed at once in Stage 2.
+
+    Example:
+        >>> pipeline = AsyncEcosystemPipeline(ParserAdapter(), concurrency=16)
+        >>> contexts = await asyncio.gather(
+        ...     pipeline.run("/srv/project-a"), pipeline.run("/srv/project-b")
+        ... )
+        >>> async with asyncio.timeout(30):
+        ...     ctx = await pipeline.run("/srv/project-c")
+    """
+
+    def __init__(
+        self,
+        validator: SingleFileValidator | None = None,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        executor: Executor | None = None,
+    ) -> None:
+        """Initialize the pipeline.
+
+        Args:
+            validator: Optional SingleFileValidator for Stage 2. Runs share
+                it, so it must be safe to call from several threads
+                (``ParserAdapter`` is).
+            concurrency: Most files processed at once per run.
+            executor: Where Stage 2's per-file work runs; the loop's
+                default thread pool if None.
+
+        Raises:
+            ValueError: If ``concurrency`` is less than 1.
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+        self._validator = validator
+        self._concurrency = concurrency
+        self._executor = executor
+
+    @property
+    def concurrency(self) -> int:
+        """Most files processed at once in Stage 2."""
+        return self._concurrency
+
+    def _stages(self) -> Sequence[PipelineStage | AsyncPipelineStage]:
+        """Fresh stage instances for one run."""
+        per_file_stage = AsyncPerFileStage(
+            self._validator, concurrency=self._concurrency, executor=self._executor
+        )
+        return [
+            DiscoveryStage(),
+            per_file_stage,
+            RelationshipStage(file_contents=per_file_stage.file_contents),
+            EcosystemValidationStage(file_contents=per_file_stage.file_contents),
+            ScoringStage(),
+        ]
+
+    async def run(
+        self,
+        root_path: str,
+        stop_after: PipelineStageId | None = None,
+    ) -> PipelineContext:
+        """Execute the pipeline on a project root or single file.
+
+        Same arguments, stage semantics, and result as
+        ``EcosystemPipeline.run()``.
+
+        Args:
+            root_path: Project root directory or a single llms.txt file.
+            stop_after: Optional stage ID to stop after.
+
+        Returns:
+            The completed PipelineContext.
+
+        Raises:
+            asyncio.CancelledError: If the awaiting task is cancelled.
+        """
+        overall_timer = StageTimer()
+        overall_timer.start()
+        context = PipelineContext(root_path=root_path)
+        logger.info(
+            "Async ecosystem pipeline starting: root_path=%s, stop_after=%s",
+            root_path,
+            stop_after.name if stop_after else "None (full run)",
+        )
+
+        for stage in self._stages():
+            result = skip_result(stage.stage_id, stop_after, context)
+            if result is None:
+                try:
+                    if isinstance(stage, AsyncPipelineStage):
+                        result = await stage.execute_async(context)
+                    else:
+                        result = await asyncio.to_thread(stage.execute, context)
+                except Exception as exc:
+                    result = exception_result(stage.stage_id, exc)
+            record_result(context, result)
+
+        log_summary(context, overall_timer.stop())
+        return context
@@ -0,0 +1,174 @@
+"""Pipeline checkpoints: save a run after any stage, resume it later.
+
+``stop_after`` halts a run after any stage; a ``PipelineCheckpoint``
+keeps what that run produced so another process (or a later run with
+different settings) continues from there instead of re-discovering and
+re-parsing the project:
+
+    >>> pipeline = EcosystemPipeline(ParserAdapter())
+    >>> pipeline.run(root, stop_after=PipelineStageId.RELATIONSHIP,
+    ...              checkpoint="ingest.ckpt.json.gz")      # ingest worker
+    >>> ctx = pipeline.resume("ingest.ckpt.json.gz")        # elsewhere
+
+A checkpoint holds:
+
+    stage          The last stage that was not skipped. Resuming runs the
+                   stages after it.
+    context        The ``PipelineContext`` (files with their parse,
+                   validation, and quality results, edges, diagnostics,
+                   stage results through ``stage``).
+    file_contents  ``PerFileStage.file_contents``, the raw text Stages 3
+                   and 4 fall back on for files without a parsed model.
+
+Stages 3-5 never read the project tree, so a checkpoint taken after
+Stage 2 resumes on a machine without the files. One taken after Stage 1
+re-reads them in Stage 2.
+
+On disk a checkpoint is gzip-compressed JSON, written atomically. Loading
+rejects checkpoints from another layout version or docstratum version
+(``ValueError``); stage code may have changed what earlier stages
+produce. Files reused from an incremental snapshot were not re-read, so
+a checkpoint of an incremental run has no raw content for them.
+
+Classes:
+    PipelineCheckpoint: A context and its side channel after one stage.
+
+Related:
+    - src/docstratum/pipeline/orchestrator.py: ``run(checkpoint=...)`` and
+      ``resume()``
+    - src/docstratum/pipeline/incremental.py: Snapshots reused across runs
+"""
+
+from __future__ import annotations
+
+import gzip
+import logging
+import os
+
+from pydantic import BaseModel, Field
+
+from docstratum import __version__
+from docstratum.pipeline.stages import (
+    PipelineContext,
+    PipelineStageId,
+    StageStatus,
+)
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FORMAT_VERSION = 1
+"""Bumped whenever the persisted checkpoint layout changes."""
+
+_COMPRESS_LEVEL = 6
+
+
+class PipelineCheckpoint(BaseModel):
+    """A pipeline context and its side channel after one stage.
+
+    Attributes:
+        format_version: Checkpoint layout version.
+        docstratum_version: Version that produced the checkpoint.
+        stage: The last stage whose results the checkpoint holds.
+        context: The context after ``stage``.
+        file_contents: Raw file content by file id, from Stage 2.
+    """
+
+    format_version: int = Field(default=CHECKPOINT_FORMAT_VERSION)
+    docstratum_version: str = Field(default=__version__)
+    stage: PipelineStageId = Field(description="Last stage that ran.")
+    context: PipelineContext = Field(description="Context after the stage.")
+    file_contents: dict[str, str] = Field(default_factory=dict)
+
+    @classmethod
+    def capture(
+        cls,
+        context: PipelineContext,
+        file_contents: dict[str, str] | None = None,
+    ) -> PipelineCheckpoint:
+        """Checkpoint a context after the last stage that ran.
+
+        Args:
+            context: A context with at least Discovery's result recorded.
+            file_contents: ``PerFileStage.file_contents`` of the run.
+
+        Returns:
+            A checkpoint sharing ``context``; later changes to the context
+            show up in it until it is saved.
+
+        Raises:
+            ValueError: If no stage has run.
+        """
+        ran = [
+            r.stage for r in context.stage_results if r.status != StageStatus.SKIPPED
+        ]
+        if not ran:
+            raise ValueError("Cannot checkpoint a context before any stage ran")
+        return cls(
+            stage=max(ran),
+            context=context,
+            file_contents=dict(file_contents or {}),
+        )
+
+    def resume_state(self) -> tuple[PipelineContext, dict[str, str]]:
+        """Fresh copies of the context and contents to continue a run from.
+
+        The context keeps the stage results through ``stage``; the
+        checkpoint itself is left untouched, so it can seed several runs.
+
+        Returns:
+            ``(context, file_contents)``.
+        """
+        # Through JSON: a live context may hold lazily parsed documents
+        # whose buffers cannot be deep-copied.
+        context = PipelineContext.model_validate_json(self.context.model_dump_json())
+        context.stage_results = [
+            r for r in context.stage_results if r.stage <= self.stage
+        ]
+        return context, dict(self.file_contents)
+
+    def save(self, path: str) -> None:
+        """Write the checkpoint to ``path`` as gzip JSON, atomically.
+
+        Args:
+            path: Destination file. Parent directories are created.
+        """
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with gzip.open(tmp_path, "wb", compresslevel=_COMPRESS_LEVEL) as fh:
+            fh.write(self.model_dump_json().encode("utf-8"))
+        os.replace(tmp_path, path)
+        logger.info("Checkpoint after %s saved to %s", self.stage.name, path)
+
+    @classmethod
+    def load(cls, path: str) -> PipelineCheckpoint:
+        """Read a checkpoint written by ``save()``.
+
+        Args:
+            path: Checkpoint file.
+
+        Returns:
+            The checkpoint.
+
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: If it is not a checkpoint, or was written by another
+                layout or docstratum version.
+        """
+        try:
+            with gzip.open(path, "rb") as fh:
+                checkpoint = cls.model_validate_json(fh.read())
+        except (gzip.BadGzipFile, EOFError) as exc:
+            raise ValueError(f"Not a pipeline checkpoint: {path}") from exc
+        if (
+            checkpoint.format_version != CHECKPOINT_FORMAT_VERSION
+            or checkpoint.docstratum_version != __version__
+        ):
+            raise ValueError(
+                f"Checkpoint {path} was written by docstratum "
+                f"{checkpoint.docstratum_version} (format "
+                f"{checkpoint.format_version}); this is {__version__} "
+                f"(format {CHECKPOINT_FORMAT_VERSION})"
+            )
+        return checkpoint
@@ -0,0 +1,155 @@
+"""Aggregate containment for W014 (AGGREGATE_INCOMPLETE) and AP_ECO_003.
+
+The question W014 asks — "is this page's content in llms-full.txt?" — is
+a substring-containment question, and searching a multi-megabyte aggregate
+once per page is O(pages x aggregate). Instead the aggregate is reduced
+once to a set of content fingerprints, and each page is answered by one
+linear pass over its own text:
+
+    1. Rolling hash: the text's lowercased words are hashed into
+       ``FINGERPRINT_WORDS``-word windows with a Rabin-Karp rolling hash
+       (``similarity.shingle_sequence``), one hash per word position.
+    2. Winnowing: from every ``WINNOW_WINDOW`` consecutive window hashes
+       the minimum is kept as a fingerprint. Selection depends only on
+       the content around it, not on where the text starts, so a page
+       copied into the aggregate selects the same fingerprints in both
+       places — every fingerprint of a contained page is a fingerprint of
+       the aggregate. The aggregate keeps roughly 2 / (WINNOW_WINDOW + 1)
+       of its window hashes.
+    3. Containment: the fraction of a page's fingerprints present in the
+       aggregate's set; 1.0 for a page copied verbatim (modulo markup and
+       whitespace), near 0.0 for a page that is absent.
+
+``AggregateIndex`` holds the aggregate's fingerprint set. It is cached by
+a hash of the aggregate text in an ``AggregateIndexCache``, so re-runs
+over an unchanged llms-full.txt skip step 1 and 2 for the aggregate.
+
+Classes:
+    Containment: Matched and total fingerprint counts for one page.
+    AggregateIndex: Fingerprint set of one aggregate text.
+    AggregateIndexCache: ContentCache of AggregateIndex.
+
+Functions:
+    fingerprints: Winnowed rolling-hash fingerprints of a text.
+
+Related:
+    - src/docstratum/pipeline/similarity.py: Shingle hashing, ContentCache
+    - src/docstratum/pipeline/ecosystem_validator.py: W014 / AP_ECO_003
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import NamedTuple
+
+from docstratum.pipeline.similarity import ContentCache, shingle_sequence
+
+FINGERPRINT_WORDS = 8
+"""Words per rolling-hash window."""
+
+WINNOW_WINDOW = 4
+"""Consecutive window hashes per winnowing window (one minimum kept)."""
+
+DEFAULT_AGGREGATE_ENTRIES = 8
+"""Default bound on the number of cached aggregate indexes."""
+
+
+def fingerprints(text: str) -> set[int]:
+    """Return the winnowed fingerprints of ``text``.
+
+    Keeps the rightmost minimum of every ``WINNOW_WINDOW`` consecutive
+    window hashes, using a monotonic deque so the pass is linear.
+
+    Args:
+        text: The text to fingerprint.
+
+    Returns:
+        The selected hashes; empty if the text has fewer than
+        ``FINGERPRINT_WORDS + WINNOW_WINDOW - 1`` words.
+    """
+    hashes = shingle_sequence(text, FINGERPRINT_WORDS)
+    selected: set[int] = set()
+    if len(hashes) < WINNOW_WINDOW:
+        return selected
+    minima: deque[int] = deque()  # positions with increasing hash values
+    for i, h in enumerate(hashes):
+        while minima and hashes[minima[-1]] >= h:
+            minima.pop()
+        minima.append(i)
+        if minima[0] <= i - WINNOW_WINDOW:
+            minima.popleft()
+        if i >= WINNOW_WINDOW - 1:
+            selected.add(hashes[minima[0]])
+    return selected
+
+
+class Containment(NamedTuple):
+    """``matched`` of a page's ``total`` fingerprints were in the aggregate."""
+
+    matched: int
+    total: int
+
+    @property
+    def ratio(self) -> float:
+        """Fraction of the page found in the aggregate (1.0 if no fingerprints)."""
+        return self.matched / self.total if self.total else 1.0
+
+
+class AggregateIndex:
+    """Fingerprint set of an aggregate (llms-full.txt) text.
+
+    Attributes:
+        fingerprints: The aggregate's winnowed fingerprints.
+
+    Example:
+        >>> aggregate = AggregateIndex(full_text)
+        >>> aggregate.containment(page_text).ratio
+        1.0
+    """
+
+    __slots__ = ("fingerprints",)
+
+    def __init__(self, text: str) -> None:
+        """Fingerprint ``text``."""
+        self.fingerprints = frozenset(fingerprints(text))
+
+    def __len__(self) -> int:
+        return len(self.fingerprints)
+
+    def containment(self, text: str) -> Containment | None:
+        """How much of ``text`` appears in the aggregate.
+
+        Args:
+            text: A page's content.
+
+        Returns:
+            The page's matched and total fingerprint counts, or None if the
+            page is too short to fingerprint.
+        """
+        page = fingerprints(text)
+        if not page:
+            return None
+        return Containment(len(page & self.fingerprints), len(page))
+
+
+class AggregateIndexCache(ContentCache[AggregateIndex]):
+    """Content-hash cache of ``AggregateIndex``.
+
+    Example:
+        >>> cache = AggregateIndexCache()
+        >>> cache.index(full_text) is cache.index(full_text)
+        True
+    """
+
+    __slots__ = ()
+
+    def __init__(self, max_entries: int = DEFAULT_AGGREGATE_ENTRIES) -> None:
+        """Create an empty cache holding at most ``max_entries`` indexes."""
+        super().__init__(max_entries)
+
+    def _compute(self, text: str) -> AggregateIndex:
+        return AggregateIndex(text)
+
+    def index(self, text: str) -> AggregateIndex:
+        """Return the (possibly cached) index of ``text``."""
+        return self.get(text)
@@ -0,0 +1,193 @@
+"""Precomputed lookups over an ecosystem's files and relationship edges.
+
+Stage 4 runs a dozen checks and Stage 5 computes scores, and each of them
+used to rescan ``context.files`` and ``context.relationships`` on its own —
+some once per index file, which made the stages O(checks x (F + R)) with
+O(F x R) worst cases. ``EcosystemIndex`` makes one pass over both lists and
+keeps everything those consumers ask for:
+
+    by_id / by_path      File lookup by UUID and by path
+    of_type()            Files of one DocumentType, in discovery order
+    outgoing / incoming  Edges per source file / per resolved target file
+    internal_outgoing    Non-EXTERNAL edges per source file
+    resolved / broken    Resolved edges / unresolved non-EXTERNAL edges
+    total_tokens         Sum of estimated tokens over classified files
+    coverage_mask        OR of per-file CanonicalCoverage bitmasks (lazy)
+    canonical_coverage   The covered categories as a set (lazy)
+
+Building is O(F + R); every lookup afterwards is O(1) or proportional to its
+answer. ``EcosystemIndex.of(context)`` caches the index on the context so
+Stage 4 and Stage 5 share one build. The cache is keyed on the identity and
+length of ``context.files`` / ``context.relationships``; stages replace
+those lists rather than editing them after Stage 3, which invalidates it.
+Code that edits the lists in place should call ``EcosystemIndex.build()``.
+
+Classes:
+    EcosystemIndex: One-pass index over files and relationships.
+
+Related:
+    - src/docstratum/pipeline/ecosystem_validator.py: Stage 4 checks
+    - src/docstratum/pipeline/ecosystem_scorer.py: Stage 5 scoring
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from docstratum.parser.section_matcher import coverage_of
+from docstratum.pipeline.stages import PipelineContext
+from docstratum.schema.classification import DocumentType
+from docstratum.schema.constants import CanonicalCoverage, CanonicalSectionName
+from docstratum.schema.ecosystem import EcosystemFile, FileRelationship
+from docstratum.schema.parsed import LinkRelationship
+
+
+class EcosystemIndex:
+    """Lookups over one snapshot of an ecosystem's files and edges.
+
+    Attributes:
+        files: The indexed files, in context order.
+        relationships: The indexed edges, in context order.
+        by_id: file_id → EcosystemFile.
+        by_path: file_path → EcosystemFile.
+        outgoing: source file_id → edges from that file, in order.
+        internal_outgoing: source file_id → non-EXTERNAL edges, in order.
+        incoming: target file_id → resolved edges into that file, in order.
+        resolved: Resolved edges, in order.
+        broken: Unresolved non-EXTERNAL edges, in order.
+        total_tokens: Sum of ``classification.estimated_tokens``.
+
+    Example:
+        >>> index = EcosystemIndex.of(context)
+        >>> [f.file_path for f in index.of_type(DocumentType.TYPE_1_INDEX)]
+        ['/project/llms.txt']
+        >>> len(index.internal_outgoing.get(index_file.file_id, ()))
+        12
+    """
+
+    __slots__ = (
+        "_by_type",
+        "_coverage",
+        "broken",
+        "by_id",
+        "by_path",
+        "files",
+        "incoming",
+        "internal_outgoing",
+        "outgoing",
+        "relationships",
+        "resolved",
+        "total_tokens",
+    )
+
+    def __init__(
+        self,
+        files: Sequence[EcosystemFile],
+        relationships: Sequence[FileRelationship],
+    ) -> None:
+        """Index ``files`` and ``relationships`` in a single pass each.
+
+        Args:
+            files: Ecosystem files, in discovery order.
+            relationships: Relationship edges, in Stage 3 order.
+        """
+        self.files = files
+        self.relationships = relationships
+        self.by_id: dict[str, EcosystemFile] = {}
+        self.by_path: dict[str, EcosystemFile] = {}
+        self._by_type: dict[DocumentType, list[EcosystemFile]] = {}
+        self.total_tokens = 0
+        self._coverage: CanonicalCoverage | None = None
+
+        for eco_file in files:
+            self.by_id[eco_file.file_id] = eco_file
+            self.by_path[eco_file.file_path] = eco_file
+            self._by_type.setdefault(eco_file.file_type, []).append(eco_file)
+            if eco_file.classification is not None:
+                self.total_tokens += eco_file.classification.estimated_tokens
+
+        self.outgoing: dict[str, list[FileRelationship]] = {}
+        self.internal_outgoing: dict[str, list[FileRelationship]] = {}
+        self.incoming: dict[str, list[FileRelationship]] = {}
+        self.resolved: list[FileRelationship] = []
+        self.broken: list[FileRelationship] = []
+
+        external = LinkRelationship.EXTERNAL
+        for rel in relationships:
+            source = rel.source_file_id
+            self.outgoing.setdefault(source, []).append(rel)
+            if rel.relationship_type != external:
+                self.internal_outgoing.setdefault(source, []).append(rel)
+                if not rel.is_resolved:
+                    self.broken.append(rel)
+            if rel.is_resolved:
+                self.resolved.append(rel)
+                if rel.target_file_id:
+                    self.incoming.setdefault(rel.target_file_id, []).append(rel)
+
+    @classmethod
+    def build(cls, context: PipelineContext) -> EcosystemIndex:
+        """Index the context's current files and relationships (uncached)."""
+        return cls(context.files, context.relationships)
+
+    @classmethod
+    def of(cls, context: PipelineContext) -> EcosystemIndex:
+        """Return the context's cached index, building it if stale.
+
+        Args:
+            context: Pipeline context after Stage 3.
+
+        Returns:
+            An index describing ``context.files`` and ``context.relationships``.
+        """
+        index = context._ecosystem_index
+        if (
+            index is None
+            or index.files is not context.files
+            or index.relationships is not context.relationships
+            or len(index.files) != len(context.files)
+            or len(index.relationships) != len(context.relationships)
+        ):
+            index = cls.build(context)
+            context._ecosystem_index = index
+        return index
+
+    def of_type(self, file_type: DocumentType) -> Sequence[EcosystemFile]:
+        """Files of ``file_type``, in discovery order (empty if none)."""
+        return self._by_type.get(file_type, ())
+
+    @property
+    def referenced_ids(self) -> set[str]:
+        """file_ids that are the target of at least one resolved edge."""
+        return set(self.incoming)
+
+    @property
+    def coverage_mask(self) -> CanonicalCoverage:
+        """Canonical section categories covered by any parsed file.
+
+        The bitwise OR of each file's ``coverage`` mask, which Stage 2
+        computes once per file. Parsed files without a mask (built outside
+        the pipeline) are measured with ``coverage_of()``. Computed on
+        first access and cached.
+        """
+        if self._coverage is None:
+            covered = CanonicalCoverage.NONE
+            for eco_file in self.files:
+                if eco_file.coverage is not None:
+                    covered |= eco_file.coverage
+                elif eco_file.parsed is not None:
+                    covered |= coverage_of(eco_file.parsed)
+            self._coverage = covered
+        return self._coverage
+
+    @property
+    def canonical_coverage(self) -> frozenset[CanonicalSectionName]:
+        """The categories in ``coverage_mask``, as enum members."""
+        return self.coverage_mask.categories()
+
+    def __repr__(self) -> str:
+        """Short summary of the indexed sizes."""
+        return (
+            f"EcosystemIndex(files={len(self.files)}, "
+            f"relationships={len(self.relationships)}, broken={len(self.broken)})"
+        )
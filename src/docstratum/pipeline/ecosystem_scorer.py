@@ -48,7 +48,7 @@ import logging
 from datetime import datetime
 
 from docstratum.schema.classification import DocumentType
-from docstratum.schema.constants import CanonicalSectionName, SECTION_NAME_ALIASES
+from docstratum.schema.constants import FULL_CANONICAL_COVERAGE, CanonicalCoverage
 from docstratum.schema.ecosystem import (
     DocumentEcosystem,
     EcosystemFile,
@@ -64,6 +64,7 @@ from docstratum.schema.quality import (
     QualityScore,
 )
 
+from docstratum.pipeline.ecosystem_index import EcosystemIndex
 from docstratum.pipeline.stages import (
     PipelineContext,
     PipelineStageId,
@@ -99,33 +100,6 @@ TOTAL_CANONICAL_CATEGORIES: int = 11
 """Number of canonical section categories defined in the specification."""
 
 
-# ── Helper: Canonical Section Matching ──────────────────────────────
-
-
-def _match_canonical_section(section_name: str) -> CanonicalSectionName | None:
-    """Match a section name to a canonical section category.
-
-    Tries exact match first, then case-insensitive match, then alias lookup.
-    This is duplicated from ecosystem_validator.py to keep modules decoupled;
-    a shared utility module can be introduced if more stages need it.
-
-    Args:
-        section_name: The section heading text (e.g., "API Reference").
-
-    Returns:
-        The matched CanonicalSectionName, or None if no match found.
-    """
-    lower = section_name.lower().strip()
-
-    # Try direct enum match.
-    for canonical in CanonicalSectionName:
-        if canonical.value.lower() == lower:
-            return canonical
-
-    # Try alias lookup.
-    return SECTION_NAME_ALIASES.get(lower)
-
-
 # ── Completeness Scoring ────────────────────────────────────────────
 
 
@@ -224,17 +198,19 @@ def calculate_coverage(
 
     Traces to: FR-082 (ecosystem Coverage scoring)
     """
-    covered: set[CanonicalSectionName] = set()
+    return _coverage_score(EcosystemIndex(files, ()).coverage_mask)
+
 
-    for eco_file in files:
-        if eco_file.parsed is None:
-            continue
-        for section in eco_file.parsed.sections:
-            matched = _match_canonical_section(section.name)
-            if matched is not None:
-                covered.add(matched)
+def _coverage_score(covered: CanonicalCoverage) -> DimensionScore:
+    """Build the Coverage DimensionScore from the covered categories.
+
+    Args:
+        covered: Bitmask of canonical categories found in the ecosystem.
 
-    categories_found = len(covered)
+    Returns:
+        DimensionScore for the Coverage dimension.
+    """
+    categories_found = covered.count
     score = (categories_found / TOTAL_CANONICAL_CATEGORIES) * 100.0
 
     return DimensionScore(
@@ -247,9 +223,9 @@ def calculate_coverage(
         details=[{
             "categories_found": categories_found,
             "total_categories": TOTAL_CANONICAL_CATEGORIES,
-            "covered": sorted(c.value for c in covered),
+            "covered": sorted(c.value for c in covered.categories()),
             "missing": sorted(
-                c.value for c in set(CanonicalSectionName) - covered
+                c.value for c in (FULL_CANONICAL_COVERAGE & ~covered).categories()
             ),
         }],
         is_gated=False,
@@ -343,8 +319,10 @@ class ScoringStage:
         )
 
         # ── Step 1: Calculate dimension scores ─────────────────────
+        # Stage 4 normally built the index already; reuse it.
+        index = EcosystemIndex.of(context)
         completeness = calculate_completeness(context.relationships)
-        coverage = calculate_coverage(context.files)
+        coverage = _coverage_score(index.coverage_mask)
 
         # ── Step 2: Calculate composite score ──────────────────────
         composite = calculate_composite_score(completeness, coverage)
@@ -367,11 +345,7 @@ class ScoringStage:
                 per_file_scores[eco_file.file_id] = eco_file.quality
 
         # ── Step 5: Count relationship stats ───────────────────────
-        broken = sum(
-            1 for r in context.relationships
-            if r.relationship_type != LinkRelationship.EXTERNAL
-            and not r.is_resolved
-        )
+        broken = len(index.broken)
 
         # ── Step 6: Assemble EcosystemScore ────────────────────────
         ecosystem_score = EcosystemScore(
@@ -388,9 +362,11 @@ class ScoringStage:
 
         # ── Step 7: Assemble DocumentEcosystem ─────────────────────
         # Find the root file (index).
-        root_file = next(
-            (f for f in context.files if f.file_type == DocumentType.TYPE_1_INDEX),
-            context.files[0] if context.files else None,
+        index_files = index.of_type(DocumentType.TYPE_1_INDEX)
+        root_file = (
+            index_files[0]
+            if index_files
+            else (context.files[0] if context.files else None)
         )
 
         if root_file is not None:
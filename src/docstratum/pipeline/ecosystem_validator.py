@@ -6,7 +6,8 @@ validator could perform: broken cross-file links, inconsistent project names
 across files, orphaned files, and the six ecosystem anti-patterns.
 
 Diagnostic codes emitted by this stage:
-    E010 (ORPHANED_ECOSYSTEM_FILE): File not referenced by any other file.
+    E010 (ORPHANED_ECOSYSTEM_FILE): File not referenced by any other file,
+         or referenced only from files the index cannot reach.
     W012 (BROKEN_CROSS_FILE_LINK): Internal link doesn't resolve to a file.
     W013 (MISSING_AGGREGATE): Project large enough to benefit from llms-full.txt
          but none exists.
@@ -39,15 +40,22 @@ Traces to:
 from __future__ import annotations
 
 import logging
+import threading
 from collections import Counter
+from collections.abc import Callable
+from enum import StrEnum
+from typing import NamedTuple
 
 from docstratum.schema.classification import DocumentType
-from docstratum.schema.constants import CanonicalSectionName, SECTION_NAME_ALIASES
+from docstratum.schema.constants import FULL_CANONICAL_COVERAGE
 from docstratum.schema.diagnostics import DiagnosticCode, Severity
 from docstratum.schema.ecosystem import EcosystemFile, FileRelationship
-from docstratum.schema.parsed import LinkRelationship
 from docstratum.schema.validation import ValidationDiagnostic, ValidationLevel
 
+from docstratum.pipeline.containment import AggregateIndexCache, Containment
+from docstratum.pipeline.ecosystem_index import EcosystemIndex
+from docstratum.pipeline.graph import RelationshipGraph
+from docstratum.pipeline.similarity import SignatureCache, find_similar_pairs
 from docstratum.pipeline.stages import (
     PipelineContext,
     PipelineStageId,
@@ -55,6 +63,7 @@ from docstratum.pipeline.stages import (
     StageStatus,
     StageTimer,
 )
+from docstratum.pipeline.tracing import NULL_TRACER, Tracer
 
 logger = logging.getLogger(__name__)
 
@@ -74,30 +83,72 @@ UNBALANCED_DISTRIBUTION_THRESHOLD: float = 0.70
 AGGREGATE_SUGGESTION_TOKEN_THRESHOLD: int = 4_500
 """Token count above which W013 (MISSING_AGGREGATE) is emitted."""
 
+REDUNDANT_CONTENT_THRESHOLD: float = 0.60
+"""Shingle Jaccard similarity between two files that triggers W017."""
 
-# ── Helper: Canonical Section Matching ──────────────────────────────
+DEFAULT_SIGNATURE_CACHE = SignatureCache()
+"""Process-wide W017 signature cache (keys are content hashes)."""
 
+AGGREGATE_CONTAINMENT_THRESHOLD: float = 0.80
+"""Fraction of an indexed page found in llms-full.txt below which W014 fires."""
 
-def _match_canonical_section(section_name: str) -> CanonicalSectionName | None:
-    """Match a section name to a canonical section category.
+SHADOW_AGGREGATE_THRESHOLD: float = 0.50
+"""Fraction of all indexed content found in llms-full.txt below which
+AP_ECO_003 (Shadow Aggregate) fires."""
 
-    Tries exact match first, then case-insensitive match, then alias lookup.
+DEFAULT_AGGREGATE_CACHE = AggregateIndexCache()
+"""Process-wide W014 aggregate fingerprint cache (keys are content hashes)."""
 
-    Args:
-        section_name: The section heading text (e.g., "API Reference").
 
-    Returns:
-        The matched CanonicalSectionName, or None if no match found.
+# ── Check Registry ──────────────────────────────────────────────────
+# Every check, in execution (and therefore diagnostic) order, with the
+# parts of the context it reads. The incremental pipeline uses the inputs
+# to decide which checks must re-run after a small edit, and the DAG
+# scheduler (orchestrator.py) to start each check as soon as they exist —
+# so a check must not read anything its inputs do not name. The entries
+# (``ECOSYSTEM_CHECKS``) follow the stage class at the end of the module.
+
+
+class CheckInput(StrEnum):
+    """Parts of the pipeline context an ecosystem check depends on.
+
+    Attributes:
+        FILES: Which files exist — their paths and document types.
+        DOCUMENTS: Per-file results — parsed models and classifications.
+        RELATIONSHIPS: The cross-file relationship edges from Stage 3.
+    """
+
+    FILES = "files"
+    DOCUMENTS = "documents"
+    RELATIONSHIPS = "relationships"
+
+
+CheckFunction = Callable[
+    ["EcosystemValidationStage", PipelineContext, EcosystemIndex],
+    list[ValidationDiagnostic],
+]
+"""An unbound ``EcosystemValidationStage._check_*`` method."""
+
+
+class EcosystemCheck(NamedTuple):
+    """One Stage 4 check.
+
+    Attributes:
+        name: Check name; keys ``check_results`` and ``check_timings``.
+        inputs: Parts of the context the check reads.
+        run: The ``EcosystemValidationStage`` method implementing it.
     """
-    lower = section_name.lower().strip()
 
-    # Try direct enum match.
-    for canonical in CanonicalSectionName:
-        if canonical.value.lower() == lower:
-            return canonical
+    name: str
+    inputs: frozenset[CheckInput]
+    run: CheckFunction
+
+
+class AggregateContainment(NamedTuple):
+    """Containment of each measured indexed page in one aggregate file."""
 
-    # Try alias lookup.
-    return SECTION_NAME_ALIASES.get(lower)
+    aggregate: EcosystemFile
+    pages: list[tuple[EcosystemFile, Containment]]
 
 
 # ── Ecosystem Validation Stage ──────────────────────────────────────
@@ -117,8 +168,18 @@ class EcosystemValidationStage:
         3. Coverage — canonical section gaps, missing companion files
         4. Anti-Patterns — the six AP_ECO patterns
 
+    The checks and their order are listed in ``ECOSYSTEM_CHECKS``.
+    ``execute()`` runs them one after another; a scheduler can instead
+    call ``start_checks()``, then ``run_check()`` for each check (from
+    any thread, in any order), then ``finish_checks()`` — the diagnostics
+    come out in registry order either way.
+
     Attributes:
         stage_id: Always ``PipelineStageId.ECOSYSTEM_VALIDATION``.
+        check_results: Diagnostics of the last ``execute()``, keyed by
+            check name, in execution order.
+        check_timings: Milliseconds each check of the last run took.
+        tracer: Receives a span per check; ``NULL_TRACER`` by default.
 
     Example:
         >>> stage = EcosystemValidationStage()
@@ -132,6 +193,36 @@ class EcosystemValidationStage:
         FR-079 (ecosystem anti-pattern detection)
     """
 
+    def __init__(
+        self,
+        file_contents: dict[str, str] | None = None,
+        signature_cache: SignatureCache | None = None,
+        aggregate_cache: AggregateIndexCache | None = None,
+    ) -> None:
+        """Initialize the Ecosystem Validation stage.
+
+        Args:
+            file_contents: Dict mapping file_id → raw content string, used
+                by content checks (W017) for files without a parsed model.
+                Typically ``PerFileStage.file_contents``.
+            signature_cache: Cache for W017 content signatures. Defaults to
+                ``DEFAULT_SIGNATURE_CACHE``.
+            aggregate_cache: Cache for W014 aggregate fingerprints. Defaults
+                to ``DEFAULT_AGGREGATE_CACHE``.
+        """
+        self.check_results: dict[str, list[ValidationDiagnostic]] = {}
+        self.check_timings: dict[str, float] = {}
+        self._file_contents = file_contents if file_contents is not None else {}
+        self._signatures = (
+            signature_cache if signature_cache is not None else DEFAULT_SIGNATURE_CACHE
+        )
+        self._aggregates = (
+            aggregate_cache if aggregate_cache is not None else DEFAULT_AGGREGATE_CACHE
+        )
+        self._containment: list[AggregateContainment] | None = None
+        self._containment_lock = threading.Lock()
+        self.tracer: Tracer = NULL_TRACER
+
     @property
     def stage_id(self) -> PipelineStageId:
         """The ordinal identifier for this stage."""
@@ -153,32 +244,71 @@ class EcosystemValidationStage:
         timer = StageTimer()
         timer.start()
 
-        diagnostics: list[ValidationDiagnostic] = []
-
         logger.info(
             "Ecosystem validation starting: %d files, %d relationships",
             len(context.files),
             len(context.relationships),
         )
+        self.start_checks()
+
+        # One pass over files and edges, shared by every check (and Stage 5).
+        index = EcosystemIndex.of(context)
+        for check in ECOSYSTEM_CHECKS:
+            self.run_check(check, context, index)
+
+        return self.finish_checks(context, timer)
+
+    def start_checks(self) -> None:
+        """Forget the previous run's results before checks are run."""
+        self.check_results = {}
+        self.check_timings = {}
+        self._containment = None
+
+    def run_check(
+        self,
+        check: EcosystemCheck,
+        context: PipelineContext,
+        index: EcosystemIndex,
+    ) -> list[ValidationDiagnostic]:
+        """Run one registered check, recording its diagnostics and timing.
 
-        # ── Group 1: Link Resolution ───────────────────────────────
-        diagnostics.extend(self._check_broken_links(context))
+        Safe to call concurrently for different checks.
 
-        # ── Group 2: Consistency ───────────────────────────────────
-        diagnostics.extend(self._check_project_name_consistency(context))
-        diagnostics.extend(self._check_token_distribution(context))
+        Args:
+            check: The check to run.
+            context: Pipeline context holding (at least) the check's inputs.
+            index: Lookups over the context, built once the check's inputs
+                were available.
 
-        # ── Group 3: Coverage ──────────────────────────────────────
-        diagnostics.extend(self._check_missing_instruction_file(context))
-        diagnostics.extend(self._check_missing_aggregate(context))
-        diagnostics.extend(self._check_coverage_gaps(context))
+        Returns:
+            The check's diagnostics.
+        """
+        timer = StageTimer()
+        timer.start()
+        with self.tracer.span(check.name, "check"):
+            results = self._run_check(check, context, index)
+        self.check_timings[check.name] = timer.stop()
+        self.check_results[check.name] = results
+        return results
+
+    def finish_checks(self, context: PipelineContext, timer: StageTimer) -> StageResult:
+        """Collect the checks' diagnostics in registry order.
+
+        Appends them to ``context.ecosystem_diagnostics``.
+
+        Args:
+            context: Pipeline context the checks ran on.
+            timer: Timer started when the stage began.
 
-        # ── Group 4: Anti-Patterns ─────────────────────────────────
-        diagnostics.extend(self._check_index_island(context))
-        diagnostics.extend(self._check_phantom_links(context))
-        diagnostics.extend(self._check_duplicate_ecosystem(context))
-        diagnostics.extend(self._check_token_black_hole(context))
-        diagnostics.extend(self._check_orphaned_files(context))
+        Returns:
+            StageResult with all ecosystem-level diagnostics.
+        """
+        self.check_results = {
+            check.name: self.check_results[check.name]
+            for check in ECOSYSTEM_CHECKS
+            if check.name in self.check_results
+        }
+        diagnostics = [d for results in self.check_results.values() for d in results]
 
         # Append to context (don't replace — Discovery may have added some).
         context.ecosystem_diagnostics.extend(diagnostics)
@@ -204,12 +334,105 @@ class EcosystemValidationStage:
             diagnostics=diagnostics,
             duration_ms=elapsed,
             message=f"{len(diagnostics)} diagnostics: {errors}E, {warnings}W, {infos}I",
+            node_timings={
+                name: self.check_timings[name]
+                for name in self.check_results
+                if name in self.check_timings
+            },
         )
 
+    def _run_check(
+        self,
+        check: EcosystemCheck,
+        context: PipelineContext,
+        index: EcosystemIndex,
+    ) -> list[ValidationDiagnostic]:
+        """Run one registered check.
+
+        The incremental pipeline overrides this to return the previous
+        run's diagnostics for checks whose inputs did not change.
+
+        Args:
+            check: The check to run.
+            context: Pipeline context with files and relationships.
+            index: Lookups over the context's files and relationships.
+
+        Returns:
+            The check's diagnostics.
+        """
+        return check.run(self, context, index)
+
+    def _file_text(self, eco_file: EcosystemFile) -> str | None:
+        """Return a file's content for content checks, if available.
+
+        Args:
+            eco_file: The file.
+
+        Returns:
+            The raw content read in Stage 2, else the parsed model's
+            ``raw_content``, else None.
+        """
+        text = self._file_contents.get(eco_file.file_id)
+        if text:
+            return text
+        if eco_file.parsed is not None and eco_file.parsed.raw_content:
+            return eco_file.parsed.raw_content
+        return None
+
+    def _aggregate_containment(
+        self, index: EcosystemIndex
+    ) -> list[AggregateContainment]:
+        """Measure how much of each indexed content page each aggregate holds.
+
+        Shared by W014 and AP_ECO_003 and computed once per run, even
+        when both checks run concurrently. Each aggregate is fingerprinted
+        once (or taken from the aggregate cache); each page costs one
+        linear pass over its own text.
+
+        Args:
+            index: Lookups over the context's files and relationships.
+
+        Returns:
+            One entry per aggregate file with readable content.
+        """
+        with self._containment_lock:
+            if self._containment is None:
+                self._containment = self._measure_containment(index)
+            return self._containment
+
+    def _measure_containment(self, index: EcosystemIndex) -> list[AggregateContainment]:
+        """Compute ``_aggregate_containment()``'s result (uncached)."""
+        pages: dict[str, EcosystemFile] = {}
+        for index_file in index.of_type(DocumentType.TYPE_1_INDEX):
+            for rel in index.internal_outgoing.get(index_file.file_id, ()):
+                if not rel.is_resolved:
+                    continue
+                target = index.by_id.get(rel.target_file_id)
+                if (
+                    target is not None
+                    and target.file_type == DocumentType.TYPE_3_CONTENT_PAGE
+                ):
+                    pages.setdefault(target.file_id, target)
+
+        page_texts = [(page, self._file_text(page)) for page in pages.values()]
+        results: list[AggregateContainment] = []
+        for aggregate in index.of_type(DocumentType.TYPE_2_FULL):
+            text = self._file_text(aggregate)
+            if not text:
+                continue
+            fingerprints = self._aggregates.index(text)
+            measured = []
+            for page, page_text in page_texts:
+                containment = fingerprints.containment(page_text) if page_text else None
+                if containment is not None:
+                    measured.append((page, containment))
+            results.append(AggregateContainment(aggregate, measured))
+        return results
+
     # ── Group 1: Link Resolution ────────────────────────────────────
 
     def _check_broken_links(
-        self, context: PipelineContext
+        self, context: PipelineContext, index: EcosystemIndex
     ) -> list[ValidationDiagnostic]:
         """Emit W012 for each internal link that doesn't resolve.
 
@@ -218,6 +441,7 @@ class EcosystemValidationStage:
 
         Args:
             context: Pipeline context with files and relationships.
+            index: Lookups over the context's files and relationships.
 
         Returns:
             List of W012 diagnostics for unresolved internal links.
@@ -226,18 +450,9 @@ class EcosystemValidationStage:
         """
         diagnostics: list[ValidationDiagnostic] = []
 
-        # Build file_id → EcosystemFile lookup for source file identification.
-        id_to_file = {f.file_id: f for f in context.files}
-
-        for rel in context.relationships:
-            # Skip external links — they don't need ecosystem resolution.
-            if rel.relationship_type == LinkRelationship.EXTERNAL:
-                continue
-            # Skip already-resolved links.
-            if rel.is_resolved:
-                continue
-
-            source_file = id_to_file.get(rel.source_file_id)
+        # index.broken holds exactly the unresolved non-EXTERNAL edges.
+        for rel in index.broken:
+            source_file = index.by_id.get(rel.source_file_id)
             source_name = source_file.file_path if source_file else "unknown"
 
             diag = ValidationDiagnostic(
@@ -260,7 +475,7 @@ class EcosystemValidationStage:
     # ── Group 2: Consistency ────────────────────────────────────────
 
     def _check_project_name_consistency(
-        self, context: PipelineContext
+        self, context: PipelineContext, index: EcosystemIndex
     ) -> list[ValidationDiagnostic]:
         """Emit W015 if H1 titles differ between parsed ecosystem files.
 
@@ -269,6 +484,7 @@ class EcosystemValidationStage:
 
         Args:
             context: Pipeline context with files.
+            index: Lookups over the context's files and relationships.
 
         Returns:
             List of W015 diagnostics (0 or 1).
@@ -286,9 +502,7 @@ class EcosystemValidationStage:
 
         unique_titles = set(titles.values())
         if len(unique_titles) > 1:
-            details = ", ".join(
-                f"{path}: '{title}'" for path, title in titles.items()
-            )
+            details = ", ".join(f"{path}: '{title}'" for path, title in titles.items())
             diag = ValidationDiagnostic(
                 code=DiagnosticCode.W015_INCONSISTENT_PROJECT_NAME,
                 severity=Severity.WARNING,
@@ -300,8 +514,71 @@ class EcosystemValidationStage:
 
         return diagnostics
 
+    def _check_redundant_content(
+        self, context: PipelineContext, index: EcosystemIndex
+    ) -> list[ValidationDiagnostic]:
+        """Emit W017 for pairs of files with heavily overlapping content.
+
+        Compares word-shingle sets with MinHash/LSH so only likely pairs
+        are checked exactly (see ``pipeline/similarity.py``); a pair is
+        reported when its Jaccard similarity exceeds
+        ``REDUNDANT_CONTENT_THRESHOLD``. Aggregate files (llms-full.txt)
+        are skipped — they duplicate the content pages by design — as are
+        files too short to shingle meaningfully.
+
+        Jaccard, |A & B| / |A | B|, rather than containment, |A & B| /
+        min(|A|, |B|), is intended: W017 flags two pages that are mostly
+        the *same* page, so it is symmetric and ignores a short page quoted
+        inside a much longer one (that page is not redundant; the long one
+        just embeds it). It also matches what LSH banding finds: bands
+        agree with probability equal to the Jaccard similarity, so a
+        containment threshold would be checked only on pairs Jaccard had
+        already made candidates. "Is this page inside another file?" is
+        answered by containment where it matters, for the aggregate
+        (W014, ``pipeline/containment.py``).
+
+        Args:
+            context: Pipeline context with files.
+            index: Lookups over the context's files and relationships.
+
+        Returns:
+            One W017 diagnostic per redundant pair.
+
+        Traces to: v0.0.7 §5.2 (W017 REDUNDANT_CONTENT)
+        """
+        candidates: list[EcosystemFile] = []
+        signatures = []
+        for eco_file in context.files:
+            if eco_file.file_type == DocumentType.TYPE_2_FULL:
+                continue
+            text = self._file_text(eco_file)
+            if not text:
+                continue
+            candidates.append(eco_file)
+            signatures.append(self._signatures.signature(text))
+
+        diagnostics: list[ValidationDiagnostic] = []
+        for pair in find_similar_pairs(signatures, REDUNDANT_CONTENT_THRESHOLD):
+            first = candidates[pair.first]
+            second = candidates[pair.second]
+            diagnostics.append(
+                ValidationDiagnostic(
+                    code=DiagnosticCode.W017_REDUNDANT_CONTENT,
+                    severity=Severity.WARNING,
+                    message=(
+                        f"{first.file_path} and {second.file_path} share "
+                        f"{pair.similarity:.0%} of their content."
+                    ),
+                    remediation=DiagnosticCode.W017_REDUNDANT_CONTENT.remediation,
+                    level=ValidationLevel.L3_BEST_PRACTICES,
+                    source_file=first.file_path,
+                )
+            )
+
+        return diagnostics
+
     def _check_token_distribution(
-        self, context: PipelineContext
+        self, context: PipelineContext, index: EcosystemIndex
     ) -> list[ValidationDiagnostic]:
         """Emit W018 if one file consumes >70% of total ecosystem tokens.
 
@@ -310,6 +587,7 @@ class EcosystemValidationStage:
 
         Args:
             context: Pipeline context with files.
+            index: Lookups over the context's files and relationships.
 
         Returns:
             List of W018 diagnostics (0 or 1 per offending file).
@@ -319,11 +597,7 @@ class EcosystemValidationStage:
         if len(context.files) < 2:
             return diagnostics
 
-        total_tokens = sum(
-            f.classification.estimated_tokens
-            for f in context.files
-            if f.classification is not None
-        )
+        total_tokens = index.total_tokens
 
         if total_tokens == 0:
             return diagnostics
@@ -353,20 +627,18 @@ class EcosystemValidationStage:
     # ── Group 3: Coverage ───────────────────────────────────────────
 
     def _check_missing_instruction_file(
-        self, context: PipelineContext
+        self, context: PipelineContext, index: EcosystemIndex
     ) -> list[ValidationDiagnostic]:
         """Emit I008 if no llms-instructions.txt exists in the ecosystem.
 
         Args:
             context: Pipeline context with files.
+            index: Lookups over the context's files and relationships.
 
         Returns:
             List containing I008 if no instruction file found (0 or 1).
         """
-        has_instructions = any(
-            f.file_type == DocumentType.TYPE_4_INSTRUCTIONS
-            for f in context.files
-        )
+        has_instructions = bool(index.of_type(DocumentType.TYPE_4_INSTRUCTIONS))
         if not has_instructions:
             return [
                 ValidationDiagnostic(
@@ -380,7 +652,7 @@ class EcosystemValidationStage:
         return []
 
     def _check_missing_aggregate(
-        self, context: PipelineContext
+        self, context: PipelineContext, index: EcosystemIndex
     ) -> list[ValidationDiagnostic]:
         """Emit W013 if the project is large enough for llms-full.txt but has none.
 
@@ -390,21 +662,15 @@ class EcosystemValidationStage:
 
         Args:
             context: Pipeline context with files.
+            index: Lookups over the context's files and relationships.
 
         Returns:
             List containing W013 if aggregate is missing and beneficial (0 or 1).
         """
-        has_aggregate = any(
-            f.file_type == DocumentType.TYPE_2_FULL for f in context.files
-        )
-        if has_aggregate:
+        if index.of_type(DocumentType.TYPE_2_FULL):
             return []
 
-        total_tokens = sum(
-            f.classification.estimated_tokens
-            for f in context.files
-            if f.classification is not None
-        )
+        total_tokens = index.total_tokens
 
         if total_tokens > AGGREGATE_SUGGESTION_TOKEN_THRESHOLD:
             return [
@@ -422,42 +688,33 @@ class EcosystemValidationStage:
         return []
 
     def _check_coverage_gaps(
-        self, context: PipelineContext
+        self, context: PipelineContext, index: EcosystemIndex
     ) -> list[ValidationDiagnostic]:
         """Emit I009 if the ecosystem doesn't cover all 11 canonical section categories.
 
-        Scans section names across ALL files in the ecosystem (not just the index)
-        and reports which canonical categories are missing.
+        Considers ALL files in the ecosystem (not just the index): the gap is
+        the full canonical mask minus the OR of the per-file coverage masks.
 
         Args:
             context: Pipeline context with files.
+            index: Lookups over the context's files and relationships.
 
         Returns:
             List containing I009 if coverage gaps exist (0 or 1).
 
         Traces to: FR-082 (coverage scoring uses this same analysis)
         """
-        covered: set[CanonicalSectionName] = set()
-
-        for eco_file in context.files:
-            if eco_file.parsed is None:
-                continue
-            for section in eco_file.parsed.sections:
-                matched = _match_canonical_section(section.name)
-                if matched is not None:
-                    covered.add(matched)
-
-        all_canonical = set(CanonicalSectionName)
-        missing = all_canonical - covered
+        covered = index.coverage_mask
+        missing = FULL_CANONICAL_COVERAGE & ~covered
 
         if missing and len(context.files) > 1:
-            missing_names = sorted(m.value for m in missing)
+            missing_names = sorted(m.value for m in missing.categories())
             return [
                 ValidationDiagnostic(
                     code=DiagnosticCode.I009_CONTENT_COVERAGE_GAP,
                     severity=Severity.INFO,
                     message=(
-                        f"Ecosystem covers {len(covered)} of 11 canonical categories. "
+                        f"Ecosystem covers {covered.count} of 11 canonical categories. "
                         f"Missing: {', '.join(missing_names)}"
                     ),
                     remediation=DiagnosticCode.I009_CONTENT_COVERAGE_GAP.remediation,
@@ -466,10 +723,54 @@ class EcosystemValidationStage:
             ]
         return []
 
+    def _check_aggregate_incomplete(
+        self, context: PipelineContext, index: EcosystemIndex
+    ) -> list[ValidationDiagnostic]:
+        """Emit W014 for each indexed page llms-full.txt does not contain.
+
+        A content page linked from the index counts as included when at
+        least ``AGGREGATE_CONTAINMENT_THRESHOLD`` of its content
+        fingerprints appear in the aggregate (see
+        ``pipeline/containment.py``), so reformatted Markdown or an added
+        heading does not count as missing content. Pages too short to
+        fingerprint, and pages whose content is unavailable, are skipped.
+
+        Args:
+            context: Pipeline context with files and relationships.
+            index: Lookups over the context's files and relationships.
+
+        Returns:
+            One W014 diagnostic per (aggregate, missing page).
+
+        Traces to: v0.0.7 §5.2 (W014 AGGREGATE_INCOMPLETE)
+        """
+        diagnostics: list[ValidationDiagnostic] = []
+
+        for aggregate, measured in self._aggregate_containment(index):
+            for page, containment in measured:
+                if containment.ratio >= AGGREGATE_CONTAINMENT_THRESHOLD:
+                    continue
+                diagnostics.append(
+                    ValidationDiagnostic(
+                        code=DiagnosticCode.W014_AGGREGATE_INCOMPLETE,
+                        severity=Severity.WARNING,
+                        message=(
+                            f"{aggregate.file_path} is missing content from "
+                            f"{page.file_path} (only {containment.ratio:.0%} "
+                            f"of it found)."
+                        ),
+                        remediation=DiagnosticCode.W014_AGGREGATE_INCOMPLETE.remediation,
+                        level=ValidationLevel.L3_BEST_PRACTICES,
+                        source_file=aggregate.file_path,
+                    )
+                )
+
+        return diagnostics
+
     # ── Group 4: Anti-Patterns ──────────────────────────────────────
 
     def _check_index_island(
-        self, context: PipelineContext
+        self, context: PipelineContext, index: EcosystemIndex
     ) -> list[ValidationDiagnostic]:
         """Detect AP_ECO_001 (INDEX ISLAND): index file with zero outgoing links.
 
@@ -478,22 +779,15 @@ class EcosystemValidationStage:
 
         Args:
             context: Pipeline context with files and relationships.
+            index: Lookups over the context's files and relationships.
 
         Returns:
             List of E010-based diagnostics if pattern detected.
         """
-        index_files = [
-            f for f in context.files
-            if f.file_type == DocumentType.TYPE_1_INDEX
-        ]
         diagnostics: list[ValidationDiagnostic] = []
 
-        for index_file in index_files:
-            outgoing = [
-                r for r in context.relationships
-                if r.source_file_id == index_file.file_id
-                and r.relationship_type != LinkRelationship.EXTERNAL
-            ]
+        for index_file in index.of_type(DocumentType.TYPE_1_INDEX):
+            outgoing = index.internal_outgoing.get(index_file.file_id, ())
             if len(outgoing) == 0 and len(context.files) > 1:
                 diagnostics.append(
                     ValidationDiagnostic(
@@ -515,7 +809,7 @@ class EcosystemValidationStage:
         return diagnostics
 
     def _check_phantom_links(
-        self, context: PipelineContext
+        self, context: PipelineContext, index: EcosystemIndex
     ) -> list[ValidationDiagnostic]:
         """Detect AP_ECO_002 (PHANTOM LINKS): >30% of index links are broken.
 
@@ -524,23 +818,16 @@ class EcosystemValidationStage:
 
         Args:
             context: Pipeline context with files and relationships.
+            index: Lookups over the context's files and relationships.
 
         Returns:
             List of diagnostics if pattern detected.
         """
         diagnostics: list[ValidationDiagnostic] = []
-        index_files = [
-            f for f in context.files
-            if f.file_type == DocumentType.TYPE_1_INDEX
-        ]
 
-        for index_file in index_files:
+        for index_file in index.of_type(DocumentType.TYPE_1_INDEX):
             # Get all non-external links from this index file.
-            internal_links = [
-                r for r in context.relationships
-                if r.source_file_id == index_file.file_id
-                and r.relationship_type != LinkRelationship.EXTERNAL
-            ]
+            internal_links = index.internal_outgoing.get(index_file.file_id, ())
 
             if len(internal_links) == 0:
                 continue  # Handled by _check_index_island.
@@ -569,8 +856,56 @@ class EcosystemValidationStage:
 
         return diagnostics
 
+    def _check_shadow_aggregate(
+        self, context: PipelineContext, index: EcosystemIndex
+    ) -> list[ValidationDiagnostic]:
+        """Detect AP_ECO_003 (SHADOW AGGREGATE): llms-full.txt doesn't match the index.
+
+        When less than ``SHADOW_AGGREGATE_THRESHOLD`` (50%) of the content
+        the index links to can be found in the aggregate — weighted by
+        page size — the aggregate describes different sections, a
+        different project, or an outdated snapshot.
+
+        Args:
+            context: Pipeline context with files and relationships.
+            index: Lookups over the context's files and relationships.
+
+        Returns:
+            List of diagnostics if pattern detected.
+        """
+        diagnostics: list[ValidationDiagnostic] = []
+
+        for aggregate, measured in self._aggregate_containment(index):
+            matched = sum(c.matched for _, c in measured)
+            total = sum(c.total for _, c in measured)
+            if not total:
+                continue
+            ratio = matched / total
+
+            if ratio < SHADOW_AGGREGATE_THRESHOLD:
+                diagnostics.append(
+                    ValidationDiagnostic(
+                        code=DiagnosticCode.W014_AGGREGATE_INCOMPLETE,
+                        severity=Severity.WARNING,
+                        message=(
+                            f"Anti-pattern AP_ECO_003 (Shadow Aggregate): "
+                            f"only {ratio:.0%} of the content linked from the index "
+                            f"({len(measured)} pages) appears in "
+                            f"{aggregate.file_path}."
+                        ),
+                        remediation=(
+                            "Regenerate llms-full.txt from the pages listed in "
+                            "llms.txt so both describe the same content."
+                        ),
+                        level=ValidationLevel.L2_CONTENT,
+                        source_file=aggregate.file_path,
+                    )
+                )
+
+        return diagnostics
+
     def _check_duplicate_ecosystem(
-        self, context: PipelineContext
+        self, context: PipelineContext, index: EcosystemIndex
     ) -> list[ValidationDiagnostic]:
         """Detect AP_ECO_004 (DUPLICATE ECOSYSTEM): multiple llms.txt files.
 
@@ -579,14 +914,12 @@ class EcosystemValidationStage:
 
         Args:
             context: Pipeline context with files.
+            index: Lookups over the context's files and relationships.
 
         Returns:
             List of diagnostics if pattern detected.
         """
-        index_files = [
-            f for f in context.files
-            if f.file_type == DocumentType.TYPE_1_INDEX
-        ]
+        index_files = index.of_type(DocumentType.TYPE_1_INDEX)
 
         if len(index_files) > 1:
             paths = [f.file_path for f in index_files]
@@ -609,7 +942,7 @@ class EcosystemValidationStage:
         return []
 
     def _check_token_black_hole(
-        self, context: PipelineContext
+        self, context: PipelineContext, index: EcosystemIndex
     ) -> list[ValidationDiagnostic]:
         """Detect AP_ECO_005 (TOKEN BLACK HOLE): one file consumes >80% of tokens.
 
@@ -618,6 +951,7 @@ class EcosystemValidationStage:
 
         Args:
             context: Pipeline context with files.
+            index: Lookups over the context's files and relationships.
 
         Returns:
             List of diagnostics if pattern detected.
@@ -627,11 +961,7 @@ class EcosystemValidationStage:
         if len(context.files) < 2:
             return diagnostics
 
-        total_tokens = sum(
-            f.classification.estimated_tokens
-            for f in context.files
-            if f.classification is not None
-        )
+        total_tokens = index.total_tokens
 
         if total_tokens == 0:
             return diagnostics
@@ -664,7 +994,7 @@ class EcosystemValidationStage:
         return diagnostics
 
     def _check_orphaned_files(
-        self, context: PipelineContext
+        self, context: PipelineContext, index: EcosystemIndex
     ) -> list[ValidationDiagnostic]:
         """Detect orphaned files and AP_ECO_006 (ORPHAN NURSERY).
 
@@ -676,6 +1006,7 @@ class EcosystemValidationStage:
 
         Args:
             context: Pipeline context with files and relationships.
+            index: Lookups over the context's files and relationships.
 
         Returns:
             List of E010 diagnostics for each orphaned file.
@@ -685,11 +1016,8 @@ class EcosystemValidationStage:
         if len(context.files) <= 1:
             return diagnostics
 
-        # Build set of all file IDs that are targets of at least one relationship.
-        referenced_ids: set[str] = set()
-        for rel in context.relationships:
-            if rel.is_resolved and rel.target_file_id:
-                referenced_ids.add(rel.target_file_id)
+        # File IDs that are targets of at least one resolved relationship.
+        referenced_ids = index.incoming
 
         orphaned_content_pages = 0
 
@@ -736,3 +1064,104 @@ class EcosystemValidationStage:
             )
 
         return diagnostics
+
+    def _check_unreachable_files(
+        self, context: PipelineContext, index: EcosystemIndex
+    ) -> list[ValidationDiagnostic]:
+        """Detect referenced files that no index file can reach.
+
+        ``_check_orphaned_files`` only asks whether anything links to a
+        file. Pages that link only to each other — a drafts folder with
+        its own table of contents, or a pair of pages that cross-reference
+        — pass that check but are still invisible from ``llms.txt``. This
+        check walks the relationship graph from every index file and flags
+        the files it never reaches that do have incoming links (files with
+        none are already reported as orphans).
+
+        Args:
+            context: Pipeline context with files and relationships.
+            index: Lookups over the context's files and relationships.
+
+        Returns:
+            List of E010 diagnostics, one per unreachable referenced file.
+        """
+        graph = RelationshipGraph.of(context)
+        if len(context.files) <= 1 or not graph.index_nodes:
+            return []
+
+        diagnostics: list[ValidationDiagnostic] = []
+        for node in graph.unreachable():
+            if graph.in_degree(node) == 0:
+                continue
+            eco_file = graph.files[node]
+            diagnostics.append(
+                ValidationDiagnostic(
+                    code=DiagnosticCode.E010_ORPHANED_ECOSYSTEM_FILE,
+                    severity=Severity.ERROR,
+                    message=(
+                        f"{eco_file.file_path} is referenced only by files "
+                        f"that cannot be reached from the index."
+                    ),
+                    remediation=DiagnosticCode.E010_ORPHANED_ECOSYSTEM_FILE.remediation,
+                    level=ValidationLevel.L1_STRUCTURAL,
+                    source_file=eco_file.file_path,
+                )
+            )
+
+        return diagnostics
+
+
+# ── Check Registry (entries) ────────────────────────────────────────
+# Listed after the stage class so each entry can name its method.
+
+_F, _D, _R = CheckInput.FILES, CheckInput.DOCUMENTS, CheckInput.RELATIONSHIPS
+_Stage = EcosystemValidationStage
+
+ECOSYSTEM_CHECKS: tuple[EcosystemCheck, ...] = (
+    # Group 1: Link Resolution
+    EcosystemCheck("broken_links", frozenset({_F, _R}), _Stage._check_broken_links),
+    # Group 2: Consistency
+    EcosystemCheck(
+        "project_name_consistency",
+        frozenset({_F, _D}),
+        _Stage._check_project_name_consistency,
+    ),
+    EcosystemCheck(
+        "redundant_content", frozenset({_F, _D}), _Stage._check_redundant_content
+    ),
+    EcosystemCheck(
+        "token_distribution", frozenset({_F, _D}), _Stage._check_token_distribution
+    ),
+    # Group 3: Coverage
+    EcosystemCheck(
+        "missing_instruction_file",
+        frozenset({_F}),
+        _Stage._check_missing_instruction_file,
+    ),
+    EcosystemCheck(
+        "missing_aggregate", frozenset({_F, _D}), _Stage._check_missing_aggregate
+    ),
+    EcosystemCheck("coverage_gaps", frozenset({_F, _D}), _Stage._check_coverage_gaps),
+    EcosystemCheck(
+        "aggregate_incomplete",
+        frozenset({_F, _D, _R}),
+        _Stage._check_aggregate_incomplete,
+    ),
+    # Group 4: Anti-Patterns
+    EcosystemCheck("index_island", frozenset({_F, _R}), _Stage._check_index_island),
+    EcosystemCheck("phantom_links", frozenset({_F, _R}), _Stage._check_phantom_links),
+    EcosystemCheck(
+        "shadow_aggregate", frozenset({_F, _D, _R}), _Stage._check_shadow_aggregate
+    ),
+    EcosystemCheck(
+        "duplicate_ecosystem", frozenset({_F}), _Stage._check_duplicate_ecosystem
+    ),
+    EcosystemCheck(
+        "token_black_hole", frozenset({_F, _D}), _Stage._check_token_black_hole
+    ),
+    EcosystemCheck("orphaned_files", frozenset({_F, _R}), _Stage._check_orphaned_files),
+    EcosystemCheck(
+        "unreachable_files", frozenset({_F, _R}), _Stage._check_unreachable_files
+    ),
+)
+"""Stage 4 checks in execution order, with their context dependencies."""
@@ -0,0 +1,367 @@
+"""Compact adjacency structure over the ecosystem relationship graph.
+
+``context.relationships`` is a flat list of Pydantic ``FileRelationship``
+edges; answering "what links into this file?" or "what can the index
+reach?" from it means filtering the whole list. ``RelationshipGraph``
+renumbers files as integer nodes (their position in ``context.files``)
+and stores the edges in compressed sparse row (CSR) form:
+
+    edge_sources  ``array('q')``  source node of edge ``e`` (-1 if unknown)
+    edge_targets  ``array('q')``  target node of edge ``e`` (-1 if unresolved)
+    edge_kinds    ``array('B')``  uint8 relationship code (index into EDGE_KINDS)
+    out_offsets   ``array('q')``  node ``n``'s out-edges are
+    out_edges     ``array('q')``      ``out_edges[out_offsets[n]:out_offsets[n + 1]]``
+    in_offsets    ``array('q')``  same layout for resolved in-edges
+    in_edges      ``array('q')``
+
+Edge ``e`` is ``context.relationships[e]``. Building is two counting-sort
+passes, O(files + edges); every query below is linear in what it visits
+and iterates memoryview slices rather than materializing lists:
+
+    out_edge_ids() / in_edge_ids()   Edge ids per node
+    successors() / predecessors()    Neighbouring nodes over resolved edges
+    reachable()                      Byte mask of nodes reachable from roots
+    unreachable()                    Nodes the index files cannot reach
+    strongly_connected_components()  Iterative Tarjan, reverse topological
+
+Stage 3 builds the graph; ``RelationshipGraph.of(context)`` returns it,
+rebuilding when ``context.files`` or ``context.relationships`` has been
+replaced (the same caching rule as ``EcosystemIndex.of``).
+
+Classes:
+    RelationshipGraph: CSR adjacency over files and relationship edges.
+
+Constants:
+    EDGE_KINDS: LinkRelationship values in code order.
+    EDGE_CODES: Mapping of LinkRelationship → uint8 code.
+
+Related:
+    - src/docstratum/pipeline/relationship.py: Stage 3 builds the graph
+    - src/docstratum/pipeline/ecosystem_validator.py: Unreachable-file check
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+
+from docstratum.pipeline.stages import PipelineContext
+from docstratum.schema.classification import DocumentType
+from docstratum.schema.ecosystem import EcosystemFile, FileRelationship
+from docstratum.schema.parsed import LinkRelationship
+
+# ── Edge codes ───────────────────────────────────────────────────────
+# The code for a LinkRelationship is its position in the enum.
+EDGE_KINDS: tuple[LinkRelationship, ...] = tuple(LinkRelationship)
+EDGE_CODES: dict[LinkRelationship, int] = {k: i for i, k in enumerate(EDGE_KINDS)}
+
+
+def _csr(keys: array[int], node_count: int) -> tuple[array[int], array[int]]:
+    """Counting-sort edge ids by ``keys[e]`` (entries < 0 are skipped).
+
+    Returns:
+        ``(offsets, edge_ids)`` with edge ids in ascending order per node.
+    """
+    offsets = array("q", bytes(8 * (node_count + 1)))
+    for node in keys:
+        if node >= 0:
+            offsets[node + 1] += 1
+    for n in range(node_count):
+        offsets[n + 1] += offsets[n]
+    fill = array("q", offsets[:-1])
+    edge_ids = array("q", bytes(8 * offsets[node_count]))
+    for e, node in enumerate(keys):
+        if node >= 0:
+            edge_ids[fill[node]] = e
+            fill[node] += 1
+    return offsets, edge_ids
+
+
+class RelationshipGraph:
+    """Files as integer nodes, relationships as CSR edge arrays.
+
+    Attributes:
+        files: The files, in node order (node ``n`` is ``files[n]``).
+        relationships: The edges, in edge-id order.
+        node_of: file_id → node.
+        index_nodes: Nodes of TYPE_1_INDEX files, in node order.
+        edge_sources: Source node per edge (-1 if not an indexed file).
+        edge_targets: Target node per edge (-1 if unresolved).
+        edge_kinds: uint8 relationship code per edge.
+        out_offsets / out_edges: CSR over all edges by source node.
+        in_offsets / in_edges: CSR over resolved edges by target node.
+
+    Example:
+        >>> graph = RelationshipGraph.of(context)
+        >>> [graph.files[n].file_path for n in graph.unreachable()]
+        ['/project/drafts/a.md', '/project/drafts/b.md']
+        >>> [len(c) for c in graph.strongly_connected_components() if len(c) > 1]
+        [2]
+    """
+
+    __slots__ = (
+        "_in_view",
+        "_out_view",
+        "edge_kinds",
+        "edge_sources",
+        "edge_targets",
+        "files",
+        "in_edges",
+        "in_offsets",
+        "index_nodes",
+        "node_of",
+        "out_edges",
+        "out_offsets",
+        "relationships",
+    )
+
+    def __init__(
+        self,
+        files: Sequence[EcosystemFile],
+        relationships: Sequence[FileRelationship],
+    ) -> None:
+        """Number the files and lay the edges out in CSR form.
+
+        Args:
+            files: Ecosystem files; their order defines the node numbers.
+            relationships: Relationship edges; their order defines edge ids.
+        """
+        self.files = files
+        self.relationships = relationships
+        self.node_of: dict[str, int] = {f.file_id: n for n, f in enumerate(files)}
+        self.index_nodes: list[int] = [
+            n for n, f in enumerate(files) if f.file_type == DocumentType.TYPE_1_INDEX
+        ]
+
+        node_of = self.node_of
+        sources: array[int] = array("q")
+        targets: array[int] = array("q")
+        kinds: array[int] = array("B")
+        for rel in relationships:
+            sources.append(node_of.get(rel.source_file_id, -1))
+            target = -1
+            if rel.is_resolved and rel.target_file_id:
+                target = node_of.get(rel.target_file_id, -1)
+            targets.append(target)
+            kinds.append(EDGE_CODES[rel.relationship_type])
+        self.edge_sources = sources
+        self.edge_targets = targets
+        self.edge_kinds = kinds
+
+        self.out_offsets, self.out_edges = _csr(sources, len(files))
+        self.in_offsets, self.in_edges = _csr(targets, len(files))
+        self._out_view = memoryview(self.out_edges)
+        self._in_view = memoryview(self.in_edges)
+
+    @classmethod
+    def build(cls, context: PipelineContext) -> RelationshipGraph:
+        """Build the graph for the context's current files and edges (uncached)."""
+        return cls(context.files, context.relationships)
+
+    @classmethod
+    def of(cls, context: PipelineContext) -> RelationshipGraph:
+        """Return the context's cached graph, building it if stale.
+
+        Args:
+            context: Pipeline context after Stage 3.
+
+        Returns:
+            A graph over ``context.files`` and ``context.relationships``.
+        """
+        graph = context._relationship_graph
+        if (
+            graph is None
+            or graph.files is not context.files
+            or graph.relationships is not context.relationships
+            or len(graph.files) != len(context.files)
+            or len(graph.relationships) != len(context.relationships)
+        ):
+            graph = cls.build(context)
+            context._relationship_graph = graph
+        return graph
+
+    # ── Sizes and lookups ────────────────────────────────────────────
+
+    @property
+    def node_count(self) -> int:
+        """Number of nodes (files)."""
+        return len(self.files)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of edges, resolved or not."""
+        return len(self.edge_kinds)
+
+    def edge_kind(self, edge: int) -> LinkRelationship:
+        """The relationship type of edge ``edge``."""
+        return EDGE_KINDS[self.edge_kinds[edge]]
+
+    def out_edge_ids(self, node: int) -> memoryview:
+        """Ids of all edges leaving ``node``, in edge order."""
+        return self._out_view[self.out_offsets[node] : self.out_offsets[node + 1]]
+
+    def in_edge_ids(self, node: int) -> memoryview:
+        """Ids of resolved edges entering ``node``, in edge order."""
+        return self._in_view[self.in_offsets[node] : self.in_offsets[node + 1]]
+
+    def out_degree(self, node: int) -> int:
+        """Number of edges leaving ``node`` (resolved or not)."""
+        return self.out_offsets[node + 1] - self.out_offsets[node]
+
+    def in_degree(self, node: int) -> int:
+        """Number of resolved edges entering ``node``."""
+        return self.in_offsets[node + 1] - self.in_offsets[node]
+
+    def successors(self, node: int) -> Iterator[int]:
+        """Target nodes of ``node``'s resolved out-edges (with repeats)."""
+        targets = self.edge_targets
+        for e in self.out_edge_ids(node):
+            if targets[e] >= 0:
+                yield targets[e]
+
+    def predecessors(self, node: int) -> Iterator[int]:
+        """Source nodes of ``node``'s resolved in-edges (with repeats)."""
+        sources = self.edge_sources
+        for e in self.in_edge_ids(node):
+            if sources[e] >= 0:
+                yield sources[e]
+
+    # ── Traversals ───────────────────────────────────────────────────
+
+    def reachable(
+        self,
+        roots: Iterable[int],
+        *,
+        kinds: Iterable[LinkRelationship] | None = None,
+    ) -> bytearray:
+        """Mark the nodes reachable from ``roots`` over resolved edges.
+
+        Args:
+            roots: Start nodes (always marked).
+            kinds: If given, follow only edges of these relationship types.
+
+        Returns:
+            A bytearray with ``mask[n] == 1`` for every reachable node.
+        """
+        allowed = None
+        if kinds is not None:
+            wanted = set(kinds)
+            allowed = bytes(1 if k in wanted else 0 for k in EDGE_KINDS)
+        seen = bytearray(self.node_count)
+        stack = []
+        for root in roots:
+            if not seen[root]:
+                seen[root] = 1
+                stack.append(root)
+
+        offsets, out_edges = self.out_offsets, self.out_edges
+        targets, edge_kinds = self.edge_targets, self.edge_kinds
+        while stack:
+            node = stack.pop()
+            for i in range(offsets[node], offsets[node + 1]):
+                e = out_edges[i]
+                target = targets[e]
+                if target < 0 or seen[target]:
+                    continue
+                if allowed is not None and not allowed[edge_kinds[e]]:
+                    continue
+                seen[target] = 1
+                stack.append(target)
+        return seen
+
+    def unreachable(self, roots: Iterable[int] | None = None) -> list[int]:
+        """Nodes that cannot be reached from ``roots``, in node order.
+
+        Args:
+            roots: Start nodes; defaults to ``index_nodes``. With no roots,
+                every node is unreachable.
+
+        Returns:
+            Node numbers not reachable over resolved edges.
+        """
+        seen = self.reachable(self.index_nodes if roots is None else roots)
+        return [n for n in range(self.node_count) if not seen[n]]
+
+    def strongly_connected_components(self) -> list[list[int]]:
+        """Strongly connected components over resolved edges.
+
+        Iterative Tarjan, so deep link chains cannot hit the recursion
+        limit. Components come out in reverse topological order of the
+        condensed graph (a component precedes every component linking to
+        it); nodes within a component are in ascending order.
+
+        Returns:
+            One list of nodes per component; every node is in exactly one.
+        """
+        count = self.node_count
+        unvisited = -1
+        order = array("q", [unvisited]) * count
+        low = array("q", bytes(8 * count))
+        on_stack = bytearray(count)
+        stack: list[int] = []
+        components: list[list[int]] = []
+        offsets, out_edges, targets = (
+            self.out_offsets,
+            self.out_edges,
+            self.edge_targets,
+        )
+        counter = 0
+
+        for start in range(count):
+            if order[start] != unvisited:
+                continue
+            # Each frame is [node, next out-edge position].
+            frames = [[start, offsets[start]]]
+            order[start] = low[start] = counter
+            counter += 1
+            stack.append(start)
+            on_stack[start] = 1
+
+            while frames:
+                frame = frames[-1]
+                node, pos = frame
+                end = offsets[node + 1]
+                descended = False
+                while pos < end:
+                    target = targets[out_edges[pos]]
+                    pos += 1
+                    if target < 0:
+                        continue
+                    if order[target] == unvisited:
+                        frame[1] = pos
+                        order[target] = low[target] = counter
+                        counter += 1
+                        stack.append(target)
+                        on_stack[target] = 1
+                        frames.append([target, offsets[target]])
+                        descended = True
+                        break
+                    if on_stack[target] and order[target] < low[node]:
+                        low[node] = order[target]
+                if descended:
+                    continue
+
+                frames.pop()
+                if frames:
+                    parent = frames[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+                if low[node] == order[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        component.append(member)
+                        if member == node:
+                            break
+                    component.sort()
+                    components.append(component)
+
+        return components
+
+    def __repr__(self) -> str:
+        """Short summary of the graph size."""
+        return (
+            f"RelationshipGraph(nodes={self.node_count}, edges={self.edge_count}, "
+            f"resolved={len(self.in_edges)})"
+        )
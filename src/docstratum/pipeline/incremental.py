@@ -0,0 +1,592 @@
+"""Incremental ecosystem re-validation driven by file fingerprints.
+
+A full ``EcosystemPipeline.run`` re-parses every file, rebuilds every
+relationship edge, and re-runs every Stage 4 check. After a small doc edit
+almost all of that work reproduces the previous result. An
+``IncrementalState`` remembers the previous run — a ``FileFingerprint``
+(size, mtime, SHA-256) per discovered file plus the per-file results,
+edges, and per-check diagnostics — and the next run through the same state
+only redoes what the change can affect:
+
+    Stage 1  Discovery runs as usual, then every file is fingerprinted and
+             compared with the snapshot. Size + mtime equal → unchanged
+             without reading; otherwise the content hash decides. Unchanged
+             files take their previous ``EcosystemFile`` (parse,
+             classification, validation, quality, edges); modified files
+             keep their previous ``file_id`` so edges into them stay valid.
+    Stage 2  Only added and modified files are read and validated.
+    Stage 3  Edges of added/modified sources are rebuilt. Edges of
+             unchanged sources are reused unless their target was modified
+             or removed, or a file with the link's target name was added or
+             removed (which can change how the link resolves).
+    Stage 4  A check re-runs only if one of its ``CheckInput``s changed
+             (see ``ECOSYSTEM_CHECKS``); the rest reuse their diagnostics.
+    Stage 5  Scoring always runs; it is a single pass over the context.
+
+Results equal a full run's, except that file ids are stable across runs
+instead of fresh per run. A snapshot is only reused when the docstratum
+version, the validator class, and the root path match; it is refreshed
+only by runs that complete Stage 4 successfully.
+
+With a ``path``, the snapshot is persisted as JSON so separate processes
+(CI jobs) can share it. One ``IncrementalState`` serves one run at a time.
+
+Classes:
+    FileFingerprint: Size, mtime, and content hash of a file.
+    ChangeSet: Paths added, modified, removed, and unchanged since last run.
+    PipelineSnapshot: Persisted result of the previous run.
+    IncrementalState: Holds the snapshot and builds incremental stages.
+
+Functions:
+    fingerprint_file: Fingerprint a file, reusing a matching previous hash.
+
+Example:
+    >>> from docstratum.pipeline import EcosystemPipeline, IncrementalState
+    >>> state = IncrementalState(".docstratum-cache/pipeline.json")
+    >>> pipeline = EcosystemPipeline(ParserAdapter(), incremental=state)
+    >>> ctx = pipeline.run("/path/to/project")   # full run, snapshot saved
+    >>> ctx = pipeline.run("/path/to/project")   # reuses everything unchanged
+    >>> state.last_changes.modified
+    ()
+
+Traces to:
+    FR-084 (pipeline orchestration)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import NamedTuple
+
+from pydantic import BaseModel, Field
+
+from docstratum import __version__
+from docstratum.pipeline.discovery import DiscoveryStage
+from docstratum.pipeline.ecosystem_index import EcosystemIndex
+from docstratum.pipeline.ecosystem_scorer import ScoringStage
+from docstratum.pipeline.ecosystem_validator import (
+    CheckInput,
+    EcosystemCheck,
+    EcosystemValidationStage,
+)
+from docstratum.pipeline.per_file import ExecutorBackend, PerFileStage
+from docstratum.pipeline.relationship import RelationshipStage
+from docstratum.pipeline.stages import (
+    PipelineContext,
+    PipelineStage,
+    PipelineStageId,
+    SingleFileValidator,
+    StageResult,
+    StageStatus,
+)
+from docstratum.schema.ecosystem import EcosystemFile, FileRelationship
+from docstratum.schema.parsed import LinkRelationship, ParsedLink
+from docstratum.schema.validation import ValidationDiagnostic
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 1
+"""Bumped whenever the persisted snapshot layout changes."""
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+# ── Fingerprints ────────────────────────────────────────────────────
+
+
+class FileFingerprint(NamedTuple):
+    """Identity of a file's content at one point in time."""
+
+    size: int
+    mtime_ns: int
+    sha256: str
+
+
+def fingerprint_file(
+    path: str, previous: FileFingerprint | None = None
+) -> FileFingerprint | None:
+    """Fingerprint a file, skipping the hash when size and mtime match.
+
+    Args:
+        path: File to fingerprint.
+        previous: The file's fingerprint from the last run, if any.
+
+    Returns:
+        The fingerprint (``previous`` itself when size and mtime are
+        unchanged), or None if the file cannot be read.
+    """
+    try:
+        stat = os.stat(path)
+        if (
+            previous is not None
+            and previous.size == stat.st_size
+            and previous.mtime_ns == stat.st_mtime_ns
+        ):
+            return previous
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            while chunk := f.read(_HASH_CHUNK_SIZE):
+                digest.update(chunk)
+    except OSError as exc:
+        logger.warning("Cannot fingerprint %s: %s", path, exc)
+        return None
+    return FileFingerprint(stat.st_size, stat.st_mtime_ns, digest.hexdigest())
+
+
+class ChangeSet(NamedTuple):
+    """File paths by how they changed since the previous run."""
+
+    added: tuple[str, ...] = ()
+    modified: tuple[str, ...] = ()
+    removed: tuple[str, ...] = ()
+    unchanged: tuple[str, ...] = ()
+
+
+# ── Snapshot ────────────────────────────────────────────────────────
+
+
+class PipelineSnapshot(BaseModel):
+    """Everything an incremental run reuses from the previous run.
+
+    Attributes:
+        format_version: Snapshot layout version.
+        docstratum_version: Version that produced the snapshot.
+        validator: Qualified class name of the per-file validator, or None.
+        root_path: The ``root_path`` the run was started with.
+        fingerprints: Fingerprint per file path.
+        files: The fully processed ecosystem files, edges included.
+        check_results: Stage 4 diagnostics keyed by check name.
+    """
+
+    format_version: int = Field(default=SNAPSHOT_FORMAT_VERSION)
+    docstratum_version: str = Field(default=__version__)
+    validator: str | None = Field(default=None)
+    root_path: str = Field(description="Root path the run was started with.")
+    fingerprints: dict[str, FileFingerprint] = Field(default_factory=dict)
+    files: list[EcosystemFile] = Field(default_factory=list)
+    check_results: dict[str, list[ValidationDiagnostic]] = Field(default_factory=dict)
+
+    def matches(self, root_path: str, validator: str | None) -> bool:
+        """Whether this snapshot can seed a run with these settings."""
+        return (
+            self.format_version == SNAPSHOT_FORMAT_VERSION
+            and self.docstratum_version == __version__
+            and self.validator == validator
+            and self.root_path == root_path
+        )
+
+
+def _validator_name(validator: SingleFileValidator | None) -> str | None:
+    """Qualified class name identifying a validator implementation."""
+    if validator is None:
+        return None
+    cls = type(validator)
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _link_target_names(url: str) -> set[str]:
+    """Lowercase file names a link URL can resolve through.
+
+    Resolution (``LinkResolver._resolve``) matches either the
+    URL's basename or a normalized path ending in the same name, so a link
+    can only change target when a file with one of these names appears or
+    disappears.
+    """
+    clean_url = url.split("#")[0].split("?")[0]
+    return {
+        os.path.basename(clean_url).lower(),
+        os.path.basename(os.path.normpath(clean_url)).lower(),
+    }
+
+
+# ── Per-run state ───────────────────────────────────────────────────
+
+
+class _IncrementalRun:
+    """Working state shared by the incremental stages of one run."""
+
+    def __init__(
+        self,
+        snapshot: PipelineSnapshot | None,
+        root_path: str,
+        validator: str | None,
+    ) -> None:
+        self.snapshot = snapshot
+        self.root_path = root_path
+        self.validator = validator
+        self.fingerprints: dict[str, FileFingerprint] = {}
+        self.changes = ChangeSet()
+        # file_ids whose per-file results come from the snapshot.
+        self.reused_ids: set[str] = set()
+        # file_ids of modified or removed files (edges into them are stale).
+        self.changed_ids: set[str] = set()
+        # Lowercase basenames of added or removed files.
+        self.touched_names: set[str] = set()
+        self.dirty_inputs: set[CheckInput] = set(CheckInput)
+        self.previous_relationships: list[FileRelationship] = []
+
+    def reconcile(self, context: PipelineContext) -> None:
+        """Match discovered files against the snapshot (after Stage 1)."""
+        previous_files = (
+            {f.file_path: f for f in self.snapshot.files} if self.snapshot else {}
+        )
+        previous_prints = self.snapshot.fingerprints if self.snapshot else {}
+        added: list[str] = []
+        modified: list[str] = []
+        unchanged: list[str] = []
+
+        for index, eco_file in enumerate(context.files):
+            path = eco_file.file_path
+            old_print = previous_prints.get(path)
+            fingerprint = fingerprint_file(path, old_print)
+            if fingerprint is not None:
+                self.fingerprints[path] = fingerprint
+
+            old_file = previous_files.get(path)
+            if old_file is None:
+                added.append(path)
+            elif (
+                fingerprint is not None
+                and old_print is not None
+                and fingerprint.sha256 == old_print.sha256
+            ):
+                unchanged.append(path)
+                # Shallow copy: the snapshot keeps its own edge list.
+                context.files[index] = old_file.model_copy()
+                self.reused_ids.add(old_file.file_id)
+            else:
+                modified.append(path)
+                eco_file.file_id = old_file.file_id
+                self.changed_ids.add(old_file.file_id)
+
+        current = {f.file_path for f in context.files}
+        removed = [p for p in previous_files if p not in current]
+        self.changed_ids.update(previous_files[p].file_id for p in removed)
+        self.touched_names = {os.path.basename(p).lower() for p in (*added, *removed)}
+        self.changes = ChangeSet(
+            added=tuple(added),
+            modified=tuple(modified),
+            removed=tuple(removed),
+            unchanged=tuple(unchanged),
+        )
+
+        if self.snapshot is not None:
+            self.dirty_inputs = set()
+            if added or removed:
+                self.dirty_inputs.add(CheckInput.FILES)
+            if added or removed or modified:
+                self.dirty_inputs.add(CheckInput.DOCUMENTS)
+            self.previous_relationships = [
+                rel for f in self.snapshot.files for rel in f.relationships
+            ]
+
+        logger.info(
+            "Incremental run: %d added, %d modified, %d removed, %d unchanged",
+            len(added),
+            len(modified),
+            len(removed),
+            len(unchanged),
+        )
+
+    def is_stale(self, edge: FileRelationship) -> bool:
+        """Whether a reused edge from an unchanged source must be rebuilt."""
+        if edge.relationship_type == LinkRelationship.EXTERNAL:
+            return False
+        if edge.target_file_id and edge.target_file_id in self.changed_ids:
+            return True
+        return bool(
+            self.touched_names
+            and not self.touched_names.isdisjoint(_link_target_names(edge.target_url))
+        )
+
+
+# ── Incremental stages ──────────────────────────────────────────────
+
+
+class _IncrementalDiscoveryStage(DiscoveryStage):
+    """Stage 1, then reconcile the manifest with the snapshot."""
+
+    def __init__(self, run: _IncrementalRun) -> None:
+        super().__init__()
+        self._run = run
+
+    def execute(self, context: PipelineContext) -> StageResult:
+        result = super().execute(context)
+        if result.status == StageStatus.SUCCESS:
+            self._run.reconcile(context)
+        return result
+
+
+class _IncrementalPerFileStage(PerFileStage):
+    """Stage 2 over added and modified files only."""
+
+    def __init__(
+        self,
+        run: _IncrementalRun,
+        validator: SingleFileValidator | None = None,
+        *,
+        jobs: int = 1,
+        backend: ExecutorBackend | str = ExecutorBackend.THREAD,
+    ) -> None:
+        super().__init__(validator, jobs=jobs, backend=backend)
+        self._run = run
+
+    def _pending_files(self, files: list[EcosystemFile]) -> list[EcosystemFile]:
+        return [f for f in files if f.file_id not in self._run.reused_ids]
+
+    def execute(self, context: PipelineContext) -> StageResult:
+        result = super().execute(context)
+        reused = len(self._run.reused_ids)
+        if not reused:
+            return result
+        return result.model_copy(
+            update={"message": f"{result.message}, {reused} unchanged reused"}
+        )
+
+
+class _IncrementalRelationshipStage(RelationshipStage):
+    """Stage 3 rebuilding only edges whose source or target changed."""
+
+    def __init__(self, run: _IncrementalRun, file_contents: dict[str, str]) -> None:
+        super().__init__(file_contents=file_contents)
+        self._run = run
+
+    def _map_file(
+        self,
+        eco_file: EcosystemFile,
+        path_lookup: dict[str, EcosystemFile],
+        root_path: str,
+    ) -> list[FileRelationship]:
+        if eco_file.file_id not in self._run.reused_ids:
+            return super()._map_file(eco_file, path_lookup, root_path)
+
+        previous = eco_file.relationships
+        stale = [i for i, edge in enumerate(previous) if self._run.is_stale(edge)]
+        if not stale:
+            return list(previous)
+
+        # Edges were built one per link, in link order. The parsed model is
+        # shared with the previous run's result, so copy before updating.
+        links: list[ParsedLink] | None = None
+        if eco_file.parsed is not None and eco_file.parsed.sections:
+            eco_file.parsed = eco_file.parsed.model_copy(deep=True)
+            links = [link for s in eco_file.parsed.sections for link in s.links]
+
+        edges = list(previous)
+        for i in stale:
+            if links is not None:
+                link = links[i]
+                # A fresh parse starts unresolved; _map_link only sets these.
+                link.resolves_to = None
+                link.target_file_type = None
+            else:
+                link = ParsedLink(
+                    title=previous[i].target_url,
+                    url=previous[i].target_url,
+                    line_number=previous[i].source_line or 1,
+                )
+            edges[i] = self._map_link(eco_file, link, path_lookup, root_path)
+        return edges
+
+
+class _IncrementalEcosystemValidationStage(EcosystemValidationStage):
+    """Stage 4 re-running only checks whose inputs changed."""
+
+    def __init__(self, run: _IncrementalRun, file_contents: dict[str, str]) -> None:
+        super().__init__(file_contents=file_contents)
+        self._run = run
+        self._relationships_compared = False
+        self._compare_lock = threading.Lock()
+
+    def _file_text(self, eco_file: EcosystemFile) -> str | None:
+        text = super()._file_text(eco_file)
+        if text is None and eco_file.file_id in self._run.reused_ids:
+            # Unchanged and unparsed: Stage 2 skipped it, so read it here
+            # the way Stage 2 would have.
+            try:
+                return Path(eco_file.file_path).read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                return None
+        return text
+
+    def _run_check(
+        self,
+        check: EcosystemCheck,
+        context: PipelineContext,
+        index: EcosystemIndex,
+    ) -> list[ValidationDiagnostic]:
+        run = self._run
+        if CheckInput.RELATIONSHIPS in check.inputs:
+            # Compared on first use: checks that do not read edges may run
+            # before Stage 3 ends (DAG scheduler).
+            with self._compare_lock:
+                if not self._relationships_compared:
+                    self._relationships_compared = True
+                    if (
+                        run.snapshot is not None
+                        and context.relationships != run.previous_relationships
+                    ):
+                        run.dirty_inputs.add(CheckInput.RELATIONSHIPS)
+        if run.snapshot is not None and check.inputs.isdisjoint(run.dirty_inputs):
+            previous = run.snapshot.check_results.get(check.name)
+            if previous is not None:
+                return list(previous)
+        return super()._run_check(check, context, index)
+
+
+# ── Public state ────────────────────────────────────────────────────
+
+
+class IncrementalState:
+    """Snapshot of the previous run, optionally persisted to disk.
+
+    Pass to ``EcosystemPipeline(incremental=...)``. Each run builds its
+    stages from the current snapshot and, if it completes Stage 4
+    successfully, replaces the snapshot with its own results.
+
+    Attributes:
+        path: JSON file the snapshot is loaded from and saved to, or None
+            to keep it in memory only.
+        last_changes: The ChangeSet computed by the most recent run.
+
+    Example:
+        >>> state = IncrementalState()
+        >>> pipeline = EcosystemPipeline(incremental=state)
+        >>> _ = pipeline.run("/project")
+        >>> _ = pipeline.run("/project")
+        >>> len(state.last_changes.unchanged) > 0
+        True
+    """
+
+    def __init__(self, path: str | os.PathLike[str] | None = None) -> None:
+        """Create the state; an existing snapshot at ``path`` is loaded lazily.
+
+        Args:
+            path: Optional snapshot file location.
+        """
+        self.path = os.fspath(path) if path is not None else None
+        self.last_changes = ChangeSet()
+        self._snapshot: PipelineSnapshot | None = None
+        self._loaded = False
+        self._run: _IncrementalRun | None = None
+        self._validation_stage: EcosystemValidationStage | None = None
+
+    @property
+    def snapshot(self) -> PipelineSnapshot | None:
+        """The current snapshot, loading it from ``path`` on first access."""
+        if not self._loaded:
+            self._loaded = True
+            if self.path is not None and os.path.exists(self.path):
+                try:
+                    self._snapshot = PipelineSnapshot.model_validate_json(
+                        Path(self.path).read_bytes()
+                    )
+                except ValueError as exc:
+                    logger.warning(
+                        "Ignoring unreadable snapshot %s: %s", self.path, exc
+                    )
+        return self._snapshot
+
+    def clear(self) -> None:
+        """Forget the snapshot (the next run is a full run)."""
+        self._snapshot = None
+        self._loaded = True
+        if self.path is not None and os.path.exists(self.path):
+            os.remove(self.path)
+
+    def stages(
+        self,
+        root_path: str,
+        validator: SingleFileValidator | None = None,
+        *,
+        jobs: int = 1,
+        backend: ExecutorBackend | str = ExecutorBackend.THREAD,
+    ) -> tuple[list[PipelineStage], PerFileStage]:
+        """Build the five stages for an incremental run.
+
+        Args:
+            root_path: The root path the run is started with.
+            validator: Per-file validator (as for ``PerFileStage``).
+            jobs: Per-file worker count.
+            backend: Per-file worker pool kind.
+
+        Returns:
+            Stages 1-5, sharing this run's working state, and Stage 2
+            again with its concrete type.
+        """
+        name = _validator_name(validator)
+        snapshot = self.snapshot
+        if snapshot is not None and not snapshot.matches(root_path, name):
+            logger.info("Snapshot does not match this run; running in full")
+            snapshot = None
+        run = _IncrementalRun(snapshot, root_path, name)
+        self._run = run
+
+        per_file_stage = _IncrementalPerFileStage(
+            run, validator=validator, jobs=jobs, backend=backend
+        )
+        self._validation_stage = _IncrementalEcosystemValidationStage(
+            run, per_file_stage.file_contents
+        )
+        stages: list[PipelineStage] = [
+            _IncrementalDiscoveryStage(run),
+            per_file_stage,
+            _IncrementalRelationshipStage(run, per_file_stage.file_contents),
+            self._validation_stage,
+            ScoringStage(),
+        ]
+        return stages, per_file_stage
+
+    def commit(self, context: PipelineContext) -> bool:
+        """Adopt the finished run's results as the new snapshot.
+
+        Args:
+            context: The context returned by the run.
+
+        Returns:
+            True if the snapshot was refreshed (the run completed Stage 4).
+        """
+        run, self._run = self._run, None
+        stage, self._validation_stage = self._validation_stage, None
+        if run is None or stage is None:
+            return False
+        self.last_changes = run.changes
+        validated = any(
+            r.stage == PipelineStageId.ECOSYSTEM_VALIDATION
+            and r.status == StageStatus.SUCCESS
+            for r in context.stage_results
+        )
+        if not validated:
+            return False
+
+        unchanged = (
+            run.snapshot is not None
+            and not (run.changes.added or run.changes.modified or run.changes.removed)
+            and run.fingerprints == run.snapshot.fingerprints
+        )
+        snapshot = PipelineSnapshot(
+            validator=run.validator,
+            root_path=run.root_path,
+            fingerprints=run.fingerprints,
+            files=context.files,
+            check_results=stage.check_results,
+        )
+        self._snapshot = snapshot
+        self._loaded = True
+        if self.path is not None and not unchanged:
+            self._save(snapshot, self.path)
+        return True
+
+    @staticmethod
+    def _save(snapshot: PipelineSnapshot, path: str) -> None:
+        """Write ``snapshot`` to ``path`` atomically."""
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        Path(tmp_path).write_text(snapshot.model_dump_json(), encoding="utf-8")
+        os.replace(tmp_path, path)
@@ -17,6 +17,25 @@ Key features:
       validator is provided, files are read from disk but not validated.
     - **Backward Compatible**: Single-file input (path to llms.txt) produces
       identical per-file results to running the single-file pipeline alone.
+    - **Parallel Per-File**: ``jobs=N`` fans Stage 2 out to a thread or
+      process pool. Results are applied in discovery order, so a parallel
+      run yields the same context as a serial one.
+    - **Incremental**: With an ``IncrementalState``, a run only re-parses
+      changed files, rebuilds the edges they affect, and re-runs the
+      Stage 4 checks whose inputs changed (see ``incremental.py``).
+    - **Checkpoint / resume**: ``run(..., checkpoint=path)`` saves the
+      context after the last stage that ran; ``resume(path)`` continues
+      from there in another process (see ``checkpoint.py``).
+    - **Profiling**: ``run(..., profile=True)`` attaches a CPU profile,
+      memory peak, and top allocations to each ``StageResult`` (plus
+      per-file step timings for Stage 2); ``write_profiles()`` exports
+      them (see ``profiling.py``).
+    - **Tracing**: ``tracer=ChromeTracer()`` records a span per run, stage,
+      DAG node, file, and Stage 4 check, exported as Chrome trace-event
+      JSON for Perfetto (see ``tracing.py``).
+    - **DAG scheduling**: ``scheduler="dag"`` replaces the barriers between
+      Stages 2-5 with a dependency graph of ``PipelineNode`` work units (see
+      "DAG scheduler" below). Results are identical to a barrier run.
     - **Observable**: Each stage produces a ``StageResult`` with timing and
       diagnostics, stored in ``PipelineContext.stage_results``.
 
@@ -25,6 +44,32 @@ Entry points:
     - ``EcosystemPipeline.run(file_path)`` — Single-file mode.
     - ``EcosystemPipeline.run(root_path, stop_after=PipelineStageId.RELATIONSHIP)``
       — Stop after Stage 3.
+    - ``EcosystemPipeline.resume(checkpoint)`` — Continue a checkpointed run.
+
+DAG scheduler:
+    After Discovery, the work of Stages 2-5 becomes these nodes, each run on
+    a thread pool as soon as the nodes it waits for have finished:
+
+        per_file              Stage 2. Each file's links are mapped (Stage 3's
+                              ``map_file()``) right after the file is parsed.
+        relationship          Stage 3: maps what is left, assembles the edges.
+        index:documents       EcosystemIndex without edges      (per_file)
+        index:relationships   The context's full EcosystemIndex (relationship)
+        <check name>          One per ``ECOSYSTEM_CHECKS`` entry, waiting only
+                              for the inputs it declares: FILES (nothing),
+                              DOCUMENTS (index:documents), or RELATIONSHIPS
+                              (index:relationships).
+        ecosystem_validation  Stage 4: collects the checks in registry order.
+        scoring               Stage 5.
+
+    ``stop_after`` drops the nodes of later stages. Stage results are still
+    recorded in stage order, with the same skip-after-failure rule. Stages
+    overlap, so a stage's ``duration_ms`` is the total time of its nodes
+    and ``node_timings`` holds each node's time.
+
+    Nodes are threads, so pure-Python work still shares the GIL: the
+    overlap pays off when Stage 2 runs on the process backend or the
+    validator waits on I/O.
 
 Research basis:
     v0.0.7 §7 (The Ecosystem Validation Pipeline)
@@ -39,26 +84,187 @@ from __future__ import annotations
 
 import logging
 import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from enum import StrEnum
+from typing import NamedTuple
 
 from docstratum.schema.ecosystem import DocumentEcosystem
 
 from docstratum.pipeline.stages import (
     PipelineContext,
+    PipelineStage,
     PipelineStageId,
     SingleFileValidator,
     StageResult,
     StageStatus,
     StageTimer,
+    exception_result,
+    log_summary,
+    record_result,
+    skip_result,
 )
 from docstratum.pipeline.discovery import DiscoveryStage
-from docstratum.pipeline.per_file import PerFileStage
+from docstratum.pipeline.per_file import (
+    ExecutorBackend,
+    PerFileStage,
+    check_picklable,
+)
 from docstratum.pipeline.relationship import RelationshipStage
-from docstratum.pipeline.ecosystem_validator import EcosystemValidationStage
+from docstratum.pipeline.ecosystem_validator import (
+    ECOSYSTEM_CHECKS,
+    CheckInput,
+    EcosystemCheck,
+    EcosystemValidationStage,
+)
 from docstratum.pipeline.ecosystem_scorer import ScoringStage
+from docstratum.pipeline.ecosystem_index import EcosystemIndex
+from docstratum.pipeline.incremental import IncrementalState
+from docstratum.pipeline.checkpoint import PipelineCheckpoint
+from docstratum.pipeline.profiling import StageProfiler
+from docstratum.pipeline.tracing import NULL_TRACER, Tracer
 
 logger = logging.getLogger(__name__)
 
 
+# ── Scheduling ──────────────────────────────────────────────────────
+
+
+class StageScheduler(StrEnum):
+    """How ``EcosystemPipeline`` orders the work of Stages 2-5.
+
+    Attributes:
+        BARRIER: Each stage runs to completion before the next starts.
+        DAG: Work units start as soon as their inputs exist; independent
+             Stage 4 checks run concurrently.
+    """
+
+    BARRIER = "barrier"
+    DAG = "dag"
+
+
+DAG_WORKERS: int = 4
+"""Threads the DAG scheduler runs ready nodes on."""
+
+
+class PipelineNode(NamedTuple):
+    """One unit of work for ``run_nodes()``.
+
+    Attributes:
+        name: Unique node name (the key in ``StageResult.node_timings``).
+        stage: The stage whose work this is.
+        run: The work itself.
+        after: Names of the nodes that must finish first.
+    """
+
+    name: str
+    stage: PipelineStageId
+    run: Callable[[], None]
+    after: frozenset[str] = frozenset()
+
+
+class NodeSpan(NamedTuple):
+    """When a node ran, in ``time.perf_counter()`` seconds."""
+
+    start: float
+    end: float
+
+    @property
+    def ms(self) -> float:
+        """Duration in milliseconds."""
+        return (self.end - self.start) * 1000.0
+
+
+def run_nodes(
+    nodes: Sequence[PipelineNode], workers: int = DAG_WORKERS
+) -> dict[str, NodeSpan]:
+    """Run ``nodes`` on a thread pool, each once its ``after`` nodes finish.
+
+    Args:
+        nodes: The work units; names must be unique.
+        workers: Pool size.
+
+    Returns:
+        Each node's span, by name.
+
+    Raises:
+        ValueError: If a name repeats, a dependency is unknown, or the
+            dependencies form a cycle (checked before anything runs).
+        Exception: The first exception a node raised. Nodes already running
+            finish; no new nodes start.
+    """
+    by_name = {node.name: node for node in nodes}
+    if len(by_name) != len(nodes):
+        raise ValueError("Duplicate node names")
+    dependents: dict[str, list[str]] = {name: [] for name in by_name}
+    for node in nodes:
+        for dep in node.after:
+            if dep not in by_name:
+                raise ValueError(f"Node {node.name!r} waits for unknown {dep!r}")
+            dependents[dep].append(node.name)
+    waiting = {node.name: len(node.after) for node in nodes}
+    _check_acyclic(nodes, dependents)
+
+    spans: dict[str, NodeSpan] = {}
+    error: BaseException | None = None
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="docstratum-dag"
+    ) as pool:
+        running: dict[Future[NodeSpan], str] = {}
+
+        def submit(name: str) -> None:
+            running[pool.submit(_timed, by_name[name].run)] = name
+
+        for node in nodes:
+            if not node.after:
+                submit(node.name)
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    spans[name] = future.result()
+                except Exception as exc:
+                    error = error or exc
+                    continue
+                if error is not None:
+                    continue
+                for child in dependents[name]:
+                    waiting[child] -= 1
+                    if waiting[child] == 0:
+                        submit(child)
+    if error is not None:
+        raise error
+    return spans
+
+
+def _timed(run: Callable[[], None]) -> NodeSpan:
+    """Call ``run`` and return when it started and ended."""
+    start = time.perf_counter()
+    run()
+    return NodeSpan(start, time.perf_counter())
+
+
+def _check_acyclic(
+    nodes: Sequence[PipelineNode], dependents: dict[str, list[str]]
+) -> None:
+    """Raise ValueError if the dependencies contain a cycle (Kahn's algorithm)."""
+    remaining = {node.name: len(node.after) for node in nodes}
+    ready = [name for name, count in remaining.items() if count == 0]
+    seen = 0
+    while ready:
+        name = ready.pop()
+        seen += 1
+        for child in dependents[name]:
+            remaining[child] -= 1
+            if remaining[child] == 0:
+                ready.append(child)
+    if seen != len(nodes):
+        cyclic = sorted(name for name, count in remaining.items() if count)
+        raise ValueError(f"Node dependencies form a cycle: {cyclic}")
+
+
 class EcosystemPipeline:
     """Orchestrator for the 5-stage ecosystem validation pipeline.
 
@@ -73,6 +279,11 @@ class EcosystemPipeline:
 
     Attributes:
         validator: The optional SingleFileValidator implementation.
+        jobs: Number of concurrent per-file workers (1 = serial).
+        backend: Worker pool kind for the per-file stage.
+        incremental: Snapshot state for incremental runs, or None.
+        scheduler: Barrier (stage by stage) or DAG scheduling.
+        tracer: Receives execution spans; ``NULL_TRACER`` by default.
 
     Example:
         >>> pipeline = EcosystemPipeline()
@@ -93,7 +304,16 @@ class EcosystemPipeline:
         FR-083 (backward-compatible single-file mode)
     """
 
-    def __init__(self, validator: SingleFileValidator | None = None) -> None:
+    def __init__(
+        self,
+        validator: SingleFileValidator | None = None,
+        *,
+        jobs: int = 1,
+        backend: ExecutorBackend | str = ExecutorBackend.THREAD,
+        incremental: IncrementalState | None = None,
+        scheduler: StageScheduler | str = StageScheduler.BARRIER,
+        tracer: Tracer | None = None,
+    ) -> None:
         """Initialize the ecosystem pipeline.
 
         Args:
@@ -101,13 +321,59 @@ class EcosystemPipeline:
                       per-file stage. If None, files are read from disk but
                       not validated — the schema models will have
                       ``parsed=None``, ``validation=None``, ``quality=None``.
+            jobs: Maximum number of files processed concurrently in Stage 2.
+                  ``1`` (the default) keeps the serial behavior.
+            backend: Worker pool for Stage 2 when ``jobs > 1`` —
+                     ``"thread"`` or ``"process"``. The process backend
+                     requires a picklable validator.
+            incremental: Optional ``IncrementalState``. Each run reuses the
+                     results of the previous run through the same state
+                     for files whose fingerprint is unchanged.
+            scheduler: ``"barrier"`` (the default) runs the stages one
+                     after another; ``"dag"`` overlaps them (see the module
+                     docstring). The validator must then be thread-safe.
+            tracer: Optional ``Tracer`` (e.g. ``ChromeTracer``) that records
+                     a span per run, stage, file, and check. Untraced runs
+                     use the no-op ``NULL_TRACER``.
+
+        Raises:
+            ValueError: If ``jobs`` is less than 1, ``backend`` or
+                        ``scheduler`` is unknown, or the process backend is
+                        given a validator that cannot be pickled.
         """
+        if jobs < 1:
+            raise ValueError(f"jobs must be >= 1, got {jobs}")
         self._validator = validator
+        self._jobs = jobs
+        self._backend = ExecutorBackend(backend)
+        if self._backend == ExecutorBackend.PROCESS and jobs > 1:
+            check_picklable(validator)
+        self._incremental = incremental
+        self._scheduler = StageScheduler(scheduler)
+        self._tracer = tracer if tracer is not None else NULL_TRACER
+
+    @property
+    def incremental(self) -> IncrementalState | None:
+        """Snapshot state for incremental runs, or None."""
+        return self._incremental
+
+    @property
+    def scheduler(self) -> StageScheduler:
+        """Barrier (stage by stage) or DAG scheduling."""
+        return self._scheduler
+
+    @property
+    def tracer(self) -> Tracer:
+        """Receives execution spans; ``NULL_TRACER`` when not tracing."""
+        return self._tracer
 
     def run(
         self,
         root_path: str,
         stop_after: PipelineStageId | None = None,
+        *,
+        checkpoint: str | None = None,
+        profile: bool = False,
     ) -> PipelineContext:
         """Execute the ecosystem pipeline on a project root or single file.
 
@@ -123,6 +389,10 @@ class EcosystemPipeline:
                        stages with higher ordinal values are skipped.
                        Example: ``PipelineStageId.RELATIONSHIP`` skips
                        Ecosystem Validation and Scoring.
+            checkpoint: Optional path. The context after the last stage
+                       that ran is saved there for ``resume()``.
+            profile: Profile each stage (``StageResult.profile``). Stages
+                       then run one after another under either scheduler.
 
         Returns:
             The completed PipelineContext containing all results accumulated
@@ -149,100 +419,349 @@ class EcosystemPipeline:
 
         # ── Build the stage sequence ───────────────────────────────
         # Stages are instantiated fresh for each run to avoid state leaks.
-        per_file_stage = PerFileStage(validator=self._validator)
+        if self._incremental is not None:
+            stages, per_file_stage = self._incremental.stages(
+                root_path,
+                self._validator,
+                jobs=self._jobs,
+                backend=self._backend,
+            )
+        else:
+            stages, per_file_stage = self._stages()
+
+        # ── Execute stages ─────────────────────────────────────────
+        tracer = self._attach_tracer(stages)
+        with tracer.span("pipeline", "pipeline", {"root_path": root_path}):
+            if self._scheduler == StageScheduler.DAG and not profile:
+                _run_stages(stages[:1], context, stop_after, tracer=tracer)
+                _run_dag(stages[1:], context, stop_after, tracer)
+            else:
+                _run_stages(stages, context, stop_after, profile=profile, tracer=tracer)
+
+        if self._incremental is not None:
+            self._incremental.commit(context)
+        if checkpoint is not None:
+            PipelineCheckpoint.capture(context, per_file_stage.file_contents).save(
+                checkpoint
+            )
+
+        log_summary(context, overall_timer.stop())
+
+        return context
+
+    def resume(
+        self,
+        checkpoint: str | PipelineCheckpoint,
+        stop_after: PipelineStageId | None = None,
+        *,
+        save_to: str | None = None,
+        profile: bool = False,
+    ) -> PipelineContext:
+        """Continue a run from a checkpoint.
+
+        Runs the stages after the checkpoint's stage (up to ``stop_after``)
+        with this pipeline's settings, on a copy of the checkpointed
+        context. Earlier stages keep their recorded results. The
+        ``incremental`` state is neither consulted nor refreshed. With
+        ``scheduler="dag"``, a run resumed after Discovery is scheduled as
+        a graph; later checkpoints leave little to overlap and run stage by
+        stage.
+
+        Args:
+            checkpoint: A ``PipelineCheckpoint`` or the path of a saved one.
+                       One checkpoint can seed any number of resumed runs.
+            stop_after: Optional stage ID to stop after, as in ``run()``.
+            save_to: Optional path to save the resumed run's checkpoint.
+            profile: Profile each stage that runs, as in ``run()``.
+
+        Returns:
+            The completed PipelineContext, as ``run()`` would return it.
+
+        Raises:
+            OSError: If the checkpoint file cannot be read.
+            ValueError: If the file is not a checkpoint of this docstratum
+                        version.
+
+        Example:
+            >>> pipeline.run(root, PipelineStageId.RELATIONSHIP, checkpoint=path)
+            >>> ctx = pipeline.resume(path)
+        """
+        overall_timer = StageTimer()
+        overall_timer.start()
 
-        stages = [
+        if not isinstance(checkpoint, PipelineCheckpoint):
+            checkpoint = PipelineCheckpoint.load(checkpoint)
+        context, file_contents = checkpoint.resume_state()
+
+        logger.info(
+            "Ecosystem pipeline resuming after %s: root_path=%s, stop_after=%s",
+            checkpoint.stage.name,
+            context.root_path,
+            stop_after.name if stop_after else "None (full run)",
+        )
+
+        stages, per_file_stage = self._stages()
+        per_file_stage.file_contents.update(file_contents)
+        remaining = [s for s in stages if s.stage_id > checkpoint.stage]
+        tracer = self._attach_tracer(stages)
+        args = {"resumed_after": checkpoint.stage.name}
+        with tracer.span("pipeline", "pipeline", args):
+            if (
+                self._scheduler == StageScheduler.DAG
+                and checkpoint.stage == PipelineStageId.DISCOVERY
+                and not profile
+            ):
+                _run_dag(remaining, context, stop_after, tracer)
+            else:
+                _run_stages(
+                    remaining, context, stop_after, profile=profile, tracer=tracer
+                )
+
+        if save_to is not None:
+            PipelineCheckpoint.capture(context, per_file_stage.file_contents).save(
+                save_to
+            )
+
+        log_summary(context, overall_timer.stop())
+
+        return context
+
+    def _attach_tracer(self, stages: Sequence[PipelineStage]) -> Tracer:
+        """Hand the tracer to the stages that record their own spans."""
+        for stage in stages:
+            if isinstance(stage, (PerFileStage, EcosystemValidationStage)):
+                stage.tracer = self._tracer
+        return self._tracer
+
+    def _stages(self) -> tuple[list[PipelineStage], PerFileStage]:
+        """Fresh stage instances for one full (non-incremental) run.
+
+        Returns:
+            Stages 1-5, and Stage 2 again with its concrete type (its
+            ``file_contents`` seed and feed checkpoints).
+        """
+        per_file_stage = PerFileStage(
+            validator=self._validator, jobs=self._jobs, backend=self._backend
+        )
+        stages: list[PipelineStage] = [
             DiscoveryStage(),
             per_file_stage,
             RelationshipStage(file_contents=per_file_stage.file_contents),
-            EcosystemValidationStage(),
+            EcosystemValidationStage(file_contents=per_file_stage.file_contents),
             ScoringStage(),
         ]
+        return stages, per_file_stage
 
-        # ── Execute stages in sequence ─────────────────────────────
-        for stage in stages:
-            stage_id = stage.stage_id
-
-            # Check if we should stop before this stage.
-            if stop_after is not None and stage_id > stop_after:
-                # Create a SKIPPED result for this stage.
-                skipped_result = StageResult(
-                    stage=stage_id,
-                    status=StageStatus.SKIPPED,
-                    message=f"Skipped (stop_after={stop_after.name})",
+
+# ── DAG run ─────────────────────────────────────────────────────────
+
+
+def _run_dag(
+    stages: Sequence[PipelineStage],
+    context: PipelineContext,
+    stop_after: PipelineStageId | None,
+    tracer: Tracer = NULL_TRACER,
+) -> None:
+    """Run Stages 2-5 as a node graph after Discovery has run.
+
+    Falls back to the stage loop when there is nothing to overlap (Stage 1
+    did not succeed, or the run stops after Stage 2).
+
+    Args:
+        stages: Stages 2-5, in order.
+        context: The pipeline context, with Discovery's result recorded.
+        stop_after: Optional stage ID to stop after.
+        tracer: Receives a span per stage and index node.
+    """
+    last = stop_after if stop_after is not None else PipelineStageId.SCORING
+    if (
+        context.stage_results[-1].status != StageStatus.SUCCESS
+        or last < PipelineStageId.RELATIONSHIP
+    ):
+        _run_stages(stages, context, stop_after, tracer=tracer)
+        return
+
+    per_file, relationship, validation, scoring = stages
+    results: dict[PipelineStageId, StageResult] = {
+        PipelineStageId.DISCOVERY: context.stage_results[-1]
+    }
+    nodes: list[PipelineNode] = []
+
+    def add_stage(
+        stage: PipelineStage,
+        after: set[str],
+        execute: Callable[[], StageResult] | None = None,
+    ) -> str:
+        stage_id = stage.stage_id
+        name = stage_id.name.lower()
+        run_stage = execute or (lambda: stage.execute(context))
+
+        def run() -> None:
+            # As in the stage loop, a failure skips only the next stage.
+            previous = results.get(PipelineStageId(stage_id - 1))
+            if previous is not None and previous.status == StageStatus.FAILED:
+                return
+            # One of the stage's own nodes (a check or index) already failed.
+            if stage_id in results:
+                return
+            logger.info("Executing stage %d: %s", stage_id.value, stage_id.name)
+            try:
+                with tracer.span(name, "stage"):
+                    results[stage_id] = run_stage()
+            except Exception as exc:
+                results[stage_id] = exception_result(stage_id, exc)
+
+        nodes.append(PipelineNode(name, stage_id, run, frozenset(after)))
+        return name
+
+    # Stage 2, mapping each file's links as soon as it is parsed.
+    if isinstance(per_file, PerFileStage) and isinstance(
+        relationship, RelationshipStage
+    ):
+        relationship.prepare(context)
+        per_file.on_file = relationship.map_file
+    per_file_node = add_stage(per_file, set())
+    relationship_node = add_stage(relationship, {per_file_node})
+
+    # Stage 4, one node per check.
+    if last >= PipelineStageId.ECOSYSTEM_VALIDATION:
+        validation_after = {relationship_node}
+        collect: Callable[[], StageResult] | None = None
+        if isinstance(validation, EcosystemValidationStage):
+            stage_id = PipelineStageId.ECOSYSTEM_VALIDATION
+            validation.start_checks()
+            indexes = {CheckInput.FILES: EcosystemIndex(context.files, ())}
+
+            def fail(exc: Exception) -> None:
+                # As in the stage loop, a raising check fails Stage 4; the
+                # collect node and Scoring are then skipped.
+                results.setdefault(stage_id, exception_result(stage_id, exc))
+
+            def build_index(level: CheckInput) -> Callable[[], None]:
+                def run() -> None:
+                    try:
+                        with tracer.span(f"index:{level.value}", "stage"):
+                            if level == CheckInput.RELATIONSHIPS:
+                                indexes[level] = EcosystemIndex.of(context)
+                            else:
+                                indexes[level] = EcosystemIndex(context.files, ())
+                    except Exception as exc:
+                        fail(exc)
+
+                return run
+
+            index_after = {
+                CheckInput.DOCUMENTS: per_file_node,
+                CheckInput.RELATIONSHIPS: relationship_node,
+            }
+            for level, dep in index_after.items():
+                name = f"index:{level.value}"
+                nodes.append(
+                    PipelineNode(name, stage_id, build_index(level), frozenset({dep}))
                 )
-                context.stage_results.append(skipped_result)
-                logger.info(
-                    "Skipping stage %d (%s): stop_after=%s",
-                    stage_id.value,
-                    stage_id.name,
-                    stop_after.name,
+
+            def run_check(
+                check: EcosystemCheck, level: CheckInput
+            ) -> Callable[[], None]:
+                def run() -> None:
+                    try:
+                        validation.run_check(check, context, indexes[level])
+                    except Exception as exc:
+                        fail(exc)
+
+                return run
+
+            for check in ECOSYSTEM_CHECKS:
+                level = next(
+                    (
+                        level
+                        for level in (CheckInput.RELATIONSHIPS, CheckInput.DOCUMENTS)
+                        if level in check.inputs
+                    ),
+                    CheckInput.FILES,
                 )
-                continue
-
-            # Check if a previous stage failed.
-            if context.stage_results and context.stage_results[-1].status == StageStatus.FAILED:
-                skipped_result = StageResult(
-                    stage=stage_id,
-                    status=StageStatus.SKIPPED,
-                    message="Skipped due to previous stage failure",
+                after = (
+                    frozenset({f"index:{level.value}"})
+                    if level != CheckInput.FILES
+                    else frozenset()
                 )
-                context.stage_results.append(skipped_result)
-                logger.info(
-                    "Skipping stage %d (%s): previous stage failed",
-                    stage_id.value,
-                    stage_id.name,
+                nodes.append(
+                    PipelineNode(check.name, stage_id, run_check(check, level), after)
                 )
-                continue
+                validation_after.add(check.name)
+
+            def finish() -> StageResult:
+                timer = StageTimer()
+                timer.start()
+                return validation.finish_checks(context, timer)
+
+            collect = finish
+
+        validation_node = add_stage(validation, validation_after, collect)
+        if last >= PipelineStageId.SCORING:
+            add_stage(scoring, {validation_node})
+
+    try:
+        spans = run_nodes(nodes)
+    finally:
+        if isinstance(per_file, PerFileStage):
+            per_file.on_file = None
+
+    # Record Stages 2-5 in order, as the stage loop would.
+    for stage in stages:
+        stage_id = stage.stage_id
+        result = skip_result(stage_id, stop_after, context)
+        if result is None:
+            result = results[stage_id]
+            timings = {n.name: spans[n.name].ms for n in nodes if n.stage == stage_id}
+            result = result.model_copy(
+                update={
+                    "duration_ms": sum(timings.values()),
+                    "node_timings": {**result.node_timings, **timings},
+                }
+            )
+        record_result(context, result)
+
 
-            # Execute the stage.
+# ── Stage loop ──────────────────────────────────────────────────────
+# Result bookkeeping lives in stages.py so AsyncEcosystemPipeline skips,
+# fails, and logs stages identically.
+
+
+def _run_stages(
+    stages: Sequence[PipelineStage],
+    context: PipelineContext,
+    stop_after: PipelineStageId | None,
+    *,
+    profile: bool = False,
+    tracer: Tracer = NULL_TRACER,
+) -> None:
+    """Run ``stages`` one after another, recording each result.
+
+    With ``profile``, each stage that runs is wrapped in a StageProfiler
+    and its result carries the profile, failed stages included. Each
+    stage that runs is a span on ``tracer``.
+    """
+    for stage in stages:
+        result = skip_result(stage.stage_id, stop_after, context)
+        if result is None:
             logger.info(
-                "Executing stage %d: %s", stage_id.value, stage_id.name
+                "Executing stage %d: %s", stage.stage_id.value, stage.stage_id.name
             )
+            profiler = StageProfiler() if profile else None
             try:
-                result = stage.execute(context)
+                with (
+                    profiler or nullcontext(),
+                    tracer.span(stage.stage_id.name.lower(), "stage"),
+                ):
+                    result = stage.execute(context)
             except Exception as exc:
-                logger.error(
-                    "Stage %d (%s) raised an exception: %s",
-                    stage_id.value,
-                    stage_id.name,
-                    exc,
+                result = exception_result(stage.stage_id, exc)
+            if profiler is not None:
+                file_timings = (
+                    stage.file_timings if isinstance(stage, PerFileStage) else None
                 )
-                result = StageResult(
-                    stage=stage_id,
-                    status=StageStatus.FAILED,
-                    message=f"Exception: {exc}",
+                result = result.model_copy(
+                    update={"profile": profiler.profile(file_timings)}
                 )
-
-            context.stage_results.append(result)
-
-            logger.info(
-                "Stage %d (%s) completed: status=%s, duration=%.1fms — %s",
-                stage_id.value,
-                stage_id.name,
-                result.status.value,
-                result.duration_ms,
-                result.message,
-            )
-
-        # ── Pipeline summary ───────────────────────────────────────
-        elapsed = overall_timer.stop()
-        completed = sum(
-            1 for r in context.stage_results if r.status == StageStatus.SUCCESS
-        )
-        failed = sum(
-            1 for r in context.stage_results if r.status == StageStatus.FAILED
-        )
-        skipped = sum(
-            1 for r in context.stage_results if r.status == StageStatus.SKIPPED
-        )
-
-        logger.info(
-            "Ecosystem pipeline complete: %d succeeded, %d failed, %d skipped in %.1fms",
-            completed,
-            failed,
-            skipped,
-            elapsed,
-        )
-
-        return context
+        record_result(context, result)
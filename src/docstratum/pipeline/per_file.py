@@ -21,6 +21,33 @@ Read strategy:
     created by Stage 1. The raw content is stored as ``_raw_content`` on the
     context for Stage 3 (Relationship Mapping) to use for link extraction.
 
+Execution modes:
+    By default files are processed serially (``jobs=1``). With ``jobs > 1``
+    the per-file work (read → parse → classify → validate → score) is fanned
+    out to a thread or process pool (``ExecutorBackend``). Each worker returns
+    a ``FileOutcome`` record instead of mutating the ``EcosystemFile``; the
+    outcomes are applied back on the calling thread as they complete. Each
+    outcome only touches its own file, so a parallel run produces the same
+    context as a serial one. A failure in one file never affects the others
+    (per-file error isolation).
+
+    Every outcome carries ``FileTimings`` (read / parse / classify /
+    validate / score milliseconds), measured where the file was processed;
+    the stage keeps them in ``file_timings`` for profiling. With a
+    ``tracer`` they also become one span per file (and per step) on the
+    worker that processed it.
+
+    ``on_file``, if set, is called (on the calling thread) with each file
+    right after its outcome is applied — the DAG scheduler uses it to start
+    Stage 3's link mapping for a file while other files are still parsing.
+
+    The process backend pickles the validator once into each worker (a pool
+    initializer), so it must be picklable (``ParserAdapter`` is); the stage
+    checks this at construction and raises ``ValueError`` otherwise. Validators that hold unpicklable
+    state (locks, open handles, mocks) should use the thread backend. If the
+    pool breaks mid-run (a worker crashed), the files without an outcome
+    are processed serially on the calling thread.
+
 Research basis:
     v0.0.7 §7.2  (Pipeline Stage 2: Per-File Validation)
 
@@ -31,12 +58,32 @@ Traces to:
 
 from __future__ import annotations
 
+import functools
+import itertools
 import logging
+import pickle
+import time
+from collections.abc import Callable
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from concurrent.futures.process import BrokenProcessPool
+from enum import StrEnum
 from pathlib import Path
+from typing import Any, NamedTuple
 
-from docstratum.schema.classification import DocumentType
+from docstratum.parser.section_matcher import coverage_of
+from docstratum.schema.classification import DocumentClassification, DocumentType
+from docstratum.schema.constants import CanonicalCoverage
 from docstratum.schema.ecosystem import EcosystemFile
+from docstratum.schema.parsed import ParsedLlmsTxt
+from docstratum.schema.quality import QualityScore
+from docstratum.schema.validation import ValidationResult
 
+from docstratum.pipeline.profiling import FileTimings
 from docstratum.pipeline.stages import (
     PipelineContext,
     PipelineStageId,
@@ -45,10 +92,191 @@ from docstratum.pipeline.stages import (
     StageStatus,
     StageTimer,
 )
+from docstratum.pipeline.tracing import NULL_TRACER, Tracer, current_worker
 
 logger = logging.getLogger(__name__)
 
 
+# ── Executor Backends ───────────────────────────────────────────────
+
+
+class ExecutorBackend(StrEnum):
+    """Worker pool used when ``PerFileStage`` runs with ``jobs > 1``.
+
+    Attributes:
+        THREAD: ``ThreadPoolExecutor``. Cheap to start and shares the
+                validator instance; best when per-file work releases the
+                GIL (I/O) or the validator is not picklable.
+        PROCESS: ``ProcessPoolExecutor``. True CPU parallelism for the
+                 pure-Python parser; the validator is pickled per task.
+    """
+
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+def check_picklable(validator: SingleFileValidator | None) -> None:
+    """Ensure ``validator`` can be sent to process-pool workers.
+
+    Args:
+        validator: The validator the process backend would pickle.
+
+    Raises:
+        ValueError: If pickling the validator fails.
+    """
+    try:
+        pickle.dumps(validator)
+    except Exception as exc:
+        raise ValueError(
+            "The process backend needs a picklable validator; "
+            f"{type(validator).__name__} is not ({exc}). "
+            "Use backend='thread' instead."
+        ) from exc
+
+
+# ── Per-File Work Unit ──────────────────────────────────────────────
+# The work for one file is a module-level function returning a plain
+# record, so it can run on any executor (including a process pool) and
+# the results can be applied to the context deterministically.
+
+
+class FileOutcome(NamedTuple):
+    """Result of processing one ecosystem file.
+
+    Fields after the first failing step are None — e.g., if ``validate()``
+    raises, ``parsed`` and ``classification`` are still populated.
+
+    Attributes:
+        read_ok: Whether the file was read from disk successfully.
+        raw_content: Decoded file content, or None if the read failed.
+        parsed: Parser output, or None.
+        coverage: Canonical coverage bitmask of ``parsed``, or None.
+        classification: Classifier output, or None.
+        validation: Validator output, or None.
+        quality: Scorer output, or None.
+        timings: Milliseconds per step.
+        started: ``time.perf_counter()`` when processing began.
+        worker: ``(pid, thread id, thread name)`` that processed the file.
+    """
+
+    read_ok: bool
+    raw_content: str | None = None
+    parsed: ParsedLlmsTxt | None = None
+    coverage: CanonicalCoverage | None = None
+    classification: DocumentClassification | None = None
+    validation: ValidationResult | None = None
+    quality: QualityScore | None = None
+    timings: FileTimings = FileTimings()
+    started: float = 0.0
+    worker: tuple[int, int, str] | None = None
+
+
+def run_file(validator: SingleFileValidator | None, file_path_str: str) -> FileOutcome:
+    """Read one file and run the single-file pipeline on it.
+
+    Never raises: read errors produce ``read_ok=False`` and validator errors
+    produce a partial outcome, mirroring the serial error isolation.
+
+    Args:
+        validator: The SingleFileValidator, or None for read-only mode.
+        file_path_str: Path of the file to process.
+
+    Returns:
+        A ``FileOutcome`` describing everything that succeeded.
+    """
+    file_path = Path(file_path_str)
+    # perf_counter() after each step; FileTimings are the differences.
+    marks = [time.perf_counter()]
+
+    # ── Step 1: Read raw content from disk ─────────────────────────
+    try:
+        raw_content = file_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as exc:
+        logger.warning("Failed to read %s: %s", file_path_str, exc)
+        marks.append(time.perf_counter())
+        return FileOutcome(read_ok=False, **_measured(marks))
+    marks.append(time.perf_counter())
+
+    # ── Step 2: Run validator if available ─────────────────────────
+    if validator is None:
+        logger.debug(
+            "No validator provided — skipping parse/validate for %s",
+            file_path.name,
+        )
+        return FileOutcome(read_ok=True, raw_content=raw_content, **_measured(marks))
+
+    parsed = coverage = classification = validation = quality = None
+    try:
+        # Parse
+        parsed = validator.parse(raw_content, file_path.name)
+        coverage = coverage_of(parsed)
+        marks.append(time.perf_counter())
+
+        # Classify
+        classification = validator.classify(parsed)
+        marks.append(time.perf_counter())
+
+        # Validate
+        validation = validator.validate(parsed, classification)
+        marks.append(time.perf_counter())
+
+        # Score
+        quality = validator.score(validation)
+        marks.append(time.perf_counter())
+
+        logger.info(
+            "Validated %s: level=%s, score=%s",
+            file_path.name,
+            validation.level_achieved.name if validation else "N/A",
+            quality.total_score if quality else "N/A",
+        )
+    except Exception as exc:
+        # If the validator fails for one file, log and continue.
+        # Fields after the failing step remain None.
+        logger.warning("Validator failed for %s: %s", file_path_str, exc)
+
+    return FileOutcome(
+        read_ok=True,
+        raw_content=raw_content,
+        parsed=parsed,
+        coverage=coverage,
+        classification=classification,
+        validation=validation,
+        quality=quality,
+        **_measured(marks),
+    )
+
+
+# Process-pool workers receive the validator once, at start-up, instead of
+# with every submitted file.
+_worker_validator: SingleFileValidator | None = None
+
+
+def _init_worker(validator: SingleFileValidator | None) -> None:
+    """Process-pool initializer: keep the validator for this worker."""
+    global _worker_validator
+    _worker_validator = validator
+
+
+def _run_worker_file(file_path_str: str) -> FileOutcome:
+    """``run_file`` with the validator handed to this worker process."""
+    return run_file(_worker_validator, file_path_str)
+
+
+def _measured(marks: list[float]) -> dict[str, Any]:
+    """Timing fields of a FileOutcome from the step boundaries so far."""
+    return {
+        "timings": FileTimings(
+            *((end - start) * 1000.0 for start, end in itertools.pairwise(marks))
+        ),
+        "started": marks[0],
+        "worker": current_worker(),
+    }
+
+
+_STEPS = ("read", "parse", "classify", "validate", "score")
+
+
 class PerFileStage:
     """Stage 2: Run the single-file validation pipeline on each ecosystem file.
 
@@ -65,6 +293,12 @@ class PerFileStage:
     Attributes:
         stage_id: Always ``PipelineStageId.PER_FILE``.
         validator: The injected SingleFileValidator, or None if not available.
+        jobs: Number of concurrent workers (1 = serial).
+        backend: Worker pool kind used when ``jobs > 1``.
+        on_file: Optional callback run with each file once its outcome
+            has been applied.
+        file_timings: Step timings of the last run, by file path.
+        tracer: Receives a span per file; ``NULL_TRACER`` by default.
 
     Example:
         >>> stage = PerFileStage()  # No validator — read-only mode
@@ -73,12 +307,22 @@ class PerFileStage:
         >>> result.status == StageStatus.SUCCESS
         True
 
+    Example (parallel):
+        >>> stage = PerFileStage(validator=ParserAdapter(), jobs=8,
+        ...                      backend=ExecutorBackend.PROCESS)
+
     Traces to:
         FR-080 (per-file validation within ecosystem)
         FR-083 (byte-identical results in single-file mode)
     """
 
-    def __init__(self, validator: SingleFileValidator | None = None) -> None:
+    def __init__(
+        self,
+        validator: SingleFileValidator | None = None,
+        *,
+        jobs: int = 1,
+        backend: ExecutorBackend | str = ExecutorBackend.THREAD,
+    ) -> None:
         """Initialize the Per-File Validation stage.
 
         Args:
@@ -86,17 +330,46 @@ class PerFileStage:
                        If provided, each file is parsed, classified,
                        validated, and scored. If None, files are only
                        read from disk (content stored for later stages).
+            jobs: Maximum number of files processed concurrently. ``1``
+                  (the default) processes files serially on the calling
+                  thread.
+            backend: Worker pool used when ``jobs > 1`` — ``"thread"`` or
+                     ``"process"``.
+
+        Raises:
+            ValueError: If ``jobs`` is less than 1, ``backend`` is not a
+                        known ExecutorBackend value, or the process backend
+                        is given a validator that cannot be pickled.
         """
+        if jobs < 1:
+            raise ValueError(f"jobs must be >= 1, got {jobs}")
         self._validator = validator
+        self._jobs = jobs
+        self._backend = ExecutorBackend(backend)
+        if self._backend == ExecutorBackend.PROCESS and jobs > 1:
+            check_picklable(validator)
         # Internal storage for raw file contents, keyed by file_id.
         # Downstream stages can access this via the stage instance.
         self.file_contents: dict[str, str] = {}
+        self.on_file: Callable[[EcosystemFile], None] | None = None
+        self.file_timings: dict[str, FileTimings] = {}
+        self.tracer: Tracer = NULL_TRACER
 
     @property
     def stage_id(self) -> PipelineStageId:
         """The ordinal identifier for this stage."""
         return PipelineStageId.PER_FILE
 
+    @property
+    def jobs(self) -> int:
+        """Maximum number of files processed concurrently."""
+        return self._jobs
+
+    @property
+    def backend(self) -> ExecutorBackend:
+        """Worker pool kind used when ``jobs > 1``."""
+        return self._backend
+
     def execute(self, context: PipelineContext) -> StageResult:
         """Run per-file validation on all discovered ecosystem files.
 
@@ -118,20 +391,41 @@ class PerFileStage:
         timer = StageTimer()
         timer.start()
 
-        files_processed = 0
-        files_failed = 0
         self.file_contents.clear()
+        self.file_timings.clear()
+        pending = self._pending_files(context.files)
 
         logger.info(
-            "Per-file stage starting: %d files to process", len(context.files)
+            "Per-file stage starting: %d files to process (jobs=%d, backend=%s)",
+            len(pending),
+            self._jobs,
+            self._backend.value,
         )
 
-        for eco_file in context.files:
-            success = self._process_file(eco_file)
-            if success:
-                files_processed += 1
-            else:
-                files_failed += 1
+        if self._jobs == 1 or len(pending) <= 1:
+            results = [self._process_file(f) for f in pending]
+        else:
+            results = self._process_parallel(pending)
+
+        return self._finish(context, results, timer)
+
+    # ── Private Methods ─────────────────────────────────────────────
+
+    def _finish(
+        self, context: PipelineContext, results: list[bool], timer: StageTimer
+    ) -> StageResult:
+        """Set the project name and build the stage result.
+
+        Args:
+            context: The pipeline context.
+            results: Per-file read success flags for the processed files.
+            timer: The stage timer, started when the stage began.
+
+        Returns:
+            The StageResult for this run.
+        """
+        files_processed = sum(results)
+        files_failed = len(results) - files_processed
 
         # Extract project name from the index file's parsed H1 title.
         for eco_file in context.files:
@@ -145,21 +439,18 @@ class PerFileStage:
 
         elapsed = timer.stop()
 
-        status = StageStatus.SUCCESS if files_failed == 0 else StageStatus.SUCCESS
-        # Note: We still return SUCCESS even if some files failed to read.
+        # We still return SUCCESS even if some files failed to read.
         # The ecosystem validator (Stage 4) will flag unreadable files.
         # We only return FAILED if ALL files failed.
+        status = StageStatus.SUCCESS
         if files_processed == 0 and files_failed > 0:
             status = StageStatus.FAILED
 
-        message = (
-            f"Processed {files_processed} file(s)"
-            + (f", {files_failed} failed" if files_failed > 0 else "")
+        message = f"Processed {files_processed} file(s)" + (
+            f", {files_failed} failed" if files_failed > 0 else ""
         )
 
-        logger.info(
-            "Per-file stage complete: %s in %.1fms", message, elapsed
-        )
+        logger.info("Per-file stage complete: %s in %.1fms", message, elapsed)
 
         return StageResult(
             stage=self.stage_id,
@@ -168,7 +459,19 @@ class PerFileStage:
             message=message,
         )
 
-    # ── Private Methods ─────────────────────────────────────────────
+    def _pending_files(self, files: list[EcosystemFile]) -> list[EcosystemFile]:
+        """Select the files this run must process.
+
+        All of them here; the incremental pipeline overrides this to skip
+        files whose results were carried over from a previous run.
+
+        Args:
+            files: Every file in the context, in discovery order.
+
+        Returns:
+            The files to read (and validate), in discovery order.
+        """
+        return files
 
     def _process_file(self, eco_file: EcosystemFile) -> bool:
         """Process a single ecosystem file: read, optionally validate.
@@ -179,55 +482,124 @@ class PerFileStage:
         Returns:
             True if the file was read successfully, False otherwise.
         """
-        file_path = Path(eco_file.file_path)
+        outcome = run_file(self._validator, eco_file.file_path)
+        return self._apply_outcome(eco_file, outcome)
+
+    def _process_parallel(self, files: list[EcosystemFile]) -> list[bool]:
+        """Process files on a worker pool, applying results as they finish.
+
+        Outcomes are independent, so applying them in completion order
+        gives the same files as a serial run; only ``on_file`` sees the
+        completion order. ``file_contents`` is put back in input order.
 
-        # ── Step 1: Read raw content from disk ─────────────────────
-        try:
-            raw_content = file_path.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError) as exc:
+        Args:
+            files: The EcosystemFiles to process. Modified in place.
+
+        Returns:
+            Per-file read success flags, in the same order as ``files``.
+        """
+        workers = min(self._jobs, len(files))
+        executor: Executor
+        work: Callable[[str], FileOutcome]
+        if self._backend == ExecutorBackend.PROCESS:
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self._validator,),
+            )
+            work = _run_worker_file
+        else:
+            executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="docstratum-per-file"
+            )
+            work = functools.partial(run_file, self._validator)
+
+        results = [False] * len(files)
+        unfinished: list[int] = []
+        with executor:
+            futures = {
+                executor.submit(work, f.file_path): i for i, f in enumerate(files)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    outcome = future.result()
+                except BrokenProcessPool:
+                    unfinished.append(i)
+                    continue
+                results[i] = self._apply_outcome(files[i], outcome)
+
+        if unfinished:
             logger.warning(
-                "Failed to read %s: %s", eco_file.file_path, exc
+                "Worker pool broke; processing %d remaining file(s) serially",
+                len(unfinished),
             )
+            for i in sorted(unfinished):
+                results[i] = self._process_file(files[i])
+
+        contents = self.file_contents
+        ordered = {
+            f.file_id: contents[f.file_id] for f in files if f.file_id in contents
+        }
+        contents.clear()
+        contents.update(ordered)
+        timings = self.file_timings
+        ordered_timings = {
+            f.file_path: timings[f.file_path] for f in files if f.file_path in timings
+        }
+        timings.clear()
+        timings.update(ordered_timings)
+        return results
+
+    def _apply_outcome(self, eco_file: EcosystemFile, outcome: FileOutcome) -> bool:
+        """Copy a worker outcome onto its EcosystemFile.
+
+        Args:
+            eco_file: The EcosystemFile the outcome belongs to.
+            outcome: The result of ``run_file`` for that file.
+
+        Returns:
+            True if the file was read successfully, False otherwise.
+        """
+        self.file_timings[eco_file.file_path] = outcome.timings
+        if self.tracer.enabled:
+            self._trace(eco_file, outcome)
+        if not outcome.read_ok:
             return False
 
         # Store raw content for downstream stages.
-        self.file_contents[eco_file.file_id] = raw_content
-
-        # ── Step 2: Run validator if available ─────────────────────
-        if self._validator is not None:
-            try:
-                # Parse
-                parsed = self._validator.parse(raw_content, file_path.name)
-                eco_file.parsed = parsed
-
-                # Classify
-                classification = self._validator.classify(parsed)
-                eco_file.classification = classification
-
-                # Validate
-                validation = self._validator.validate(parsed, classification)
-                eco_file.validation = validation
-
-                # Score
-                quality = self._validator.score(validation)
-                eco_file.quality = quality
-
-                logger.info(
-                    "Validated %s: level=%s, score=%s",
-                    file_path.name,
-                    validation.level_achieved.name if validation else "N/A",
-                    quality.total_score if quality else "N/A",
-                )
-            except Exception as exc:
-                # If the validator fails for one file, log and continue.
-                # The file's parsed/validation/quality will remain None.
-                logger.warning(
-                    "Validator failed for %s: %s", eco_file.file_path, exc
-                )
-        else:
-            logger.debug(
-                "No validator provided — skipping parse/validate for %s",
-                file_path.name,
-            )
+        self.file_contents[eco_file.file_id] = outcome.raw_content or ""
+
+        if outcome.parsed is not None:
+            eco_file.parsed = outcome.parsed
+        if outcome.coverage is not None:
+            eco_file.coverage = outcome.coverage
+        if outcome.classification is not None:
+            eco_file.classification = outcome.classification
+        if outcome.validation is not None:
+            eco_file.validation = outcome.validation
+        if outcome.quality is not None:
+            eco_file.quality = outcome.quality
+
+        if self.on_file is not None:
+            self.on_file(eco_file)
 
         return True
+
+    def _trace(self, eco_file: EcosystemFile, outcome: FileOutcome) -> None:
+        """Record a file's span and its step spans on its worker's track."""
+        tracer = self.tracer
+        start = outcome.started
+        for step, ms in zip(_STEPS, outcome.timings, strict=True):
+            if ms:
+                end = start + ms / 1000.0
+                tracer.complete(step, "file", start, end, worker=outcome.worker)
+                start = end
+        tracer.complete(
+            Path(eco_file.file_path).name,
+            "file",
+            outcome.started,
+            start,
+            worker=outcome.worker,
+            args={"path": eco_file.file_path, "read_ok": outcome.read_ok},
+        )
@@ -0,0 +1,359 @@
+"""Opt-in per-stage profiling: CPU profile, memory peak, per-file timings.
+
+``StageResult.duration_ms`` says how long a stage took, not why. A run
+started with ``EcosystemPipeline.run(root, profile=True)`` wraps each
+stage in a ``StageProfiler`` and attaches a ``StageProfile`` to its
+``StageResult.profile``:
+
+    cpu_profile      The stage's ``cProfile`` data, in the format
+                     ``pstats.Stats.dump_stats()`` writes (``.prof``), so
+                     pstats, snakeviz, or gprof2dot can read it.
+    top_functions    The most expensive functions by cumulative time.
+    memory_peak      Peak traced memory above the level at stage start
+                     (``tracemalloc``), in bytes.
+    top_allocations  Source lines whose retained memory grew the most.
+    file_timings     Stage 2 only: read / parse / classify / validate /
+                     score milliseconds per file path.
+
+``write_profiles()`` exports a profiled context as files: one ``.prof``
+and one plain-text report per stage.
+
+Scope:
+    ``cProfile`` sees only the thread that runs the stage. With
+    ``jobs > 1`` Stage 2's work happens in pool workers, so its CPU
+    profile shows the wait; ``file_timings`` are measured inside the
+    workers and cover every backend. ``tracemalloc`` traces every thread
+    of the process (not process-pool workers). A profiled run executes
+    stages one after another, even under ``scheduler="dag"``, so each
+    profile holds only its own stage's work.
+
+    Profiling slows a run down considerably (``tracemalloc`` alone often
+    2x or more); it is meant for diagnosing, not for routine runs.
+
+Classes:
+    FileTimings: Milliseconds per Stage 2 step for one file.
+    FunctionStat: One row of a CPU profile.
+    AllocationStat: Memory retained by one source line.
+    StageProfile: Everything measured for one stage.
+    StageProfiler: Context manager that measures one stage.
+
+Functions:
+    write_profiles: Export the profiles of a run as files.
+
+Related:
+    - src/docstratum/pipeline/orchestrator.py: ``run(profile=True)``
+    - src/docstratum/pipeline/per_file.py: Per-file step timings
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import logging
+import marshal
+import os
+import pstats
+import tempfile
+import tracemalloc
+from types import TracebackType
+from typing import TYPE_CHECKING, NamedTuple
+
+from pydantic import BaseModel, ConfigDict, Field
+
+if TYPE_CHECKING:
+    from docstratum.pipeline.stages import PipelineContext
+
+logger = logging.getLogger(__name__)
+
+TOP_FUNCTIONS = 25
+"""Functions listed in ``StageProfile.top_functions``."""
+
+TOP_ALLOCATIONS = 10
+"""Source lines listed in ``StageProfile.top_allocations``."""
+
+TRACEMALLOC_FRAMES = 1
+"""Frames stored per allocation when profiling starts ``tracemalloc``."""
+
+_SLOWEST_FILES = 10
+
+
+# ── Records ─────────────────────────────────────────────────────────
+
+
+class FileTimings(NamedTuple):
+    """Milliseconds spent on each Stage 2 step for one file.
+
+    Steps after a failing one are 0.0.
+    """
+
+    read_ms: float = 0.0
+    parse_ms: float = 0.0
+    classify_ms: float = 0.0
+    validate_ms: float = 0.0
+    score_ms: float = 0.0
+
+    @property
+    def total_ms(self) -> float:
+        """Milliseconds for all steps."""
+        return sum(self)
+
+
+class FunctionStat(NamedTuple):
+    """One function of a CPU profile.
+
+    Attributes:
+        function: ``file:line(name)``, as pstats prints it.
+        calls: Total number of calls.
+        primitive_calls: Calls that were not recursive.
+        own_ms: Time in the function itself.
+        cumulative_ms: Time in the function and everything it called.
+    """
+
+    function: str
+    calls: int
+    primitive_calls: int
+    own_ms: float
+    cumulative_ms: float
+
+
+class AllocationStat(NamedTuple):
+    """Memory a source line held at stage end that it did not at start.
+
+    Attributes:
+        location: ``file:line`` of the allocation.
+        size_bytes: Growth in retained bytes (negative if freed).
+        blocks: Growth in the number of live memory blocks.
+    """
+
+    location: str
+    size_bytes: int
+    blocks: int
+
+
+class StageProfile(BaseModel):
+    """CPU and memory profile of one stage.
+
+    Attributes:
+        cpu_profile: Marshalled pstats data (a ``.prof`` file's content).
+        top_functions: Most expensive functions by cumulative time.
+        memory_peak: Peak traced bytes above the level at stage start.
+        top_allocations: Source lines whose retained memory grew most.
+        file_timings: Per-file step timings by path (Stage 2 only).
+    """
+
+    # JSON (checkpoints) carries the binary profile as base64.
+    model_config = ConfigDict(ser_json_bytes="base64", val_json_bytes="base64")
+
+    cpu_profile: bytes = Field(
+        default=b"",
+        description="pstats data, as written by Stats.dump_stats().",
+    )
+    top_functions: list[FunctionStat] = Field(default_factory=list)
+    memory_peak: int = Field(default=0, ge=0)
+    top_allocations: list[AllocationStat] = Field(default_factory=list)
+    file_timings: dict[str, FileTimings] = Field(default_factory=dict)
+
+    def stats(self) -> pstats.Stats:
+        """The CPU profile as a ``pstats.Stats`` object.
+
+        Example:
+            >>> result.profile.stats().sort_stats("tottime").print_stats(10)
+        """
+        if not self.cpu_profile:
+            return pstats.Stats()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "stage.prof")
+            with open(path, "wb") as fh:
+                fh.write(self.cpu_profile)
+            return pstats.Stats(path)
+
+    def report(self) -> str:
+        """Plain-text summary: functions, allocations, slowest files."""
+        lines = ["Top functions (cumulative):"]
+        lines.append(f"  {'calls':>9} {'own ms':>10} {'cum ms':>10}  function")
+        lines.extend(
+            f"  {f.calls:>9} {f.own_ms:>10.2f} {f.cumulative_ms:>10.2f}  "
+            f"{f.function}"
+            for f in self.top_functions
+        )
+        lines.append("")
+        lines.append(f"Memory peak: {self.memory_peak:,} bytes")
+        lines.append("Top allocations (retained growth):")
+        lines.extend(
+            f"  {a.size_bytes:>12,} B {a.blocks:>8} blocks  {a.location}"
+            for a in self.top_allocations
+        )
+        if self.file_timings:
+            slowest = sorted(
+                self.file_timings.items(), key=lambda item: -item[1].total_ms
+            )[:_SLOWEST_FILES]
+            lines.append("")
+            lines.append(
+                "Slowest files (ms): "
+                "read / parse / classify / validate / score  path"
+            )
+            lines.extend(
+                "  " + " / ".join(f"{ms:.2f}" for ms in timings) + f"  {path}"
+                for path, timings in slowest
+            )
+        return "\n".join(lines) + "\n"
+
+
+# ── Profiler ────────────────────────────────────────────────────────
+
+
+class StageProfiler:
+    """Measures the code run inside ``with profiler:``.
+
+    Starts ``tracemalloc`` if it is not already tracing (and stops it
+    again on exit); a caller's own tracing is left running, but its peak
+    is reset on entry (``tracemalloc.reset_peak()``), so afterwards
+    ``get_traced_memory()`` reports the peak since the stage started.
+    The caller's peak up to entry is kept in ``caller_peak``.
+
+    Example:
+        >>> profiler = StageProfiler()
+        >>> with profiler:
+        ...     result = stage.execute(context)
+        >>> profile = profiler.profile()
+    """
+
+    __slots__ = (
+        "_base",
+        "_before",
+        "_caller_peak",
+        "_cpu",
+        "_growth",
+        "_owns_tracing",
+        "_peak",
+    )
+
+    def __init__(self) -> None:
+        self._cpu = cProfile.Profile()
+        self._before: tracemalloc.Snapshot | None = None
+        self._base = 0
+        self._caller_peak = 0
+        self._peak = 0
+        self._growth: list[tracemalloc.StatisticDiff] = []
+        self._owns_tracing = False
+
+    def __enter__(self) -> StageProfiler:
+        self._owns_tracing = not tracemalloc.is_tracing()
+        if self._owns_tracing:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        self._before = _snapshot()
+        self._caller_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.reset_peak()
+        self._base = tracemalloc.get_traced_memory()[0]
+        self._cpu.enable()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._cpu.disable()
+        before, self._before = self._before, None
+        if before is None:
+            raise RuntimeError("StageProfiler exited without being entered")
+        self._peak = max(tracemalloc.get_traced_memory()[1] - self._base, 0)
+        after = _snapshot()
+        if self._owns_tracing:
+            tracemalloc.stop()
+        self._growth = after.compare_to(before, "lineno")
+
+    @property
+    def caller_peak(self) -> int:
+        """Peak traced bytes reported just before entry (0 if not tracing)."""
+        return self._caller_peak
+
+    def profile(
+        self, file_timings: dict[str, FileTimings] | None = None
+    ) -> StageProfile:
+        """Build the profile of the measured block.
+
+        Args:
+            file_timings: Per-file timings to include (Stage 2).
+
+        Returns:
+            The StageProfile.
+        """
+        stats = pstats.Stats(self._cpu, stream=io.StringIO())
+        stats.sort_stats(pstats.SortKey.CUMULATIVE)
+        # fcn_list, stats, and func_std_string are what pstats itself prints
+        # from; typeshed does not declare them. Keys are (file, line, name),
+        # so same-named functions stay apart, and times are raw seconds.
+        table = stats.stats  # type: ignore[attr-defined]
+        top_functions = []
+        for key in stats.fcn_list[:TOP_FUNCTIONS]:  # type: ignore[attr-defined]
+            primitive, calls, own, cumulative, _ = table[key]
+            top_functions.append(
+                FunctionStat(
+                    pstats.func_std_string(key),  # type: ignore[attr-defined]
+                    calls,
+                    primitive,
+                    own * 1000.0,
+                    cumulative * 1000.0,
+                )
+            )
+        top_allocations = [
+            AllocationStat(
+                f"{diff.traceback[0].filename}:{diff.traceback[0].lineno}",
+                diff.size_diff,
+                diff.count_diff,
+            )
+            for diff in self._growth[:TOP_ALLOCATIONS]
+        ]
+        return StageProfile(
+            cpu_profile=marshal.dumps(table),
+            top_functions=top_functions,
+            memory_peak=self._peak,
+            top_allocations=top_allocations,
+            file_timings=dict(file_timings or {}),
+        )
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    """Traced allocations, without tracemalloc's own bookkeeping."""
+    return tracemalloc.take_snapshot().filter_traces(
+        (tracemalloc.Filter(False, tracemalloc.__file__),)
+    )
+
+
+# ── Export ──────────────────────────────────────────────────────────
+
+
+def write_profiles(context: PipelineContext, directory: str) -> list[str]:
+    """Write each profiled stage's ``.prof`` file and text report.
+
+    Files are named after the stage, e.g. ``stage-2-per_file.prof`` and
+    ``stage-2-per_file.txt``.
+
+    Args:
+        context: A context from a run with ``profile=True``.
+        directory: Output directory, created if missing.
+
+    Returns:
+        The paths written, in stage order.
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths: list[str] = []
+    for result in context.stage_results:
+        if result.profile is None:
+            continue
+        stem = os.path.join(
+            directory, f"stage-{result.stage.value}-{result.stage.name.lower()}"
+        )
+        with open(f"{stem}.prof", "wb") as fh:
+            fh.write(result.profile.cpu_profile)
+        with open(f"{stem}.txt", "w", encoding="utf-8") as fh:
+            fh.write(
+                f"Stage {result.stage.value} ({result.stage.name}): "
+                f"{result.duration_ms:.1f} ms, {result.status.value}\n\n"
+            )
+            fh.write(result.profile.report())
+        paths.extend((f"{stem}.prof", f"{stem}.txt"))
+    logger.info("Wrote %d profile file(s) to %s", len(paths), directory)
+    return paths
@@ -19,6 +19,18 @@ Resolution logic:
     discovered file's path (or basename), the relationship is marked as resolved
     and the ``target_file_id`` is set to the matched file's UUID.
 
+    ``LinkResolver`` holds the path index and memoizes each
+    ``(source directory, url)`` pair, so a URL repeated across files (the
+    same nav links on every page) is resolved once per directory.
+
+Pipelining:
+    Resolution only needs Stage 1's manifest, and one file's edges only
+    that file's Stage 2 result. ``prepare()`` builds the lookup once the
+    manifest exists and ``map_file()`` maps a file as soon as Stage 2 has
+    parsed it (the DAG scheduler installs it as ``PerFileStage.on_file``);
+    ``execute()`` then maps only the files not mapped yet and assembles
+    the edges in discovery order.
+
 Outputs:
     - ``context.relationships``: All FileRelationship edges for the ecosystem.
     - Each ``EcosystemFile.relationships``: Subset of edges originating from
@@ -41,12 +53,16 @@ import logging
 import os
 import re
 from pathlib import Path, PurePosixPath
+from typing import NamedTuple
 from urllib.parse import urlparse
 
+from docstratum.parser.io import SourceText, preprocess
 from docstratum.schema.classification import DocumentType
 from docstratum.schema.ecosystem import EcosystemFile, FileRelationship
 from docstratum.schema.parsed import LinkRelationship, ParsedLink
+from docstratum.schema.trusted import revalidate, trusted_constructor
 
+from docstratum.pipeline.graph import RelationshipGraph
 from docstratum.pipeline.stages import (
     PipelineContext,
     PipelineStageId,
@@ -69,19 +85,25 @@ _MARKDOWN_LINK_PATTERN = re.compile(
 )
 
 
-def extract_links_from_content(content: str) -> list[ParsedLink]:
+def extract_links_from_content(content: str | SourceText) -> list[ParsedLink]:
     """Extract Markdown links from raw content using regex.
 
     This is a fallback for when parsed models aren't available (i.e., the
     SingleFileValidator hasn't been implemented yet). It finds all ``[text](url)``
     patterns and returns them as ``ParsedLink`` instances.
 
+    Line numbers come from the ``SourceText`` line-offset index (one scan,
+    then a bisect per link), so extraction stays linear in the content size
+    even for pages with thousands of links.
+
     Args:
-        content: Raw Markdown content of a file.
+        content: Raw Markdown content of a file, or a ``SourceText`` that
+            already wraps it (its line index is then shared with the caller).
+            Raw strings are LF-normalized with ``preprocess()`` first.
 
     Returns:
-        List of ParsedLink objects extracted from the content. Line numbers
-        are approximate (based on newline counting up to the match position).
+        List of ParsedLink objects extracted from the content, with the
+        1-indexed line each link starts on.
 
     Example:
         >>> links = extract_links_from_content("See [API Docs](docs/api.md) for details.")
@@ -90,21 +112,18 @@ def extract_links_from_content(content: str) -> list[ParsedLink]:
         >>> links[0].url
         'docs/api.md'
     """
+    source = preprocess(content) if isinstance(content, str) else content
     links: list[ParsedLink] = []
+    new_link = trusted_constructor(ParsedLink)
 
-    for match in _MARKDOWN_LINK_PATTERN.finditer(content):
+    for match in _MARKDOWN_LINK_PATTERN.finditer(source.text):
         title = match.group(1).strip()
         url = match.group(2).strip()
 
-        # Calculate approximate line number.
-        line_number = content[: match.start()].count("\n") + 1
+        line_number = source.line_number(match.start())
 
         links.append(
-            ParsedLink(
-                title=title,
-                url=url,
-                line_number=line_number,
-            )
+            new_link({"title": title, "url": url, "line_number": line_number})
         )
 
     return links
@@ -221,6 +240,173 @@ def classify_relationship(
     return LinkRelationship.UNKNOWN
 
 
+# ── Link Resolution ─────────────────────────────────────────────────
+
+
+class ResolverStats(NamedTuple):
+    """Counters for one ``LinkResolver``.
+
+    ``hits`` and ``misses`` count ``resolve()`` calls answered from and
+    added to the memo; ``entries`` is the memo size and ``unresolved`` the
+    number of memoized pairs that matched no file.
+    """
+
+    hits: int
+    misses: int
+    entries: int
+    unresolved: int
+
+
+class UrlInfo(NamedTuple):
+    """Source-independent facts about a link URL, memoized per URL."""
+
+    is_external: bool
+    target_filename: str
+
+
+class LinkResolver:
+    """Memoizing resolver from link URLs to ecosystem files.
+
+    Wraps the path lookup built by ``RelationshipStage._build_file_lookup``
+    (full, normalized, basename, and lowercase-basename keys per file) and
+    remembers the answer for every ``(source_dir, url)`` pair it has seen.
+    The strategies and their order are unchanged; a repeated pair costs
+    one dict lookup instead of up to four path normalizations. The URL
+    parsing used to classify a link (``url_info()``) is memoized per URL
+    the same way.
+
+    Attributes:
+        lookup: Path representation → EcosystemFile.
+        root_path: Project root that root-relative links resolve against.
+
+    Example:
+        >>> resolver = LinkResolver(lookup, "/project")
+        >>> resolver.resolve("api.md", "/project/llms.txt").file_path
+        '/project/api.md'
+        >>> resolver.resolve("api.md#auth", "/project/llms.txt") is not None
+        True
+        >>> resolver.stats()
+        ResolverStats(hits=0, misses=2, entries=2, unresolved=0)
+    """
+
+    __slots__ = (
+        "_hits",
+        "_memo",
+        "_misses",
+        "_source_dirs",
+        "_url_info",
+        "lookup",
+        "root_path",
+    )
+
+    def __init__(self, lookup: dict[str, EcosystemFile], root_path: str) -> None:
+        """Create a resolver over an already-built path lookup.
+
+        Args:
+            lookup: Dict for path → EcosystemFile resolution.
+            root_path: Project root directory path.
+        """
+        self.lookup = lookup
+        self.root_path = root_path
+        self._memo: dict[tuple[str, str], EcosystemFile | None] = {}
+        self._hits = 0
+        self._misses = 0
+        self._source_dirs: dict[str, str] = {}
+        self._url_info: dict[str, UrlInfo] = {}
+
+    def resolve(self, url: str, source_file_path: str) -> EcosystemFile | None:
+        """Resolve ``url`` as written in the file at ``source_file_path``.
+
+        Args:
+            url: The link URL/path to resolve.
+            source_file_path: Path of the file containing the link.
+
+        Returns:
+            The resolved EcosystemFile, or None if not found.
+        """
+        source_dir = self._source_dirs.get(source_file_path)
+        if source_dir is None:
+            source_dir = self._source_dirs[source_file_path] = os.path.dirname(
+                source_file_path
+            )
+        key = (source_dir, url)
+        try:
+            result = self._memo[key]
+        except KeyError:
+            self._misses += 1
+            result = self._memo[key] = self._resolve(url, source_dir)
+            if result is None:
+                logger.debug(
+                    "Could not resolve link: %s (from %s)", url, source_file_path
+                )
+            return result
+        self._hits += 1
+        return result
+
+    def url_info(self, url: str) -> UrlInfo:
+        """Return whether ``url`` is external and the file name it targets.
+
+        Args:
+            url: The link URL/path.
+
+        Returns:
+            UrlInfo with ``is_external_url(url)`` and the target file name
+            used by ``classify_relationship()``.
+        """
+        info = self._url_info.get(url)
+        if info is None:
+            external = is_external_url(url)
+            if external:
+                target_filename = urlparse(url).path.split("/")[-1] or ""
+            else:
+                target_filename = os.path.basename(url.split("#")[0].split("?")[0])
+            info = self._url_info[url] = UrlInfo(external, target_filename)
+        return info
+
+    def _resolve(self, url: str, source_dir: str) -> EcosystemFile | None:
+        """Run the resolution strategies for one uncached pair.
+
+        Tries multiple resolution strategies:
+            1. Direct match against basename.
+            2. Normalized path relative to source file's directory.
+            3. Normalized path relative to project root.
+            4. The normalized path as-is.
+        """
+        lookup = self.lookup
+
+        # Strip fragment and query from URL.
+        clean_url = url.split("#")[0].split("?")[0]
+
+        # Strategy 1: Direct basename match.
+        basename = os.path.basename(clean_url)
+        if basename in lookup:
+            return lookup[basename]
+        if basename.lower() in lookup:
+            return lookup[basename.lower()]
+
+        # Strategy 2: Resolve relative to source file's directory.
+        resolved = _normalize_path(clean_url, source_dir)
+        if resolved in lookup:
+            return lookup[resolved]
+
+        # Strategy 3: Resolve relative to project root.
+        resolved = _normalize_path(clean_url, self.root_path)
+        if resolved in lookup:
+            return lookup[resolved]
+
+        # Strategy 4: Try the normalized path as-is.
+        return lookup.get(os.path.normpath(clean_url))
+
+    def stats(self) -> ResolverStats:
+        """Return the memo counters."""
+        return ResolverStats(
+            hits=self._hits,
+            misses=self._misses,
+            entries=len(self._memo),
+            unresolved=sum(1 for v in self._memo.values() if v is None),
+        )
+
+
 # ── Relationship Mapping Stage ──────────────────────────────────────
 
 
@@ -241,6 +427,10 @@ class RelationshipStage:
 
     Attributes:
         stage_id: Always ``PipelineStageId.RELATIONSHIP``.
+        resolver: The ``LinkResolver`` of the last ``execute()`` (None
+            before the first run); ``resolver.stats()`` reports memo hits.
+        mapping_ms: Milliseconds spent in ``map_file()`` before
+            ``execute()`` (0.0 when nothing was mapped ahead).
 
     Example:
         >>> stage = RelationshipStage(file_contents={"id1": "# Title\\n[Link](api.md)"})
@@ -263,6 +453,11 @@ class RelationshipStage:
                           ``PerFileStage.file_contents``.
         """
         self._file_contents = file_contents if file_contents is not None else {}
+        self.resolver: LinkResolver | None = None
+        self.mapping_ms = 0.0
+        self._context: PipelineContext | None = None
+        self._lookup: dict[str, EcosystemFile] = {}
+        self._mapped: dict[str, list[FileRelationship]] = {}
 
     @property
     def stage_id(self) -> PipelineStageId:
@@ -274,7 +469,8 @@ class RelationshipStage:
 
         Populates ``context.relationships`` with all FileRelationship edges
         and each ``EcosystemFile.relationships`` with edges originating from
-        that file.
+        that file, and builds the ``RelationshipGraph`` that
+        ``RelationshipGraph.of(context)`` returns to later stages.
 
         Args:
             context: Pipeline context with ``files`` populated by Stages 1–2.
@@ -288,44 +484,33 @@ class RelationshipStage:
 
         all_relationships: list[FileRelationship] = []
 
-        # Build a lookup from file path (and basename) to EcosystemFile
-        # for resolution.
-        path_to_file = self._build_file_lookup(context.files)
+        if self._context is not context:
+            self.prepare(context)
+        mapped, self._mapped = self._mapped, {}
+        self._context = None
 
         logger.info(
-            "Relationship mapping starting: %d files, %d in lookup",
+            "Relationship mapping starting: %d files, %d in lookup, %d mapped ahead",
             len(context.files),
-            len(path_to_file),
+            len(self._lookup),
+            len(mapped),
         )
 
         for eco_file in context.files:
-            # Extract links from parsed model or raw content.
-            links = self._get_links(eco_file)
-
-            file_relationships: list[FileRelationship] = []
-
-            for link in links:
-                relationship = self._build_relationship(
-                    source_file=eco_file,
-                    link=link,
-                    path_lookup=path_to_file,
-                    root_path=context.root_path,
+            file_relationships = mapped.get(eco_file.file_id)
+            if file_relationships is None:
+                file_relationships = self._map_file(
+                    eco_file, self._lookup, context.root_path
                 )
-                file_relationships.append(relationship)
-
-                # Update the link's ecosystem metadata if it's from a parsed model.
-                link.relationship = relationship.relationship_type
-                if relationship.is_resolved and relationship.target_file_id:
-                    link.resolves_to = relationship.target_file_id
-                    # Set target_file_type as string to avoid circular import.
-                    target = path_to_file.get(relationship.target_file_id)
-                    if target is not None:
-                        link.target_file_type = target.file_type.value
-
-            eco_file.relationships = file_relationships
+                eco_file.relationships = file_relationships
             all_relationships.extend(file_relationships)
 
         context.relationships = all_relationships
+        graph = RelationshipGraph.of(context)
+
+        # Debug switch only (schema/trusted.py): re-check every edge.
+        for relationship in all_relationships:
+            revalidate(relationship)
 
         # Count resolution stats for logging.
         resolved = sum(1 for r in all_relationships if r.is_resolved)
@@ -338,13 +523,16 @@ class RelationshipStage:
         elapsed = timer.stop()
 
         logger.info(
-            "Relationship mapping complete: %d total (%d resolved, %d external, %d unresolved) in %.1fms",
+            "Relationship mapping complete: %d total (%d resolved, %d external, %d unresolved), %d graph edges in %.1fms",
             len(all_relationships),
             resolved,
             external,
             unresolved,
+            len(graph.in_edges),
             elapsed,
         )
+        if self.resolver is not None and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Link resolver: %s", self.resolver.stats())
 
         return StageResult(
             stage=self.stage_id,
@@ -354,10 +542,108 @@ class RelationshipStage:
                 f"{len(all_relationships)} relationships: "
                 f"{resolved} resolved, {external} external, {unresolved} unresolved"
             ),
+            node_timings={"link_mapping": self.mapping_ms} if mapped else {},
         )
 
+    def prepare(self, context: PipelineContext) -> None:
+        """Build the file lookup and resolver for ``context``'s manifest.
+
+        Call once Stage 1 has populated ``context.files``, before
+        ``map_file()``.
+
+        Args:
+            context: Pipeline context with ``files`` populated by Stage 1.
+        """
+        # Build a lookup from file path (and basename) to EcosystemFile
+        # for resolution.
+        self._lookup = self._build_file_lookup(context.files)
+        self.resolver = LinkResolver(self._lookup, context.root_path)
+        self._context = context
+        self._mapped = {}
+        self.mapping_ms = 0.0
+
+    def map_file(self, eco_file: EcosystemFile) -> None:
+        """Map one file's edges ahead of ``execute()``.
+
+        Called from one thread at a time, once the file's Stage 2 result
+        has been applied. ``execute()`` reuses the edges.
+
+        Args:
+            eco_file: A file of the prepared context. Its ``relationships``
+                (and its parsed links' ecosystem fields) are set.
+
+        Raises:
+            RuntimeError: If ``prepare()`` was not called for this run.
+        """
+        if self._context is None:
+            raise RuntimeError("map_file() called before prepare()")
+        timer = StageTimer()
+        timer.start()
+        edges = self._map_file(eco_file, self._lookup, self._context.root_path)
+        eco_file.relationships = edges
+        self._mapped[eco_file.file_id] = edges
+        self.mapping_ms += timer.stop()
+
     # ── Private Methods ─────────────────────────────────────────────
 
+    def _map_file(
+        self,
+        eco_file: EcosystemFile,
+        path_lookup: dict[str, EcosystemFile],
+        root_path: str,
+    ) -> list[FileRelationship]:
+        """Build the relationship edges originating from one file.
+
+        Args:
+            eco_file: The source file.
+            path_lookup: Dict for resolving target paths to EcosystemFile objects.
+            root_path: The project root path for resolving relative URLs.
+
+        Returns:
+            One FileRelationship per link, in link order.
+        """
+        # Extract links from parsed model or raw content.
+        return [
+            self._map_link(eco_file, link, path_lookup, root_path)
+            for link in self._get_links(eco_file)
+        ]
+
+    def _map_link(
+        self,
+        eco_file: EcosystemFile,
+        link: ParsedLink,
+        path_lookup: dict[str, EcosystemFile],
+        root_path: str,
+    ) -> FileRelationship:
+        """Build one edge and record it on the link's ecosystem fields.
+
+        Args:
+            eco_file: The file containing the link.
+            link: The link; its relationship fields are updated in place.
+            path_lookup: Dict for resolving target paths to EcosystemFile objects.
+            root_path: The project root path for resolving relative URLs.
+
+        Returns:
+            The FileRelationship edge for ``link``.
+        """
+        relationship = self._build_relationship(
+            source_file=eco_file,
+            link=link,
+            path_lookup=path_lookup,
+            root_path=root_path,
+        )
+
+        # Update the link's ecosystem metadata if it's from a parsed model.
+        link.relationship = relationship.relationship_type
+        if relationship.is_resolved and relationship.target_file_id:
+            link.resolves_to = relationship.target_file_id
+            # Set target_file_type as string to avoid circular import.
+            target = path_lookup.get(relationship.target_file_id)
+            if target is not None:
+                link.target_file_type = target.file_type.value
+
+        return relationship
+
     def _build_file_lookup(
         self, files: list[EcosystemFile]
     ) -> dict[str, EcosystemFile]:
@@ -439,13 +725,10 @@ class RelationshipStage:
             A FileRelationship edge.
         """
         url = link.url
-        external = is_external_url(url)
+        resolver = self._resolver_for(path_lookup, root_path)
 
-        # Determine target filename for classification.
-        if external:
-            target_filename = urlparse(url).path.split("/")[-1] or ""
-        else:
-            target_filename = os.path.basename(url.split("#")[0].split("?")[0])
+        # External flag and target filename for classification.
+        external, target_filename = resolver.url_info(url)
 
         # Classify the relationship type.
         rel_type = classify_relationship(
@@ -459,75 +742,31 @@ class RelationshipStage:
         is_resolved = False
 
         if not external:
-            resolved_file = self._resolve_link(
-                url=url,
-                source_file_path=source_file.file_path,
-                root_path=root_path,
-                path_lookup=path_lookup,
-            )
+            resolved_file = resolver.resolve(url, source_file.file_path)
             if resolved_file is not None:
                 target_file_id = resolved_file.file_id
                 is_resolved = True
 
-        return FileRelationship(
-            source_file_id=source_file.file_id,
-            target_file_id=target_file_id,
-            relationship_type=rel_type,
-            source_line=link.line_number,
-            target_url=url,
-            is_resolved=is_resolved,
+        return trusted_constructor(FileRelationship)(
+            {
+                "source_file_id": source_file.file_id,
+                "target_file_id": target_file_id,
+                "relationship_type": rel_type,
+                "source_line": link.line_number,
+                "target_url": url,
+                "is_resolved": is_resolved,
+            }
         )
 
-    def _resolve_link(
-        self,
-        url: str,
-        source_file_path: str,
-        root_path: str,
-        path_lookup: dict[str, EcosystemFile],
-    ) -> EcosystemFile | None:
-        """Attempt to resolve a link URL to an ecosystem file.
-
-        Tries multiple resolution strategies:
-            1. Direct match against basename.
-            2. Normalized path relative to source file's directory.
-            3. Normalized path relative to project root.
-
-        Args:
-            url: The link URL/path to resolve.
-            source_file_path: Path of the file containing the link.
-            root_path: Project root directory path.
-            path_lookup: Dict for path → EcosystemFile resolution.
-
-        Returns:
-            The resolved EcosystemFile, or None if not found.
-        """
-        # Strip fragment and query from URL.
-        clean_url = url.split("#")[0].split("?")[0]
-
-        # Strategy 1: Direct basename match.
-        basename = os.path.basename(clean_url)
-        if basename in path_lookup:
-            return path_lookup[basename]
-        if basename.lower() in path_lookup:
-            return path_lookup[basename.lower()]
-
-        # Strategy 2: Resolve relative to source file's directory.
-        source_dir = os.path.dirname(source_file_path)
-        resolved = _normalize_path(clean_url, source_dir)
-        if resolved in path_lookup:
-            return path_lookup[resolved]
-
-        # Strategy 3: Resolve relative to project root.
-        resolved = _normalize_path(clean_url, root_path)
-        if resolved in path_lookup:
-            return path_lookup[resolved]
-
-        # Strategy 4: Try the normalized path as-is.
-        normalized = os.path.normpath(clean_url)
-        if normalized in path_lookup:
-            return path_lookup[normalized]
-
-        logger.debug(
-            "Could not resolve link: %s (from %s)", url, source_file_path
-        )
-        return None
+    def _resolver_for(
+        self, path_lookup: dict[str, EcosystemFile], root_path: str
+    ) -> LinkResolver:
+        """The run's resolver, replaced if built for another lookup or root."""
+        resolver = self.resolver
+        if (
+            resolver is None
+            or resolver.lookup is not path_lookup
+            or resolver.root_path != root_path
+        ):
+            resolver = self.resolver = LinkResolver(path_lookup, root_path)
+        return resolver
@@ -0,0 +1,306 @@
+"""Near-duplicate detection for W017 (REDUNDANT_CONTENT).
+
+Comparing every pair of files is O(F^2) — two million comparisons for a
+2,000-page ecosystem. This module finds the pairs worth comparing in
+near-linear time and checks only those:
+
+    1. Shingling: each file becomes the set of hashed 5-word windows
+       ("shingles") over its lowercased words.
+    2. MinHash: each shingle set is summarized by a fixed-length signature
+       whose positions agree between two files with probability equal to
+       their Jaccard similarity. One-permutation hashing fills all
+       ``SIGNATURE_SIZE`` positions from a single hash per shingle;
+       empty positions are densified from their right neighbour.
+    3. LSH banding: signatures are cut into ``BANDS`` bands of ``ROWS``
+       positions; files sharing any band land in the same bucket and
+       become a candidate pair. With 32 x 4 a pair at Jaccard 0.6 is a
+       candidate with probability ~0.99, a pair at 0.2 with ~0.05.
+    4. Exact check: candidates are scored by the exact Jaccard similarity
+       of their shingle sets, so the reported similarity is never an
+       estimate and false candidates are dropped.
+
+Hashing uses CRC-32 per word and a polynomial rolling hash per window, so
+signatures (and therefore candidates) are the same in every process.
+
+Signatures are cached by a hash of the text in a ``SignatureCache``; a
+re-run over unchanged pages only shingles the pages that changed.
+
+Classes:
+    ContentSignature: Shingle set plus MinHash signature of one text.
+    ContentCache: Bounded content-hash → derived value cache.
+    SignatureCache: ContentCache of ContentSignature.
+    SimilarPair: Two item indices and their exact Jaccard similarity.
+
+Functions:
+    shingle_sequence: Hashed word shingles of a text, in order.
+    shingle_hashes: The set of hashed word shingles of a text.
+    find_similar_pairs: LSH candidates filtered by exact similarity.
+
+Related:
+    - src/docstratum/pipeline/ecosystem_validator.py: W017 check
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Sequence
+from typing import Generic, NamedTuple, TypeVar
+
+SHINGLE_SIZE = 5
+"""Words per shingle."""
+
+SIGNATURE_SIZE = 128
+"""MinHash signature length (one-permutation hashing bins)."""
+
+BANDS = 32
+"""LSH bands per signature."""
+
+ROWS = SIGNATURE_SIZE // BANDS
+"""Signature positions per band."""
+
+MIN_SHINGLES = 20
+"""Texts with fewer shingles (roughly 24 words) get no signature."""
+
+DEFAULT_CACHE_ENTRIES = 16_384
+"""Default bound on the number of cached signatures."""
+
+_T = TypeVar("_T")
+
+_WORD = re.compile(r"\w+")
+_MASK = (1 << 64) - 1
+_BASE = 1_000_003
+_MIX = 0x9E3779B97F4A7C15  # 2^64 / golden ratio, odd
+_BIN_SHIFT = 64 - (SIGNATURE_SIZE.bit_length() - 1)
+_VALUE_MASK = (1 << _BIN_SHIFT) - 1
+
+
+def shingle_sequence(text: str, size: int = SHINGLE_SIZE) -> list[int]:
+    """Return the 64-bit hashes of ``text``'s ``size``-word shingles, in order.
+
+    Words are ``\\w+`` runs, lowercased, so whitespace, punctuation, and
+    Markdown markup do not affect the result. Each word is hashed once
+    (CRC-32) and windows are combined with a Rabin-Karp rolling hash, so
+    the whole sequence costs one pass over the words.
+
+    Args:
+        text: The text to shingle.
+        size: Words per shingle.
+
+    Returns:
+        One hash per window position (empty if the text has fewer words).
+    """
+    words = [zlib.crc32(w.encode("utf-8")) for w in _WORD.findall(text.lower())]
+    if len(words) < size:
+        return []
+    top = pow(_BASE, size - 1, 1 << 64)
+    h = 0
+    for w in words[:size]:
+        h = (h * _BASE + w) & _MASK
+    hashes = [h]
+    append = hashes.append
+    for i in range(size, len(words)):
+        h = ((h - words[i - size] * top) * _BASE + words[i]) & _MASK
+        append(h)
+    return hashes
+
+
+def shingle_hashes(text: str, size: int = SHINGLE_SIZE) -> set[int]:
+    """Return the set of ``text``'s ``size``-word shingle hashes.
+
+    Args:
+        text: The text to shingle.
+        size: Words per shingle.
+
+    Returns:
+        The distinct hashes from ``shingle_sequence()``.
+    """
+    return set(shingle_sequence(text, size))
+
+
+def _minhash(shingles: set[int]) -> tuple[int, ...]:
+    """One-permutation MinHash with rotation densification."""
+    empty = _VALUE_MASK + 1
+    bins = [empty] * SIGNATURE_SIZE
+    for s in shingles:
+        m = (s * _MIX) & _MASK
+        b = m >> _BIN_SHIFT
+        v = m & _VALUE_MASK
+        if v < bins[b]:
+            bins[b] = v
+    # Fill each empty bin from the next originally non-empty bin to its
+    # right (circularly), offset by the distance so a borrowed value never
+    # equals a real one. The caller guarantees at least one shingle.
+    original = bins[:]
+    for i in range(SIGNATURE_SIZE):
+        if original[i] != empty:
+            continue
+        distance = 1
+        while original[(i + distance) % SIGNATURE_SIZE] == empty:
+            distance += 1
+        bins[i] = original[(i + distance) % SIGNATURE_SIZE] + empty * distance
+    return tuple(bins)
+
+
+class ContentSignature:
+    """Shingle set and MinHash signature of one text.
+
+    Attributes:
+        shingles: Hashed word shingles, for the exact similarity check.
+        minhash: ``SIGNATURE_SIZE`` MinHash values, for LSH banding.
+    """
+
+    __slots__ = ("minhash", "shingles")
+
+    def __init__(self, shingles: frozenset[int], minhash: tuple[int, ...]) -> None:
+        self.shingles = shingles
+        self.minhash = minhash
+
+    @classmethod
+    def of(cls, text: str) -> ContentSignature | None:
+        """Signature of ``text``, or None if it has under ``MIN_SHINGLES``."""
+        shingles = shingle_hashes(text)
+        if len(shingles) < MIN_SHINGLES:
+            return None
+        return cls(frozenset(shingles), _minhash(shingles))
+
+    def jaccard(self, other: ContentSignature) -> float:
+        """Exact Jaccard similarity of the two shingle sets."""
+        small, large = sorted((self.shingles, other.shingles), key=len)
+        shared = len(small & large)
+        return shared / (len(small) + len(large) - shared)
+
+
+class ContentCache(ABC, Generic[_T]):
+    """Bounded cache of values derived from a text, keyed by its hash.
+
+    Keys depend only on the text, so one cache can be shared by every
+    pipeline run (and every ecosystem) in a process. When full, the
+    oldest entry is dropped. Subclasses implement ``_compute``. Safe to share
+    between threads; a value may be computed twice by racing lookups.
+
+    Attributes:
+        max_entries: Upper bound on the number of cached values.
+        hits: Lookups answered from the cache.
+        misses: Lookups that computed a value.
+    """
+
+    __slots__ = ("_entries", "_lock", "hits", "max_entries", "misses")
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_ENTRIES) -> None:
+        """Create an empty cache.
+
+        Raises:
+            ValueError: If ``max_entries`` is less than 1.
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[bytes, _T] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @abstractmethod
+    def _compute(self, text: str) -> _T:
+        """Derive the value for ``text`` (called on a miss)."""
+
+    def get(self, text: str) -> _T:
+        """Return the (possibly cached) value for ``text``."""
+        key = hashlib.blake2b(
+            text.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+        with self._lock:
+            try:
+                result = self._entries[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self.hits += 1
+                return result
+        result = self._compute(text)
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = result
+        return result
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+class SignatureCache(ContentCache["ContentSignature | None"]):
+    """Content-hash cache of ``ContentSignature`` (None for short texts).
+
+    Example:
+        >>> cache = SignatureCache()
+        >>> sig = cache.signature(page_text)
+        >>> cache.signature(page_text) is sig
+        True
+    """
+
+    __slots__ = ()
+
+    def _compute(self, text: str) -> ContentSignature | None:
+        return ContentSignature.of(text)
+
+    def signature(self, text: str) -> ContentSignature | None:
+        """Return the (possibly cached) signature of ``text``."""
+        return self.get(text)
+
+
+class SimilarPair(NamedTuple):
+    """Items ``first < second`` with exact Jaccard ``similarity``."""
+
+    first: int
+    second: int
+    similarity: float
+
+
+def find_similar_pairs(
+    signatures: Sequence[ContentSignature | None],
+    threshold: float,
+) -> list[SimilarPair]:
+    """Find item pairs whose exact Jaccard similarity exceeds ``threshold``.
+
+    Candidates come from LSH banding; only they are compared exactly.
+    Items whose signature is None are ignored.
+
+    Args:
+        signatures: One signature (or None) per item.
+        threshold: Similarity a pair must exceed to be reported.
+
+    Returns:
+        Pairs ordered by ``(first, second)``.
+    """
+    present = {i: sig for i, sig in enumerate(signatures) if sig is not None}
+    candidates: set[tuple[int, int]] = set()
+    for band in range(BANDS):
+        lo = band * ROWS
+        buckets: dict[tuple[int, ...], array[int]] = {}
+        for i, sig in present.items():
+            key = sig.minhash[lo : lo + ROWS]
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = array("q", [i])
+                continue
+            for j in bucket:
+                candidates.add((j, i))
+            bucket.append(i)
+
+    pairs = []
+    for i, j in sorted(candidates):
+        similarity = present[i].jaccard(present[j])
+        if similarity > threshold:
+            pairs.append(SimilarPair(i, j, similarity))
+    return pairs
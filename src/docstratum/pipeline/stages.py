@@ -20,6 +20,8 @@ The five stages are:
 Design decisions:
     - ``Protocol`` (not ABC) for ``PipelineStage``: stages are duck-typed, which
       allows third-party stages without inheritance coupling.
+    - ``AsyncPipelineStage`` is an optional second protocol: a stage that also
+      defines ``execute_async()`` runs natively under ``AsyncEcosystemPipeline``.
     - ``PipelineContext`` is a Pydantic model, not a dict: typed fields prevent
       the "stringly-typed context bag" anti-pattern.
     - ``StageResult`` captures duration and diagnostics for observability.
@@ -42,10 +44,11 @@ from __future__ import annotations
 import logging
 import time
 from enum import IntEnum, StrEnum
-from typing import Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
+from docstratum.pipeline.profiling import StageProfile
 from docstratum.schema.classification import DocumentClassification
 from docstratum.schema.diagnostics import DiagnosticCode
 from docstratum.schema.ecosystem import (
@@ -58,6 +61,10 @@ from docstratum.schema.parsed import ParsedLlmsTxt
 from docstratum.schema.quality import QualityScore
 from docstratum.schema.validation import ValidationDiagnostic, ValidationResult
 
+if TYPE_CHECKING:
+    from docstratum.pipeline.ecosystem_index import EcosystemIndex
+    from docstratum.pipeline.graph import RelationshipGraph
+
 logger = logging.getLogger(__name__)
 
 
@@ -124,6 +131,11 @@ class StageResult(BaseModel):
                      ``validation`` field, not here.
         duration_ms: Wall-clock execution time in milliseconds.
         message: Human-readable summary of what happened (for logging).
+        node_timings: Milliseconds spent in each named unit of work inside
+                      the stage (e.g. one entry per Stage 4 check, or per
+                      scheduler node when run by the DAG scheduler).
+        profile: CPU/memory profile of the stage when the run was started
+                 with ``profile=True`` (see ``profiling.py``), else None.
 
     Example:
         >>> result = StageResult(
@@ -156,6 +168,14 @@ class StageResult(BaseModel):
         default="",
         description="Human-readable summary for logging.",
     )
+    node_timings: dict[str, float] = Field(
+        default_factory=dict,
+        description="Milliseconds per named unit of work within the stage.",
+    )
+    profile: StageProfile | None = Field(
+        default=None,
+        description="CPU and memory profile, for runs with profile=True.",
+    )
 
 
 # ── Pipeline Context ────────────────────────────────────────────────
@@ -234,6 +254,11 @@ class PipelineContext(BaseModel):
         description="Project name from llms.txt H1 title.",
     )
 
+    # Cache for ``EcosystemIndex.of(context)``, shared by Stages 4 and 5.
+    _ecosystem_index: EcosystemIndex | None = PrivateAttr(default=None)
+    # Cache for ``RelationshipGraph.of(context)``, built by Stage 3.
+    _relationship_graph: RelationshipGraph | None = PrivateAttr(default=None)
+
 
 # ── Pipeline Stage Protocol ─────────────────────────────────────────
 # Every stage implements this interface. The orchestrator iterates over
@@ -284,6 +309,41 @@ class PipelineStage(Protocol):
         ...
 
 
+@runtime_checkable
+class AsyncPipelineStage(Protocol):
+    """Interface for stages with a native asyncio implementation.
+
+    ``AsyncEcosystemPipeline`` awaits ``execute_async()`` on stages that
+    provide it; any other ``PipelineStage`` has its blocking ``execute()``
+    run in a worker thread instead. A stage may implement both.
+
+    Example:
+        >>> class MyAsyncStage:
+        ...     @property
+        ...     def stage_id(self) -> PipelineStageId:
+        ...         return PipelineStageId.DISCOVERY
+        ...     async def execute_async(self, context: PipelineContext) -> StageResult:
+        ...         await asyncio.sleep(0)  # ... non-blocking work ...
+        ...         return StageResult(stage=self.stage_id, status=StageStatus.SUCCESS)
+    """
+
+    @property
+    def stage_id(self) -> PipelineStageId:
+        """The ordinal identifier for this stage."""
+        ...
+
+    async def execute_async(self, context: PipelineContext) -> StageResult:
+        """Execute this stage without blocking the event loop.
+
+        Args:
+            context: The mutable pipeline context.
+
+        Returns:
+            A StageResult describing the outcome.
+        """
+        ...
+
+
 # ── Single-File Validator Protocol ──────────────────────────────────
 # Defines the interface for the L0–L4 single-file pipeline that will
 # be built in later phases. The Per-File stage (Stage 2) delegates to
@@ -400,3 +460,74 @@ class StageTimer:
     def elapsed_ms(self) -> float:
         """The most recently measured elapsed time in milliseconds."""
         return self._elapsed_ms
+
+
+# ── Stage Result Helpers ────────────────────────────────────────────
+# Shared by EcosystemPipeline and AsyncEcosystemPipeline so both runners
+# skip, fail, and log stages identically.
+
+
+def skip_result(
+    stage_id: PipelineStageId,
+    stop_after: PipelineStageId | None,
+    context: PipelineContext,
+) -> StageResult | None:
+    """Return a SKIPPED result if the stage must not run, else None.
+
+    A stage is skipped when it comes after ``stop_after`` or when the
+    previous stage failed.
+    """
+    if stop_after is not None and stage_id > stop_after:
+        reason = f"Skipped (stop_after={stop_after.name})"
+    elif (
+        context.stage_results and context.stage_results[-1].status == StageStatus.FAILED
+    ):
+        reason = "Skipped due to previous stage failure"
+    else:
+        return None
+    logger.info("Skipping stage %d (%s): %s", stage_id.value, stage_id.name, reason)
+    return StageResult(stage=stage_id, status=StageStatus.SKIPPED, message=reason)
+
+
+def exception_result(stage_id: PipelineStageId, exc: Exception) -> StageResult:
+    """FAILED result for a stage that raised ``exc``."""
+    logger.error(
+        "Stage %d (%s) raised an exception: %s",
+        stage_id.value,
+        stage_id.name,
+        exc,
+    )
+    return StageResult(
+        stage=stage_id,
+        status=StageStatus.FAILED,
+        message=f"Exception: {exc}",
+    )
+
+
+def record_result(context: PipelineContext, result: StageResult) -> None:
+    """Append a stage result to the context and log it."""
+    context.stage_results.append(result)
+    if result.status == StageStatus.SKIPPED:
+        return
+    logger.info(
+        "Stage %d (%s) completed: status=%s, duration=%.1fms — %s",
+        result.stage.value,
+        result.stage.name,
+        result.status.value,
+        result.duration_ms,
+        result.message,
+    )
+
+
+def log_summary(context: PipelineContext, elapsed: float) -> None:
+    """Log how many stages succeeded, failed, and were skipped."""
+    counts = {status: 0 for status in StageStatus}
+    for result in context.stage_results:
+        counts[result.status] += 1
+    logger.info(
+        "Ecosystem pipeline complete: %d succeeded, %d failed, %d skipped in %.1fms",
+        counts[StageStatus.SUCCESS],
+        counts[StageStatus.FAILED],
+        counts[StageStatus.SKIPPED],
+        elapsed,
+    )
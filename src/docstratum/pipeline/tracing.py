@@ -0,0 +1,260 @@
+"""Execution tracing in the Chrome trace-event format.
+
+Per-stage ``duration_ms`` and ``node_timings`` are totals; they do not
+show *when* work ran. With a ``ChromeTracer`` the pipeline records a
+timeline, one span per unit of work on the thread (or process) that ran
+it:
+
+    pipeline   One per ``run()`` / ``resume()``.
+    stage      One per stage that ran, named after the stage; under
+               ``scheduler="dag"`` also the ``index:*`` nodes.
+    file       One per file processed in Stage 2, named after the file,
+               with ``read`` / ``parse`` / ``classify`` / ``validate`` /
+               ``score`` spans nested inside.
+    check      One per Stage 4 ecosystem check.
+
+``ChromeTracer.save()`` writes the trace-event JSON that Perfetto
+(ui.perfetto.dev) and ``chrome://tracing`` load. Gaps on a worker's track
+are time the worker sat idle.
+
+File spans are measured inside ``run_file`` (``time.perf_counter()``),
+so they place the work on the worker that did it, including process-pool
+workers, which show up as their own process. ``perf_counter()`` is a
+system-wide monotonic clock on Linux, macOS, and Windows, so timestamps
+from workers line up with the parent's.
+
+Overhead: the default ``NULL_TRACER`` has ``enabled = False`` and its
+``span()`` returns one shared no-op context manager, so an untraced run
+pays a method call per stage and per check, and an attribute test per
+file.
+
+Classes:
+    Tracer: Protocol the pipeline records spans through.
+    NullTracer: Records nothing (the default).
+    ChromeTracer: Collects spans and writes trace-event JSON.
+
+Example:
+    >>> tracer = ChromeTracer()
+    >>> EcosystemPipeline(ParserAdapter(), jobs=4, tracer=tracer).run(root)
+    >>> tracer.save("pipeline-trace.json")   # open in ui.perfetto.dev
+
+Related:
+    - src/docstratum/pipeline/orchestrator.py: Pipeline, stage, node spans
+    - src/docstratum/pipeline/per_file.py: File and step spans
+    - src/docstratum/pipeline/ecosystem_validator.py: Check spans
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import AbstractContextManager, nullcontext
+from types import TracebackType
+from typing import Any, Protocol, runtime_checkable
+
+_NULL_SPAN: AbstractContextManager[None] = nullcontext()
+
+
+@runtime_checkable
+class Tracer(Protocol):
+    """Receives the pipeline's spans.
+
+    Attributes:
+        enabled: False if spans are discarded; callers skip building
+            span arguments when it is.
+    """
+
+    enabled: bool
+
+    def span(
+        self, name: str, category: str, args: dict[str, Any] | None = None
+    ) -> AbstractContextManager[None]:
+        """Context manager recording the enclosed block as a span."""
+        ...
+
+    def complete(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        end: float,
+        *,
+        worker: tuple[int, int, str] | None = None,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        """Record a span measured elsewhere.
+
+        Args:
+            name: Span name.
+            category: Span category (``"file"``, ``"check"``, ...).
+            start: ``time.perf_counter()`` at the start.
+            end: ``time.perf_counter()`` at the end.
+            worker: ``(pid, thread id, thread name)`` that did the work;
+                the calling thread if None.
+            args: Extra values shown with the span.
+        """
+        ...
+
+
+class NullTracer:
+    """Tracer that records nothing; the pipeline's default."""
+
+    enabled = False
+
+    def span(
+        self, name: str, category: str, args: dict[str, Any] | None = None
+    ) -> AbstractContextManager[None]:
+        """Return a shared no-op context manager."""
+        return _NULL_SPAN
+
+    def complete(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        end: float,
+        *,
+        worker: tuple[int, int, str] | None = None,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        """Discard the span."""
+
+
+NULL_TRACER = NullTracer()
+"""The shared disabled tracer."""
+
+
+def current_worker() -> tuple[int, int, str]:
+    """``(pid, thread id, thread name)`` of the calling thread."""
+    thread = threading.current_thread()
+    return os.getpid(), threading.get_ident(), thread.name
+
+
+class _Span:
+    """Times a ``with`` block and hands it to a ChromeTracer."""
+
+    __slots__ = ("_args", "_category", "_name", "_start", "_tracer")
+
+    def __init__(
+        self,
+        tracer: ChromeTracer,
+        name: str,
+        category: str,
+        args: dict[str, Any] | None,
+    ) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._category = category
+        self._args = args
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        args = self._args
+        if exc_type is not None:
+            args = {**(args or {}), "error": repr(exc)}
+        self._tracer.complete(
+            self._name, self._category, self._start, time.perf_counter(), args=args
+        )
+
+
+class ChromeTracer:
+    """Collects spans as Chrome trace events (complete, ``"ph": "X"``).
+
+    Safe to use from several threads. Timestamps are microseconds since
+    the tracer was created. One tracer can record several runs.
+
+    Attributes:
+        enabled: Always True.
+    """
+
+    enabled = True
+
+    def __init__(self) -> None:
+        self._origin = time.perf_counter()
+        self._events: list[dict[str, Any]] = []
+        self._threads: dict[tuple[int, int], str] = {}
+        self._lock = threading.Lock()
+
+    def span(
+        self, name: str, category: str, args: dict[str, Any] | None = None
+    ) -> AbstractContextManager[None]:
+        """Context manager recording the enclosed block as a span.
+
+        A span left by an exception records it in ``args["error"]``.
+        """
+        return _Span(self, name, category, args)
+
+    def complete(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        end: float,
+        *,
+        worker: tuple[int, int, str] | None = None,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        """Record a span measured elsewhere (see ``Tracer.complete``)."""
+        pid, tid, thread_name = worker or current_worker()
+        event: dict[str, Any] = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self._origin) * 1e6,
+            "dur": max(end - start, 0.0) * 1e6,
+            "pid": pid,
+            "tid": tid,
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self._events.append(event)
+            self._threads.setdefault((pid, tid), thread_name)
+
+    def events(self) -> list[dict[str, Any]]:
+        """Thread-name metadata events, then the spans in start order."""
+        with self._lock:
+            spans = sorted(self._events, key=lambda e: e["ts"])
+            threads = dict(self._threads)
+        metadata = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": tid,
+                "args": {"name": name},
+            }
+            for (pid, tid), name in threads.items()
+        ]
+        return metadata + spans
+
+    def to_json(self) -> str:
+        """The trace as a Chrome trace-event JSON document."""
+        return json.dumps(
+            {"traceEvents": self.events(), "displayTimeUnit": "ms"},
+            default=str,
+        )
+
+    def save(self, path: str) -> None:
+        """Write the trace to ``path`` (parent directories are created)."""
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write(self.to_json())
+
+    def clear(self) -> None:
+        """Drop the recorded spans."""
+        with self._lock:
+            self._events.clear()
+            self._threads.clear()
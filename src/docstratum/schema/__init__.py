@@ -21,6 +21,7 @@ from docstratum.schema.classification import (
 from docstratum.schema.constants import (
     ANTI_PATTERN_REGISTRY,
     CANONICAL_SECTION_ORDER,
+    FULL_CANONICAL_COVERAGE,
     SECTION_NAME_ALIASES,
     TOKEN_BUDGET_TIERS,
     TOKEN_ZONE_ANTI_PATTERN,
@@ -30,6 +31,7 @@ from docstratum.schema.constants import (
     AntiPatternCategory,
     AntiPatternEntry,
     AntiPatternID,
+    CanonicalCoverage,
     CanonicalSectionName,
     TokenBudgetTier,
 )
@@ -72,6 +74,7 @@ __all__ = [
     # Constants
     "ANTI_PATTERN_REGISTRY",
     "CANONICAL_SECTION_ORDER",
+    "FULL_CANONICAL_COVERAGE",
     "SECTION_NAME_ALIASES",
     "TOKEN_BUDGET_TIERS",
     "TOKEN_ZONE_ANTI_PATTERN",
@@ -81,6 +84,7 @@ __all__ = [
     "AntiPatternCategory",
     "AntiPatternEntry",
     "AntiPatternID",
+    "CanonicalCoverage",
     "CanonicalSectionName",
     # [v0.1.2d] Enrichment models
     "Concept",
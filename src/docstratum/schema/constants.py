@@ -16,8 +16,11 @@ All values are derived from empirical research:
 Traces to: FR-079 (ecosystem anti-pattern detection)
 """
 
+from __future__ import annotations
+
 import logging
-from enum import StrEnum
+from collections.abc import Iterable
+from enum import IntFlag, StrEnum
 from typing import NamedTuple
 
 logger = logging.getLogger(__name__)
@@ -98,6 +101,59 @@ SECTION_NAME_ALIASES: dict[str, CanonicalSectionName] = {
     "extras": CanonicalSectionName.OPTIONAL,
 }
 
+
+class CanonicalCoverage(IntFlag):
+    """Bitmask of canonical section categories, one bit per category.
+
+    Member names match ``CanonicalSectionName``. Per-file masks are
+    computed once in Stage 2 (``EcosystemFile.coverage``); ecosystem
+    coverage is the bitwise OR of the per-file masks, and a gap is
+    ``FULL_CANONICAL_COVERAGE & ~covered``.
+
+    Example:
+        >>> mask = CanonicalCoverage.of([CanonicalSectionName.FAQ])
+        >>> mask |= CanonicalCoverage.EXAMPLES
+        >>> mask.count, sorted(c.value for c in mask.categories())
+        (2, ['Examples', 'FAQ'])
+    """
+
+    NONE = 0
+    MASTER_INDEX = 1 << 0
+    LLM_INSTRUCTIONS = 1 << 1
+    GETTING_STARTED = 1 << 2
+    CORE_CONCEPTS = 1 << 3
+    API_REFERENCE = 1 << 4
+    EXAMPLES = 1 << 5
+    CONFIGURATION = 1 << 6
+    ADVANCED_TOPICS = 1 << 7
+    TROUBLESHOOTING = 1 << 8
+    FAQ = 1 << 9
+    OPTIONAL = 1 << 10
+
+    @classmethod
+    def of(cls, categories: Iterable[CanonicalSectionName]) -> CanonicalCoverage:
+        """Mask with the bit of each given category set."""
+        mask = cls.NONE
+        for category in categories:
+            mask |= cls[category.name]
+        return mask
+
+    @property
+    def count(self) -> int:
+        """Number of categories covered."""
+        return self.bit_count()
+
+    def categories(self) -> frozenset[CanonicalSectionName]:
+        """The covered categories as CanonicalSectionName members."""
+        return frozenset(
+            c for c in CanonicalSectionName if self & CanonicalCoverage[c.name]
+        )
+
+
+FULL_CANONICAL_COVERAGE = CanonicalCoverage.of(CanonicalSectionName)
+"""Mask with every canonical category covered."""
+
+
 # Canonical section ordering (position in the 10-step sequence).
 # OPTIONAL has no fixed position — it is always last.
 CANONICAL_SECTION_ORDER: dict[CanonicalSectionName, int] = {
@@ -46,6 +46,7 @@ from enum import StrEnum
 from pydantic import BaseModel, Field
 
 from docstratum.schema.classification import DocumentClassification, DocumentType
+from docstratum.schema.constants import CanonicalCoverage
 from docstratum.schema.parsed import LinkRelationship, ParsedLlmsTxt
 from docstratum.schema.quality import DimensionScore, QualityGrade, QualityScore
 from docstratum.schema.validation import ValidationResult
@@ -225,6 +226,8 @@ class EcosystemFile(BaseModel):
         validation: Per-file validation results from the L0–L4 pipeline.
                     None if validation hasn't run yet.
         quality: Per-file quality score. None if scoring hasn't run yet.
+        coverage: Canonical section categories the parsed file covers, as a
+                  bitmask. Set in Per-File Validation; None if not parsed.
         relationships: Directed relationships from this file to other
                        ecosystem files. Populated during Relationship Mapping.
 
@@ -266,6 +269,13 @@ class EcosystemFile(BaseModel):
         default=None,
         description="Per-file quality score. None before scoring.",
     )
+    coverage: CanonicalCoverage | None = Field(
+        default=None,
+        description=(
+            "Bitmask of canonical section categories covered by the parsed "
+            "file. None before Per-File Validation or if parsing failed."
+        ),
+    )
     relationships: list[FileRelationship] = Field(
         default_factory=list,
         description=(
@@ -5,6 +5,7 @@ import pytest
 from docstratum.schema.constants import (
     ANTI_PATTERN_REGISTRY,
     CANONICAL_SECTION_ORDER,
+    FULL_CANONICAL_COVERAGE,
     SECTION_NAME_ALIASES,
     TOKEN_BUDGET_TIERS,
     TOKEN_ZONE_ANTI_PATTERN,
@@ -13,6 +14,7 @@ from docstratum.schema.constants import (
     TOKEN_ZONE_OPTIMAL,
     AntiPatternCategory,
     AntiPatternID,
+    CanonicalCoverage,
     CanonicalSectionName,
 )
 
@@ -42,6 +44,29 @@ def test_canonical_section_order():
     assert positions == list(range(1, 11))
 
 
+@pytest.mark.unit
+def test_canonical_coverage_has_one_bit_per_section():
+    """Verify each canonical name has its own bit and FULL covers all 11."""
+    bits = [CanonicalCoverage[c.name] for c in CanonicalSectionName]
+    assert len(set(bits)) == 11
+    assert all(bit.count == 1 for bit in bits)
+    assert FULL_CANONICAL_COVERAGE.count == 11
+    assert FULL_CANONICAL_COVERAGE.categories() == frozenset(CanonicalSectionName)
+
+
+@pytest.mark.unit
+def test_canonical_coverage_set_operations():
+    """Verify of()/categories() round-trip and gaps are bitwise."""
+    chosen = {CanonicalSectionName.FAQ, CanonicalSectionName.EXAMPLES}
+    mask = CanonicalCoverage.of(chosen)
+    assert mask.categories() == chosen
+    assert (mask | CanonicalCoverage.FAQ) == mask
+    missing = FULL_CANONICAL_COVERAGE & ~mask
+    assert missing.count == 9
+    assert missing.categories() == set(CanonicalSectionName) - chosen
+    assert CanonicalCoverage.of([]) == CanonicalCoverage.NONE
+
+
 @pytest.mark.unit
 def test_token_budget_tiers():
     """Verify token budget tiers consistency."""
@@ -0,0 +1,195 @@
+"""Tests for the persistent parse cache (ParseCache + ParserAdapter).
+
+Tests cover key derivation, hit/miss counting, parity between cached and
+freshly parsed results, persistence across instances, LRU eviction, and
+pickling for process-pool workers.
+See RR-META-testing-standards for naming conventions and fixture patterns.
+"""
+
+import pickle
+
+import pytest
+
+from docstratum.parser import cache as cache_module
+from docstratum.parser.cache import ParseCache
+from docstratum.parser.validator_adapter import ParserAdapter
+
+CONTENT = "# Title\n\n> Summary\n\n## Docs\n\n- [Guide](https://x.io/g): Guide\n"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """A fresh cache database in a temporary directory."""
+    c = ParseCache(tmp_path / "cache" / "parse.db")
+    yield c
+    c.close()
+
+
+class TestParseCacheKeys:
+    """Cache keys depend on everything that affects the result."""
+
+    def test_key_varies_with_content_filename_and_config(self, tmp_path):
+        """Verify content, filename, and config each change the key."""
+        # Arrange
+        plain = ParseCache(tmp_path / "a.db")
+        configured = ParseCache(tmp_path / "b.db", config={"strict": True})
+
+        # Act
+        base = plain.key(CONTENT, "llms.txt")
+
+        # Assert
+        assert base == plain.key(CONTENT, "llms.txt")
+        assert base != plain.key(CONTENT + "\n", "llms.txt")
+        assert base != plain.key(CONTENT, "llms-full.txt")
+        assert base != configured.key(CONTENT, "llms.txt")
+        assert base != plain.key(CONTENT, "llms.txt", "fuzzy-sections:0.8")
+
+    def test_invalid_max_bytes_rejected(self, tmp_path):
+        """Verify max_bytes < 1 raises ValueError."""
+        with pytest.raises(ValueError, match="max_bytes"):
+            ParseCache(tmp_path / "c.db", max_bytes=0)
+
+
+class TestCachedAdapter:
+    """ParserAdapter with a cache returns the same results as without."""
+
+    def test_second_parse_is_a_hit_with_identical_results(self, cache):
+        """Verify a repeated parse/classify is served from the cache."""
+        # Arrange
+        adapter = ParserAdapter(cache=cache)
+        expected = ParserAdapter().parse_session(CONTENT, "llms.txt")
+
+        # Act
+        first = adapter.parse(CONTENT, "llms.txt")
+        first_cls = adapter.classify(first)
+        second = adapter.parse(CONTENT, "llms.txt")
+        second_cls = adapter.classify(second)
+
+        # Assert
+        stats = cache.stats()
+        assert (stats.hits, stats.misses) == (2, 2)
+        assert second.model_dump(exclude={"parsed_at"}) == (
+            expected.document.model_dump(exclude={"parsed_at"})
+        )
+        assert second_cls == first_cls
+        session = adapter.session_for(second)
+        assert session.file_meta == expected.file_meta
+        assert session.source.text == expected.source.text
+
+    def test_cache_persists_across_instances(self, tmp_path):
+        """Verify a new cache over the same file sees earlier entries."""
+        # Arrange
+        path = tmp_path / "parse.db"
+        ParserAdapter(cache=ParseCache(path)).parse(CONTENT, "llms.txt")
+
+        # Act
+        reopened = ParseCache(path)
+        ParserAdapter(cache=reopened).parse(CONTENT, "llms.txt")
+
+        # Assert
+        assert reopened.stats().hits == 1
+        assert reopened.stats().entries == 1
+
+    def test_adapter_pickles_with_cache(self, cache):
+        """Verify process-pool pickling keeps the cache (by path)."""
+        # Arrange
+        ParserAdapter(cache=cache).parse(CONTENT, "llms.txt")
+
+        # Act
+        clone = pickle.loads(pickle.dumps(ParserAdapter(cache=cache)))
+        clone.parse(CONTENT, "llms.txt")
+
+        # Assert
+        assert clone.cache.path == cache.path
+        assert clone.cache.stats().hits == 1
+
+    def test_unpickling_defers_the_connection(self, cache, monkeypatch):
+        """Verify a worker connects once, on first use, not per unpickle."""
+        # Arrange
+        opened = []
+        connect = cache_module._Database.__init__
+
+        def counting_connect(self, path):
+            opened.append(path)
+            connect(self, path)
+
+        monkeypatch.setattr(cache_module._Database, "__init__", counting_connect)
+        data = pickle.dumps(ParserAdapter(cache=cache))
+
+        # Act
+        clones = [pickle.loads(data) for _ in range(5)]
+        before_use = len(opened)
+        for clone in clones:
+            clone.parse(CONTENT, "llms.txt")
+
+        # Assert
+        assert before_use == 0
+        assert len(opened) <= 1
+
+
+class TestParseCacheEviction:
+    """Size-bounded LRU eviction."""
+
+    def test_least_recently_used_entries_evicted(self, tmp_path):
+        """Verify the entry not touched recently is evicted first."""
+        # Arrange — entries of equal size; the bound fits exactly two
+        cache = ParseCache(tmp_path / "lru.db")
+        keys = [cache.key(str(i), "llms.txt") for i in range(3)]
+        cache.put_session(keys[0], "entry-0")
+        cache.max_bytes = 2 * cache.stats().size_bytes
+
+        # Act
+        cache.put_session(keys[1], "entry-1")
+        cache.get_session(keys[0])  # keys[1] is now least recently used
+        cache.put_session(keys[2], "entry-2")
+
+        # Assert
+        assert cache.stats().evictions == 1
+        assert cache.get_session(keys[1]) is None
+        assert cache.get_session(keys[0]) == "entry-0"
+        assert cache.get_session(keys[2]) == "entry-2"
+
+    def test_clear_resets_entries_and_counters(self, cache):
+        """Verify clear() empties the database and the counters."""
+        key = cache.key(CONTENT, "llms.txt")
+        cache.put_session(key, "{}")
+        cache.get_session(key)
+
+        cache.clear()
+
+        assert tuple(cache.stats()) == (0, 0, 0, 0, 0)
+
+    def test_eviction_drains_many_entries_in_batches(self, tmp_path):
+        """Verify one large write evicts more than a batch of older entries."""
+        # Arrange — 100 small entries, then a bound that fits only the last
+        cache = ParseCache(tmp_path / "batch.db")
+        for i in range(100):
+            cache.put_session(cache.key(str(i), "llms.txt"), f"entry-{i:03d}")
+        entry_size = cache.stats().size_bytes // 100
+        cache.max_bytes = 2 * entry_size - 1
+
+        # Act
+        cache.put_session(cache.key("last", "llms.txt"), "entry-999")
+
+        # Assert
+        stats = cache.stats()
+        assert stats.entries == 1
+        assert stats.evictions == 100
+        assert cache.get_session(cache.key("last", "llms.txt")) == "entry-999"
+
+    def test_running_size_tracks_replacements_and_reopen(self, tmp_path):
+        """Verify the running total matches the database after each write."""
+        # Arrange
+        path = tmp_path / "size.db"
+        cache = ParseCache(path)
+        key = cache.key(CONTENT, "llms.txt")
+
+        # Act
+        cache.put_session(key, "x" * 50)
+        cache.put_session(key, "short")
+        cache.put_classification(key, '{"document_type": "type_1_index"}')
+        reopened = ParseCache(path)
+
+        # Assert
+        assert cache._database().size == cache.stats().size_bytes
+        assert reopened._database() is cache._database()
@@ -10,6 +10,7 @@ See RR-META-testing-standards for naming conventions and fixture patterns.
 import copy
 
 from docstratum.parser.classifier import (
+    _count_h1_headings,
     assign_size_tier,
     classify_document,
     classify_document_type,
@@ -317,6 +318,30 @@ class TestH1Counting:
         # Assert -- should NOT be TYPE_2_FULL despite many headings
         assert result == DocumentType.TYPE_1_INDEX
 
+    def test_h1_count_matches_line_by_line_scan(self):
+        """Verify the regex scan agrees with a splitlines() reference."""
+
+        def reference(raw: str) -> int:
+            count, in_code = 0, False
+            for line in raw.splitlines():
+                if line.startswith("```"):
+                    in_code = not in_code
+                elif not in_code and line.startswith("# "):
+                    count += 1
+            return count
+
+        samples = [
+            "",
+            "# One",
+            "# A\n# B\n",
+            "x # not\n #indented\n#nospace\n# yes\n",
+            "# A\r\n```\r\n# hidden\r\n```\r\n# B\r",
+            "# A\x0c# B\u2028# C\x85```\n# hidden",
+            "```\n# unclosed fence\n# still hidden\n",
+        ]
+        for raw in samples:
+            assert _count_h1_headings(raw) == reference(raw), repr(raw)
+
 
 # ── Immutability ────────────────────────────────────────────────────
 
@@ -5,12 +5,14 @@ Tests the ``ParserAdapter`` class that bridges the parser pipeline to the
 enrichments, classification, stub validation/scoring, and full pipeline
 integration through the ``EcosystemPipeline`` orchestrator.
 
-10 tests:
+16 tests:
     - Protocol compliance (1)
     - Parse behavior (3: basic parse, enrichments, metadata)
+    - Parse sessions / reentrancy (5)
     - Classify behavior (1)
     - Validate/Score stubs (2)
-    - Full pipeline integration (3: single file, multi file, broken file)
+    - Full pipeline integration (4: single file, multi file, broken file,
+      process backend)
 
 See:
     - docs/design/03-parser/RR-SPEC-v0.2.2d-pipeline-integration.md
@@ -23,7 +25,7 @@ from pathlib import Path
 
 import pytest
 
-from docstratum.parser.validator_adapter import ParserAdapter
+from docstratum.parser.validator_adapter import ParserAdapter, ParseSession
 from docstratum.pipeline.orchestrator import EcosystemPipeline
 from docstratum.pipeline.stages import SingleFileValidator
 from docstratum.schema.classification import DocumentClassification, DocumentType
@@ -108,10 +110,10 @@ class TestParserAdapter:
         assert doc.sections[0].canonical_name == "Getting Started"
 
     def test_parse_extracts_metadata(self):
-        """parse() calls extract_metadata; result is stashed on adapter.
+        """parse() calls extract_metadata; result travels on the session.
 
         ``ParsedLlmsTxt`` does not have a ``metadata`` field, so the
-        extraction result is stored as ``_last_metadata`` on the adapter.
+        extraction result is carried by the document's ``ParseSession``.
         The document itself should still parse correctly despite the
         YAML frontmatter being present.
 
@@ -132,10 +134,12 @@ class TestParserAdapter:
         # Act
         doc = adapter.parse(content, "llms.txt")
 
-        # Assert — metadata extracted and stashed
-        assert adapter._last_metadata is not None
-        assert adapter._last_metadata.site_name == "Test Project"
-        assert adapter._last_metadata.generator == "manual"
+        # Assert — metadata extracted and attached to the document's session
+        session = adapter.session_for(doc)
+        assert session is not None
+        assert session.metadata is not None
+        assert session.metadata.site_name == "Test Project"
+        assert session.metadata.generator == "manual"
         # Doc still parses correctly (frontmatter stripped before tokenizing)
         assert doc.title == "Test"
 
@@ -207,6 +211,90 @@ class TestParserAdapter:
         assert len(quality.dimensions) == 3
 
 
+class TestParseSession:
+    """Reentrancy of ParserAdapter: per-call sessions instead of last-call state."""
+
+    def test_parse_session_carries_file_metadata(self):
+        """parse_session() bundles the document with its FileMetadata and Metadata."""
+        # Arrange
+        adapter = ParserAdapter()
+        content = "---\nsite_name: Demo\n---\r\n# Demo\r\n"
+
+        # Act
+        session = adapter.parse_session(content, "llms.txt")
+
+        # Assert
+        assert isinstance(session, ParseSession)
+        assert session.document.title == "Demo"
+        assert session.file_meta.byte_count == len(content.encode("utf-8"))
+        assert session.metadata is not None
+        assert session.metadata.site_name == "Demo"
+        assert adapter.session_for(session.document) is None  # not registered
+
+    def test_interleaved_parse_classify_uses_own_metadata(self):
+        """classify(doc) uses doc's own FileMetadata even after other parses.
+
+        CRLF content has a larger raw byte count than its LF-normalized
+        ``raw_content``; the classification must reflect the raw bytes.
+        """
+        # Arrange
+        adapter = ParserAdapter()
+        crlf = "# CRLF\r\n\r\n> Windows line endings\r\n" * 20
+        first = adapter.parse(crlf, "a.txt")
+        second = adapter.parse("# Small\n", "b.txt")
+
+        # Act — classify in the opposite order to parsing
+        second_cls = adapter.classify(second)
+        first_cls = adapter.classify(first)
+
+        # Assert
+        assert first_cls.size_bytes == len(crlf.encode("utf-8"))
+        assert second_cls.size_bytes == len(b"# Small\n")
+
+    def test_shared_adapter_is_thread_safe(self):
+        """Many threads sharing one adapter each get their own classification."""
+        # Arrange
+        from concurrent.futures import ThreadPoolExecutor
+
+        adapter = ParserAdapter()
+        contents = [
+            f"# Doc {i}\r\n\r\n" + "- [L](https://x.io): d\r\n" * i for i in range(40)
+        ]
+
+        def run(content: str) -> int:
+            doc = adapter.parse(content, "llms.txt")
+            return adapter.classify(doc).size_bytes
+
+        # Act
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            sizes = list(pool.map(run, contents))
+
+        # Assert
+        assert sizes == [len(c.encode("utf-8")) for c in contents]
+
+    def test_sessions_released_with_document(self):
+        """The registry entry is dropped when its document is collected."""
+        import gc
+
+        adapter = ParserAdapter()
+        doc = adapter.parse("# Temp\n", "llms.txt")
+        assert adapter.session_for(doc) is not None
+
+        del doc
+        gc.collect()
+
+        assert adapter._sessions == {}
+
+    def test_classify_foreign_document_reconstructs_metadata(self):
+        """classify() on a document not produced by parse() still works."""
+        adapter = ParserAdapter()
+        foreign = ParsedLlmsTxt(title="X", raw_content="# X\n")
+
+        classification = adapter.classify(foreign)
+
+        assert classification.size_bytes == 4
+
+
 class TestPipelineIntegration:
     """End-to-end pipeline integration tests with ParserAdapter (v0.2.2d)."""
 
@@ -311,3 +399,43 @@ class TestPipelineIntegration:
         finally:
             # Restore permissions for cleanup
             broken_file.chmod(0o644)
+
+    def test_pipeline_process_backend_matches_serial(self):
+        """Process-pool Stage 2 yields the same per-file results as serial.
+
+        The adapter is pickled into each worker, so every file gets its own
+        copy and results are applied back in discovery order.
+        """
+        # Arrange
+        fixture_dir = ECOSYSTEMS_DIR / "healthy"
+        serial = EcosystemPipeline(validator=ParserAdapter())
+        parallel = EcosystemPipeline(
+            validator=ParserAdapter(), jobs=2, backend="process"
+        )
+
+        # Act
+        serial_result = serial.run(str(fixture_dir))
+        parallel_result = parallel.run(str(fixture_dir))
+
+        # Assert — same files, same order, same parse/classification output
+        # (file_ids are random per run, so map them back to paths)
+        def snapshot(ctx):
+            rendered = repr(
+                [
+                    (
+                        f.file_path,
+                        f.parsed.model_dump(exclude={"parsed_at"}),
+                        f.classification.model_dump(exclude={"classified_at"}),
+                    )
+                    for f in ctx.files
+                ]
+            )
+            for f in ctx.files:
+                rendered = rendered.replace(f.file_id, f.file_path)
+            return rendered
+
+        assert snapshot(parallel_result) == snapshot(serial_result)
+        assert parallel_result.project_name == serial_result.project_name
+        assert [r.target_url for r in parallel_result.relationships] == [
+            r.target_url for r in serial_result.relationships
+        ]
@@ -5,9 +5,23 @@ detection, line ending detection/normalization, and edge cases.
 See RR-META-testing-standards for naming conventions and fixture patterns.
 """
 
+import io
+import tracemalloc
+
 import pytest
 
-from docstratum.parser.io import FileMetadata, read_bytes, read_file, read_string
+from docstratum.parser.io import (
+    FileMetadata,
+    LineStream,
+    MappedFile,
+    SourceText,
+    preprocess,
+    read_bytes,
+    read_bytes_source,
+    read_file,
+    read_file_mapped,
+    read_string,
+)
 
 
 class TestReadFile:
@@ -264,3 +278,234 @@ class TestFileMetadataModel:
         """Verify byte_count field constraint ge=0."""
         with pytest.raises(ValueError):
             FileMetadata(byte_count=-1)
+
+
+# ── Streaming reader ─────────────────────────────────────────────────
+
+STREAM_CASES = [
+    b"",
+    b"\n",
+    b"\r",
+    b"# Title\n> Desc\n",
+    b"no trailing newline",
+    b"a\r\nb\r\nc\r\n",
+    b"a\rb\rc",
+    b"mixed\r\nlf\ncr\rend\r\n",
+    b"\xef\xbb\xbf# BOM\r\n",
+    b"\xef\xbb\xbf",
+    "# caf\u00e9 \u2014 \U0001f600\n".encode("utf-8") * 3,
+    b"nul\x00byte\n",
+    b"ascii prefix\ncaf\xe9\n",
+    b"truncated \xe2\x80",
+]
+
+
+def _stream_all(data: bytes, chunk_size: int) -> tuple[list[str], FileMetadata]:
+    """Read ``data`` through LineStream and return (lines, metadata)."""
+    stream = LineStream(io.BytesIO(data), chunk_size=chunk_size)
+    lines = list(stream)
+    assert stream.finished
+    return lines, stream.metadata
+
+
+def _expected_lines(content: str) -> list[str]:
+    """Lines as tokenize() sees them: split, minus the trailing artifact."""
+    lines = content.split("\n") if content else []
+    if lines and lines[-1] == "":
+        lines.pop()
+    return lines
+
+
+class TestLineStream:
+    """Tests for LineStream — chunked reading with read_bytes() semantics."""
+
+    @pytest.mark.parametrize("data", STREAM_CASES)
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 64])
+    def test_matches_read_bytes(self, data, chunk_size):
+        """Verify lines and metadata match read_bytes() at any chunk size."""
+        # Arrange
+        content, expected_meta = read_bytes(data)
+
+        # Act
+        lines, meta = _stream_all(data, chunk_size)
+
+        # Assert
+        assert lines == _expected_lines(content)
+        assert meta.model_dump(exclude={"decoding_error"}) == (
+            expected_meta.model_dump(exclude={"decoding_error"})
+        )
+        assert (meta.decoding_error is None) == (expected_meta.decoding_error is None)
+
+    @pytest.mark.parametrize("chunk_size", [1, 4, 64])
+    def test_text_stream_matches_read_string(self, chunk_size):
+        """Verify text-mode streams follow read_string() semantics."""
+        # Arrange
+        text = "# T\r\n\u00e9\rx\n"
+        content, expected_meta = read_string(text)
+
+        # Act
+        stream = LineStream(io.StringIO(text), chunk_size=chunk_size)
+        lines = list(stream)
+
+        # Assert
+        assert lines == _expected_lines(content)
+        assert stream.metadata == expected_meta
+
+    def test_crlf_split_across_chunks_is_one_line_ending(self):
+        """Verify a CR at a chunk end followed by LF counts as one CRLF."""
+        lines, meta = _stream_all(b"ab\r\ncd\r\n", chunk_size=3)
+
+        assert lines == ["ab", "cd"]
+        assert meta.line_ending_style == "crlf"
+        assert meta.line_count == 3
+
+    def test_invalid_chunk_size_rejected(self):
+        """Verify chunk_size < 1 raises ValueError."""
+        with pytest.raises(ValueError, match="chunk_size"):
+            LineStream(io.BytesIO(b""), chunk_size=0)
+
+
+# ── One-pass preprocessing ───────────────────────────────────────────
+
+
+class TestPreprocess:
+    """Tests for preprocess() and SourceText."""
+
+    @pytest.mark.parametrize(
+        "text",
+        ["", "x", "a\nb\n", "a\r\nb\r\n", "a\rb", "a\r\nb\nc\rd", "\r\r\n\n"],
+    )
+    def test_matches_two_pass_normalization(self, text):
+        """Verify text, style, and line count match the multi-pass approach."""
+        # Arrange — the previous implementation, written out
+        expected = text.replace("\r\n", "\n").replace("\r", "\n")
+
+        # Act
+        src = preprocess(text)
+
+        # Assert
+        assert src.text == expected
+        assert src.line_count == (expected.count("\n") + 1 if expected else 0)
+        assert src.crlf_count == text.count("\r\n")
+
+    def test_lf_text_is_not_copied(self):
+        """Verify LF-only input is passed through without a copy."""
+        text = "# Title\n" * 100
+
+        assert preprocess(text).text is text
+
+    def test_line_starts_index(self):
+        """Verify the lazy line-offset index and line() lookups."""
+        src = preprocess("ab\r\ncd\n\nef")
+
+        assert list(src.line_starts) == [0, 3, 6, 7]
+        assert src.line_starts is src.line_starts  # built once, cached
+        assert [src.line(n) for n in range(1, 5)] == ["ab", "cd", "", "ef"]
+        with pytest.raises(IndexError):
+            src.line(5)
+
+    def test_line_number_matches_prefix_count(self):
+        """Verify line_number(offset) equals counting newlines before it."""
+        src = preprocess("ab\ncd\n\nef\n")
+
+        for offset in range(len(src.text) + 1):
+            expected = src.text[:offset].count("\n") + 1
+            assert src.line_number(offset) == expected
+        with pytest.raises(IndexError):
+            src.line_number(len(src.text) + 1)
+
+    def test_read_bytes_source_exposes_source_text(self):
+        """Verify read_bytes_source() returns the SourceText with metadata."""
+        src, meta = read_bytes_source(b"\xef\xbb\xbfa\r\nb")
+
+        assert isinstance(src, SourceText)
+        assert src.text == "a\nb"
+        assert meta.line_count == src.line_count == 2
+        assert meta.line_ending_style == src.line_ending_style == "crlf"
+        assert "SourceText(chars=3" in repr(src)
+
+
+# ── Memory-mapped reading ────────────────────────────────────────────
+
+MAPPED_CASES = [
+    b"",
+    b"\xef\xbb\xbf",
+    b"# T\n> d\n",
+    b"a\r\nb\r\n",
+    b"a\rb\nc\r\n",
+    b"\xef\xbb\xbf# T\r\n\xc3\xa9\n",
+    b"caf\xe9\n" * 3,
+    b"ok\n\xe2\x82",
+    b"\xef\xbb\xbfab\xff\xfe",
+    b"x\x00y",
+]
+
+
+class TestMappedFile:
+    """Tests for MappedFile / read_file_mapped() — parity with read_bytes()."""
+
+    @pytest.mark.parametrize("data", MAPPED_CASES)
+    @pytest.mark.parametrize("window", [1, 2, 3, 1024])
+    def test_matches_read_bytes(self, tmp_path, data, window):
+        """Verify text and metadata (incl. decoding_error) match read_bytes()."""
+        # Arrange
+        path = tmp_path / "f.txt"
+        path.write_bytes(data)
+
+        # Act
+        with MappedFile(str(path), window=window) as mapped:
+            meta = mapped.scan()
+            text = mapped.read_text()
+
+        # Assert
+        assert (text, meta) == read_bytes(data)
+
+    def test_crlf_split_across_windows_counts_once(self, tmp_path):
+        """Verify a CR ending one window and LF starting the next is one CRLF."""
+        path = tmp_path / "f.txt"
+        path.write_bytes(b"ab\r\ncd\r\n")
+
+        with MappedFile(str(path), window=3) as mapped:
+            meta = mapped.scan()
+
+        assert meta.line_ending_style == "crlf"
+        assert meta.line_count == 3
+
+    def test_read_file_switches_to_mapped_above_threshold(self, tmp_path):
+        """Verify read_file() gives the same result on either path."""
+        path = tmp_path / "f.txt"
+        path.write_bytes(b"\xef\xbb\xbf# T\r\nbody\n")
+
+        assert read_file(str(path), mmap_threshold=0) == read_file(str(path))
+        assert read_file_mapped(str(path)) == read_file(str(path))
+
+    def test_invalid_window_rejected(self, tmp_path):
+        """Verify window < 1 raises ValueError."""
+        path = tmp_path / "f.txt"
+        path.write_bytes(b"x")
+
+        with pytest.raises(ValueError, match="window"):
+            MappedFile(str(path), window=0)
+
+    def test_peak_memory_below_read_file(self, tmp_path):
+        """Verify the mapped path never holds the raw bytes alongside the text."""
+        # Arrange — ~4 MB ASCII file, LF line endings
+        path = tmp_path / "big.txt"
+        path.write_bytes(b"- [Link](https://example.com/page): description\n" * 80_000)
+        size = path.stat().st_size
+
+        def peak(fn) -> int:
+            tracemalloc.start()
+            try:
+                fn()
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        # Act
+        mapped_peak = peak(lambda: read_file_mapped(str(path)))
+        eager_peak = peak(lambda: read_file(str(path), mmap_threshold=size + 1))
+
+        # Assert — decoded text (~1x) plus one scan window, vs bytes + text
+        assert mapped_peak < size * 1.5
+        assert eager_peak >= size * 2
@@ -0,0 +1,211 @@
+"""Tests for lazy, section-indexed parsing (v0.9.2b).
+
+Tests cover equivalence with the eager populator (random documents and
+the parser fixtures), what is available without materialization, the
+classifier's early exit, and ParserAdapter.parse_lazy().
+See RR-META-testing-standards for naming conventions and fixture patterns.
+"""
+
+import random
+import time
+from pathlib import Path
+
+import pytest
+
+from docstratum.parser import (
+    LAZY_THRESHOLD_TOKENS,
+    LazyDocument,
+    ParserAdapter,
+    populate,
+    populate_lazy,
+    tokenize_table,
+)
+from docstratum.schema.classification import DocumentType
+from docstratum.schema.parsed import ParsedLlmsTxt
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+_PIECES = [
+    "# Title",
+    "# Another",
+    "> quote",
+    ">",
+    "",
+    "   ",
+    "## Section",
+    "## ",
+    "##nospace",
+    "### Sub",
+    "```",
+    "```python",
+    "- [Link](https://example.com)",
+    "- [Rel](./page.md): described",
+    "- [broken",
+    "plain text",
+]
+
+
+def _eager(body: str):
+    return populate(tokenize_table(body), raw_content=body)
+
+
+def _dump(doc):
+    return doc.model_dump(exclude={"parsed_at"})
+
+
+def _big_document(sections: int) -> str:
+    lines = ["# Big Docs", "> Everything in one file", ""]
+    for i in range(sections):
+        lines += [f"## Section {i}", ""]
+        lines += [f"Prose line {j} about topic {i}." for j in range(20)]
+        lines += ["```md", "## not a heading", "- [in](code)", "```"]
+        lines += [f"- [Page {i}](https://example.com/{i}): page", ""]
+    return "\n".join(lines)
+
+
+class TestLazyEquivalence:
+    """materialize() equals what populate() builds from the same text."""
+
+    def test_random_documents_match_eager_population(self):
+        """Verify 2,000 random line mixes, including fences and edge cases."""
+        rng = random.Random(11)
+        for _ in range(2000):
+            # Arrange
+            lines = [rng.choice(_PIECES) for _ in range(rng.randint(0, 14))]
+            body = "\n".join(lines) + rng.choice(["", "\n", "\n\n"])
+
+            # Act
+            lazy = populate_lazy(body, raw_content=body)
+
+            # Assert
+            assert _dump(lazy.materialize()) == _dump(_eager(body)), body
+
+    @pytest.mark.parametrize("blank", ["\xa0", "\u3000", "\u2000 \t", " \xa0 "])
+    def test_unicode_blank_preamble_lines_match_eager_population(self, blank):
+        """Verify Unicode-whitespace lines before the title stay blank."""
+        # Arrange
+        body = f"{blank}\n# Title\n{blank}\n> sum\n\n## A\n- [L](https://x.io)\n"
+
+        # Act
+        lazy = populate_lazy(body, raw_content=body)
+
+        # Assert
+        assert lazy.title == "Title"
+        assert lazy.title_line == _eager(body).title_line
+        assert _dump(lazy.materialize()) == _dump(_eager(body))
+
+    def test_fixture_files_match_eager_population(self):
+        """Verify every Markdown/text fixture indexes like the eager parse."""
+        # Arrange
+        paths = [
+            p
+            for p in FIXTURES_DIR.rglob("*")
+            if p.is_file() and p.suffix in {".txt", ".md"}
+        ]
+
+        # Act / Assert
+        assert paths
+        for path in paths:
+            body = path.read_text(encoding="utf-8", errors="replace")
+            lazy = populate_lazy(body, raw_content=body)
+            assert _dump(lazy.materialize()) == _dump(_eager(body)), path
+
+
+class TestLazyAccess:
+    """Titles, names, and token estimates need no materialization."""
+
+    def test_structure_is_read_from_the_offset_table(self):
+        """Verify names, line numbers, and tokens come from the spans."""
+        # Arrange
+        body = _big_document(50)
+
+        # Act
+        doc = populate_lazy(body, raw_content=body, source_filename="llms-full.txt")
+
+        # Assert
+        assert doc.title == "Big Docs"
+        assert doc.blockquote.text == "Everything in one file"
+        assert doc.section_count == 50
+        assert doc.section_names[:2] == ["Section 0", "Section 1"]
+        assert doc.spans[1].line_number == 32
+        assert doc.section_tokens(0) == _eager(body).sections[0].estimated_tokens
+        assert doc.sections.materialized == 0
+
+    def test_sections_are_built_once_on_access(self):
+        """Verify indexing builds one section and reuses it."""
+        # Arrange
+        body = _big_document(3)
+        doc = populate_lazy(body, raw_content=body)
+
+        # Act
+        first = doc.sections[1]
+
+        # Assert
+        assert doc.sections[1] is first
+        assert doc.sections.materialized == 1
+        assert [link.title for link in first.links] == ["Page 1"]
+        assert doc.sections[-1].name == "Section 2"
+        assert len(doc.sections[:2]) == 2
+
+
+class TestLazyParserAdapter:
+    """ParserAdapter.parse_lazy() and classification of lazy documents."""
+
+    def test_classification_matches_and_stops_early(self):
+        """Verify the classifier agrees and only touches what it needs."""
+        # Arrange
+        adapter = ParserAdapter()
+        content = (
+            "# Docs\n\n> Summary\n\n## A\n\n- [x](https://x.dev)\n\n## B\n\nText\n"
+        )
+
+        # Act
+        lazy = adapter.parse_lazy(content, "docs.md")
+        lazy_result = adapter.classify(lazy)
+        eager_result = adapter.classify(adapter.parse(content, "docs.md"))
+
+        # Assert
+        assert isinstance(lazy, LazyDocument)
+        assert lazy.file_meta.byte_count == len(content)
+        assert lazy_result.document_type == DocumentType.TYPE_1_INDEX
+        assert lazy_result.model_dump(exclude={"classified_at"}) == (
+            eager_result.model_dump(exclude={"classified_at"})
+        )
+        assert lazy.sections.materialized == 1  # stopped at the first link
+
+    def test_parse_for_reading_is_lazy_from_the_threshold(self):
+        """Verify oversized content is indexed lazily and smaller is parsed."""
+        # Arrange
+        adapter = ParserAdapter()
+        small = "# Docs\n\n## A\n\nText\n"
+        oversized = _big_document(2000)
+
+        # Act
+        eager = adapter.parse_for_reading(small, "docs.md")
+        lazy = adapter.parse_for_reading(oversized, "llms-full.txt")
+
+        # Assert
+        assert len(oversized) // 4 >= LAZY_THRESHOLD_TOKENS
+        assert isinstance(eager, ParsedLlmsTxt)
+        assert isinstance(lazy, LazyDocument)
+        assert adapter.classify(lazy).document_type == DocumentType.TYPE_2_FULL
+
+    @pytest.mark.integration
+    def test_oversized_file_indexes_faster_than_full_parse(self):
+        """Verify a ~500K-token aggregate indexes well under a full parse."""
+        # Arrange
+        content = _big_document(2000)
+        adapter = ParserAdapter()
+
+        # Act
+        start = time.perf_counter()
+        eager = adapter.parse(content, "llms-full.txt")
+        eager_time = time.perf_counter() - start
+        start = time.perf_counter()
+        lazy = adapter.parse_lazy(content, "llms-full.txt")
+        lazy_time = time.perf_counter() - start
+
+        # Assert
+        assert lazy.section_names == eager.section_names
+        assert lazy.estimated_tokens == eager.estimated_tokens
+        assert lazy_time < eager_time / 2
@@ -8,7 +8,7 @@ See RR-META-testing-standards for naming conventions and fixture patterns.
 
 from unittest.mock import patch
 
-from docstratum.parser.metadata import extract_metadata
+from docstratum.parser.metadata import _extract_frontmatter_text, extract_metadata
 
 # ── No Frontmatter ──────────────────────────────────────────────────
 
@@ -169,3 +169,37 @@ class TestSafety:
             meta = extract_metadata("---\nsite_name: X\n---\n")
             mock_safe.assert_called_once()
             assert meta is not None
+
+
+class TestFrontmatterScan:
+    """The lazy line scan must behave like splitlines(keepends=True)."""
+
+    def test_matches_splitlines_reference(self):
+        """Verify extraction agrees with the list-based implementation."""
+
+        def reference(content: str) -> str | None:
+            lines = content.splitlines(keepends=True)
+            i = 0
+            while i < len(lines) and lines[i].strip() == "":
+                i += 1
+            if i >= len(lines) or lines[i].strip() != "---":
+                return None
+            for j in range(i + 1, len(lines)):
+                if lines[j].strip() == "---":
+                    return "".join(lines[i + 1 : j])
+            return None
+
+        samples = [
+            "",
+            "\n\n",
+            "---\na: 1\n---\n# T\n",
+            "\n  \n---\r\na: 1\r\n---\r\n",
+            "---\x0ca: 1\u2028---",
+            "---\na: 1\nno closing\n",
+            "# No frontmatter\n---\na: 1\n---\n",
+            "---",
+        ]
+        for content in samples:
+            assert _extract_frontmatter_text(content) == reference(content), repr(
+                content
+            )
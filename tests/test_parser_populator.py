@@ -6,9 +6,13 @@ token estimation.
 See RR-META-testing-standards for naming conventions and fixture patterns.
 """
 
+import time
 from datetime import datetime
 
+import pytest
+
 from docstratum.parser.populator import populate
+from docstratum.parser.tokenizer import tokenize_table
 from docstratum.parser.tokens import Token, TokenType
 
 # ── Helpers ──────────────────────────────────────────────────────────
@@ -405,6 +409,34 @@ class TestUrlValidation:
         # Assert
         assert doc.sections[0].links[0].is_valid_url is False
 
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("https://x.com/a?b#c", True),
+            ("http://localhost:8080", True),
+            ("https://", False),
+            ("https:///path", False),
+            ("http://?q=1", False),
+            ("https://#top", False),
+            ("https://\tx.com", True),
+            ("https://bücher.de", True),
+            ("HTTPS://X.COM", True),
+        ],
+    )
+    def test_url_validation_http_fast_path_matches_urlparse(self, url, expected):
+        """Verify plain http(s) URLs are judged exactly as urlparse() would."""
+        # Arrange
+        tokens = [
+            _tok(TokenType.H2, 1, "## Docs"),
+            _tok(TokenType.LINK_ENTRY, 2, f"- [T]({url})"),
+        ]
+
+        # Act
+        doc = populate(tokens)
+
+        # Assert
+        assert doc.sections[0].links[0].is_valid_url is expected
+
 
 # ── Assembly ─────────────────────────────────────────────────────────
 
@@ -537,3 +569,62 @@ class TestTokenEstimation:
         assert len(doc.sections) == 3
         for section in doc.sections:
             assert section.estimated_tokens >= 0
+
+
+# ── Section Content Assembly ────────────────────────────────────────
+
+
+class TestSectionContentAssembly:
+    """raw_content is one slice per section, not per-line concatenation."""
+
+    def test_leading_empty_lines_dropped_inner_ones_kept(self):
+        """Verify only the empty lines a section starts with are dropped."""
+        # Arrange
+        body = "## A\n\n\n  \nText\n\n```\n## B\n```\n\n## C\n\n"
+
+        # Act
+        doc = populate(tokenize_table(body), raw_content=body)
+
+        # Assert
+        content = "  \nText\n\n```\n## B\n```\n"
+        assert [s.raw_content for s in doc.sections] == [content, ""]
+        assert doc.sections[0].estimated_tokens == len(content) // 4
+
+    def test_token_list_and_table_agree(self):
+        """Verify list[Token] input builds the same sections as a table."""
+        # Arrange
+        body = "# T\n## A\n\n- [x](https://x.dev)\ntext\n## B\nmore"
+        table = tokenize_table(body)
+
+        # Act
+        from_table = populate(table, raw_content=body)
+        from_list = populate(table.to_tokens(), raw_content=body)
+
+        # Assert
+        assert from_table.sections == from_list.sections
+
+    @pytest.mark.integration
+    def test_single_section_scales_linearly(self):
+        """Verify an 8x longer section takes well under 64x (quadratic) time.
+
+        With per-line ``+=`` a 200k-line section took ~90 s; slicing makes
+        it a few hundredths of a second.
+        """
+
+        def timed(lines: int) -> float:
+            body = "# T\n## Big\n" + "\n".join(
+                f"line {i} of one very large section" for i in range(lines)
+            )
+            table = tokenize_table(body)
+            start = time.perf_counter()
+            doc = populate(table, raw_content=body)
+            elapsed = time.perf_counter() - start
+            assert doc.sections[0].raw_content == body[len("# T\n## Big\n") :]
+            return elapsed
+
+        # Act
+        small = min(timed(25_000) for _ in range(3))
+        large = min(timed(200_000) for _ in range(3))
+
+        # Assert
+        assert large < 20 * small
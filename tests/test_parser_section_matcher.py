@@ -6,7 +6,19 @@ in-place mutation semantics.
 See RR-META-testing-standards for naming conventions and fixture patterns.
 """
 
-from docstratum.parser.section_matcher import match_canonical_sections
+import pickle
+import random
+
+import pytest
+
+from docstratum.parser.section_matcher import (
+    SECTION_NAME_INDEX,
+    FuzzySectionMatcher,
+    canonical_section,
+    match_canonical_sections,
+    normalize_section_name,
+)
+from docstratum.parser.validator_adapter import ParserAdapter
 from docstratum.schema.constants import SECTION_NAME_ALIASES, CanonicalSectionName
 from docstratum.schema.parsed import ParsedLlmsTxt, ParsedSection
 
@@ -162,6 +174,186 @@ class TestWhitespace:
         assert doc.sections[0].canonical_name is None
 
 
+# ── Punctuation and Unicode Normalization ───────────────────────────
+
+
+class TestNormalization:
+    """Tests for punctuation, separator, and Unicode normalization."""
+
+    def test_punctuation_and_separators_ignored(self):
+        """Verify 'API-Reference:' and 'getting_started' match."""
+        doc = _make_doc(["API-Reference:", "getting_started", "Core  Concepts"])
+        match_canonical_sections(doc)
+        assert [s.canonical_name for s in doc.sections] == [
+            "API Reference",
+            "Getting Started",
+            "Core Concepts",
+        ]
+
+    def test_unicode_casefold_and_width(self):
+        """Verify full-width and casefolded names match."""
+        assert normalize_section_name("\uff26\uff21\uff31") == "faq"
+        assert normalize_section_name("Quick\u00a0Start") == "quick start"
+        assert canonical_section("\uff26\uff21\uff31") == CanonicalSectionName.FAQ
+
+    def test_words_still_required(self):
+        """Verify normalization does not turn partial names into matches."""
+        assert canonical_section("Getting Start") is None
+        assert canonical_section("APIReference") is None
+
+
+# ── Shared Index ────────────────────────────────────────────────────
+
+
+class TestSectionNameIndex:
+    """Tests for the precompiled index and memoized lookup."""
+
+    def test_index_is_read_only(self):
+        """Verify SECTION_NAME_INDEX cannot be modified."""
+        with pytest.raises(TypeError):
+            SECTION_NAME_INDEX["x"] = CanonicalSectionName.FAQ  # type: ignore[index]
+
+    def test_index_covers_names_and_aliases(self):
+        """Verify every canonical name and alias has a normalized key."""
+        assert len(SECTION_NAME_INDEX) == len(CanonicalSectionName) + len(
+            SECTION_NAME_ALIASES
+        )
+
+    def test_lookup_is_memoized(self):
+        """Verify a repeated name is answered from the cache."""
+        canonical_section("Troubleshooting Memo Test")
+        hits = canonical_section.cache_info().hits
+        canonical_section("Troubleshooting Memo Test")
+        assert canonical_section.cache_info().hits == hits + 1
+
+
+# ── Fuzzy Matching ──────────────────────────────────────────────────
+
+
+class TestFuzzyMatcher:
+    """Tests for the opt-in trigram-indexed fuzzy matcher."""
+
+    @pytest.mark.parametrize(
+        ("heading", "expected"),
+        [
+            ("Getting started guide", CanonicalSectionName.GETTING_STARTED),
+            ("API Ref", CanonicalSectionName.API_REFERENCE),
+            ("Troubleshootng", CanonicalSectionName.TROUBLESHOOTING),
+            ("Core concept", CanonicalSectionName.CORE_CONCEPTS),
+            ("Frequently asked question", CanonicalSectionName.FAQ),
+        ],
+    )
+    def test_near_misses_match(self, heading, expected):
+        """Verify typos, extra words, and abbreviations reach a canonical."""
+        # Act
+        match = FuzzySectionMatcher().match(heading)
+
+        # Assert
+        assert match is not None
+        assert match.canonical == expected
+        assert 0.8 <= match.confidence < 1.0
+
+    @pytest.mark.parametrize(
+        "heading", ["Release Notes", "API Changes", "License", "Overview", ""]
+    )
+    def test_unrelated_headings_do_not_match(self, heading):
+        """Verify headings that merely share letters stay unmatched."""
+        assert FuzzySectionMatcher().match(heading) is None
+
+    def test_exact_match_has_full_confidence(self):
+        """Verify exact names and aliases score 1.0."""
+        match = FuzzySectionMatcher().match("Quick-Start")
+        assert match.canonical == CanonicalSectionName.GETTING_STARTED
+        assert match.key == "quick start"
+        assert match.confidence == 1.0
+
+    def test_min_confidence_is_respected(self):
+        """Verify a stricter matcher rejects what the default accepts."""
+        assert FuzzySectionMatcher(min_confidence=0.95).match("API Ref") is None
+        with pytest.raises(ValueError, match="min_confidence"):
+            FuzzySectionMatcher(min_confidence=0.0)
+
+    def test_results_are_memoized_and_picklable(self):
+        """Verify repeats hit the memo and a pickled copy matches the same."""
+        # Arrange
+        fuzzy = FuzzySectionMatcher()
+        first = fuzzy.match("Getting started guide")
+
+        # Act
+        again = fuzzy.match("Getting started guide")
+        copy = pickle.loads(pickle.dumps(fuzzy))
+
+        # Assert
+        assert again is first
+        assert fuzzy.match.cache_info().hits == 1
+        assert copy.match("Getting started guide") == first
+
+    def test_fuzzy_is_opt_in(self):
+        """Verify match_canonical_sections only fuzzy matches when asked."""
+        # Arrange
+        exact = _make_doc(["Getting started guide", "FAQ"])
+        fuzzy = _make_doc(["Getting started guide", "FAQ"])
+
+        # Act
+        match_canonical_sections(exact)
+        match_canonical_sections(fuzzy, fuzzy=FuzzySectionMatcher())
+
+        # Assert
+        assert [s.canonical_name for s in exact.sections] == [None, "FAQ"]
+        assert [s.canonical_name for s in fuzzy.sections] == [
+            "Getting Started",
+            "FAQ",
+        ]
+
+    def test_parser_adapter_option(self):
+        """Verify ParserAdapter(fuzzy_sections=...) enriches parsed sections."""
+        # Arrange
+        content = "# Docs\n\n## Getting started guide\n\n- [a](a.md)\n"
+        adapter = ParserAdapter(fuzzy_sections=FuzzySectionMatcher())
+
+        # Act
+        doc = adapter.parse(content, "llms.txt")
+
+        # Assert
+        assert doc.sections[0].canonical_name == "Getting Started"
+        plain = ParserAdapter().parse(content, "llms.txt")
+        assert plain.sections[0].canonical_name is None
+
+    @pytest.mark.integration
+    def test_corpus_scale_headings_are_matched_once_each(self):
+        """Verify 50,000 headings (many repeated) match each distinct one once."""
+        # Arrange
+        rng = random.Random(4)
+        vocab = [
+            "api",
+            "ref",
+            "getting",
+            "started",
+            "guide",
+            "setup",
+            "notes",
+            "config",
+            "advanced",
+            "usage",
+            "faq",
+            "core",
+            "concept",
+            "cli",
+        ]
+        headings = [
+            " ".join(rng.choice(vocab) for _ in range(rng.randint(1, 4)))
+            for _ in range(50_000)
+        ]
+        fuzzy = FuzzySectionMatcher()
+
+        # Act
+        matched = sum(fuzzy.match(h) is not None for h in headings)
+
+        # Assert — repeats are memoized, so only distinct headings are scored
+        assert matched > 0
+        assert fuzzy.match.cache_info().misses == len(set(headings))
+
+
 # ── Multi-Section and Edge Cases ────────────────────────────────────
 
 
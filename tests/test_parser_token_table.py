@@ -0,0 +1,144 @@
+"""Tests for the columnar TokenTable and tokenize_table().
+
+Tests cover equivalence with the ``list[Token]`` tokenizer on synthetic
+edge cases and real-world specimens, the compatibility views in both
+directions, populate() parity, and the memory advantage of the table.
+See RR-META-testing-standards for naming conventions and fixture patterns.
+"""
+
+import tracemalloc
+from array import array
+from pathlib import Path
+
+import pytest
+
+from docstratum.parser.io import read_string
+from docstratum.parser.populator import populate
+from docstratum.parser.token_table import TOKEN_TYPES, TokenTable
+from docstratum.parser.tokenizer import tokenize, tokenize_table
+from docstratum.parser.tokens import Token, TokenType
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "parser"
+
+EDGE_CASES = [
+    "",
+    "\n",
+    "\n\n",
+    "# Title",
+    "# Title\n",
+    "#Title\n##NoSpace\n####\n### Sub\n",
+    ">\n> quote\n>no-space\n",
+    "- [ok](https://x.io)\n- not a link\n-[x](y)\n",
+    "   \n\t\n\x0b\n\xa0\n",
+    "```\n# inside\n- [a](b)\n```\n# outside\n",
+    "```python\nunclosed fence\n## still text\n",
+    "# A\n\n> B\n\n## S\n- [L](u): d\ntext\n",
+]
+
+
+def _all_fixture_texts() -> list[str]:
+    """Normalized content of every parser fixture file."""
+    texts = []
+    for path in sorted(FIXTURES_DIR.rglob("*.txt")):
+        normalized, _ = read_string(path.read_text(encoding="utf-8"))
+        texts.append(normalized)
+    return texts
+
+
+class TestTokenizeTableEquivalence:
+    """tokenize_table() must describe exactly what tokenize() produces."""
+
+    @pytest.mark.parametrize("content", EDGE_CASES)
+    def test_edge_cases_match_list_tokenizer(self, content):
+        """Verify types, texts, and line numbers agree on edge cases."""
+        # Act
+        table = tokenize_table(content)
+        tokens = tokenize(content)
+
+        # Assert
+        assert table.to_tokens() == tokens
+
+    def test_fixtures_match_list_tokenizer(self):
+        """Verify every parser fixture tokenizes identically in both forms."""
+        for content in _all_fixture_texts():
+            assert tokenize_table(content).to_tokens() == tokenize(content)
+
+    def test_columns_are_typed_arrays(self):
+        """Verify the columns are compact typed arrays over the source."""
+        table = tokenize_table("# T\n\n## S\n")
+
+        assert table.types.typecode == "B"
+        assert table.starts.typecode == "q"
+        assert table.ends.typecode == "q"
+        assert table.line_numbers.typecode == "I"
+        assert list(table.line_numbers) == [1, 2, 3]
+        assert [TOKEN_TYPES[c] for c in table.types] == [
+            TokenType.H1,
+            TokenType.BLANK,
+            TokenType.H2,
+        ]
+        assert table.raw_text(2) == "## S"
+
+
+class TestTokenTableViews:
+    """Conversions between TokenTable and list[Token]."""
+
+    def test_from_tokens_round_trip(self):
+        """Verify from_tokens() preserves arbitrary line numbers and texts."""
+        # Arrange — non-contiguous line numbers, as a hand-built list may have
+        tokens = [
+            Token(token_type=TokenType.H1, line_number=3, raw_text="# T"),
+            Token(token_type=TokenType.TEXT, line_number=9, raw_text="body"),
+            Token(token_type=TokenType.BLANK, line_number=10, raw_text=""),
+        ]
+
+        # Act
+        table = TokenTable.from_tokens(tokens)
+
+        # Assert
+        assert len(table) == 3
+        assert table.to_tokens() == tokens
+        assert table.token(1).line_number == 9
+
+    def test_mismatched_columns_rejected(self):
+        """Verify columns of different lengths raise ValueError."""
+        with pytest.raises(ValueError, match="same length"):
+            TokenTable("x", array("B", [0]), array("q"), array("q"), array("I"))
+
+    def test_repr_is_compact(self):
+        """Verify repr() summarizes instead of dumping columns."""
+        assert repr(tokenize_table("# T\n")) == "TokenTable(tokens=1, source_chars=4)"
+
+
+class TestPopulateFromTable:
+    """populate() consumes TokenTable directly with identical results."""
+
+    def test_populate_table_matches_token_list(self):
+        """Verify populate(table) == populate(list) for all fixtures."""
+        for content in _all_fixture_texts() + EDGE_CASES:
+            from_table = populate(tokenize_table(content), raw_content=content)
+            from_list = populate(tokenize(content), raw_content=content)
+
+            assert from_table.model_dump(exclude={"parsed_at"}) == (
+                from_list.model_dump(exclude={"parsed_at"})
+            )
+
+    def test_table_uses_less_memory_than_token_list(self):
+        """Verify the table's peak allocation is well below list[Token]'s."""
+        # Arrange
+        content = "## S\n- [L](https://x.io): d\ntext line\n\n" * 5_000
+
+        def peak(fn) -> tuple[int, object]:
+            tracemalloc.start()
+            try:
+                result = fn(content)
+                return tracemalloc.get_traced_memory()[1], result
+            finally:
+                tracemalloc.stop()
+
+        # Act
+        table_peak, _ = peak(tokenize_table)
+        list_peak, _ = peak(tokenize)
+
+        # Assert
+        assert table_peak * 4 < list_peak
@@ -5,9 +5,18 @@ line number preservation, priority ordering, and edge cases.
 See RR-META-testing-standards for naming conventions and fixture patterns.
 """
 
-from docstratum.parser.tokenizer import tokenize
+import io
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from docstratum.parser.io import LineStream, read_bytes
+from docstratum.parser.tokenizer import iter_tokens, tokenize
 from docstratum.parser.tokens import TokenType
 
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "parser"
+
 
 class TestTokenClassification:
     """Tests for individual token type classification."""
@@ -272,3 +281,65 @@ class TestFullDocument:
         # Assert
         assert tokens[0].raw_text == "# Title"
         assert tokens[1].raw_text == "> Description with  extra   spaces"
+
+
+class TestIterTokens:
+    """Tests for the streaming tokenizer over file objects."""
+
+    @pytest.mark.parametrize("chunk_size", [61, 4096])
+    def test_matches_tokenize_on_fixtures(self, chunk_size):
+        """Verify iter_tokens() yields exactly tokenize(read_bytes(data))."""
+        for path in sorted(FIXTURES_DIR.rglob("*.txt")):
+            # Arrange — CRLF variant exercises normalization across chunks
+            data = path.read_bytes()
+            for variant in (data, data.replace(b"\n", b"\r\n")):
+                content, _ = read_bytes(variant)
+
+                # Act
+                streamed = list(iter_tokens(io.BytesIO(variant), chunk_size=chunk_size))
+
+                # Assert
+                assert streamed == tokenize(content), path.name
+
+    def test_code_fence_state_spans_chunks(self):
+        """Verify fence state carries across chunk boundaries."""
+        data = b"## S\n```\n# not a heading\n- [a](b)\n```\n# H1\n"
+
+        tokens = list(iter_tokens(io.BytesIO(data), chunk_size=2))
+
+        assert [t.token_type for t in tokens] == [
+            TokenType.H2,
+            TokenType.CODE_FENCE,
+            TokenType.TEXT,
+            TokenType.TEXT,
+            TokenType.CODE_FENCE,
+            TokenType.H1,
+        ]
+
+    def test_metadata_available_after_exhaustion(self):
+        """Verify a LineStream source exposes FileMetadata when done."""
+        lines = LineStream(io.BytesIO(b"\xef\xbb\xbf# T\r\n"), chunk_size=1)
+
+        tokens = list(iter_tokens(lines))
+
+        assert tokens[0].raw_text == "# T"
+        assert lines.metadata.has_bom is True
+        assert lines.metadata.line_ending_style == "crlf"
+
+    def test_memory_is_bounded_by_chunk_not_file(self):
+        """Verify streaming a large file does not allocate its full size."""
+        # Arrange — ~3 MB of content, created before tracing starts
+        line = b"- [Page](https://example.com/page): description text\n"
+        stream = io.BytesIO(line * 60_000)
+
+        # Act
+        tracemalloc.start()
+        try:
+            count = sum(1 for _ in iter_tokens(stream, chunk_size=16_384))
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        # Assert
+        assert count == 60_000
+        assert peak < 800_000
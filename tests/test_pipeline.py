@@ -14,12 +14,14 @@ Total target: ~85 tests covering the primary contracts, error cases, and
 integration scenarios.
 """
 
+import os
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
 
+from docstratum.parser.io import SourceText, preprocess
 from docstratum.pipeline import (
     DiscoveryStage,
     EcosystemPipeline,
@@ -28,7 +30,10 @@ from docstratum.pipeline import (
     PipelineStageId,
     PipelineStage,
     PerFileStage,
+    ExecutorBackend,
+    LinkResolver,
     RelationshipStage,
+    ResolverStats,
     ScoringStage,
     SingleFileValidator,
     StageResult,
@@ -58,7 +63,12 @@ from docstratum.schema.parsed import (
     ParsedLlmsTxt,
     ParsedSection,
 )
-from docstratum.schema.quality import DimensionScore, QualityDimension, QualityScore
+from docstratum.schema.quality import (
+    DimensionScore,
+    QualityDimension,
+    QualityGrade,
+    QualityScore,
+)
 from docstratum.schema.validation import ValidationDiagnostic, ValidationLevel, ValidationResult
 
 
@@ -507,6 +517,243 @@ class TestDiscoveryStage:
         assert "does not exist" in result.message
 
 
+# =============================================================================
+# PART 2b: per_file.py Tests
+# =============================================================================
+
+
+class _TitleValidator:
+    """Deterministic, stateless validator used by the per-file tests.
+
+    Uses the first line of content as the title and fails on any file whose
+    name starts with ``bad``, to exercise per-file error isolation.
+    """
+
+    def parse(self, content: str, filename: str) -> ParsedLlmsTxt:
+        if filename.startswith("bad"):
+            raise ValueError(f"cannot parse {filename}")
+        title = content.splitlines()[0].lstrip("# ") if content else None
+        return ParsedLlmsTxt(
+            title=title, raw_content=content, source_filename=filename
+        )
+
+    def classify(self, parsed: ParsedLlmsTxt) -> DocumentClassification:
+        return DocumentClassification(
+            document_type=DocumentType.TYPE_1_INDEX,
+            size_bytes=len(parsed.raw_content),
+            estimated_tokens=len(parsed.raw_content) // 4,
+            size_tier=SizeTier.MINIMAL,
+            filename=parsed.source_filename,
+        )
+
+    def validate(
+        self, parsed: ParsedLlmsTxt, classification: DocumentClassification
+    ) -> ValidationResult:
+        return ValidationResult(
+            level_achieved=ValidationLevel.L0_PARSEABLE,
+            diagnostics=[],
+            source_filename=parsed.source_filename,
+        )
+
+    def score(self, result: ValidationResult) -> QualityScore:
+        return QualityScore(
+            total_score=float(len(result.source_filename)),
+            grade=QualityGrade.CRITICAL,
+            dimensions={},
+        )
+
+
+class _WorkerCrashValidator(_TitleValidator):
+    """Validator that kills any process-pool worker it is sent to.
+
+    Parsing in the process that created it works normally, so the files
+    a broken pool leaves behind can still be processed serially.
+    """
+
+    def __init__(self) -> None:
+        self._parent_pid = os.getpid()
+
+    def parse(self, content: str, filename: str) -> ParsedLlmsTxt:
+        if os.getpid() != self._parent_pid:
+            os._exit(1)
+        return super().parse(content, filename)
+
+
+class _PickleCountingValidator(_TitleValidator):
+    """Validator that counts how often it is pickled in this process."""
+
+    pickles = 0
+
+    def __reduce__(self):
+        type(self).pickles += 1
+        return (type(self), ())
+
+
+def _make_per_file_context(tmp_path: Path, count: int) -> PipelineContext:
+    """Write ``count`` content pages plus one failing file and discover them."""
+    (tmp_path / "llms.txt").write_text("# Index\n")
+    for i in range(count):
+        (tmp_path / f"page-{i:02d}.md").write_text(f"# Page {i}\n" + "text\n" * i)
+    (tmp_path / "bad-page.md").write_text("# Bad\n")
+    ctx = PipelineContext(root_path=str(tmp_path))
+    DiscoveryStage().execute(ctx)
+    return ctx
+
+
+def _per_file_snapshot(ctx: PipelineContext) -> list[tuple]:
+    """Reduce per-file results to comparable, timestamp-free tuples."""
+    return [
+        (
+            f.file_path,
+            f.parsed.title if f.parsed else None,
+            f.classification.size_bytes if f.classification else None,
+            f.quality.total_score if f.quality else None,
+        )
+        for f in ctx.files
+    ]
+
+
+class TestPerFileStage:
+    """Tests for PerFileStage, including the parallel execution modes."""
+
+    @pytest.mark.unit
+    def test_per_file_stage_id(self):
+        """Verify PerFileStage.stage_id is PER_FILE and defaults are serial."""
+        stage = PerFileStage()
+        assert stage.stage_id == PipelineStageId.PER_FILE
+        assert stage.jobs == 1
+        assert stage.backend == ExecutorBackend.THREAD
+
+    @pytest.mark.unit
+    def test_per_file_rejects_invalid_jobs(self):
+        """Verify jobs < 1 is rejected at construction."""
+        with pytest.raises(ValueError, match="jobs must be >= 1"):
+            PerFileStage(jobs=0)
+
+    @pytest.mark.unit
+    def test_per_file_backend_accepts_string(self):
+        """Verify backend may be given as its string value."""
+        stage = PerFileStage(jobs=2, backend="process")
+        assert stage.backend == ExecutorBackend.PROCESS
+        with pytest.raises(ValueError):
+            PerFileStage(jobs=2, backend="fibers")
+
+    @pytest.mark.unit
+    def test_per_file_thread_mode_matches_serial(self, tmp_path):
+        """Verify a threaded run produces the same results as a serial run."""
+        # Arrange
+        serial_ctx = _make_per_file_context(tmp_path, 12)
+        parallel_ctx = PipelineContext(root_path=str(tmp_path))
+        DiscoveryStage().execute(parallel_ctx)
+
+        # Act
+        serial = PerFileStage(validator=_TitleValidator())
+        serial_result = serial.execute(serial_ctx)
+        parallel = PerFileStage(validator=_TitleValidator(), jobs=4)
+        parallel_result = parallel.execute(parallel_ctx)
+
+        # Assert
+        assert _per_file_snapshot(parallel_ctx) == _per_file_snapshot(serial_ctx)
+        assert parallel_result.message == serial_result.message
+        assert list(parallel.file_contents.values()) == list(
+            serial.file_contents.values()
+        )
+
+    @pytest.mark.unit
+    def test_per_file_parallel_isolates_validator_errors(self, tmp_path):
+        """Verify one failing file does not affect the others in parallel mode."""
+        ctx = _make_per_file_context(tmp_path, 3)
+
+        result = PerFileStage(validator=_TitleValidator(), jobs=3).execute(ctx)
+
+        assert result.status == StageStatus.SUCCESS
+        bad = next(f for f in ctx.files if f.file_path.endswith("bad-page.md"))
+        assert bad.parsed is None
+        others = [f for f in ctx.files if f is not bad]
+        assert all(f.parsed is not None for f in others)
+        assert ctx.project_name == "Index"
+
+    @pytest.mark.unit
+    def test_per_file_parallel_counts_unreadable_files(self, tmp_path):
+        """Verify read failures are counted, not raised, in parallel mode."""
+        ctx = _make_per_file_context(tmp_path, 2)
+        (tmp_path / "page-00.md").write_bytes(b"\xff\xfe\x00bad")
+
+        result = PerFileStage(jobs=2).execute(ctx)
+
+        assert result.status == StageStatus.SUCCESS
+        assert "1 failed" in result.message
+
+    @pytest.mark.unit
+    def test_per_file_process_backend_rejects_unpicklable_validator(self):
+        """Verify an unpicklable validator fails at construction, not mid-run."""
+        with pytest.raises(ValueError, match="picklable"):
+            PerFileStage(validator=Mock(), jobs=2, backend="process")
+        with pytest.raises(ValueError, match="picklable"):
+            EcosystemPipeline(validator=Mock(), jobs=2, backend="process")
+        # Serial runs and the thread backend never pickle the validator.
+        PerFileStage(validator=Mock(), jobs=1, backend="process")
+        PerFileStage(validator=Mock(), jobs=2, backend="thread")
+
+    @pytest.mark.integration
+    def test_per_file_process_backend_sends_validator_once_per_worker(
+        self, tmp_path, monkeypatch
+    ):
+        """Verify the validator is not pickled again for every file."""
+        # Arrange
+        ctx = _make_per_file_context(tmp_path, 12)
+        stage = PerFileStage(
+            validator=_PickleCountingValidator(), jobs=2, backend="process"
+        )
+        monkeypatch.setattr(_PickleCountingValidator, "pickles", 0)
+
+        # Act
+        result = stage.execute(ctx)
+
+        # Assert
+        assert result.status == StageStatus.SUCCESS
+        assert _PickleCountingValidator.pickles <= 2
+        assert all(
+            f.parsed is not None
+            for f in ctx.files
+            if not f.file_path.endswith("bad-page.md")
+        )
+
+    @pytest.mark.integration
+    def test_per_file_broken_pool_falls_back_to_serial(self, tmp_path):
+        """Verify files left by a crashed worker are processed serially."""
+        # Arrange
+        ctx = _make_per_file_context(tmp_path, 4)
+        stage = PerFileStage(
+            validator=_WorkerCrashValidator(), jobs=2, backend="process"
+        )
+
+        # Act
+        result = stage.execute(ctx)
+
+        # Assert
+        assert result.status == StageStatus.SUCCESS
+        bad = next(f for f in ctx.files if f.file_path.endswith("bad-page.md"))
+        assert bad.parsed is None
+        assert all(f.parsed is not None for f in ctx.files if f is not bad)
+        assert list(stage.file_contents) == [f.file_id for f in ctx.files]
+
+    @pytest.mark.unit
+    def test_pipeline_passes_jobs_to_per_file(self, tmp_path):
+        """Verify EcosystemPipeline threads jobs/backend to Stage 2."""
+        (tmp_path / "llms.txt").write_text("# Test\n[API](api.md)\n")
+        (tmp_path / "api.md").write_text("# API\n")
+
+        ctx = EcosystemPipeline(validator=_TitleValidator(), jobs=2).run(
+            str(tmp_path)
+        )
+
+        assert ctx.stage_results[1].status == StageStatus.SUCCESS
+        assert all(f.parsed is not None for f in ctx.files)
+        with pytest.raises(ValueError):
+            EcosystemPipeline(jobs=0)
+
+
 # =============================================================================
 # PART 3: relationship.py Tests (~12 tests)
 # =============================================================================
@@ -552,6 +799,46 @@ class TestExtractLinksFromContent:
         assert len(links) == 1
         assert links[0].line_number == 3
 
+    @pytest.mark.unit
+    def test_extract_links_line_numbers_for_crlf_and_cr(self):
+        """Verify CRLF and lone-CR line endings both count as one line."""
+        crlf = extract_links_from_content("a\r\n[A](a.md)\r\n\r\n[B](b.md)")
+        cr = extract_links_from_content("a\r[A](a.md)\r\r[B](b.md)")
+        assert [link.line_number for link in crlf] == [2, 4]
+        assert [link.line_number for link in cr] == [2, 4]
+
+    @pytest.mark.unit
+    def test_extract_links_accepts_source_text(self):
+        """Verify a SourceText is used as-is and its line index is shared."""
+        source = preprocess("x\n[A](a.md) [B](b.md)\n\n[C](c.md)\n")
+        links = extract_links_from_content(source)
+        assert [(link.url, link.line_number) for link in links] == [
+            ("a.md", 2),
+            ("b.md", 2),
+            ("c.md", 4),
+        ]
+        assert source._line_starts is not None
+
+    @pytest.mark.unit
+    def test_extract_links_scales_linearly(self, monkeypatch):
+        """Verify 20k links on 20k lines share one line index (no rescans)."""
+        builds = []
+        build_line_starts = SourceText.line_starts.fget
+
+        def counting_line_starts(self):
+            if self._line_starts is None:
+                builds.append(1)
+            return build_line_starts(self)
+
+        monkeypatch.setattr(SourceText, "line_starts", property(counting_line_starts))
+        content = "".join(f"- [Page {i}](p{i}.md)\n" for i in range(20_000))
+
+        links = extract_links_from_content(content)
+
+        assert len(links) == 20_000
+        assert [link.line_number for link in links] == list(range(1, 20_001))
+        assert builds == [1]
+
     @pytest.mark.unit
     def test_extract_external_urls(self):
         """Verify extraction works with external URLs."""
@@ -671,6 +958,72 @@ class TestRelationshipStage:
         assert result.status == StageStatus.SUCCESS
         assert len(ctx.relationships) > 0
 
+    @pytest.mark.unit
+    def test_repeated_links_hit_the_resolver_memo(self, tmp_path):
+        """Verify a nav link repeated on every page is resolved once per dir."""
+        # Arrange — ten pages in one directory, each linking to the same two
+        pages = [
+            EcosystemFile(
+                file_path=str(tmp_path / f"page{i}.md"),
+                file_type=DocumentType.TYPE_3_CONTENT_PAGE,
+            )
+            for i in range(10)
+        ]
+        nav = "[Home](page0.md) [Missing](gone.md)"
+        stage = RelationshipStage(file_contents={p.file_id: nav for p in pages})
+        ctx = PipelineContext(root_path=str(tmp_path), files=pages)
+
+        # Act
+        stage.execute(ctx)
+
+        # Assert
+        assert stage.resolver.stats() == ResolverStats(
+            hits=18, misses=2, entries=2, unresolved=1
+        )
+        assert [r.is_resolved for r in ctx.relationships] == [True, False] * 10
+
+
+class TestLinkResolver:
+    """Tests for LinkResolver strategies and memoization."""
+
+    @pytest.fixture
+    def resolver(self, tmp_path):
+        files = [
+            EcosystemFile(
+                file_path=str(tmp_path / "llms.txt"),
+                file_type=DocumentType.TYPE_1_INDEX,
+            ),
+            EcosystemFile(
+                file_path=str(tmp_path / "docs" / "Guide.md"),
+                file_type=DocumentType.TYPE_3_CONTENT_PAGE,
+            ),
+        ]
+        lookup = RelationshipStage()._build_file_lookup(files)
+        return LinkResolver(lookup, str(tmp_path))
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "url",
+        ["Guide.md", "guide.md", "docs/Guide.md#setup", "./docs/Guide.md?x=1"],
+    )
+    def test_resolves_basename_and_relative_paths(self, resolver, tmp_path, url):
+        """Verify basename, case-folded, and path forms reach the same file."""
+        target = resolver.resolve(url, str(tmp_path / "llms.txt"))
+        assert target is not None
+        assert target.file_path.endswith("Guide.md")
+
+    @pytest.mark.unit
+    def test_memo_is_keyed_by_source_directory(self, resolver, tmp_path):
+        """Verify the same URL from another directory is a separate entry."""
+        # Act
+        for source in ("llms.txt", "a.md", "docs/b.md", "docs/c.md"):
+            resolver.resolve("nope.md", str(tmp_path / source))
+
+        # Assert
+        assert resolver.stats() == ResolverStats(
+            hits=2, misses=2, entries=2, unresolved=2
+        )
+
 
 # =============================================================================
 # PART 4: ecosystem_validator.py Tests (~15 tests)
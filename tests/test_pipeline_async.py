@@ -0,0 +1,202 @@
+"""Tests for the asyncio-native ecosystem pipeline (async_pipeline.py).
+
+Tests cover equivalence with EcosystemPipeline, stop_after, bounded
+Stage 2 concurrency, cancellation, and event-loop responsiveness.
+Coroutines are driven with ``asyncio.run()`` (no async test plugin).
+See RR-META-testing-standards for naming conventions and fixture patterns.
+"""
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from docstratum.parser import ParserAdapter
+from docstratum.pipeline import (
+    AsyncEcosystemPipeline,
+    AsyncPerFileStage,
+    AsyncPipelineStage,
+    EcosystemPipeline,
+    PipelineStageId,
+    StageStatus,
+)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+HEALTHY = str(FIXTURES_DIR / "ecosystems" / "healthy")
+
+
+class _SlowAdapter(ParserAdapter):
+    """ParserAdapter whose parse() sleeps and records peak concurrency."""
+
+    def __init__(self, delay: float = 0.02) -> None:
+        super().__init__()
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def parse(self, content, filename):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            return super().parse(content, filename)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+class _BlockingAdapter(ParserAdapter):
+    """ParserAdapter whose parse() waits until released."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def parse(self, content, filename):
+        self.started.set()
+        self.release.wait(timeout=5)
+        return super().parse(content, filename)
+
+
+def _summary(ctx):
+    paths = {f.file_id: f.file_path for f in ctx.files}
+    return (
+        [(f.file_path, f.file_type, f.coverage) for f in ctx.files],
+        [
+            (paths[r.source_file_id], r.target_url, r.is_resolved)
+            for r in ctx.relationships
+        ],
+        sorted(d.code for d in ctx.ecosystem_diagnostics),
+        [(r.stage, r.status) for r in ctx.stage_results],
+        ctx.ecosystem_score.total_score if ctx.ecosystem_score else None,
+    )
+
+
+class TestAsyncEcosystemPipeline:
+    """AsyncEcosystemPipeline.run() matches the synchronous runner."""
+
+    @pytest.mark.integration
+    def test_results_match_synchronous_pipeline(self):
+        """Verify files, edges, diagnostics, and score equal a sync run."""
+        # Arrange
+        expected = EcosystemPipeline(ParserAdapter()).run(HEALTHY)
+
+        # Act
+        ctx = asyncio.run(AsyncEcosystemPipeline(ParserAdapter()).run(HEALTHY))
+
+        # Assert
+        assert _summary(ctx) == _summary(expected)
+        assert ctx.ecosystem is not None
+
+    def test_stop_after_skips_later_stages(self):
+        """Verify stop_after behaves like the synchronous runner."""
+        # Arrange
+        pipeline = AsyncEcosystemPipeline()
+
+        # Act
+        ctx = asyncio.run(pipeline.run(HEALTHY, stop_after=PipelineStageId.PER_FILE))
+
+        # Assert
+        statuses = [r.status for r in ctx.stage_results]
+        assert statuses[:2] == [StageStatus.SUCCESS, StageStatus.SUCCESS]
+        assert all(s == StageStatus.SKIPPED for s in statuses[2:])
+        assert ctx.ecosystem is None
+
+    def test_several_runs_share_one_loop(self):
+        """Verify concurrent runs on one loop produce independent contexts."""
+        # Arrange
+        pipeline = AsyncEcosystemPipeline(ParserAdapter(), concurrency=2)
+
+        async def run_twice():
+            return await asyncio.gather(pipeline.run(HEALTHY), pipeline.run(HEALTHY))
+
+        # Act
+        first, second = asyncio.run(run_twice())
+
+        # Assert
+        assert _summary(first) == _summary(second)
+        assert first is not second
+
+    def test_invalid_concurrency_rejected(self):
+        """Verify concurrency must be at least 1."""
+        # Act / Assert
+        with pytest.raises(ValueError, match="concurrency"):
+            AsyncEcosystemPipeline(concurrency=0)
+        with pytest.raises(ValueError, match="concurrency"):
+            AsyncPerFileStage(concurrency=-1)
+
+
+class TestAsyncPerFileStage:
+    """Bounded concurrency, cancellation, and loop responsiveness."""
+
+    def test_satisfies_async_protocol(self):
+        """Verify the stage implements AsyncPipelineStage."""
+        # Act / Assert
+        assert isinstance(AsyncPerFileStage(), AsyncPipelineStage)
+
+    def test_concurrency_is_bounded(self, tmp_path):
+        """Verify no more than ``concurrency`` files are parsed at once."""
+        # Arrange
+        (tmp_path / "llms.txt").write_text("# Root\n\n## Docs\n\n- [A](a0.md)\n")
+        for i in range(12):
+            (tmp_path / f"a{i}.md").write_text(f"# Page {i}\n\nText\n")
+        adapter = _SlowAdapter()
+        pipeline = AsyncEcosystemPipeline(adapter, concurrency=3)
+
+        # Act
+        ctx = asyncio.run(pipeline.run(str(tmp_path)))
+
+        # Assert
+        assert len(ctx.files) == 13
+        assert all(f.parsed is not None for f in ctx.files)
+        assert 1 < adapter.peak <= 3
+
+    def test_event_loop_stays_responsive(self, tmp_path):
+        """Verify other coroutines keep running while files are parsed."""
+        # Arrange
+        for i in range(6):
+            (tmp_path / f"p{i}.md").write_text(f"# Page {i}\n")
+        (tmp_path / "llms.txt").write_text("# Root\n")
+        pipeline = AsyncEcosystemPipeline(_SlowAdapter(delay=0.05), concurrency=1)
+
+        async def main():
+            ticks = 0
+            task = asyncio.create_task(pipeline.run(str(tmp_path)))
+            while not task.done():
+                ticks += 1
+                await asyncio.sleep(0.005)
+            return ticks, await task
+
+        # Act
+        ticks, ctx = asyncio.run(main())
+
+        # Assert
+        assert ctx.ecosystem is not None
+        assert ticks > 10
+
+    def test_cancellation_propagates(self, tmp_path):
+        """Verify cancelling the run raises CancelledError to the caller."""
+        # Arrange
+        (tmp_path / "llms.txt").write_text("# Root\n")
+        (tmp_path / "page.md").write_text("# Page\n")
+        adapter = _BlockingAdapter()
+        pipeline = AsyncEcosystemPipeline(adapter, concurrency=1)
+
+        async def main():
+            task = asyncio.create_task(pipeline.run(str(tmp_path)))
+            while not adapter.started.is_set():
+                await asyncio.sleep(0.001)
+            task.cancel()
+            try:
+                await task
+            finally:
+                adapter.release.set()
+
+        # Act / Assert
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(main())
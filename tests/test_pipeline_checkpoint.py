@@ -0,0 +1,222 @@
+"""Tests for pipeline checkpoints (checkpoint.py) and EcosystemPipeline.resume().
+
+Tests cover resuming after every stage against an uninterrupted run,
+resuming without the project files, repeated resumes from one
+checkpoint, the DAG scheduler, and rejection of foreign or stale files.
+See RR-META-testing-standards for naming conventions and fixture patterns.
+"""
+
+import gzip
+import shutil
+from pathlib import Path
+
+import pytest
+
+from docstratum.parser import ParserAdapter
+from docstratum.pipeline import (
+    EcosystemPipeline,
+    PipelineCheckpoint,
+    PipelineContext,
+    PipelineStageId,
+    StageStatus,
+)
+from docstratum.pipeline.checkpoint import CHECKPOINT_FORMAT_VERSION
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "ecosystems"
+HEALTHY = str(FIXTURES_DIR / "healthy")
+
+
+def _render(ctx):
+    """Comparable summary of a context; file ids mapped back to paths."""
+    paths = {f.file_id: f.file_path for f in ctx.files}
+    return (
+        [(f.file_path, f.file_type, f.coverage) for f in ctx.files],
+        [
+            (paths[r.source_file_id], paths.get(r.target_file_id), r.target_url)
+            for r in ctx.relationships
+        ],
+        [(d.code, d.source_file, d.message) for d in ctx.ecosystem_diagnostics],
+        [(r.stage, r.status) for r in ctx.stage_results],
+        ctx.ecosystem_score.total_score if ctx.ecosystem_score else None,
+        ctx.project_name,
+    )
+
+
+class TestPipelineCheckpoint:
+    """Capture, save, and load round-trip a context."""
+
+    def test_round_trip_preserves_context(self, tmp_path):
+        """Verify a saved checkpoint loads back field for field."""
+        # Arrange
+        ctx = EcosystemPipeline(ParserAdapter()).run(HEALTHY)
+        checkpoint = PipelineCheckpoint.capture(ctx, {"id": "text"})
+        path = str(tmp_path / "nested" / "run.ckpt.json.gz")
+
+        # Act
+        checkpoint.save(path)
+        loaded = PipelineCheckpoint.load(path)
+
+        # Assert
+        assert loaded.stage == PipelineStageId.SCORING
+        assert loaded.file_contents == {"id": "text"}
+        assert loaded.context.model_dump() == ctx.model_dump()
+        with gzip.open(path, "rb") as fh:
+            assert fh.read(1) == b"{"
+
+    def test_stage_is_last_stage_that_ran(self):
+        """Verify stages skipped by stop_after are not counted."""
+        # Arrange
+        ctx = EcosystemPipeline().run(HEALTHY, PipelineStageId.PER_FILE)
+
+        # Act
+        checkpoint = PipelineCheckpoint.capture(ctx)
+
+        # Assert
+        assert checkpoint.stage == PipelineStageId.PER_FILE
+
+    def test_capture_requires_a_stage(self):
+        """Verify an empty context cannot be checkpointed."""
+        # Act / Assert
+        with pytest.raises(ValueError, match="before any stage"):
+            PipelineCheckpoint.capture(PipelineContext(root_path=HEALTHY))
+
+    def test_resume_state_copies_and_trims(self):
+        """Verify resume_state() leaves the checkpoint untouched."""
+        # Arrange
+        ctx = EcosystemPipeline().run(HEALTHY, PipelineStageId.DISCOVERY)
+        checkpoint = PipelineCheckpoint.capture(ctx, {"a": "b"})
+
+        # Act
+        context, contents = checkpoint.resume_state()
+        context.files.clear()
+        contents.clear()
+
+        # Assert
+        assert [r.stage for r in context.stage_results] == [PipelineStageId.DISCOVERY]
+        assert checkpoint.context.files
+        assert checkpoint.file_contents == {"a": "b"}
+
+    def test_non_checkpoint_file_rejected(self, tmp_path):
+        """Verify a plain file is a ValueError, not a crash."""
+        # Arrange
+        path = tmp_path / "bogus.gz"
+        path.write_text("not gzip")
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="Not a pipeline checkpoint"):
+            PipelineCheckpoint.load(str(path))
+
+    @pytest.mark.parametrize(
+        "field",
+        [
+            {"format_version": CHECKPOINT_FORMAT_VERSION + 1},
+            {"docstratum_version": "0.0.0-old"},
+        ],
+    )
+    def test_other_versions_rejected(self, tmp_path, field):
+        """Verify checkpoints from another layout or release are refused."""
+        # Arrange
+        ctx = EcosystemPipeline().run(HEALTHY, PipelineStageId.DISCOVERY)
+        path = str(tmp_path / "old.ckpt.json.gz")
+        PipelineCheckpoint.capture(ctx).model_copy(update=field).save(path)
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="was written by"):
+            PipelineCheckpoint.load(path)
+
+
+class TestEcosystemPipelineResume:
+    """resume() continues a checkpointed run as if it had not stopped."""
+
+    @pytest.mark.integration
+    @pytest.mark.parametrize(
+        "stage",
+        [
+            PipelineStageId.DISCOVERY,
+            PipelineStageId.PER_FILE,
+            PipelineStageId.RELATIONSHIP,
+            PipelineStageId.ECOSYSTEM_VALIDATION,
+            PipelineStageId.SCORING,
+        ],
+    )
+    def test_resume_after_each_stage_matches_full_run(self, tmp_path, stage):
+        """Verify files, edges, diagnostics, and score equal a full run."""
+        # Arrange
+        pipeline = EcosystemPipeline(ParserAdapter())
+        path = str(tmp_path / "run.ckpt.json.gz")
+        pipeline.run(HEALTHY, stop_after=stage, checkpoint=path)
+
+        # Act
+        ctx = pipeline.resume(path)
+
+        # Assert
+        assert _render(ctx) == _render(pipeline.run(HEALTHY))
+        assert ctx.ecosystem is not None
+
+    def test_resume_without_project_files(self, tmp_path):
+        """Verify Stages 4-5 run where the project tree does not exist."""
+        # Arrange
+        root = tmp_path / "project"
+        shutil.copytree(FIXTURES_DIR / "broken_links", root)
+        pipeline = EcosystemPipeline(ParserAdapter())
+        path = str(tmp_path / "ingest.ckpt.json.gz")
+        expected = pipeline.run(str(root))
+        pipeline.run(str(root), PipelineStageId.RELATIONSHIP, checkpoint=path)
+        shutil.rmtree(root)
+
+        # Act
+        ctx = pipeline.resume(path)
+
+        # Assert
+        assert _render(ctx) == _render(expected)
+
+    def test_one_checkpoint_seeds_many_runs(self):
+        """Verify resumed runs do not change the checkpoint they start from."""
+        # Arrange
+        pipeline = EcosystemPipeline(ParserAdapter())
+        checkpoint = PipelineCheckpoint.capture(
+            pipeline.run(HEALTHY, PipelineStageId.RELATIONSHIP)
+        )
+
+        # Act
+        partial = pipeline.resume(checkpoint, PipelineStageId.ECOSYSTEM_VALIDATION)
+        first = pipeline.resume(checkpoint)
+        second = EcosystemPipeline(scheduler="dag").resume(checkpoint)
+
+        # Assert
+        assert partial.ecosystem_score is None
+        assert _render(first) == _render(second)
+        assert checkpoint.context.ecosystem_diagnostics == []
+        assert len(checkpoint.context.stage_results) == 5
+
+    @pytest.mark.integration
+    def test_dag_resume_after_discovery(self, tmp_path):
+        """Verify the DAG scheduler resumes a Discovery checkpoint."""
+        # Arrange
+        path = str(tmp_path / "run.ckpt.json.gz")
+        EcosystemPipeline().run(HEALTHY, PipelineStageId.DISCOVERY, checkpoint=path)
+        pipeline = EcosystemPipeline(ParserAdapter(), scheduler="dag")
+
+        # Act
+        ctx = pipeline.resume(path)
+
+        # Assert
+        assert _render(ctx) == _render(EcosystemPipeline(ParserAdapter()).run(HEALTHY))
+        assert "per_file" in ctx.stage_results[1].node_timings
+
+    def test_resume_saves_a_new_checkpoint(self, tmp_path):
+        """Verify save_to checkpoints the resumed run."""
+        # Arrange
+        pipeline = EcosystemPipeline(ParserAdapter())
+        first = str(tmp_path / "stage1.ckpt.json.gz")
+        second = str(tmp_path / "stage3.ckpt.json.gz")
+        pipeline.run(HEALTHY, PipelineStageId.DISCOVERY, checkpoint=first)
+
+        # Act
+        pipeline.resume(first, PipelineStageId.RELATIONSHIP, save_to=second)
+        ctx = pipeline.resume(second)
+
+        # Assert
+        assert PipelineCheckpoint.load(second).stage == PipelineStageId.RELATIONSHIP
+        assert PipelineCheckpoint.load(second).file_contents
+        assert all(r.status == StageStatus.SUCCESS for r in ctx.stage_results)
@@ -0,0 +1,243 @@
+"""Tests for aggregate containment (pipeline/containment.py).
+
+Tests cover winnowed fingerprints, containment ratios, the aggregate
+index cache, and the Stage 4 W014 / AP_ECO_003 checks in full and
+incremental runs.
+See RR-META-testing-standards for naming conventions and fixture patterns.
+"""
+
+import random
+import shutil
+from pathlib import Path
+
+import pytest
+
+from docstratum.pipeline import (
+    AggregateIndexCache,
+    EcosystemPipeline,
+    EcosystemValidationStage,
+    IncrementalState,
+    PipelineContext,
+    containment,
+)
+from docstratum.pipeline.containment import AggregateIndex, fingerprints
+from docstratum.schema.classification import DocumentType
+from docstratum.schema.diagnostics import DiagnosticCode
+from docstratum.schema.ecosystem import EcosystemFile, FileRelationship
+from docstratum.schema.parsed import LinkRelationship
+from docstratum.schema.validation import ValidationLevel
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "ecosystems"
+
+
+def _pages(count: int, words: int = 150, seed: int = 1) -> list[str]:
+    """Random Markdown pages with a heading and ``words`` body words."""
+    rng = random.Random(seed)
+    vocab = [f"term{i}" for i in range(5000)]
+    return [
+        f"# Page {n}\n\n" + " ".join(rng.choice(vocab) for _ in range(words))
+        for n in range(count)
+    ]
+
+
+def _ecosystem(pages: list[str], aggregate: str):
+    """Index linking every page, the pages, and an aggregate; plus contents."""
+    index = EcosystemFile(file_path="/p/llms.txt", file_type=DocumentType.TYPE_1_INDEX)
+    page_files = [
+        EcosystemFile(
+            file_path=f"/p/page{n}.md", file_type=DocumentType.TYPE_3_CONTENT_PAGE
+        )
+        for n in range(len(pages))
+    ]
+    full = EcosystemFile(
+        file_path="/p/llms-full.txt", file_type=DocumentType.TYPE_2_FULL
+    )
+    relationships = [
+        FileRelationship(
+            source_file_id=index.file_id,
+            target_file_id=page.file_id,
+            target_url=page.file_path,
+            relationship_type=LinkRelationship.INDEXES,
+            is_resolved=True,
+        )
+        for page in page_files
+    ]
+    ctx = PipelineContext(files=[index, *page_files, full], relationships=relationships)
+    contents = {
+        page.file_id: text for page, text in zip(page_files, pages, strict=True)
+    }
+    contents[full.file_id] = aggregate
+    return ctx, contents
+
+
+def _w014(ctx):
+    return [
+        d
+        for d in ctx.ecosystem_diagnostics
+        if d.code == DiagnosticCode.W014_AGGREGATE_INCOMPLETE
+    ]
+
+
+class TestFingerprints:
+    """Winnowed fingerprints of a contained page are a subset of the whole."""
+
+    def test_contained_pages_are_fully_found(self):
+        """Verify every page copied into an aggregate has containment 1.0."""
+        # Arrange
+        pages = _pages(20)
+        aggregate = AggregateIndex("\n\n".join(pages))
+
+        # Act
+        ratios = [aggregate.containment(page).ratio for page in pages]
+
+        # Assert
+        assert ratios == [1.0] * len(pages)
+
+    def test_markup_changes_do_not_lose_content(self):
+        """Verify demoted headings and rewrapped lines still match."""
+        # Arrange
+        page = _pages(1)[0]
+        reformatted = "## " + page.lstrip("# ").replace(" ", "\n", 40)
+
+        # Act
+        containment = AggregateIndex("# All\n\n" + reformatted).containment(page)
+
+        # Assert
+        assert containment.ratio == 1.0
+
+    def test_absent_and_partial_pages(self):
+        """Verify an absent page scores near 0 and a half page near 0.5."""
+        # Arrange
+        present, absent = _pages(2)
+        words = present.split()
+        aggregate = AggregateIndex(" ".join(words[: len(words) // 2]))
+
+        # Act
+        half = aggregate.containment(present).ratio
+        none = aggregate.containment(absent).ratio
+
+        # Assert
+        assert none < 0.05
+        assert 0.35 < half < 0.65
+
+    def test_short_text_is_not_measured(self):
+        """Verify texts under FINGERPRINT_WORDS + WINNOW_WINDOW - 1 words."""
+        assert fingerprints("only a handful of words here") == set()
+        assert AggregateIndex(_pages(1)[0]).containment("too short") is None
+
+
+class TestAggregateIndexCache:
+    """Aggregate indexes are reused while the aggregate text is unchanged."""
+
+    def test_same_aggregate_is_fingerprinted_once(self):
+        """Verify an unchanged aggregate hits and a changed one misses."""
+        # Arrange
+        cache = AggregateIndexCache()
+        text = "\n".join(_pages(5))
+
+        # Act
+        first = cache.index(text)
+        again = cache.index(text)
+        changed = cache.index(text + " appended words")
+
+        # Assert
+        assert again is first
+        assert changed is not first
+        assert (cache.hits, cache.misses) == (1, 2)
+
+
+class TestAggregateChecks:
+    """The Stage 4 W014 and AP_ECO_003 checks."""
+
+    def test_missing_pages_reported_once_each(self):
+        """Verify W014 names each indexed page absent from llms-full.txt."""
+        # Arrange
+        pages = _pages(4)
+        ctx, contents = _ecosystem(pages, "\n\n".join(pages[:3]))
+        stage = EcosystemValidationStage(
+            file_contents=contents, aggregate_cache=AggregateIndexCache()
+        )
+
+        # Act
+        stage.execute(ctx)
+
+        # Assert
+        [diag] = stage.check_results["aggregate_incomplete"]
+        assert "/p/page3.md" in diag.message
+        assert diag.source_file == "/p/llms-full.txt"
+        assert stage.check_results["shadow_aggregate"] == []
+
+    def test_unrelated_aggregate_is_a_shadow_aggregate(self):
+        """Verify AP_ECO_003 fires when the aggregate holds other content."""
+        # Arrange
+        pages = _pages(3)
+        ctx, contents = _ecosystem(pages, "\n\n".join(_pages(3, seed=99)))
+        stage = EcosystemValidationStage(
+            file_contents=contents, aggregate_cache=AggregateIndexCache()
+        )
+
+        # Act
+        stage.execute(ctx)
+
+        # Assert
+        [shadow] = stage.check_results["shadow_aggregate"]
+        assert shadow.message.startswith("Anti-pattern AP_ECO_003")
+        assert shadow.level == ValidationLevel.L2_CONTENT
+        assert len(stage.check_results["aggregate_incomplete"]) == 3
+
+    def test_unindexed_pages_are_not_required(self):
+        """Verify pages the index does not link to are not checked."""
+        # Arrange
+        pages = _pages(2)
+        ctx, contents = _ecosystem(pages, pages[0])
+        ctx.relationships = ctx.relationships[:1]
+
+        # Act
+        EcosystemValidationStage(file_contents=contents).execute(ctx)
+
+        # Assert
+        assert _w014(ctx) == []
+
+    @pytest.mark.integration
+    def test_two_thousand_pages_in_one_pass_each(self, monkeypatch):
+        """Verify 2,000 pages against a 300k-word aggregate in one pass each."""
+        # Arrange
+        pages = _pages(2000, seed=5)
+        aggregate = "\n\n".join(pages[:-10])
+        ctx, contents = _ecosystem(pages, aggregate)
+        stage = EcosystemValidationStage(
+            file_contents=contents, aggregate_cache=AggregateIndexCache()
+        )
+        hashed = []
+
+        def counting_fingerprints(text):
+            hashed.append(text)
+            return fingerprints(text)
+
+        monkeypatch.setattr(containment, "fingerprints", counting_fingerprints)
+
+        # Act
+        stage.execute(ctx)
+
+        # Assert — the aggregate and every page are fingerprinted once
+        assert len(stage.check_results["aggregate_incomplete"]) == 10
+        assert sorted(hashed) == sorted([aggregate, *pages])
+
+    @pytest.mark.integration
+    def test_incremental_run_matches_full_run(self, tmp_path):
+        """Verify W014 sees a stale aggregate after a page edit."""
+        # Arrange
+        root = tmp_path / "healthy"
+        shutil.copytree(FIXTURES_DIR / "healthy", root)
+        pipeline = EcosystemPipeline(incremental=IncrementalState())
+        assert _w014(pipeline.run(str(root))) == []
+
+        # Act — the page changes but llms-full.txt is not regenerated
+        (root / "configuration.md").write_text("# Config\n\n" + _pages(1)[0])
+        ctx = pipeline.run(str(root))
+
+        # Assert
+        full = EcosystemPipeline().run(str(root))
+        assert [d.message for d in _w014(ctx)] == [d.message for d in _w014(full)]
+        assert len(_w014(ctx)) == 1
+        assert "configuration.md" in _w014(ctx)[0].message
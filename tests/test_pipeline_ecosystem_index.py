@@ -0,0 +1,250 @@
+"""Tests for the shared ecosystem index (EcosystemIndex).
+
+Tests cover the lookups Stage 4 and Stage 5 read, cache reuse across the
+two stages, and linear scaling on a large synthetic ecosystem.
+See RR-META-testing-standards for naming conventions and fixture patterns.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from docstratum.parser import ParserAdapter
+from docstratum.parser.section_matcher import coverage_of
+from docstratum.pipeline import (
+    EcosystemIndex,
+    EcosystemPipeline,
+    EcosystemValidationStage,
+    PipelineContext,
+    ScoringStage,
+    calculate_coverage,
+)
+from docstratum.schema.classification import (
+    DocumentClassification,
+    DocumentType,
+    SizeTier,
+)
+from docstratum.schema.constants import CanonicalCoverage, CanonicalSectionName
+from docstratum.schema.diagnostics import DiagnosticCode
+from docstratum.schema.ecosystem import EcosystemFile, FileRelationship
+from docstratum.schema.parsed import LinkRelationship, ParsedLlmsTxt, ParsedSection
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "ecosystems"
+
+
+def _file(path: str, file_type: DocumentType, tokens: int | None = None):
+    classification = None
+    if tokens is not None:
+        classification = DocumentClassification(
+            document_type=file_type,
+            size_bytes=tokens * 4,
+            estimated_tokens=tokens,
+            size_tier=SizeTier.STANDARD,
+            filename=path.rsplit("/", 1)[-1],
+        )
+    return EcosystemFile(
+        file_path=path, file_type=file_type, classification=classification
+    )
+
+
+def _edge(source, target, kind=LinkRelationship.INDEXES):
+    return FileRelationship(
+        source_file_id=source.file_id,
+        target_file_id=target.file_id if target else "",
+        target_url=target.file_path if target else "missing.md",
+        relationship_type=kind,
+        source_line=1,
+        is_resolved=target is not None,
+    )
+
+
+@pytest.fixture
+def small_context():
+    """Index file, two pages, one resolved, one broken, one external edge."""
+    index = _file("/p/llms.txt", DocumentType.TYPE_1_INDEX, tokens=100)
+    guide = _file("/p/guide.md", DocumentType.TYPE_3_CONTENT_PAGE, tokens=300)
+    api = _file("/p/api.md", DocumentType.TYPE_3_CONTENT_PAGE)
+    guide.parsed = ParsedLlmsTxt(
+        title="P",
+        sections=[
+            ParsedSection(name="Getting Started", line_number=3),
+            ParsedSection(name="faq", line_number=9),
+        ],
+    )
+    edges = [
+        _edge(index, guide),
+        _edge(index, None),
+        _edge(guide, None, LinkRelationship.EXTERNAL),
+    ]
+    return PipelineContext(files=[index, guide, api], relationships=edges)
+
+
+class TestEcosystemIndexLookups:
+    """Each lookup matches a direct scan of the context."""
+
+    def test_lookups_partition_files_and_edges(self, small_context):
+        """Verify type, edge, and token lookups over a small ecosystem."""
+        # Arrange
+        index_file, guide, api = small_context.files
+        resolved, broken, _external = small_context.relationships
+
+        # Act
+        index = EcosystemIndex.build(small_context)
+
+        # Assert
+        assert index.of_type(DocumentType.TYPE_1_INDEX) == [index_file]
+        assert index.of_type(DocumentType.TYPE_2_FULL) == ()
+        assert index.by_path["/p/api.md"] is api
+        assert index.by_id[guide.file_id] is guide
+        assert index.outgoing[index_file.file_id] == [resolved, broken]
+        assert index.internal_outgoing.get(guide.file_id) is None
+        assert index.incoming == {guide.file_id: [resolved]}
+        assert index.referenced_ids == {guide.file_id}
+        assert index.resolved == [resolved]
+        assert index.broken == [broken]
+        assert index.total_tokens == 400
+
+    def test_canonical_coverage_matches_names_and_aliases(self, small_context):
+        """Verify coverage is case-insensitive and honours aliases."""
+        # Act
+        covered = EcosystemIndex.build(small_context).canonical_coverage
+
+        # Assert
+        assert CanonicalSectionName.GETTING_STARTED in covered
+        assert CanonicalSectionName.FAQ in covered
+        assert calculate_coverage(small_context.files).checks_passed == len(covered)
+
+    def test_canonical_coverage_reuses_stage_2_matches(self, small_context):
+        """Verify a canonical_name set by the parser is used as-is."""
+        # Arrange
+        guide = small_context.files[1]
+        guide.parsed.sections[0].canonical_name = "Examples"
+
+        # Act
+        covered = EcosystemIndex.build(small_context).canonical_coverage
+
+        # Assert
+        assert CanonicalSectionName.EXAMPLES in covered
+        assert CanonicalSectionName.GETTING_STARTED not in covered
+
+
+class TestCoverageMasks:
+    """Ecosystem coverage is the OR of per-file masks set in Stage 2."""
+
+    def test_mask_is_or_of_file_masks(self, small_context):
+        """Verify stored masks are used without reading sections."""
+        # Arrange
+        index_file, _guide, api = small_context.files
+        index_file.coverage = CanonicalCoverage.MASTER_INDEX
+        api.coverage = CanonicalCoverage.API_REFERENCE | CanonicalCoverage.FAQ
+
+        # Act
+        mask = EcosystemIndex.build(small_context).coverage_mask
+
+        # Assert — guide has no mask, so its sections are measured
+        assert mask == (
+            CanonicalCoverage.MASTER_INDEX
+            | CanonicalCoverage.API_REFERENCE
+            | CanonicalCoverage.FAQ
+            | CanonicalCoverage.GETTING_STARTED
+        )
+
+    @pytest.mark.integration
+    def test_stage_2_sets_a_mask_per_parsed_file(self):
+        """Verify the pipeline stores each parsed file's coverage."""
+        # Act
+        pipeline = EcosystemPipeline(ParserAdapter())
+        ctx = pipeline.run(str(FIXTURES_DIR / "healthy"))
+
+        # Assert
+        parsed = [f for f in ctx.files if f.parsed is not None]
+        assert parsed
+        for eco_file in parsed:
+            assert eco_file.coverage == coverage_of(eco_file.parsed)
+        restored = type(parsed[0]).model_validate_json(parsed[0].model_dump_json())
+        assert restored.coverage == parsed[0].coverage
+
+
+class TestEcosystemIndexCaching:
+    """Stage 4 and Stage 5 share one index per context."""
+
+    def test_index_is_reused_until_lists_are_replaced(self, small_context):
+        """Verify of() caches, and a replaced list triggers a rebuild."""
+        # Arrange
+        first = EcosystemIndex.of(small_context)
+
+        # Act
+        again = EcosystemIndex.of(small_context)
+        small_context.relationships = list(small_context.relationships[:1])
+        rebuilt = EcosystemIndex.of(small_context)
+
+        # Assert
+        assert again is first
+        assert rebuilt is not first
+        assert rebuilt.broken == []
+
+    def test_scoring_reuses_stage4_index(self, small_context, monkeypatch):
+        """Verify ScoringStage does not rebuild the index Stage 4 built."""
+        # Arrange
+        builds = []
+        original = EcosystemIndex.build.__func__
+
+        def counting_build(cls, context):
+            builds.append(1)
+            return original(cls, context)
+
+        monkeypatch.setattr(EcosystemIndex, "build", classmethod(counting_build))
+
+        # Act
+        EcosystemValidationStage().execute(small_context)
+        ScoringStage().execute(small_context)
+
+        # Assert
+        assert builds == [1]
+        assert small_context.ecosystem_score is not None
+
+
+class TestEcosystemIndexScaling:
+    """Stage 4 + Stage 5 stay linear in files and edges."""
+
+    @pytest.mark.slow
+    @pytest.mark.integration
+    def test_many_index_files_and_links(self):
+        """Verify 10k files / 100k links with 500 index files are validated.
+
+        Before the shared index, per-index-file relationship scans made this
+        shape O(index files x links) and took tens of seconds. Marked slow;
+        the structural guarantee (one index build shared by every check) is
+        covered by the caching tests above.
+        """
+        # Arrange
+        files = [
+            _file(f"/p/{j}/llms.txt", DocumentType.TYPE_1_INDEX) for j in range(500)
+        ]
+        files += [
+            _file(f"/p/page{i}.md", DocumentType.TYPE_3_CONTENT_PAGE)
+            for i in range(9500)
+        ]
+        edges = [
+            _edge(
+                files[i % len(files)],
+                None if i % 50 == 0 else files[(i * 7 + 1) % len(files)],
+                LinkRelationship.REFERENCES,
+            )
+            for i in range(100_000)
+        ]
+        ctx = PipelineContext(files=files, relationships=edges)
+
+        # Act
+        EcosystemValidationStage().execute(ctx)
+        ScoringStage().execute(ctx)
+
+        # Assert
+        broken = [
+            d
+            for d in ctx.ecosystem_diagnostics
+            if d.code == DiagnosticCode.W012_BROKEN_CROSS_FILE_LINK
+            and "AP_ECO_002" not in d.message
+        ]
+        assert len(broken) == 2000
+        assert ctx.ecosystem_score is not None
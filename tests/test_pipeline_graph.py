@@ -0,0 +1,237 @@
+"""Tests for the CSR relationship graph (RelationshipGraph).
+
+Tests cover the CSR layout, neighbour and reachability queries, strongly
+connected components (against a brute-force reference), the Stage 4
+unreachable-file check, and Stage 3 building the graph.
+See RR-META-testing-standards for naming conventions and fixture patterns.
+"""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from docstratum.pipeline import (
+    EcosystemPipeline,
+    EcosystemValidationStage,
+    PipelineContext,
+    RelationshipGraph,
+)
+from docstratum.schema.classification import DocumentType
+from docstratum.schema.diagnostics import DiagnosticCode
+from docstratum.schema.ecosystem import EcosystemFile, FileRelationship
+from docstratum.schema.parsed import LinkRelationship
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "ecosystems"
+
+
+def _files(count: int) -> list[EcosystemFile]:
+    """Node 0 is the index file; the rest are content pages."""
+    page = DocumentType.TYPE_3_CONTENT_PAGE
+    return [
+        EcosystemFile(
+            file_path=f"/p/{n}.md",
+            file_type=DocumentType.TYPE_1_INDEX if n == 0 else page,
+        )
+        for n in range(count)
+    ]
+
+
+def _context(count: int, edges, kind=LinkRelationship.REFERENCES) -> PipelineContext:
+    """Context over ``count`` files; ``edges`` are (source, target|None)."""
+    files = _files(count)
+    relationships = [
+        FileRelationship(
+            source_file_id=files[s].file_id,
+            target_file_id=files[t].file_id if t is not None else "",
+            target_url=f"{t}.md",
+            relationship_type=kind,
+            is_resolved=t is not None,
+        )
+        for s, t in edges
+    ]
+    return PipelineContext(files=files, relationships=relationships)
+
+
+def _reference_sccs(count: int, edges) -> set[frozenset[int]]:
+    """Brute force: nodes u, v share a component iff each reaches the other."""
+    adjacency = {n: set() for n in range(count)}
+    for s, t in edges:
+        if t is not None:
+            adjacency[s].add(t)
+
+    def reach(start):
+        seen, stack = {start}, [start]
+        while stack:
+            for nxt in adjacency[stack.pop()]:
+                if nxt not in seen:
+                    seen.add(nxt)
+                    stack.append(nxt)
+        return seen
+
+    reaches = {n: reach(n) for n in range(count)}
+    return {
+        frozenset(v for v in range(count) if v in reaches[u] and u in reaches[v])
+        for u in range(count)
+    }
+
+
+class TestRelationshipGraphLayout:
+    """CSR arrays and neighbour queries."""
+
+    def test_out_and_in_edges_follow_edge_order(self):
+        """Verify per-node edge ids, degrees, and neighbours."""
+        # Arrange — edge ids 0..4
+        ctx = _context(4, [(0, 1), (0, 2), (1, 2), (2, None), (3, 1)])
+
+        # Act
+        graph = RelationshipGraph.build(ctx)
+
+        # Assert
+        assert list(graph.out_edge_ids(0)) == [0, 1]
+        assert list(graph.out_edge_ids(2)) == [3]
+        assert list(graph.in_edge_ids(1)) == [0, 4]
+        assert list(graph.in_edge_ids(2)) == [1, 2]
+        assert graph.out_degree(2) == 1
+        assert graph.in_degree(0) == 0
+        assert list(graph.successors(2)) == []
+        assert sorted(graph.predecessors(1)) == [0, 3]
+        assert graph.edge_targets[3] == -1
+        assert graph.edge_kind(4) == LinkRelationship.REFERENCES
+        assert graph.index_nodes == [0]
+        assert (graph.node_count, graph.edge_count) == (4, 5)
+
+    def test_of_caches_until_relationships_are_replaced(self):
+        """Verify of() reuses the graph and rebuilds for a new edge list."""
+        # Arrange
+        ctx = _context(3, [(0, 1)])
+        first = RelationshipGraph.of(ctx)
+
+        # Act
+        same = RelationshipGraph.of(ctx)
+        ctx.relationships = ctx.relationships + _context(3, [(1, 2)]).relationships
+
+        # Assert
+        assert same is first
+        assert RelationshipGraph.of(ctx) is not first
+
+
+class TestRelationshipGraphTraversals:
+    """Reachability and strongly connected components."""
+
+    def test_unreachable_finds_cycles_detached_from_index(self):
+        """Verify a two-page cycle the index never reaches is unreachable."""
+        # Arrange — 0 → 1; 2 ⇄ 3; 4 isolated
+        ctx = _context(5, [(0, 1), (2, 3), (3, 2)])
+
+        # Act
+        graph = RelationshipGraph.build(ctx)
+
+        # Assert
+        assert graph.unreachable() == [2, 3, 4]
+        assert graph.unreachable(roots=[2]) == [0, 1, 4]
+        assert list(graph.reachable([0])) == [1, 1, 0, 0, 0]
+
+    def test_reachable_can_filter_by_relationship_type(self):
+        """Verify kinds= restricts the traversal to the given edge types."""
+        # Arrange
+        ctx = _context(3, [(0, 1), (1, 2)], kind=LinkRelationship.INDEXES)
+        ctx.relationships[1].relationship_type = LinkRelationship.REFERENCES
+
+        # Act
+        graph = RelationshipGraph.build(ctx)
+
+        # Assert
+        assert list(graph.reachable([0])) == [1, 1, 1]
+        indexes_only = graph.reachable([0], kinds=[LinkRelationship.INDEXES])
+        assert list(indexes_only) == [1, 1, 0]
+
+    def test_sccs_match_brute_force_on_random_graphs(self):
+        """Verify Tarjan's components against pairwise reachability."""
+        rng = random.Random(7)
+        for _ in range(20):
+            # Arrange
+            count = rng.randint(1, 30)
+            edges = [
+                (rng.randrange(count), rng.choice([None, *range(count)]))
+                for _ in range(rng.randint(0, 3 * count))
+            ]
+            ctx = _context(count, edges)
+
+            # Act
+            sccs = RelationshipGraph.build(ctx).strongly_connected_components()
+
+            # Assert
+            assert {frozenset(c) for c in sccs} == _reference_sccs(count, edges)
+            assert sum(len(c) for c in sccs) == count
+
+    def test_sccs_come_out_in_reverse_topological_order(self):
+        """Verify a component precedes the components that link to it."""
+        # Arrange — 0 → {1 ⇄ 2} → 3
+        ctx = _context(4, [(0, 1), (1, 2), (2, 1), (2, 3)])
+
+        # Act
+        sccs = RelationshipGraph.build(ctx).strongly_connected_components()
+
+        # Assert
+        assert sccs == [[3], [1, 2], [0]]
+
+    def test_deep_chain_does_not_recurse(self):
+        """Verify a 50k-node link chain is handled iteratively."""
+        # Arrange
+        count = 50_000
+        ctx = _context(count, [(n, n + 1) for n in range(count - 1)] + [(count - 1, 0)])
+
+        # Act
+        graph = RelationshipGraph.build(ctx)
+
+        # Assert
+        assert len(graph.strongly_connected_components()) == 1
+        assert graph.unreachable() == []
+
+
+class TestUnreachableFilesCheck:
+    """Stage 4 flags referenced files the index cannot reach."""
+
+    def test_cross_referencing_drafts_are_flagged_once(self):
+        """Verify the cycle is E010 here and not also an orphan."""
+        # Arrange — 0 → 1; drafts 2 ⇄ 3 link only to each other
+        ctx = _context(4, [(0, 1), (2, 3), (3, 2)])
+
+        # Act
+        EcosystemValidationStage().execute(ctx)
+
+        # Assert
+        e010 = [
+            d
+            for d in ctx.ecosystem_diagnostics
+            if d.code == DiagnosticCode.E010_ORPHANED_ECOSYSTEM_FILE
+        ]
+        assert sorted(d.source_file for d in e010) == ["/p/2.md", "/p/3.md"]
+        assert all("cannot be reached from the index" in d.message for d in e010)
+
+    def test_no_index_file_skips_the_check(self):
+        """Verify without an index file nothing is reported as unreachable."""
+        # Arrange
+        ctx = _context(3, [(1, 2), (2, 1)])
+        ctx.files[0].file_type = DocumentType.TYPE_3_CONTENT_PAGE
+
+        # Act
+        stage = EcosystemValidationStage()
+        stage.execute(ctx)
+
+        # Assert
+        assert stage.check_results["unreachable_files"] == []
+
+    @pytest.mark.integration
+    def test_relationship_stage_builds_the_graph(self):
+        """Verify Stage 3 caches a graph that Stage 4 reuses."""
+        # Act
+        ctx = EcosystemPipeline().run(str(FIXTURES_DIR / "healthy"))
+
+        # Assert
+        graph = ctx._relationship_graph
+        assert graph is not None
+        assert RelationshipGraph.of(ctx) is graph
+        assert graph.edge_count == len(ctx.relationships)
+        assert graph.unreachable() == []
@@ -0,0 +1,273 @@
+"""Tests for incremental ecosystem re-validation (IncrementalState).
+
+Each scenario copies a fixture ecosystem to a temporary directory, runs the
+pipeline once to seed the snapshot, edits the files, and checks that the
+incremental run (a) only re-parses what changed and (b) produces the same
+context as a fresh full run.
+See RR-META-testing-standards for naming conventions and fixture patterns.
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from docstratum.parser.validator_adapter import ParserAdapter
+from docstratum.pipeline import (
+    EcosystemPipeline,
+    IncrementalState,
+    fingerprint_file,
+)
+from docstratum.pipeline.ecosystem_validator import EcosystemValidationStage
+from docstratum.schema.diagnostics import DiagnosticCode
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "ecosystems"
+
+
+class _CountingAdapter(ParserAdapter):
+    """ParserAdapter that records which files it parsed."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.parsed_names: list[str] = []
+
+    def parse(self, content, filename):
+        self.parsed_names.append(filename)
+        return super().parse(content, filename)
+
+
+def _copy_fixture(name: str, tmp_path: Path) -> Path:
+    """Copy a fixture ecosystem so the test can edit it."""
+    target = tmp_path / name
+    shutil.copytree(FIXTURES_DIR / name, target)
+    return target
+
+
+def _strip_timestamps(value):
+    """Drop ``*_at`` fields, which differ between any two runs."""
+    if isinstance(value, dict):
+        return {
+            k: _strip_timestamps(v) for k, v in value.items() if not k.endswith("_at")
+        }
+    if isinstance(value, list):
+        return [_strip_timestamps(v) for v in value]
+    return value
+
+
+def _render(ctx) -> str:
+    """Comparable rendering of a context; file ids mapped back to paths."""
+    rendered = repr(
+        _strip_timestamps(
+            {
+                "files": [f.model_dump(mode="json") for f in ctx.files],
+                "relationships": [r.model_dump(mode="json") for r in ctx.relationships],
+                "diagnostics": [
+                    d.model_dump(mode="json") for d in ctx.ecosystem_diagnostics
+                ],
+                "score": ctx.ecosystem_score.model_dump(mode="json"),
+                "project_name": ctx.project_name,
+            }
+        )
+    )
+    for f in ctx.files:
+        rendered = rendered.replace(f.file_id, f.file_path)
+    return rendered
+
+
+def _full_run(root: Path) -> str:
+    return _render(EcosystemPipeline(validator=ParserAdapter()).run(str(root)))
+
+
+class TestIncrementalRuns:
+    """Incremental runs re-do only affected work and match full runs."""
+
+    @pytest.mark.integration
+    def test_unchanged_ecosystem_reparses_nothing(self, tmp_path):
+        """Verify a second run over unchanged files reuses every result."""
+        # Arrange
+        root = _copy_fixture("healthy", tmp_path)
+        adapter = _CountingAdapter()
+        state = IncrementalState()
+        pipeline = EcosystemPipeline(validator=adapter, incremental=state)
+        first = _render(pipeline.run(str(root)))
+        adapter.parsed_names.clear()
+
+        # Act
+        second = pipeline.run(str(root))
+
+        # Assert
+        assert adapter.parsed_names == []
+        assert len(state.last_changes.unchanged) == 5
+        assert _render(second) == first
+
+    @pytest.mark.integration
+    def test_modified_file_is_the_only_one_reparsed(self, tmp_path):
+        """Verify editing one page re-parses it alone and matches a full run."""
+        # Arrange
+        root = _copy_fixture("healthy", tmp_path)
+        adapter = _CountingAdapter()
+        pipeline = EcosystemPipeline(validator=adapter, incremental=IncrementalState())
+        pipeline.run(str(root))
+        adapter.parsed_names.clear()
+        page = root / "api-reference.md"
+        page.write_text(page.read_text() + "\n## FAQ\n\nNew section.\n")
+
+        # Act
+        ctx = pipeline.run(str(root))
+
+        # Assert
+        assert adapter.parsed_names == ["api-reference.md"]
+        assert pipeline.incremental.last_changes.modified == (str(page),)
+        assert _render(ctx) == _full_run(root)
+
+    @pytest.mark.integration
+    def test_added_target_resolves_previously_broken_link(self, tmp_path):
+        """Verify adding a linked file re-resolves edges from unchanged sources."""
+        # Arrange
+        root = _copy_fixture("broken_links", tmp_path)
+        pipeline = EcosystemPipeline(
+            validator=ParserAdapter(), incremental=IncrementalState()
+        )
+        before = pipeline.run(str(root))
+        broken_before = [
+            d
+            for d in before.ecosystem_diagnostics
+            if d.code == DiagnosticCode.W012_BROKEN_CROSS_FILE_LINK
+        ]
+        (root / "missing-guide.md").write_text("# Migration Guide\n\nSteps.\n")
+
+        # Act
+        ctx = pipeline.run(str(root))
+
+        # Assert
+        broken_after = [
+            d
+            for d in ctx.ecosystem_diagnostics
+            if d.code == DiagnosticCode.W012_BROKEN_CROSS_FILE_LINK
+        ]
+        assert len(broken_after) < len(broken_before)
+        assert pipeline.incremental.last_changes.added == (
+            str(root / "missing-guide.md"),
+        )
+        assert _render(ctx) == _full_run(root)
+
+    @pytest.mark.integration
+    def test_added_target_without_validator(self, tmp_path):
+        """Verify re-resolution works for regex-extracted (unparsed) links."""
+        # Arrange
+        root = _copy_fixture("broken_links", tmp_path)
+        pipeline = EcosystemPipeline(incremental=IncrementalState())
+        pipeline.run(str(root))
+        (root / "old-docs.md").write_text("# Legacy\n")
+
+        # Act
+        ctx = pipeline.run(str(root))
+
+        # Assert
+        assert _render(ctx) == _render(EcosystemPipeline().run(str(root)))
+
+    @pytest.mark.integration
+    def test_removed_file_matches_full_run(self, tmp_path):
+        """Verify deleting a linked page invalidates the edges into it."""
+        # Arrange
+        root = _copy_fixture("healthy", tmp_path)
+        pipeline = EcosystemPipeline(
+            validator=ParserAdapter(), incremental=IncrementalState()
+        )
+        pipeline.run(str(root))
+        (root / "configuration.md").unlink()
+
+        # Act
+        ctx = pipeline.run(str(root))
+
+        # Assert
+        assert len(pipeline.incremental.last_changes.removed) == 1
+        assert _render(ctx) == _full_run(root)
+
+    @pytest.mark.integration
+    def test_unaffected_checks_are_not_rerun(self, tmp_path, monkeypatch):
+        """Verify a content-only edit skips checks that read only files/edges."""
+        # Arrange
+        root = _copy_fixture("healthy", tmp_path)
+        pipeline = EcosystemPipeline(
+            validator=ParserAdapter(), incremental=IncrementalState()
+        )
+        pipeline.run(str(root))
+        calls = []
+        original = EcosystemValidationStage._run_check
+
+        def spy(self, check, context, index):
+            calls.append(check.name)
+            return original(self, check, context, index)
+
+        monkeypatch.setattr(EcosystemValidationStage, "_run_check", spy)
+        page = root / "getting-started.md"
+        page.write_text(page.read_text() + "\nOne more paragraph.\n")
+
+        # Act
+        ctx = pipeline.run(str(root))
+
+        # Assert
+        assert "redundant_content" in calls
+        assert "orphaned_files" not in calls
+        assert _render(ctx) == _full_run(root)
+
+
+class TestIncrementalState:
+    """Snapshot persistence and invalidation."""
+
+    @pytest.mark.integration
+    def test_snapshot_persists_across_processes(self, tmp_path):
+        """Verify a fresh state over the same file reuses the snapshot."""
+        # Arrange
+        root = _copy_fixture("healthy", tmp_path)
+        path = tmp_path / "state" / "snapshot.json"
+        EcosystemPipeline(
+            validator=_CountingAdapter(), incremental=IncrementalState(path)
+        ).run(str(root))
+        adapter = _CountingAdapter()
+
+        # Act
+        ctx = EcosystemPipeline(
+            validator=adapter, incremental=IncrementalState(path)
+        ).run(str(root))
+
+        # Assert
+        assert path.exists()
+        assert adapter.parsed_names == []
+        assert _render(ctx) == _full_run(root)
+
+    @pytest.mark.integration
+    def test_different_validator_forces_full_run(self, tmp_path):
+        """Verify a snapshot from another validator is not reused."""
+        # Arrange
+        root = _copy_fixture("healthy", tmp_path)
+        state = IncrementalState()
+        EcosystemPipeline(incremental=state).run(str(root))
+        adapter = _CountingAdapter()
+
+        # Act
+        EcosystemPipeline(validator=adapter, incremental=state).run(str(root))
+
+        # Assert
+        assert len(adapter.parsed_names) == 5
+        assert len(state.last_changes.added) == 5
+
+    def test_fingerprint_skips_hash_when_stat_matches(self, tmp_path):
+        """Verify size+mtime equality reuses the previous fingerprint."""
+        # Arrange
+        path = tmp_path / "f.md"
+        path.write_text("# A\n")
+        first = fingerprint_file(str(path))
+
+        # Act — same content, new mtime
+        same = fingerprint_file(str(path), first)
+        os.utime(path, ns=(first.mtime_ns + 10**9, first.mtime_ns + 10**9))
+        touched = fingerprint_file(str(path), first)
+
+        # Assert
+        assert same is first
+        assert touched.sha256 == first.sha256
+        assert touched.mtime_ns != first.mtime_ns
+        assert fingerprint_file(str(tmp_path / "missing.md")) is None
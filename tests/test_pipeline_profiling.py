@@ -0,0 +1,284 @@
+"""Tests for opt-in per-stage profiling (profiling.py).
+
+Tests cover StageProfiler measurements, per-file step timings in
+PerFileStage, EcosystemPipeline.run(profile=True), export with
+write_profiles(), and profiles surviving a checkpoint round trip.
+See RR-META-testing-standards for naming conventions and fixture patterns.
+"""
+
+import pstats
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from docstratum.parser import ParserAdapter
+from docstratum.pipeline import (
+    EcosystemPipeline,
+    FileTimings,
+    PerFileStage,
+    PipelineCheckpoint,
+    PipelineContext,
+    PipelineStageId,
+    ScoringStage,
+    StageProfile,
+    StageProfiler,
+    StageStatus,
+    write_profiles,
+)
+from docstratum.pipeline.discovery import DiscoveryStage
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "ecosystems"
+HEALTHY = str(FIXTURES_DIR / "healthy")
+
+
+def _allocate():
+    return [str(i) * 10 for i in range(5000)]
+
+
+def _work_in(filename):
+    """A function named ``work`` whose code claims to live in ``filename``."""
+    namespace = {}
+    source = "def work(n):\n    total = 0\n    for i in range(n):\n        total += i\n"
+    exec(compile(source, filename, "exec"), namespace)
+    return namespace["work"]
+
+
+class TestStageProfiler:
+    """StageProfiler captures CPU time and memory of its block."""
+
+    def test_profile_names_the_work_done(self):
+        """Verify functions, peak, and allocations reflect the block."""
+        # Arrange
+        profiler = StageProfiler()
+
+        # Act
+        with profiler:
+            kept = _allocate()
+        profile = profiler.profile()
+
+        # Assert
+        assert any("_allocate" in f.function for f in profile.top_functions)
+        assert profile.memory_peak > 5000 * 40
+        assert profile.top_allocations[0].size_bytes > 0
+        assert "test_pipeline_profiling.py" in profile.top_allocations[0].location
+        assert len(kept) == 5000
+
+    def test_same_named_functions_kept_apart_in_order(self):
+        """Verify rows are per (file, line, name), sorted, with raw times."""
+        # Arrange
+        alpha, beta = _work_in("alpha_mod.py"), _work_in("beta_mod.py")
+        profiler = StageProfiler()
+
+        # Act
+        with profiler:
+            alpha(200_000)
+            beta(100_000)
+        top = profiler.profile().top_functions
+
+        # Assert
+        rows = {f.function: f for f in top}
+        assert {"alpha_mod.py:1(work)", "beta_mod.py:1(work)"} <= set(rows)
+        cumulative = [f.cumulative_ms for f in top]
+        assert cumulative == sorted(cumulative, reverse=True)
+        assert rows["alpha_mod.py:1(work)"].own_ms > 0
+        assert rows["beta_mod.py:1(work)"].own_ms > 0
+
+    def test_stats_load_the_cpu_profile(self):
+        """Verify the stored profile reads back as pstats data."""
+        # Arrange
+        profiler = StageProfiler()
+        with profiler:
+            _allocate()
+
+        # Act
+        stats = profiler.profile().stats()
+
+        # Assert
+        assert isinstance(stats, pstats.Stats)
+        assert any(name == "_allocate" for _, _, name in stats.stats)
+
+    def test_callers_tracing_is_left_running(self):
+        """Verify tracemalloc started by the caller is not stopped."""
+        # Arrange
+        tracemalloc.start()
+        try:
+            # Act
+            with StageProfiler():
+                _allocate()
+
+            # Assert
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+    def test_callers_peak_kept_before_reset(self):
+        """Verify the caller's peak is readable after entry resets it."""
+        # Arrange
+        tracemalloc.start()
+        try:
+            kept = _allocate()
+            del kept
+            peak = tracemalloc.get_traced_memory()[1]
+            profiler = StageProfiler()
+
+            # Act
+            with profiler:
+                pass
+
+            # Assert
+            assert profiler.caller_peak >= peak
+            assert tracemalloc.get_traced_memory()[1] < peak
+        finally:
+            tracemalloc.stop()
+
+    def test_own_tracing_is_stopped(self):
+        """Verify tracemalloc is off again after a profiled block."""
+        # Act
+        with StageProfiler():
+            pass
+
+        # Assert
+        assert not tracemalloc.is_tracing()
+
+
+class TestPerFileTimings:
+    """PerFileStage records read/parse/classify/validate/score timings."""
+
+    @pytest.mark.parametrize("jobs", [1, 3])
+    def test_every_file_is_timed(self, jobs):
+        """Verify each file has timings for all five steps, in file order."""
+        # Arrange
+        context = PipelineContext(root_path=HEALTHY)
+        DiscoveryStage().execute(context)
+        stage = PerFileStage(ParserAdapter(), jobs=jobs)
+
+        # Act
+        stage.execute(context)
+
+        # Assert
+        assert list(stage.file_timings) == [f.file_path for f in context.files]
+        for timings in stage.file_timings.values():
+            assert timings.parse_ms > 0
+            assert timings.total_ms == pytest.approx(sum(timings))
+
+    def test_read_only_mode_times_the_read(self, tmp_path):
+        """Verify without a validator only the read step is timed."""
+        # Arrange
+        (tmp_path / "llms.txt").write_text("# Root\n")
+        context = PipelineContext(root_path=str(tmp_path))
+        DiscoveryStage().execute(context)
+        stage = PerFileStage()
+
+        # Act
+        stage.execute(context)
+
+        # Assert
+        (timings,) = stage.file_timings.values()
+        assert timings.read_ms > 0
+        assert timings[1:] == FileTimings()[1:]
+
+
+class TestProfiledRun:
+    """EcosystemPipeline.run(profile=True) and write_profiles()."""
+
+    @pytest.mark.integration
+    def test_every_stage_has_a_profile(self):
+        """Verify profiles on each result and file timings on Stage 2."""
+        # Act
+        ctx = EcosystemPipeline(ParserAdapter()).run(HEALTHY, profile=True)
+
+        # Assert
+        assert all(r.profile is not None for r in ctx.stage_results)
+        assert all(r.profile.top_functions for r in ctx.stage_results)
+        per_file = ctx.stage_results[1].profile
+        assert set(per_file.file_timings) == {f.file_path for f in ctx.files}
+        assert ctx.stage_results[2].profile.file_timings == {}
+
+    def test_results_match_unprofiled_run(self):
+        """Verify profiling does not change what the pipeline produces."""
+        # Arrange
+        expected = EcosystemPipeline(ParserAdapter()).run(HEALTHY)
+
+        # Act
+        ctx = EcosystemPipeline(ParserAdapter(), scheduler="dag").run(
+            HEALTHY, profile=True
+        )
+
+        # Assert
+        assert ctx.ecosystem_score.total_score == expected.ecosystem_score.total_score
+        assert [d.code for d in ctx.ecosystem_diagnostics] == [
+            d.code for d in expected.ecosystem_diagnostics
+        ]
+        assert ctx.stage_results[1].node_timings == {}
+
+    def test_default_run_has_no_profiles(self):
+        """Verify profiling is opt-in."""
+        # Act
+        ctx = EcosystemPipeline().run(HEALTHY)
+
+        # Assert
+        assert all(r.profile is None for r in ctx.stage_results)
+
+    def test_skipped_and_failed_stages(self, monkeypatch):
+        """Verify failed stages keep a profile and skipped ones have none."""
+
+        # Arrange
+        def boom(self, context):
+            raise RuntimeError("scoring exploded")
+
+        monkeypatch.setattr(ScoringStage, "execute", boom)
+
+        # Act
+        ctx = EcosystemPipeline().run(
+            HEALTHY, stop_after=PipelineStageId.SCORING, profile=True
+        )
+        partial = EcosystemPipeline().run(
+            HEALTHY, stop_after=PipelineStageId.DISCOVERY, profile=True
+        )
+
+        # Assert
+        assert ctx.stage_results[-1].status == StageStatus.FAILED
+        assert ctx.stage_results[-1].profile is not None
+        assert all(r.profile is None for r in partial.stage_results[1:])
+
+    def test_write_profiles_exports_each_stage(self, tmp_path):
+        """Verify a .prof file and a text report per profiled stage."""
+        # Arrange
+        ctx = EcosystemPipeline(ParserAdapter()).run(
+            HEALTHY, stop_after=PipelineStageId.PER_FILE, profile=True
+        )
+        out = tmp_path / "profiles"
+
+        # Act
+        paths = write_profiles(ctx, str(out))
+
+        # Assert
+        assert [Path(p).name for p in paths] == [
+            "stage-1-discovery.prof",
+            "stage-1-discovery.txt",
+            "stage-2-per_file.prof",
+            "stage-2-per_file.txt",
+        ]
+        stats = pstats.Stats(str(out / "stage-2-per_file.prof"))
+        assert stats.total_calls > 0
+        report = (out / "stage-2-per_file.txt").read_text()
+        assert report.startswith("Stage 2 (PER_FILE)")
+        assert "Slowest files" in report
+        assert "llms.txt" in report
+
+    def test_profiles_survive_a_checkpoint(self, tmp_path):
+        """Verify the binary profile round-trips through JSON."""
+        # Arrange
+        ctx = EcosystemPipeline().run(
+            HEALTHY, stop_after=PipelineStageId.DISCOVERY, profile=True
+        )
+        path = str(tmp_path / "run.ckpt.json.gz")
+        PipelineCheckpoint.capture(ctx).save(path)
+
+        # Act
+        loaded = PipelineCheckpoint.load(path).context.stage_results[0].profile
+
+        # Assert
+        assert isinstance(loaded, StageProfile)
+        assert loaded == ctx.stage_results[0].profile
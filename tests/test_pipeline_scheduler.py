@@ -0,0 +1,325 @@
+"""Tests for the DAG stage scheduler (orchestrator.py).
+
+Tests cover run_nodes() ordering, concurrency, and error handling, and
+EcosystemPipeline(scheduler="dag") against the barrier scheduler:
+identical contexts, stop_after, failures, incremental runs, and
+per-node timings.
+See RR-META-testing-standards for naming conventions and fixture patterns.
+"""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from docstratum.parser import ParserAdapter
+from docstratum.pipeline import (
+    ECOSYSTEM_CHECKS,
+    EcosystemPipeline,
+    EcosystemValidationStage,
+    IncrementalState,
+    PipelineContext,
+    PipelineNode,
+    PipelineStageId,
+    RelationshipStage,
+    ScoringStage,
+    StageScheduler,
+    StageStatus,
+    run_nodes,
+)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "ecosystems"
+_STAGE = PipelineStageId.ECOSYSTEM_VALIDATION
+
+
+def _node(name, run=lambda: None, after=()):
+    return PipelineNode(name, _STAGE, run, frozenset(after))
+
+
+def _render(ctx):
+    """Comparable summary of a context; file ids mapped back to paths."""
+    paths = {f.file_id: f.file_path for f in ctx.files}
+    return (
+        [
+            (f.file_path, f.file_type, f.coverage, len(f.relationships))
+            for f in ctx.files
+        ],
+        [
+            (paths[r.source_file_id], paths.get(r.target_file_id), r.target_url)
+            for r in ctx.relationships
+        ],
+        [(d.code, d.source_file, d.message) for d in ctx.ecosystem_diagnostics],
+        [(r.stage, r.status, r.message) for r in ctx.stage_results],
+        ctx.ecosystem_score.total_score if ctx.ecosystem_score else None,
+        ctx.project_name,
+    )
+
+
+def _write_ecosystem(root: Path, pages: int) -> Path:
+    """An index linking ``pages`` content pages that link to each other."""
+    root.mkdir(parents=True, exist_ok=True)
+    (root / "llms.txt").write_text(
+        "# Project\n\n> Summary\n\n## Docs\n\n"
+        + "".join(f"- [Page {i}](page-{i}.md): page\n" for i in range(pages))
+        + "- [Missing](missing.md)\n"
+    )
+    for i in range(pages):
+        (root / f"page-{i}.md").write_text(
+            f"# Page {i}\n\n## Overview\n\n- [Next](page-{(i + 1) % pages}.md)\n"
+            + f"Text about topic {i}.\n" * 20
+        )
+    return root
+
+
+class TestRunNodes:
+    """run_nodes() honours dependencies and runs independent nodes at once."""
+
+    def test_dependencies_finish_first(self):
+        """Verify every node starts only after the nodes it waits for."""
+        # Arrange
+        order = []
+        nodes = [
+            _node("c", lambda: order.append("c"), after={"a", "b"}),
+            _node("a", lambda: order.append("a")),
+            _node("b", lambda: order.append("b"), after={"a"}),
+        ]
+
+        # Act
+        spans = run_nodes(nodes)
+
+        # Assert
+        assert order == ["a", "b", "c"]
+        assert spans["a"].end <= spans["b"].start
+        assert spans["b"].end <= spans["c"].start
+        assert all(span.ms >= 0 for span in spans.values())
+
+    def test_independent_nodes_run_concurrently(self):
+        """Verify two ready nodes overlap (each waits for the other)."""
+        # Arrange
+        barrier = threading.Barrier(2, timeout=5)
+        nodes = [_node("left", barrier.wait), _node("right", barrier.wait)]
+
+        # Act / Assert (a sequential run would break the barrier)
+        run_nodes(nodes, workers=2)
+
+    def test_exception_propagates_and_stops_dependents(self):
+        """Verify a failing node's error is raised and its dependents skipped."""
+        # Arrange
+        ran = []
+
+        def boom():
+            raise RuntimeError("boom")
+
+        nodes = [_node("a", boom), _node("b", lambda: ran.append("b"), after={"a"})]
+
+        # Act / Assert
+        with pytest.raises(RuntimeError, match="boom"):
+            run_nodes(nodes)
+        assert ran == []
+
+    @pytest.mark.parametrize(
+        ("nodes", "message"),
+        [
+            ([_node("a"), _node("a")], "Duplicate"),
+            ([_node("a", after={"z"})], "unknown"),
+            ([_node("a", after={"b"}), _node("b", after={"a"})], "cycle"),
+        ],
+    )
+    def test_invalid_graphs_rejected(self, nodes, message):
+        """Verify duplicates, unknown dependencies, and cycles are errors."""
+        # Act / Assert
+        with pytest.raises(ValueError, match=message):
+            run_nodes(nodes)
+
+
+class TestDagPipeline:
+    """scheduler="dag" produces the barrier scheduler's context."""
+
+    @pytest.mark.integration
+    @pytest.mark.parametrize("fixture", ["healthy", "orphan_nursery", "broken_links"])
+    def test_fixtures_match_barrier_run(self, fixture):
+        """Verify files, edges, diagnostics, and scores on the fixtures."""
+        # Arrange
+        root = FIXTURES_DIR / fixture
+        expected = EcosystemPipeline(ParserAdapter()).run(str(root))
+
+        # Act
+        ctx = EcosystemPipeline(ParserAdapter(), scheduler="dag").run(str(root))
+
+        # Assert
+        assert _render(ctx) == _render(expected)
+
+    def test_parallel_per_file_matches_barrier_run(self, tmp_path):
+        """Verify pipelined link mapping with a thread pool in Stage 2."""
+        # Arrange
+        root = _write_ecosystem(tmp_path / "eco", 12)
+        expected = EcosystemPipeline(ParserAdapter()).run(str(root))
+
+        # Act
+        ctx = EcosystemPipeline(
+            ParserAdapter(), jobs=4, scheduler=StageScheduler.DAG
+        ).run(str(root))
+
+        # Assert
+        assert _render(ctx) == _render(expected)
+        assert "W012" in {d.code.value for d in ctx.ecosystem_diagnostics}
+
+    def test_node_timings_recorded(self, tmp_path):
+        """Verify each stage reports its nodes, including every check."""
+        # Arrange
+        root = _write_ecosystem(tmp_path / "eco", 3)
+
+        # Act
+        ctx = EcosystemPipeline(ParserAdapter(), scheduler="dag").run(str(root))
+
+        # Assert
+        per_file, relationship, validation, scoring = ctx.stage_results[1:]
+        assert set(per_file.node_timings) == {"per_file"}
+        assert set(relationship.node_timings) == {"link_mapping", "relationship"}
+        assert {c.name for c in ECOSYSTEM_CHECKS} <= set(validation.node_timings)
+        assert "ecosystem_validation" in validation.node_timings
+        assert set(scoring.node_timings) == {"scoring"}
+        assert validation.duration_ms == pytest.approx(
+            sum(validation.node_timings.values())
+        )
+
+    @pytest.mark.parametrize(
+        "stop_after",
+        [
+            PipelineStageId.DISCOVERY,
+            PipelineStageId.PER_FILE,
+            PipelineStageId.RELATIONSHIP,
+            PipelineStageId.ECOSYSTEM_VALIDATION,
+        ],
+    )
+    def test_stop_after_matches_barrier_run(self, tmp_path, stop_after):
+        """Verify stop_after skips the same stages and leaves the same state."""
+        # Arrange
+        root = _write_ecosystem(tmp_path / "eco", 3)
+        expected = EcosystemPipeline(ParserAdapter()).run(str(root), stop_after)
+
+        # Act
+        ctx = EcosystemPipeline(ParserAdapter(), scheduler="dag").run(
+            str(root), stop_after
+        )
+
+        # Assert
+        assert _render(ctx) == _render(expected)
+        assert len(ctx.stage_results) == 5
+
+    def test_unreadable_files_fail_stage_two(self, tmp_path):
+        """Verify a failed Stage 2 skips Stage 3, as the stage loop does."""
+        # Arrange
+        (tmp_path / "llms.txt").write_bytes(b"# Bad \xff\xfe\n")
+        (tmp_path / "page.md").write_bytes(b"\xff\xfe\xfa")
+
+        expected = EcosystemPipeline(ParserAdapter()).run(str(tmp_path))
+
+        # Act
+        ctx = EcosystemPipeline(ParserAdapter(), scheduler="dag").run(str(tmp_path))
+
+        # Assert
+        statuses = [r.status for r in ctx.stage_results]
+        assert statuses[1:3] == [StageStatus.FAILED, StageStatus.SKIPPED]
+        assert _render(ctx) == _render(expected)
+
+    def test_stage_exception_recorded_as_failure(self, tmp_path, monkeypatch):
+        """Verify an exception in a stage node becomes a FAILED result."""
+        # Arrange
+        root = _write_ecosystem(tmp_path / "eco", 2)
+
+        def boom(self, context):
+            raise RuntimeError("scoring exploded")
+
+        monkeypatch.setattr(ScoringStage, "execute", boom)
+
+        # Act
+        ctx = EcosystemPipeline(ParserAdapter(), scheduler="dag").run(str(root))
+
+        # Assert
+        scoring = ctx.stage_results[-1]
+        assert scoring.status == StageStatus.FAILED
+        assert "scoring exploded" in scoring.message
+        assert ctx.stage_results[3].status == StageStatus.SUCCESS
+
+    def test_check_exception_matches_barrier_run(self, tmp_path, monkeypatch):
+        """Verify a raising check fails Stage 4 and skips Scoring."""
+        # Arrange
+        root = _write_ecosystem(tmp_path / "eco", 2)
+        run_check = EcosystemValidationStage._run_check
+
+        def boom(self, check, context, index):
+            if check.name == "token_distribution":
+                raise RuntimeError("check exploded")
+            return run_check(self, check, context, index)
+
+        monkeypatch.setattr(EcosystemValidationStage, "_run_check", boom)
+        expected = EcosystemPipeline(ParserAdapter()).run(str(root))
+
+        # Act
+        ctx = EcosystemPipeline(ParserAdapter(), scheduler="dag").run(str(root))
+
+        # Assert
+        statuses = [r.status for r in ctx.stage_results]
+        assert statuses[3:] == [StageStatus.FAILED, StageStatus.SKIPPED]
+        assert "check exploded" in ctx.stage_results[3].message
+        assert [(r.stage, r.status, r.message) for r in ctx.stage_results] == [
+            (r.stage, r.status, r.message) for r in expected.stage_results
+        ]
+
+    @pytest.mark.integration
+    def test_incremental_run_matches_full_run(self, tmp_path):
+        """Verify the DAG scheduler reuses an incremental snapshot correctly."""
+        # Arrange
+        root = _write_ecosystem(tmp_path / "eco", 6)
+        pipeline = EcosystemPipeline(
+            ParserAdapter(), incremental=IncrementalState(), scheduler="dag"
+        )
+        pipeline.run(str(root))
+        (root / "page-2.md").write_text("# Page 2\n\n- [Gone](gone.md)\n")
+
+        # Act
+        ctx = pipeline.run(str(root))
+
+        # Assert
+        full = EcosystemPipeline(ParserAdapter()).run(str(root))
+        assert _render(ctx)[:3] == _render(full)[:3]
+        assert _render(ctx)[4:] == _render(full)[4:]
+        assert pipeline.incremental.last_changes.modified
+
+    def test_unknown_scheduler_rejected(self):
+        """Verify the scheduler must be a StageScheduler value."""
+        # Act / Assert
+        with pytest.raises(ValueError):
+            EcosystemPipeline(scheduler="eager")
+
+
+class TestRelationshipPipelining:
+    """RelationshipStage.prepare() / map_file() ahead of execute()."""
+
+    def test_map_file_requires_prepare(self):
+        """Verify map_file() refuses to run without a prepared manifest."""
+        # Act / Assert
+        with pytest.raises(RuntimeError, match="prepare"):
+            RelationshipStage().map_file(None)
+
+    def test_execute_reuses_mapped_files(self, tmp_path):
+        """Verify files mapped ahead are not mapped again."""
+        # Arrange
+        root = _write_ecosystem(tmp_path / "eco", 2)
+        ctx = EcosystemPipeline(ParserAdapter()).run(
+            str(root), PipelineStageId.PER_FILE
+        )
+        fresh = PipelineContext(root_path=ctx.root_path, files=ctx.files)
+        stage = RelationshipStage()
+        stage.prepare(fresh)
+        stage.map_file(fresh.files[0])
+        mapped = fresh.files[0].relationships
+
+        # Act
+        result = stage.execute(fresh)
+
+        # Assert
+        assert fresh.files[0].relationships is mapped
+        assert fresh.relationships[: len(mapped)] == mapped
+        assert set(result.node_timings) == {"link_mapping"}
@@ -0,0 +1,226 @@
+"""Tests for W017 near-duplicate detection (pipeline/similarity.py).
+
+Tests cover shingling, MinHash/LSH recall against brute-force pairwise
+comparison, the signature cache, and the Stage 4 redundant_content check
+in full and incremental runs.
+See RR-META-testing-standards for naming conventions and fixture patterns.
+"""
+
+import random
+import shutil
+from itertools import combinations
+from pathlib import Path
+
+import pytest
+
+from docstratum.pipeline import (
+    EcosystemPipeline,
+    EcosystemValidationStage,
+    IncrementalState,
+    PipelineContext,
+)
+from docstratum.pipeline.similarity import (
+    ContentSignature,
+    SignatureCache,
+    find_similar_pairs,
+    shingle_hashes,
+)
+from docstratum.schema.classification import DocumentType
+from docstratum.schema.diagnostics import DiagnosticCode, Severity
+from docstratum.schema.ecosystem import EcosystemFile
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "ecosystems"
+
+
+def _documents(count: int, seed: int = 1) -> list[str]:
+    """Random 200-word documents; every tenth one is a variant of the previous.
+
+    Variants keep a prefix of their original and replace the rest, so their
+    similarity to it spans roughly 0.3 to 0.9.
+    """
+    rng = random.Random(seed)
+    vocab = [f"term{i}" for i in range(3000)]
+    docs: list[str] = []
+    for n in range(count):
+        if n % 10 == 9:
+            kept = docs[-1].split()[: rng.randint(90, 190)]
+            fresh = [rng.choice(vocab) for _ in range(200 - len(kept))]
+            docs.append(" ".join(kept + fresh))
+        else:
+            docs.append(" ".join(rng.choice(vocab) for _ in range(200)))
+    return docs
+
+
+def _w017(ctx):
+    return [
+        d
+        for d in ctx.ecosystem_diagnostics
+        if d.code == DiagnosticCode.W017_REDUNDANT_CONTENT
+    ]
+
+
+class TestShingling:
+    """Shingles ignore case, punctuation, and whitespace."""
+
+    def test_markup_and_case_do_not_change_shingles(self):
+        """Verify formatting-only differences give identical shingles."""
+        plain = "the quick brown fox jumps over the lazy dog"
+        marked = "## The *Quick* brown\n\n- fox jumps, over THE lazy dog!"
+
+        assert shingle_hashes(plain) == shingle_hashes(marked)
+        assert len(shingle_hashes(plain)) == 5
+
+    def test_short_text_has_no_signature(self):
+        """Verify texts under MIN_SHINGLES are skipped."""
+        assert shingle_hashes("too short") == set()
+        assert ContentSignature.of("one two three four five six") is None
+
+
+class TestFindSimilarPairs:
+    """LSH candidates plus exact checks find what brute force finds."""
+
+    def test_matches_brute_force_pairs(self):
+        """Verify recall against all-pairs exact Jaccard on 300 documents."""
+        # Arrange
+        signatures = [ContentSignature.of(d) for d in _documents(300)]
+        expected = {
+            (i, j)
+            for i, j in combinations(range(len(signatures)), 2)
+            if signatures[i].jaccard(signatures[j]) > 0.6
+        }
+
+        # Act
+        found = find_similar_pairs(signatures, 0.6)
+
+        # Assert
+        assert expected  # the generator does produce near-duplicates
+        assert {(p.first, p.second) for p in found} == expected
+        assert all(p.similarity > 0.6 for p in found)
+
+    def test_none_signatures_are_ignored(self):
+        """Verify items without a signature are never paired."""
+        doc = _documents(1)[0]
+        signatures = [ContentSignature.of(doc), None, ContentSignature.of(doc)]
+
+        pairs = find_similar_pairs(signatures, 0.6)
+
+        assert [(p.first, p.second, p.similarity) for p in pairs] == [(0, 2, 1.0)]
+
+
+class TestSignatureCache:
+    """Signatures are cached by content hash."""
+
+    def test_same_text_hits_and_bound_is_enforced(self):
+        """Verify repeated text is a hit and the oldest entry is evicted."""
+        # Arrange
+        cache = SignatureCache(max_entries=2)
+        a, b, c = _documents(3)
+
+        # Act
+        first = cache.signature(a)
+        again = cache.signature(a)
+        cache.signature(b)
+        cache.signature(c)
+
+        # Assert
+        assert again is first
+        assert (cache.hits, cache.misses, len(cache)) == (1, 3, 2)
+        assert cache.signature(a) is not first  # evicted, recomputed
+
+    def test_invalid_bound_rejected(self):
+        """Verify max_entries < 1 raises ValueError."""
+        with pytest.raises(ValueError, match="max_entries"):
+            SignatureCache(max_entries=0)
+
+
+class TestRedundantContentCheck:
+    """The Stage 4 W017 check."""
+
+    def test_duplicate_pages_reported_and_aggregate_skipped(self):
+        """Verify one W017 per redundant pair; llms-full.txt is exempt."""
+        # Arrange
+        doc, other = _documents(2)
+        page = DocumentType.TYPE_3_CONTENT_PAGE
+        files = [
+            EcosystemFile(file_path="/p/a.md", file_type=page),
+            EcosystemFile(file_path="/p/b.md", file_type=page),
+            EcosystemFile(file_path="/p/c.md", file_type=page),
+            EcosystemFile(
+                file_path="/p/llms-full.txt", file_type=DocumentType.TYPE_2_FULL
+            ),
+        ]
+        contents = dict(
+            zip(
+                [f.file_id for f in files],
+                [doc, "# B\n\n" + doc, other, doc],
+                strict=True,
+            )
+        )
+        ctx = PipelineContext(files=files)
+
+        # Act
+        EcosystemValidationStage(
+            file_contents=contents, signature_cache=SignatureCache()
+        ).execute(ctx)
+
+        # Assert
+        [diag] = _w017(ctx)
+        assert diag.source_file == "/p/a.md"
+        assert "/p/b.md" in diag.message
+        assert diag.severity == Severity.WARNING
+
+    @pytest.mark.integration
+    def test_two_thousand_pages_avoid_all_pairs(self, monkeypatch):
+        """Verify 2,000 pages are checked without all-pairs comparison."""
+        # Arrange
+        docs = _documents(2000, seed=3)
+        files = [
+            EcosystemFile(
+                file_path=f"/p/page{i}.md",
+                file_type=DocumentType.TYPE_3_CONTENT_PAGE,
+            )
+            for i in range(len(docs))
+        ]
+        ctx = PipelineContext(files=files)
+        stage = EcosystemValidationStage(
+            file_contents={f.file_id: d for f, d in zip(files, docs, strict=True)},
+            signature_cache=SignatureCache(),
+        )
+        compared = []
+        jaccard = ContentSignature.jaccard
+
+        def counting_jaccard(self, other):
+            compared.append(1)
+            return jaccard(self, other)
+
+        monkeypatch.setattr(ContentSignature, "jaccard", counting_jaccard)
+
+        # Act
+        stage.execute(ctx)
+
+        # Assert — only planted variants can exceed the threshold, and only
+        # LSH candidates (not the ~2M pairs) are compared exactly
+        pairs = [d.message for d in _w017(ctx)]
+        assert 0 < len(pairs) <= 200
+        assert len(compared) < 20_000
+        assert stage.check_results["redundant_content"] == _w017(ctx)
+
+    @pytest.mark.integration
+    def test_incremental_run_matches_full_run(self, tmp_path):
+        """Verify W017 sees unchanged, unparsed pages in incremental runs."""
+        # Arrange
+        root = tmp_path / "healthy"
+        shutil.copytree(FIXTURES_DIR / "healthy", root)
+        doc = _documents(1)[0]
+        (root / "api-reference.md").write_text("# API\n\n" + doc)
+        pipeline = EcosystemPipeline(incremental=IncrementalState())
+        pipeline.run(str(root))
+
+        # Act — the copy appears only after the snapshot was taken
+        (root / "getting-started.md").write_text("# Start\n\n" + doc)
+        ctx = pipeline.run(str(root))
+
+        # Assert
+        full = EcosystemPipeline().run(str(root))
+        assert [d.message for d in _w017(ctx)] == [d.message for d in _w017(full)]
+        assert len(_w017(ctx)) == 1
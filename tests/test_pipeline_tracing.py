@@ -0,0 +1,256 @@
+"""Tests for Chrome trace-event tracing (tracing.py).
+
+Tests cover the tracers themselves, the spans a traced pipeline run
+records (pipeline, stages, files, checks) under both schedulers and the
+process backend, and the exported JSON document.
+See RR-META-testing-standards for naming conventions and fixture patterns.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from docstratum.parser import ParserAdapter
+from docstratum.pipeline import (
+    ECOSYSTEM_CHECKS,
+    NULL_TRACER,
+    ChromeTracer,
+    EcosystemPipeline,
+    NullTracer,
+    PipelineCheckpoint,
+    PipelineStageId,
+    Tracer,
+)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "ecosystems"
+HEALTHY = str(FIXTURES_DIR / "healthy")
+
+
+def _spans(tracer, category=None):
+    return [
+        e
+        for e in tracer.events()
+        if e["ph"] == "X" and (category is None or e["cat"] == category)
+    ]
+
+
+def _inside(inner, outer):
+    return (
+        outer["ts"] <= inner["ts"]
+        and inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"] + 1
+    )
+
+
+class TestTracers:
+    """NullTracer discards spans; ChromeTracer records them."""
+
+    def test_null_tracer_is_a_shared_noop(self):
+        """Verify the disabled tracer hands out one no-op context manager."""
+        # Act
+        with NULL_TRACER.span("a", "stage") as value:
+            pass
+        NULL_TRACER.complete("b", "file", 0.0, 1.0)
+
+        # Assert
+        assert value is None
+        assert NULL_TRACER.enabled is False
+        assert NULL_TRACER.span("x", "y") is NULL_TRACER.span("z", "w")
+        assert isinstance(NullTracer(), Tracer)
+        assert isinstance(ChromeTracer(), Tracer)
+
+    def test_span_records_complete_event(self):
+        """Verify a span carries name, category, thread, and arguments."""
+        # Arrange
+        tracer = ChromeTracer()
+
+        # Act
+        with tracer.span("work", "stage", {"n": 1}):
+            pass
+
+        # Assert
+        (event,) = _spans(tracer)
+        assert event["name"] == "work"
+        assert event["cat"] == "stage"
+        assert event["pid"] == os.getpid()
+        assert event["tid"] == threading.get_ident()
+        assert event["args"] == {"n": 1}
+        assert event["ts"] >= 0
+        assert event["dur"] >= 0
+
+    def test_span_records_exception(self):
+        """Verify a span left by an exception notes the error."""
+        # Arrange
+        tracer = ChromeTracer()
+
+        # Act
+        with pytest.raises(RuntimeError), tracer.span("boom", "check"):
+            raise RuntimeError("failed")
+
+        # Assert
+        (event,) = _spans(tracer)
+        assert "failed" in event["args"]["error"]
+
+    def test_threads_are_named(self):
+        """Verify each thread that recorded a span gets a name event."""
+        # Arrange
+        tracer = ChromeTracer()
+
+        def work():
+            with tracer.span("in-thread", "stage"):
+                pass
+
+        thread = threading.Thread(target=work, name="worker-7")
+
+        # Act
+        thread.start()
+        thread.join()
+
+        # Assert
+        names = [e["args"]["name"] for e in tracer.events() if e["ph"] == "M"]
+        assert names == ["worker-7"]
+
+    def test_clear_drops_spans(self):
+        """Verify clear() empties the tracer."""
+        # Arrange
+        tracer = ChromeTracer()
+        with tracer.span("a", "stage"):
+            pass
+
+        # Act
+        tracer.clear()
+
+        # Assert
+        assert tracer.events() == []
+
+
+class TestTracedPipeline:
+    """A traced run records pipeline, stage, file, and check spans."""
+
+    @pytest.mark.integration
+    def test_barrier_run_spans(self):
+        """Verify one span per stage, file, step, and check, properly nested."""
+        # Arrange
+        tracer = ChromeTracer()
+        pipeline = EcosystemPipeline(ParserAdapter(), tracer=tracer)
+
+        # Act
+        ctx = pipeline.run(HEALTHY)
+
+        # Assert
+        (run,) = _spans(tracer, "pipeline")
+        stages = _spans(tracer, "stage")
+        assert [s["name"] for s in stages] == [
+            "discovery",
+            "per_file",
+            "relationship",
+            "ecosystem_validation",
+            "scoring",
+        ]
+        assert all(_inside(s, run) for s in stages)
+        checks = _spans(tracer, "check")
+        assert sorted(c["name"] for c in checks) == sorted(
+            c.name for c in ECOSYSTEM_CHECKS
+        )
+        assert all(_inside(c, stages[3]) for c in checks)
+        files = [s for s in _spans(tracer, "file") if "args" in s]
+        assert sorted(f["args"]["path"] for f in files) == sorted(
+            f.file_path for f in ctx.files
+        )
+        steps = [s for s in _spans(tracer, "file") if "args" not in s]
+        assert {s["name"] for s in steps} == {
+            "read",
+            "parse",
+            "classify",
+            "validate",
+            "score",
+        }
+        assert all(_inside(f, stages[1]) for f in files)
+
+    def test_dag_run_spans_index_nodes(self):
+        """Verify the DAG scheduler also records its index nodes."""
+        # Arrange
+        tracer = ChromeTracer()
+
+        # Act
+        EcosystemPipeline(ParserAdapter(), scheduler="dag", tracer=tracer).run(HEALTHY)
+
+        # Assert
+        names = {s["name"] for s in _spans(tracer, "stage")}
+        assert {"index:documents", "index:relationships", "scoring"} <= names
+        assert len(_spans(tracer, "check")) == len(ECOSYSTEM_CHECKS)
+
+    def test_files_on_worker_threads(self):
+        """Verify parallel file spans sit on the pool's threads."""
+        # Arrange
+        tracer = ChromeTracer()
+
+        # Act
+        EcosystemPipeline(ParserAdapter(), jobs=3, tracer=tracer).run(HEALTHY)
+
+        # Assert
+        names = {e["tid"]: e["args"]["name"] for e in tracer.events() if e["ph"] == "M"}
+        file_threads = {names[s["tid"]] for s in _spans(tracer, "file")}
+        assert all(n.startswith("docstratum-per-file") for n in file_threads)
+
+    @pytest.mark.integration
+    def test_files_on_process_workers(self):
+        """Verify process-pool files are attributed to the worker processes."""
+        # Arrange
+        tracer = ChromeTracer()
+        pipeline = EcosystemPipeline(
+            ParserAdapter(), jobs=2, backend="process", tracer=tracer
+        )
+
+        # Act
+        pipeline.run(HEALTHY)
+
+        # Assert
+        file_pids = {s["pid"] for s in _spans(tracer, "file")}
+        assert file_pids and os.getpid() not in file_pids
+
+    def test_resume_is_traced(self):
+        """Verify resume() records a pipeline span and the remaining stages."""
+        # Arrange
+        pipeline = EcosystemPipeline(ParserAdapter())
+        checkpoint = PipelineCheckpoint.capture(
+            pipeline.run(HEALTHY, PipelineStageId.RELATIONSHIP)
+        )
+        tracer = ChromeTracer()
+
+        # Act
+        EcosystemPipeline(tracer=tracer).resume(checkpoint)
+
+        # Assert
+        (run,) = _spans(tracer, "pipeline")
+        assert run["args"] == {"resumed_after": "RELATIONSHIP"}
+        assert [s["name"] for s in _spans(tracer, "stage")] == [
+            "ecosystem_validation",
+            "scoring",
+        ]
+
+    def test_untraced_run_uses_null_tracer(self):
+        """Verify tracing is off unless a tracer is given."""
+        # Act
+        pipeline = EcosystemPipeline()
+
+        # Assert
+        assert pipeline.tracer is NULL_TRACER
+
+    def test_save_writes_trace_event_json(self, tmp_path):
+        """Verify the saved file is a trace-event document."""
+        # Arrange
+        tracer = ChromeTracer()
+        EcosystemPipeline(tracer=tracer).run(HEALTHY, PipelineStageId.DISCOVERY)
+        path = tmp_path / "out" / "trace.json"
+
+        # Act
+        tracer.save(str(path))
+
+        # Assert
+        document = json.loads(path.read_text())
+        assert document["displayTimeUnit"] == "ms"
+        assert {e["ph"] for e in document["traceEvents"]} == {"M", "X"}
+        assert document["traceEvents"] == tracer.events()
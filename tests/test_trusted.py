@@ -0,0 +1,153 @@
+"""Tests for trusted model construction (trusted.py).
+
+Tests cover equivalence with normal construction, the strict validate
+switch, revalidation of finished documents, and parsing / the ecosystem
+pipeline with the switch on.
+See RR-META-testing-standards for naming conventions and fixture patterns.
+"""
+
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from docstratum.parser import ParserAdapter, populate, tokenize_table
+from docstratum.parser.tokens import Token, TokenType
+from docstratum.pipeline import EcosystemPipeline
+from docstratum.schema.ecosystem import FileRelationship
+from docstratum.schema.parsed import LinkRelationship, ParsedLink
+from docstratum.schema.trusted import (
+    revalidate,
+    set_validate_trusted,
+    trusted_constructor,
+    validate_trusted_enabled,
+)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+_CONTENT = (
+    "# Docs\n\n> Summary\n\n## API\n\n- [Ref](https://x.dev/ref): The reference\n"
+    "- [Guide](./guide.md)\n\n```\n## not a section\n```\n\n## Notes\n\nText\n"
+)
+
+
+@pytest.fixture
+def validate_switch():
+    """Turn the validate switch on for one test, then restore it."""
+    previous = set_validate_trusted(True)
+    yield
+    set_validate_trusted(previous)
+
+
+class TestTrustedConstructor:
+    """Trusted construction builds the same models as __init__."""
+
+    def test_instances_equal_normal_construction(self):
+        """Verify links, tokens, and relationships equal model(**fields)."""
+        # Arrange
+        cases = [
+            (ParsedLink, {"title": "API", "url": "api.md", "line_number": 3}),
+            (
+                Token,
+                {"token_type": TokenType.H2, "line_number": 1, "raw_text": "## A"},
+            ),
+            (
+                FileRelationship,
+                {
+                    "source_file_id": "a",
+                    "target_file_id": "b",
+                    "relationship_type": LinkRelationship.INDEXES,
+                    "target_url": "b.md",
+                },
+            ),
+        ]
+
+        # Act / Assert
+        for model, fields in cases:
+            assert trusted_constructor(model)(dict(fields)) == model(**fields)
+
+    def test_switch_makes_construction_strict(self, validate_switch):
+        """Verify coercible values are rejected while the switch is on."""
+        # Arrange
+        new_link = trusted_constructor(ParsedLink)
+
+        # Act / Assert
+        assert validate_trusted_enabled() is True
+        with pytest.raises(ValidationError):
+            new_link({"title": "API", "url": "api.md", "line_number": "3"})
+
+    def test_set_validate_trusted_returns_previous_setting(self):
+        """Verify the setter reports what it replaced."""
+        # Arrange
+        original = validate_trusted_enabled()
+
+        # Act
+        previous = set_validate_trusted(not original)
+        restored = set_validate_trusted(original)
+
+        # Assert
+        assert previous == original
+        assert restored == (not original)
+        assert validate_trusted_enabled() == original
+
+
+class TestRevalidate:
+    """revalidate() re-checks finished documents only when enabled."""
+
+    def test_bad_assignment_is_caught_with_switch_on(self, validate_switch):
+        """Verify a field assigned after construction is re-checked."""
+        # Arrange
+        doc = populate(tokenize_table(_CONTENT), raw_content=_CONTENT)
+        doc.sections[0].links[0].line_number = "five"
+
+        # Act / Assert
+        with pytest.raises(ValidationError):
+            revalidate(doc)
+
+    def test_noop_with_switch_off(self):
+        """Verify revalidate() does nothing by default."""
+        # Arrange
+        previous = set_validate_trusted(False)
+        doc = populate(tokenize_table(_CONTENT))
+        doc.title_line = "one"
+
+        # Act / Assert
+        try:
+            revalidate(doc)
+        finally:
+            set_validate_trusted(previous)
+
+
+class TestValidateSwitchEndToEnd:
+    """Parsing and the pipeline produce identical results either way."""
+
+    def test_parse_is_identical_with_switch_on(self):
+        """Verify the validated parse equals the trusted parse."""
+        # Arrange
+        adapter = ParserAdapter()
+        trusted = adapter.parse(_CONTENT, "llms.txt")
+
+        # Act
+        previous = set_validate_trusted(True)
+        try:
+            validated = adapter.parse(_CONTENT, "llms.txt")
+        finally:
+            set_validate_trusted(previous)
+
+        # Assert
+        assert validated.model_dump(exclude={"parsed_at"}) == trusted.model_dump(
+            exclude={"parsed_at"}
+        )
+
+    @pytest.mark.integration
+    def test_pipeline_runs_with_switch_on(self, validate_switch):
+        """Verify the healthy ecosystem builds validated relationships."""
+        # Arrange
+        pipeline = EcosystemPipeline()
+
+        # Act
+        ctx = pipeline.run(str(FIXTURES_DIR / "ecosystems" / "healthy"))
+
+        # Assert
+        assert ctx.relationships
+        assert all(isinstance(r, FileRelationship) for r in ctx.relationships)